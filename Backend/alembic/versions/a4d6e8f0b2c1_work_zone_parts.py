@@ -0,0 +1,62 @@
+"""work_zone_parts: ST_Subdivide'd pieces of each work zone
+
+A gov-drawn work zone can carry thousands of vertices. The GIST index from f1a2b3c4d5e6
+barely helps a zone-scope `ST_Contains` against one, because the zone's single bbox covers
+almost every candidate point, and the exact test then walks every edge. This adds a
+companion table holding each zone cut by `ST_Subdivide` into pieces of at most 64
+vertices, so a point-in-zone check touches one or two small, tightly indexed polygons.
+
+The app keeps the table in sync from WorkZone's mapper events (app/models/team.py); this
+migration only backfills the zones that already exist. Derived data, so not audited.
+
+Revision ID: a4d6e8f0b2c1
+Revises: b8f4d2a6e1c3
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from geoalchemy2 import Geometry
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4d6e8f0b2c1'
+down_revision: str | Sequence[str] | None = 'b8f4d2a6e1c3'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Frozen copy of app.models.team.WORK_ZONE_PART_MAX_VERTICES at this revision.
+_MAX_VERTICES = 64
+
+
+def upgrade() -> None:
+    """Create work_zone_parts with its GIST index, then subdivide every existing zone."""
+    op.create_table(
+        "work_zone_parts",
+        sa.Column("zone_uuid", sa.UUID(as_uuid=True), nullable=False),
+        sa.Column("geometry", Geometry("GEOMETRY", srid=4326, spatial_index=False), nullable=True),
+        sa.Column("uuid", sa.UUID(as_uuid=True), nullable=False, comment="主鍵 UUID"),
+        sa.ForeignKeyConstraint(["zone_uuid"], ["work_zones.uuid"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("uuid"),
+    )
+    op.create_index(op.f("ix_work_zone_parts_zone_uuid"), "work_zone_parts", ["zone_uuid"])
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_work_zone_parts_geometry ON work_zone_parts USING GIST (geometry)"
+    )
+    op.execute(
+        f"""
+        INSERT INTO work_zone_parts (uuid, zone_uuid, geometry)
+        SELECT gen_random_uuid(), uuid, ST_Subdivide(geometry, {_MAX_VERTICES})
+        FROM work_zones
+        WHERE geometry IS NOT NULL
+        """
+    )
+
+
+def downgrade() -> None:
+    """Drop work_zone_parts and its indexes."""
+    op.execute("DROP INDEX IF EXISTS idx_work_zone_parts_geometry")
+    op.drop_index(op.f("ix_work_zone_parts_zone_uuid"), table_name="work_zone_parts")
+    op.drop_table("work_zone_parts")
@@ -0,0 +1,41 @@
+"""base_geometries external_source/external_id: key for re-importing open-data feeds
+
+Government shelter lists and road-closure feeds are imported over and over
+(app/services/geo_import.py). Each row keeps the dataset it came from and its id in that
+dataset, and the import upserts on the pair, so a re-run updates rows instead of
+duplicating them. A plain unique constraint rather than a partial index: rows created in
+the app leave both columns NULL, and NULLs never collide, while `ON CONFLICT
+(external_source, external_id)` can infer a plain constraint without repeating a predicate.
+
+Revision ID: c3e5a7b9d1f2
+Revises: a4d6e8f0b2c1
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3e5a7b9d1f2'
+down_revision: str | Sequence[str] | None = 'a4d6e8f0b2c1'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add the external source/id columns and their unique constraint."""
+    op.add_column('base_geometries', sa.Column('external_source', sa.String(length=100), nullable=True))
+    op.add_column('base_geometries', sa.Column('external_id', sa.String(length=200), nullable=True))
+    op.create_unique_constraint(
+        'uq_base_geometries_external', 'base_geometries', ['external_source', 'external_id']
+    )
+
+
+def downgrade() -> None:
+    """Drop the unique constraint and the external source/id columns."""
+    op.drop_constraint('uq_base_geometries_external', 'base_geometries', type_='unique')
+    op.drop_column('base_geometries', 'external_id')
+    op.drop_column('base_geometries', 'external_source')
@@ -2,7 +2,7 @@
 
 from fastapi import APIRouter
 
-from app.api.v1.endpoints import admin, auth, map, rbac_admin, rbac_test, users
+from app.api.v1.endpoints import admin, auth, bulk, export, map, rbac_admin, rbac_test, users
 from app.core.config import settings
 
 api_router = APIRouter()
@@ -38,6 +38,12 @@ if rbac_test_enabled(settings.ENV):
 # 註冊地圖圖磚路由
 api_router.include_router(map.router, prefix="/map", tags=["地圖圖磚"])
 
+# 註冊批次建立 API（站點 / 需求單 / 任務，供試算表匯入）
+api_router.include_router(bulk.router, prefix="/bulk", tags=["批次建立"])
+
+# 註冊資料匯出 API（站點 / 需求單全量串流匯出，GeoJSON / NDJSON / CSV）
+api_router.include_router(export.router, prefix="/export", tags=["資料匯出"])
+
 # 未來其他功能路由註冊處
 # api_router.include_router(stations.router, prefix="/stations", tags=["stations"])
 # api_router.include_router(requests.router, prefix="/requests", tags=["requests"])
@@ -1,34 +1,47 @@
-"""Minimal admin REST API: list users, assign roles, manage team members (ADR-013/022, T117).
+"""Minimal admin REST API: users, roles, team members, and open-data imports (ADR-013/022, T117).
 
 Read-only listing is gated declaratively at the route (checkpoint 1 only, like Phase 2's
-config queries — `user.view` carries no per-row scope in the current seed). The three
-write endpoints stay thin (ADR-014): they only parse input and call an admin service
-function, which performs both RBAC checkpoints itself via `require_scope` — mirroring how
-GraphQL mutations call the service layer, just over REST instead.
+config queries — `user.view` carries no per-row scope in the current seed). The write
+endpoints (including signing a whole team out) stay thin (ADR-014): they only parse input
+and call an admin service function, which performs both RBAC checkpoints itself via
+`require_scope` — mirroring how GraphQL mutations call the service layer, just over REST
+instead.
 """
 
+import io
+from typing import Literal
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, File, HTTPException, Query, Request, UploadFile, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core import security
+from app.core import security, user_cache
+from app.core.normalize import normalize_email, normalize_phone
 from app.core.permissions import Perm
 from app.core.rbac_scopes import Scope
+from app.core.redis import app_redis, get_redis
+from app.graphql.response_cache import bump
+from app.messaging.outbox import Outbox
 from app.models.auth import User
 from app.models.rbac import Role, UserRoleAssign
 from app.repositories.auth_repository import user_repository
+from app.repositories.session_repository import SessionRepository
 from app.schemas.admin import (
     AdminUserListItem,
     AssignRoleRequest,
     AssignRoleResponse,
     CreateTeamRequest,
+    ImportReportResponse,
+    ImportRowError,
+    OutboxMessageStatus,
+    RevokeSessionsResponse,
     TeamMemberRequest,
     TeamMemberResponse,
     TeamResponse,
 )
 from app.services import admin as admin_service
+from app.services import geo_import
 from app.services.admin import AdminConflictError, AdminNotFoundError
 
 router = APIRouter()
@@ -62,7 +75,9 @@ async def list_users(
     db: AsyncSession = Depends(security.get_db),
 ):
     """List users with their current platform/team role names (checkpoint 1 only)."""
-    users = await user_repository.get_multi(db, skip=skip, limit=limit)
+    users = await user_repository.get_multi_rows(
+        db, (User.uuid, User.name, User.team_uuid), skip=skip, limit=limit
+    )
     roles_by_user = await _role_names_by_user(db, [str(u.uuid) for u in users])
     return [
         AdminUserListItem(
@@ -139,6 +154,7 @@ async def list_teams(
 async def add_team_member(
     team_uuid: UUID,
     body: TeamMemberRequest,
+    request: Request,
     db: AsyncSession = Depends(security.get_db),
     current_user: User = Depends(security.get_current_user),
 ):
@@ -152,6 +168,7 @@ async def add_team_member(
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(err)) from err
     except AdminConflictError as err:
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(err)) from err
+    await user_cache.invalidate(app_redis(request), user.uuid)
     return TeamMemberResponse(uuid=user.uuid, team_uuid=user.team_uuid)
 
 
@@ -159,6 +176,7 @@ async def add_team_member(
 async def remove_team_member(
     team_uuid: UUID,
     user_uuid: UUID,
+    request: Request,
     db: AsyncSession = Depends(security.get_db),
     current_user: User = Depends(security.get_current_user),
 ):
@@ -169,4 +187,82 @@ async def remove_team_member(
         )
     except AdminNotFoundError as err:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(err)) from err
+    await user_cache.invalidate(app_redis(request), user.uuid)
     return TeamMemberResponse(uuid=user.uuid, team_uuid=user.team_uuid)
+
+
+@router.post("/teams/{team_uuid}/sessions/revoke", response_model=RevokeSessionsResponse)
+async def revoke_team_sessions(
+    team_uuid: UUID,
+    db: AsyncSession = Depends(security.get_db),
+    redis=Depends(get_redis),
+    current_user: User = Depends(security.get_current_user),
+):
+    """Sign every member of a team out of every device (refresh tokens die immediately)."""
+    try:
+        user_uuids = await admin_service.team_member_uuids(db, actor=current_user, team_uuid=str(team_uuid))
+    except AdminNotFoundError as err:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(err)) from err
+    revoked = await SessionRepository(redis).revoke_all_for_users(user_uuids)
+    return RevokeSessionsResponse(user_count=len(user_uuids), session_count=revoked)
+
+
+@router.get(
+    "/outbox",
+    response_model=list[OutboxMessageStatus],
+    dependencies=[security.has_permission(Perm.USER_VIEW)],
+)
+async def list_outbox_messages(
+    type: Literal["email", "phone"],
+    value: str,
+    limit: int = Query(20, ge=1, le=50),
+    redis=Depends(get_redis),
+):
+    """Delivery status of the latest emails/SMS sent to one address or phone (support lookups)."""
+    try:
+        recipient = normalize_email(value) if type == "email" else normalize_phone(value)
+    except ValueError as err:
+        raise HTTPException(status.HTTP_422_UNPROCESSABLE_ENTITY, detail="Invalid identifier") from err
+    return await Outbox(redis).recent(recipient, limit)
+
+
+@router.post("/imports/{kind}", response_model=ImportReportResponse)
+async def import_geo_features(
+    kind: Literal["station", "closure_area"],
+    request: Request,
+    source: str = Query(..., max_length=100),
+    id_field: str = "id",
+    file_format: Literal["geojson", "csv"] | None = Query(None, alias="format"),
+    field_map: list[str] = Query([], alias="map"),
+    file: UploadFile = File(...),
+    db: AsyncSession = Depends(security.get_db),
+    current_user: User = Depends(security.get_current_user),
+):
+    """Import a GeoJSON or CSV open-data file as stations or closure areas (app/services/geo_import.py).
+
+    Re-uploading a file updates the rows it imported before rather than duplicating them.
+    `map` entries (`column=property`) name the feed's property for a column it calls
+    something else; `format` defaults from the file name. A file that cannot be read at all
+    is a 400; features the import skipped come back in `errors`.
+    """
+    stream = io.TextIOWrapper(file.file, encoding="utf-8-sig")
+    try:
+        if (file_format or geo_import.format_for(file.filename)) == "csv":
+            reader = geo_import.read_csv(stream)
+        else:
+            reader = geo_import.read_geojson(stream)
+        report = await geo_import.import_features(
+            db, actor=current_user, kind=kind, source=source, reader=reader,
+            id_field=id_field, fields=geo_import.parse_field_map(field_map),
+        )
+    except ValueError as err:  # UnicodeDecodeError included
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(err)) from err
+    finally:
+        stream.detach()
+    if report.created or report.updated:
+        await bump(app_redis(request), ("geo",))
+    return ImportReportResponse(
+        read=report.read, created=report.created, updated=report.updated,
+        unchanged=report.unchanged, skipped=report.skipped, rejected=report.rejected,
+        errors=[ImportRowError(index=e.index, message=e.message) for e in report.errors],
+    )
@@ -2,13 +2,12 @@
 
 import os
 
-from fastapi import Request, Response
-from fastapi_limiter.depends import RateLimiter
-from pyrate_limiter import Duration, Limiter, Rate
+from fastapi import Request
 
 from app.core import security
 from app.core.config import settings
 from app.core.normalize import normalize_email, normalize_phone
+from app.core.rate_limit import RateLimit, body_identifier
 from app.repositories.session_repository import SessionRepository
 from app.schemas.auth import TokenPair
 
@@ -31,14 +30,15 @@ async def issue_token_pair(redis, request: Request, user_uuid: str) -> TokenPair
 
 # 頻率限制包裝器：支援測試環境繞過
 def get_rate_limiter(times: int, seconds: int):
-    """Build a rate-limiter FastAPI dependency that is bypassed in testing."""
-    _limiter = Limiter(Rate(times, Duration.SECOND * seconds))
+    """Build a rate-limiter FastAPI dependency (per IP and per identifier) that is bypassed in testing.
 
-    async def dynamic_rate_limiter(request: Request, response: Response):
+    Counters live in Redis (app/core/rate_limit.py), so the limit holds across all workers.
+    """
+    limiter = RateLimit(times, seconds, identifier=body_identifier)
+
+    async def dynamic_rate_limiter(request: Request):
         # 只有在非測試環境下才執行限制
         if os.getenv("ENV") != "testing":
-            limiter_dep = RateLimiter(_limiter)
-            return await limiter_dep(request, response)
-        return None
+            await limiter(request)
 
     return dynamic_rate_limiter
@@ -50,9 +50,9 @@ async def change_password(
     if identity is None:
         raise HTTPException(status.HTTP_422_UNPROCESSABLE_ENTITY,
                             detail="No password set; use /auth/set-password")
-    if not security.verify_password(body.old_password, identity.password_hash):
+    if not await security.verify_password_async(body.old_password, identity.password_hash):
         raise HTTPException(status.HTTP_401_UNAUTHORIZED, detail="Incorrect current password")
-    new_hash = security.get_password_hash(body.new_password, body.salt_frontend)
+    new_hash = await security.get_password_hash_async(body.new_password, body.salt_frontend)
     await identity_repository.update(db, db_obj=identity, obj_in={"password_hash": new_hash})
     await SessionRepository(redis).revoke_all_for_user(user_uuid)
 
@@ -69,7 +69,7 @@ async def set_password(
     if await identity_repository.get_password_identity(db, user_uuid) is not None:
         raise HTTPException(status.HTTP_409_CONFLICT,
                             detail="Password already set; use /auth/change-password")
-    password_hash = security.get_password_hash(body.password, body.salt_frontend)
+    password_hash = await security.get_password_hash_async(body.password, body.salt_frontend)
     try:
         await identity_repository.create(db, obj_in={
             "user_uuid": current_user.uuid, "provider": "password", "password_hash": password_hash,
@@ -148,6 +148,6 @@ async def reset_password(
     identity = await identity_repository.get_password_identity(db, user_uuid)
     if identity is None:
         raise bad  # defensive: SSO-only never receives a code
-    new_hash = security.get_password_hash(body.new_password, body.salt_frontend)
+    new_hash = await security.get_password_hash_async(body.new_password, body.salt_frontend)
     await identity_repository.update(db, db_obj=identity, obj_in={"password_hash": new_hash})
     await SessionRepository(redis).revoke_all_for_user(user_uuid)
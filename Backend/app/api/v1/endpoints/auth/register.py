@@ -73,7 +73,7 @@ async def register(
     if await contact_repository.is_value_taken(db, type_=body.type, value=ident):
         raise HTTPException(status.HTTP_409_CONFLICT, detail=f"{body.type.capitalize()} already in use")
 
-    password_hash = security.get_password_hash(body.password, body.salt_frontend)
+    password_hash = await security.get_password_hash_async(body.password, body.salt_frontend)
     code = await VerificationRepository(redis).issue_registration(
         type_=body.type, value=ident, password_hash=password_hash, name=body.name
     )
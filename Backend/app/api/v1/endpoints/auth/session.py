@@ -54,7 +54,9 @@ async def login(
     if user is None:
         raise cred_exc
     identity = await identity_repository.get_password_identity(db, str(user.uuid))
-    if identity is None or not security.verify_password(form_data.password, identity.password_hash):
+    if identity is None:
+        raise cred_exc
+    if not await security.verify_password_async(form_data.password, identity.password_hash):
         raise cred_exc
     await user_repository.update(db, db_obj=user, obj_in={"last_login_at": datetime.now(UTC)})
     return await issue_token_pair(redis, request, str(user.uuid))
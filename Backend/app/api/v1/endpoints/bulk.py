@@ -0,0 +1,80 @@
+"""Bulk create REST API: stations, tickets and ticket tasks from a spreadsheet import.
+
+The REST face of the `bulkCreate*` GraphQL mutations, for import scripts that would rather
+POST JSON than build a GraphQL document. Thin (ADR-014): the bulk service functions own
+authz (checked once per batch), per-row validation and the single transaction. A
+batch-level ValueError (empty, or over BULK_CREATE_MAX_ROWS) is a 400; rows the service
+skipped come back in `errors` with a 201.
+
+These writes bypass GraphQL, so they bump the anonymous response cache themselves
+(app/graphql/response_cache.py).
+"""
+
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core import security
+from app.core.redis import app_redis
+from app.graphql.response_cache import bump
+from app.models.auth import User
+from app.schemas.bulk import BulkCreateResponse, BulkRowErrorOut, StationIn, TicketIn, TicketTaskIn
+from app.services import station as station_service
+from app.services import ticket as ticket_service
+from app.services.bulk import BulkResult
+
+router = APIRouter()
+
+
+async def _respond(request: Request, tag: str, create) -> BulkCreateResponse:
+    try:
+        result: BulkResult = await create
+    except ValueError as err:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(err)) from err
+    if result.created:
+        await bump(app_redis(request), (tag,))
+    return BulkCreateResponse(
+        created=[m.uuid for m in result.created],
+        errors=[BulkRowErrorOut(index=e.index, message=e.message) for e in result.errors],
+    )
+
+
+@router.post("/stations", response_model=BulkCreateResponse, status_code=status.HTTP_201_CREATED)
+async def bulk_create_stations(
+    body: list[StationIn],
+    request: Request,
+    db: AsyncSession = Depends(security.get_db),
+    current_user: User = Depends(security.get_current_user),
+):
+    """Create many stations in one transaction (station.add)."""
+    rows = [row.model_dump() for row in body]
+    return await _respond(
+        request, "geo", station_service.bulk_create_stations(db, actor=current_user, rows=rows)
+    )
+
+
+@router.post("/tickets", response_model=BulkCreateResponse, status_code=status.HTTP_201_CREATED)
+async def bulk_create_tickets(
+    body: list[TicketIn],
+    request: Request,
+    db: AsyncSession = Depends(security.get_db),
+    current_user: User = Depends(security.get_current_user),
+):
+    """Create many tickets in one transaction (ticket.add)."""
+    rows = [row.model_dump() for row in body]
+    return await _respond(
+        request, "tickets", ticket_service.bulk_create_tickets(db, actor=current_user, rows=rows)
+    )
+
+
+@router.post("/ticket-tasks", response_model=BulkCreateResponse, status_code=status.HTTP_201_CREATED)
+async def bulk_create_ticket_tasks(
+    body: list[TicketTaskIn],
+    request: Request,
+    db: AsyncSession = Depends(security.get_db),
+    current_user: User = Depends(security.get_current_user),
+):
+    """Create many ticket tasks, under any number of tickets, in one transaction (ticket.add)."""
+    rows = [row.model_dump() for row in body]
+    return await _respond(
+        request, "tickets", ticket_service.bulk_create_ticket_tasks(db, actor=current_user, rows=rows)
+    )
@@ -0,0 +1,55 @@
+"""Data export REST API: full station and ticket layers as GeoJSON, NDJSON or CSV.
+
+Thin (ADR-014): app/services/export.py authorizes the export and builds the query before
+the response starts, so a missing capability is still a 403 and a bad filter a 400. The
+body is then streamed straight off a server-side cursor, optionally gzipped
+(`gzip=true` → an `.gz` attachment), so a full dump never sits in worker memory.
+"""
+
+from datetime import UTC, datetime
+from typing import Literal
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core import security
+from app.models.auth import User
+from app.services import export as export_service
+
+router = APIRouter()
+
+
+@router.get("/{layer}")
+async def export_layer(
+    layer: Literal["stations", "tickets"],
+    format: Literal["geojson", "ndjson", "csv"] = "geojson",
+    gzip: bool = False,
+    bbox: str | None = Query(None, description="min_lng,min_lat,max_lng,max_lat"),
+    station_type: str | None = Query(None, description="stations only"),
+    ticket_status: str | None = Query(None, alias="status", description="tickets only"),
+    priority: str | None = Query(None, description="tickets only"),
+    db: AsyncSession = Depends(security.get_db),
+    current_user: User = Depends(security.get_current_user),
+) -> StreamingResponse:
+    """Stream every row of `layer` the caller may view, contact fields masked as in GraphQL."""
+    try:
+        plan = await export_service.plan_export(
+            db,
+            actor=current_user,
+            layer=layer,
+            format=format,
+            bounds=export_service.parse_bbox(bbox) if bbox else None,
+            filters={"station_type": station_type, "status": ticket_status, "priority": priority},
+        )
+    except ValueError as err:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(err)) from err
+    media_type, extension = export_service.FORMATS[format]
+    filename = f"{layer}-{datetime.now(UTC):%Y%m%d-%H%M%S}.{extension}"
+    if gzip:
+        media_type, filename = "application/gzip", f"{filename}.gz"
+    return StreamingResponse(
+        export_service.stream_export(plan, gzip=gzip),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
@@ -1,10 +1,11 @@
 """User profile endpoints for reading and updating the current user's account."""
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core import security
-from app.models.auth import User
+from app.core import security, user_cache
+from app.core.redis import app_redis
+from app.core.user_cache import CachedUser
 from app.repositories.auth_repository import user_repository
 from app.schemas.auth import UserResponse, UserUpdate
 
@@ -12,7 +13,7 @@ router = APIRouter()
 
 @router.get("/me", response_model=UserResponse)
 async def read_user_me(
-    current_user: User = Depends(security.get_current_user)
+    current_user: CachedUser = Depends(security.get_current_user)
 ):
     """獲取當前登入使用者的個人資料。"""
     return current_user
@@ -21,10 +22,13 @@ async def read_user_me(
 @router.patch("/me", response_model=UserResponse)
 async def update_user_me(
     user_in: UserUpdate,
+    request: Request,
     db: AsyncSession = Depends(security.get_db),
-    current_user: User = Depends(security.get_current_user)
+    current_user: CachedUser = Depends(security.get_current_user)
 ):
     """更新當前登入使用者的個人資料。"""
     update_data = user_in.model_dump(exclude_unset=True)
-    updated_user = await user_repository.update(db, db_obj=current_user, obj_in=update_data)
+    user = await current_user.load(db)
+    updated_user = await user_repository.update(db, db_obj=user, obj_in=update_data)
+    await user_cache.invalidate(app_redis(request), updated_user.uuid)
     return updated_user
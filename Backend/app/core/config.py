@@ -24,10 +24,48 @@ class Settings(BaseSettings):
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 15            # short-lived access token
     REFRESH_TOKEN_EXPIRE_DAYS: int = 14              # refresh token lifetime (Redis TTL)
 
+    # PBKDF2 (600k iterations) runs in a dedicated thread pool, off the event loop; this caps
+    # how many hashes run at once per worker — the rest wait in the pool's queue.
+    PASSWORD_HASH_CONCURRENCY: int = int(os.getenv("PASSWORD_HASH_CONCURRENCY", "2"))
+    # Log a warning (at most once a minute) when this many hashes wait behind the running ones.
+    PASSWORD_HASH_QUEUE_WARN: int = int(os.getenv("PASSWORD_HASH_QUEUE_WARN", "16"))
+
     # Redis 連線字串
     # Docker 內部連線預設: redis://redis:6379
     # 本地開發連線預設: redis://localhost:6379
     REDIS_URL: str = os.getenv("REDIS_URL", "redis://localhost:6379")
+    # Each worker's revoked-session denylist also reloads from Redis this often, covering
+    # any pub/sub message missed while its subscription was down.
+    REVOCATION_RESYNC_SECONDS: int = int(os.getenv("REVOCATION_RESYNC_SECONDS", "60"))
+    # A rate-limit check slower than this uses the worker-local fallback bucket instead.
+    RATE_LIMIT_REDIS_TIMEOUT_MS: int = int(os.getenv("RATE_LIMIT_REDIS_TIMEOUT_MS", "50"))
+    # Outbox delivery (app/messaging/outbox.py): in-flight sends per provider per process,
+    # stream entries read per batch, and attempts before a message is marked failed.
+    OUTBOX_EMAIL_CONCURRENCY: int = int(os.getenv("OUTBOX_EMAIL_CONCURRENCY", "4"))
+    OUTBOX_SMS_CONCURRENCY: int = int(os.getenv("OUTBOX_SMS_CONCURRENCY", "2"))
+    OUTBOX_BATCH_SIZE: int = int(os.getenv("OUTBOX_BATCH_SIZE", "20"))
+    OUTBOX_MAX_ATTEMPTS: int = int(os.getenv("OUTBOX_MAX_ATTEMPTS", "5"))
+    # Upper bound on how long an anonymous GraphQL response stays cached
+    # (app/graphql/response_cache.py); mutations invalidate entries much sooner.
+    RESPONSE_CACHE_TTL_SECONDS: int = int(os.getenv("RESPONSE_CACHE_TTL_SECONDS", "300"))
+    # Persisted queries (app/graphql/persisted_queries.py): the build-time manifest, whether
+    # only its operations may run (production), and how many validated documents to keep.
+    GRAPHQL_PERSISTED_QUERY_MANIFEST: str = os.getenv("GRAPHQL_PERSISTED_QUERY_MANIFEST", "")
+    GRAPHQL_PERSISTED_ONLY: bool = os.getenv("GRAPHQL_PERSISTED_ONLY", "false").lower() == "true"
+    GRAPHQL_DOCUMENT_CACHE_SIZE: int = int(os.getenv("GRAPHQL_DOCUMENT_CACHE_SIZE", "512"))
+    # Per-request GraphQL limits (app/graphql/query_cost.py), lower for Guests.
+    GRAPHQL_MAX_COST_GUEST: int = int(os.getenv("GRAPHQL_MAX_COST_GUEST", "10000"))
+    GRAPHQL_MAX_COST_AUTHENTICATED: int = int(os.getenv("GRAPHQL_MAX_COST_AUTHENTICATED", "50000"))
+    GRAPHQL_MAX_DEPTH_GUEST: int = int(os.getenv("GRAPHQL_MAX_DEPTH_GUEST", "8"))
+    GRAPHQL_MAX_DEPTH_AUTHENTICATED: int = int(os.getenv("GRAPHQL_MAX_DEPTH_AUTHENTICATED", "12"))
+    # Give each root field and DataLoader batch of a GraphQL query its own pooled session, so
+    # independent root fields run in parallel (app/graphql/context.py `ReadSessions`). One
+    # request can then hold several pool connections at once.
+    GRAPHQL_CONCURRENT_READS: bool = os.getenv("GRAPHQL_CONCURRENT_READS", "false").lower() == "true"
+    # Most rows one bulkCreate* mutation or /bulk REST call may carry (app/services/bulk.py).
+    BULK_CREATE_MAX_ROWS: int = int(os.getenv("BULK_CREATE_MAX_ROWS", "5000"))
+    # Rows an open-data import parses, validates and COPYs per round (app/services/geo_import.py).
+    IMPORT_BATCH_ROWS: int = int(os.getenv("IMPORT_BATCH_ROWS", "5000"))
 
     EMAIL_PROVIDER: str = os.getenv("EMAIL_PROVIDER", "console")  # console | smtp2go
     EMAIL_FROM: str = os.getenv("EMAIL_FROM", "no-reply@disaster-rescue.local")
@@ -2,34 +2,58 @@
 
 from contextvars import ContextVar
 
-from fastapi import Request
-from jose import JWTError, jwt
-from starlette.middleware.base import BaseHTTPMiddleware
+from jose import JWTError
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Receive, Scope, Send
 
-from app.core.config import settings
+from app.core.token_cache import verified_tokens
 
 # Thread-safe/Async-safe context variables
 request_user_uuid: ContextVar[str | None] = ContextVar("request_user_uuid", default=None)
 request_client_ip: ContextVar[str | None] = ContextVar("request_client_ip", default=None)
+# (raw bearer token, its verified claims) — decoded once here, reused by
+# security._decode_access_payload so the same request never verifies its token twice.
+request_access_claims: ContextVar[tuple[str, dict] | None] = ContextVar(
+    "request_access_claims", default=None
+)
 
 
-class AuditContextMiddleware(BaseHTTPMiddleware):
-    """FastAPI middleware capturing request IP and authenticated user UUID to thread-local contexts."""
+class AuditContextMiddleware:
+    """ASGI middleware capturing request IP and authenticated user UUID into context variables.
+
+    Raw ASGI rather than Starlette's BaseHTTPMiddleware: that base class runs every request
+    through an extra task and re-wraps the response body stream, which costs on every call
+    and buffers streamed responses (tile proxy, exports). Here the scope headers are read,
+    the contextvars set, and `send` is passed through untouched.
+    """
+
+    def __init__(self, app: ASGIApp):
+        """Wrap the downstream ASGI application."""
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Populate the context variables for HTTP/WebSocket scopes, then call the app."""
+        if scope["type"] not in ("http", "websocket"):
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
 
-    async def dispatch(self, request: Request, call_next):
-        """Intercept the HTTP request, populate context variables, and proceed."""
         # Extract IP address
-        client_ip = request.client.host if request.client else None
-        if "x-forwarded-for" in request.headers:
-            client_ip = request.headers["x-forwarded-for"].split(",")[0].strip()
+        client = scope.get("client")
+        client_ip = client[0] if client else None
+        if "x-forwarded-for" in headers:
+            client_ip = headers["x-forwarded-for"].split(",")[0].strip()
 
         # Extract authenticated user UUID from Authorization header
         user_uuid = None
-        auth_header = request.headers.get("authorization")
+        claims = None
+        auth_header = headers.get("authorization")
         if auth_header and auth_header.lower().startswith("bearer "):
             token = auth_header[7:]
             try:
-                payload = jwt.decode(token, settings.JWT_SIGNING_KEY, algorithms=[settings.ALGORITHM])
+                payload = verified_tokens.decode(token)
+                claims = (token, payload)
                 if payload.get("type") == "access":
                     user_uuid = payload.get("sub")
             except JWTError:
@@ -38,10 +62,12 @@ class AuditContextMiddleware(BaseHTTPMiddleware):
         # Set context variables
         token_user = request_user_uuid.set(user_uuid)
         token_ip = request_client_ip.set(client_ip)
+        token_claims = request_access_claims.set(claims)
 
         try:
-            return await call_next(request)
+            await self.app(scope, receive, send)
         finally:
             # Safely reset context variables
             request_user_uuid.reset(token_user)
             request_client_ip.reset(token_ip)
+            request_access_claims.reset(token_claims)
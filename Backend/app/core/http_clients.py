@@ -0,0 +1,78 @@
+"""Application-scoped outbound HTTP clients, one keep-alive pool per upstream service.
+
+Adapters used to open a fresh `httpx.AsyncClient` per call, so every LINE login and every
+OTP email paid a new TCP + TLS handshake. The app lifespan now creates one `HttpClients`
+registry (`app.state.http_clients`); adapters receive their client through FastAPI
+dependencies (`get_http_clients`) and reuse its pooled connections.
+
+Each upstream gets its own named profile, so connection limits, keep-alive and timeouts
+are per host: a slow SMTP provider can exhaust only its own pool, never LINE's.
+"""
+
+from dataclasses import dataclass
+
+import httpx
+from fastapi import Request
+
+
+@dataclass(frozen=True)
+class ClientProfile:
+    """Pool and timeout settings for one upstream service."""
+
+    timeout: float
+    max_connections: int = 20
+    max_keepalive_connections: int = 10
+    keepalive_expiry: float = 30.0
+
+
+PROFILES: dict[str, ClientProfile] = {
+    "google": ClientProfile(timeout=8),      # www.googleapis.com JWKS
+    "line": ClientProfile(timeout=8),        # api.line.me JWKS and id_token verify
+    "smtp2go": ClientProfile(timeout=10),    # api.smtp2go.com transactional email
+    "sms": ClientProfile(timeout=10),        # reserved for the SMS provider adapter
+}
+
+
+class HttpClients:
+    """Named registry of pooled `httpx.AsyncClient`s, created on first use."""
+
+    def __init__(self, profiles: dict[str, ClientProfile] = PROFILES, transport=None):
+        """Use `profiles`; `transport` (tests) replaces the network for every client."""
+        self._profiles = profiles
+        self._transport = transport
+        self._clients: dict[str, httpx.AsyncClient] = {}
+
+    def get(self, name: str) -> httpx.AsyncClient:
+        """Return the shared client for upstream `name` (KeyError for an unknown profile)."""
+        client = self._clients.get(name)
+        if client is None:
+            profile = self._profiles[name]
+            client = httpx.AsyncClient(
+                timeout=profile.timeout,
+                limits=httpx.Limits(
+                    max_connections=profile.max_connections,
+                    max_keepalive_connections=profile.max_keepalive_connections,
+                    keepalive_expiry=profile.keepalive_expiry,
+                ),
+                transport=self._transport,
+            )
+            self._clients[name] = client
+        return client
+
+    async def aclose(self) -> None:
+        """Close every client opened so far (app shutdown)."""
+        clients, self._clients = self._clients, {}
+        for client in clients.values():
+            await client.aclose()
+
+
+def get_http_clients(request: Request) -> HttpClients:
+    """FastAPI dependency: the lifespan's client registry.
+
+    Without a lifespan (in-process test transports) a registry is attached on first use;
+    it opens nothing until an adapter actually asks for a client.
+    """
+    clients = getattr(request.app.state, "http_clients", None)
+    if clients is None:
+        clients = request.app.state.http_clients = HttpClients()
+    return clients
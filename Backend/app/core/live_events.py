@@ -0,0 +1,125 @@
+"""Change notifications behind the GraphQL subscriptions (app/graphql/subscriptions.py).
+
+Services call `live_events.publish(kind, uuid, op)` after committing a write to a ticket,
+ticket task or station. Every worker holds one Redis subscription on the `live_changes`
+channel (`LiveEvents.start`, from the app lifespan) and fans each change out to the
+subscriptions open on that worker. A websocket never holds a Redis connection of its own.
+
+A change carries only what changed, never the row: each subscriber loads the row itself,
+under its own RBAC scope and PII masking. Delivery is best-effort, as with the response
+cache. A failed publish is logged, not raised, because the write it announces has already
+committed. A subscriber that falls QUEUE_SIZE changes behind loses the oldest ones.
+
+Without a Redis client (tests, or an app run without its lifespan), `publish` delivers
+straight to the subscribers in this process.
+"""
+
+import asyncio
+import contextlib
+import json
+import logging
+from collections import defaultdict
+from collections.abc import AsyncIterator
+from dataclasses import asdict, dataclass
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "live_changes"
+QUEUE_SIZE = 256
+
+
+@dataclass(frozen=True)
+class Change:
+    """One committed write: `kind` is "ticket" / "task" / "station"; `op` created/updated/deleted."""
+
+    kind: str
+    uuid: str
+    op: str
+
+
+class LiveEvents:
+    """Per-worker fan-out of `Change`s from the Redis channel to in-process subscribers."""
+
+    def __init__(self):
+        """Start unbound: `publish` delivers locally until `start` binds a Redis client."""
+        self.redis = None
+        self._queues: dict[str, set[asyncio.Queue]] = defaultdict(set)
+        self._task: asyncio.Task | None = None
+
+    def start(self, redis) -> None:
+        """Publish through `redis` and begin relaying its channel in the background."""
+        self.redis = redis
+        self._task = asyncio.create_task(self._run(), name="live-events")
+
+    async def stop(self) -> None:
+        """Cancel the relay and fall back to local delivery."""
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        self.redis = None
+
+    async def publish(self, kind: str, uuid, op: str = "updated") -> None:
+        """Announce a committed change to every worker's subscribers."""
+        await self.publish_many(kind, [uuid], op)
+
+    async def publish_many(self, kind: str, uuids, op: str = "updated") -> None:
+        """Announce the same change to many rows, in one Redis round trip."""
+        changes = [Change(kind, str(uuid), op) for uuid in uuids]
+        if self.redis is None:
+            for change in changes:
+                self._deliver(change)
+            return
+        if not changes:
+            return
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for change in changes:
+                    pipe.publish(CHANNEL, json.dumps(asdict(change)))
+                await pipe.execute()
+        except Exception:
+            logger.warning("live event publish failed", exc_info=True)
+
+    @contextlib.asynccontextmanager
+    async def subscribe(self, kind: str) -> AsyncIterator[asyncio.Queue]:
+        """A queue receiving every `kind` change until the block exits."""
+        queue: asyncio.Queue = asyncio.Queue(QUEUE_SIZE)
+        self._queues[kind].add(queue)
+        try:
+            yield queue
+        finally:
+            self._queues[kind].discard(queue)
+
+    def _deliver(self, change: Change) -> None:
+        for queue in self._queues.get(change.kind, ()):
+            if queue.full():
+                queue.get_nowait()  # a stalled subscriber loses its oldest change
+            queue.put_nowait(change)
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self._listen()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.warning("live events lost Redis; retrying in 5s", exc_info=True)
+                await asyncio.sleep(5)
+
+    async def _listen(self) -> None:
+        async with self.redis.pubsub(ignore_subscribe_messages=True) as pubsub:
+            await pubsub.subscribe(CHANNEL)
+            while True:
+                message = await pubsub.get_message(timeout=1.0)
+                if message is None:
+                    continue
+                try:
+                    change = Change(**json.loads(message["data"]))
+                except (TypeError, ValueError):
+                    logger.warning("malformed live event: %r", message["data"])
+                    continue
+                self._deliver(change)
+
+
+live_events = LiveEvents()
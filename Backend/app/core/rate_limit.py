@@ -0,0 +1,167 @@
+"""Redis-backed rate limiting shared by every worker (GCRA, one Lua script per check).
+
+The previous limiter kept its counters in each process's memory, so N workers allowed N
+times the configured rate and every deploy reset them. Here the state lives in Redis as
+one GCRA "theoretical arrival time" per key, so a limit means the same thing however many
+workers run. A check consults every key it is given — the caller's IP and, where the
+request names one, the account identifier — and admits the request only if all of them
+have room, in a single EVALSHA.
+
+When Redis is missing (no lifespan), erroring, or slower than RATE_LIMIT_REDIS_TIMEOUT_MS,
+the check falls back to an in-process token bucket with the same rate: limits then hold
+per worker again instead of failing open or turning a Redis hiccup into 500s.
+
+REST routes use `RateLimit` as a dependency; GraphQL resolvers call `RateLimit.check`
+(see app/graphql/context.py `rate_limit`).
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+
+from fastapi import HTTPException, Request, status
+from redis.commands.core import AsyncScript
+
+from app.core.config import settings
+from app.core.redis import app_redis
+
+logger = logging.getLogger(__name__)
+
+_KEY = "ratelimit:"
+
+# KEYS: one per dimension checked. ARGV: emission interval (ms), period (ms).
+# GCRA: each key stores the theoretical arrival time (TAT); a request is admitted when
+# TAT - period <= now, and then advances TAT by one interval. Returns {allowed, retry_ms}.
+# Every key is checked before any is advanced, so a refused request costs no quota.
+_GCRA = AsyncScript(None, b"""
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+local interval, period = tonumber(ARGV[1]), tonumber(ARGV[2])
+local tats, retry = {}, 0
+for i, key in ipairs(KEYS) do
+    local tat = math.max(tonumber(redis.call('GET', key) or now), now)
+    tats[i] = tat
+    retry = math.max(retry, tat + interval - period - now)
+end
+if retry > 0 then return {0, math.ceil(retry)} end
+for i, key in ipairs(KEYS) do
+    local new_tat = tats[i] + interval
+    redis.call('SET', key, new_tat, 'PX', math.ceil(new_tat - now))
+end
+return {1, 0}
+""")
+
+
+class LocalTokenBucket:
+    """Per-process fallback: one token bucket per key, least-recently-used evicted."""
+
+    def __init__(self, maxsize: int = 10_000):
+        """Start empty, tracking at most `maxsize` keys."""
+        self.maxsize = maxsize
+        self._buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()
+
+    def acquire(self, keys: list[str], times: int, seconds: float) -> float:
+        """Take one token from every key's bucket; return 0 if admitted, else seconds to wait."""
+        now = time.monotonic()
+        rate = times / seconds
+        levels = {}
+        for key in keys:
+            tokens, stamp = self._buckets.get(key, (float(times), now))
+            levels[key] = min(float(times), tokens + (now - stamp) * rate)
+        short = max(1 - level for level in levels.values())
+        if short > 0:
+            return short / rate
+        for key, level in levels.items():
+            self._buckets[key] = (level - 1, now)
+            self._buckets.move_to_end(key)
+        while len(self._buckets) > self.maxsize:
+            self._buckets.popitem(last=False)
+        return 0.0
+
+
+local_buckets = LocalTokenBucket()
+
+
+def client_ip(request: Request) -> str:
+    """The caller's IP, preferring the first X-Forwarded-For hop (same rule as the audit log)."""
+    forwarded = request.headers.get("x-forwarded-for")
+    if forwarded:
+        return forwarded.split(",")[0].strip()
+    return request.client.host if request.client else "unknown"
+
+
+async def body_identifier(request: Request) -> str | None:
+    """The account identifier a request is about: JSON `value`, or the login form's `username`.
+
+    FastAPI has already read and cached the body by the time dependencies run, so this
+    costs no second read.
+    """
+    content_type = request.headers.get("content-type", "")
+    try:
+        if content_type.startswith("application/json"):
+            body = await request.json()
+            value = body.get("value") if isinstance(body, dict) else None
+        elif content_type.startswith(("application/x-www-form-urlencoded", "multipart/form-data")):
+            value = (await request.form()).get("username")
+        else:
+            return None
+    except ValueError:
+        return None
+    return str(value).strip().lower() if value else None
+
+
+class RateLimit:
+    """`times` requests per `seconds`, per client IP and (optionally) per account identifier.
+
+    Usable directly as a FastAPI dependency (`dependencies=[Depends(RateLimit(5, 60))]`);
+    the bucket is named after the matched route, so two routes never share one. Raises 429
+    with a Retry-After header when over the limit.
+    """
+
+    def __init__(
+        self,
+        times: int,
+        seconds: int,
+        *,
+        identifier: Callable[[Request], Awaitable[str | None]] | None = None,
+    ):
+        """Configure the rate; `identifier` extracts an extra per-account key from the request."""
+        self.times = times
+        self.seconds = seconds
+        self.identifier = identifier
+
+    async def __call__(self, request: Request) -> None:
+        """Check the limit for this request's route, IP and identifier."""
+        route = request.scope.get("route")
+        name = f"{request.method}:{getattr(route, 'path', request.url.path)}"
+        subject = await self.identifier(request) if self.identifier else None
+        await self.check(app_redis(request), name, ip=client_ip(request), subject=subject)
+
+    async def check(self, redis, name: str, *, ip: str | None = None, subject: str | None = None) -> None:
+        """Admit one request against bucket `name`, keyed by `ip` and/or `subject`; else 429."""
+        keys = [f"{_KEY}{name}:{kind}:{value}" for kind, value in (("ip", ip), ("id", subject)) if value]
+        if not keys:
+            return
+        retry_after = await self._acquire(redis, keys)
+        if retry_after > 0:
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="Too Many Requests",
+                headers={"Retry-After": str(max(1, round(retry_after)))},
+            )
+
+    async def _acquire(self, redis, keys: list[str]) -> float:
+        """Seconds until admitted (0 = admitted now), from Redis or the local fallback."""
+        if redis is not None:
+            interval_ms = self.seconds * 1000 / self.times
+            try:
+                async with asyncio.timeout(settings.RATE_LIMIT_REDIS_TIMEOUT_MS / 1000):
+                    allowed, retry_ms = await _GCRA(
+                        keys=keys, args=(interval_ms, self.seconds * 1000), client=redis
+                    )
+                return 0.0 if allowed else retry_ms / 1000
+            except Exception:
+                logger.warning("rate limit check fell back to the local bucket", exc_info=True)
+        return local_buckets.acquire(keys, self.times, self.seconds)
@@ -5,7 +5,8 @@ ADR-049 (乙, pure-geography model): a geo resource's jurisdiction is decided by
 owner-org. So there is no `resource.team_uuid` and no `gov`/`ngo` scope. The surviving scopes:
 
 - `own`  — I created it (`created_by`).
-- `zone` — its location is inside a WorkZone assigned to my team (`ST_Contains`).
+- `zone` — its location is inside a WorkZone assigned to my team (tested against the
+  zone's `ST_Subdivide`d pieces in work_zone_parts, see `_zone_covers`).
 - `all`  — everything.
 - `team` — kept ONLY for team-member management (a team admin manages their own team); it
   matches on a `team_uuid` attribute that only the Team-management adaptor supplies, never a
@@ -17,11 +18,11 @@ object); `scope_filter()` is the same policy reshaped into a SQL WHERE clause fo
 
 from enum import StrEnum
 
-from sqlalchemy import exists, false, func, select
+from sqlalchemy import case, exists, false, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.auth import User
-from app.models.team import TeamZoneAssign, WorkZone
+from app.models.team import TeamZoneAssign, WorkZone, WorkZonePart
 
 
 class Scope(StrEnum):
@@ -53,6 +54,39 @@ def widest(scopes) -> Scope:
     return result
 
 
+def _assigned_zones(team_uuid):
+    """Subquery of the non-deleted WorkZone uuids assigned to `team_uuid`."""
+    return (
+        select(WorkZone.uuid)
+        .join(TeamZoneAssign, TeamZoneAssign.zone_uuid == WorkZone.uuid)
+        .where(TeamZoneAssign.team_uuid == team_uuid, WorkZone.delete_at.is_(None))
+    )
+
+
+def _zone_covers(zone_uuids, geometry):
+    """SQL boolean: does any zone in `zone_uuids` contain `geometry`?
+
+    Points (every station and ticket) are tested against the zones' subdivided pieces: each
+    piece has a tight bbox, so the GiST index on work_zone_parts prunes to one or two small
+    polygons instead of running `ST_Contains` over a whole coastline. `ST_Intersects` rather
+    than `ST_Contains`, because a point on a cut line between two pieces lies on the
+    boundary of both; the cost is that a point exactly on a zone's outer edge now counts as
+    inside. Anything wider than a point (closure areas, zones themselves) can span several
+    pieces, so it keeps the whole-zone `ST_Contains`.
+    """
+    in_a_part = exists(
+        select(1)
+        .select_from(WorkZonePart)
+        .where(WorkZonePart.zone_uuid.in_(zone_uuids), func.ST_Intersects(WorkZonePart.geometry, geometry))
+    )
+    in_a_zone = exists(
+        select(1)
+        .select_from(WorkZone)
+        .where(WorkZone.uuid.in_(zone_uuids), func.ST_Contains(WorkZone.geometry, geometry))
+    )
+    return case((func.ST_Dimension(geometry) == 0, in_a_part), else_=in_a_zone)
+
+
 async def in_scope(scope: Scope, *, actor: User, resource, db: AsyncSession) -> bool:
     """Checkpoint 2: does `resource` fall within `scope` for `actor`?
 
@@ -86,17 +120,8 @@ async def in_scope(scope: Scope, *, actor: User, resource, db: AsyncSession) ->
         geometry = getattr(resource, "geometry", None)
         if geometry is None or actor.team_uuid is None:
             return False
-        count = await db.scalar(
-            select(func.count())
-            .select_from(WorkZone)
-            .join(TeamZoneAssign, TeamZoneAssign.zone_uuid == WorkZone.uuid)
-            .where(
-                TeamZoneAssign.team_uuid == actor.team_uuid,
-                WorkZone.delete_at.is_(None),
-                func.ST_Contains(WorkZone.geometry, geometry),
-            )
-        )
-        return bool(count and count > 0)
+        covered = await db.scalar(select(_zone_covers(_assigned_zones(actor.team_uuid), geometry)))
+        return bool(covered)
 
     return False
 
@@ -105,8 +130,8 @@ def scope_filter(scope: Scope, *, actor: User, model) -> list:
     """List-query counterpart to in_scope() (ADR-028).
 
     Returns a WHERE-clause list implementing `scope`, instead of a single-object boolean.
-    Empty list = no filter (ALL). Never awaits the DB itself — ZONE builds an EXISTS
-    subquery left for the caller's query to execute in one round trip.
+    Empty list = no filter (ALL). Never awaits the DB itself — ZONE builds EXISTS subqueries
+    left for the caller's query to execute in one round trip.
     """
     if scope == Scope.ALL:
         return []
@@ -133,18 +158,7 @@ def scope_filter(scope: Scope, *, actor: User, model) -> list:
         # raising AttributeError — e.g. Team, which is non-geographic.
         if not actor.team_uuid or not hasattr(model, "geometry"):
             return [false()]
-        my_zones = (
-            select(WorkZone.uuid)
-            .join(TeamZoneAssign, TeamZoneAssign.zone_uuid == WorkZone.uuid)
-            .where(TeamZoneAssign.team_uuid == actor.team_uuid, WorkZone.delete_at.is_(None))
-        )
-        return [
-            exists(
-                select(1)
-                .select_from(WorkZone)
-                .where(WorkZone.uuid.in_(my_zones), func.ST_Contains(WorkZone.geometry, model.geometry))
-            )
-        ]
+        return [_zone_covers(_assigned_zones(actor.team_uuid), model.geometry)]
 
     # Scope.NONE — defensive only; checkpoint 1 should already have 403'd before this.
     return [false()]
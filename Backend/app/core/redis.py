@@ -6,3 +6,13 @@ from fastapi import Request
 def get_redis(request: Request):
     """Return the shared async Redis client created in the app lifespan."""
     return request.app.state.redis
+
+
+def app_redis(request: Request):
+    """Return the lifespan Redis client, or None when the app runs without its lifespan.
+
+    For best-effort caches only (app/core/user_cache.py): unlike `get_redis`, a missing
+    client is not an error — in-process ASGI transports never run the lifespan, and a cache
+    must not turn that into a failed request.
+    """
+    return getattr(request.app.state, "redis", None)
@@ -0,0 +1,144 @@
+"""Per-worker denylist of revoked session ids, so logout kills access tokens immediately.
+
+An access token is verified by signature and `exp` alone, so before this a token whose
+session had been revoked (logout, reuse detection, password reset) stayed usable for up to
+ACCESS_TOKEN_EXPIRE_MINUTES. Checking Redis on every request would close that gap at one
+round trip per call; instead every worker holds the recently revoked `sid`s in memory:
+
+- `publish` (called by SessionRepository after a revocation) records the sids in the
+  `revoked_sids` sorted set, scored by when they stop mattering — the moment any access
+  token minted for them has expired — and announces them on the `session_revoked` channel.
+- `RevocationListener` (one task per worker, started in the app lifespan) applies those
+  announcements, and reloads the whole set every REVOCATION_RESYNC_SECONDS and after every
+  reconnect, so a message missed while the subscription was down is picked up anyway.
+
+Tokens minted without a session id cannot be revoked this way; none are issued by login.
+Like token_cache, free of app imports beyond config (app.core.security imports this).
+"""
+
+import asyncio
+import contextlib
+import logging
+import time
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+REVOKED_KEY = "revoked_sids"
+CHANNEL = "session_revoked"
+
+
+class RevokedSessions:
+    """sid -> epoch after which it no longer needs denying. Event-loop-only, so not locked."""
+
+    def __init__(self):
+        """Start with nothing revoked."""
+        self._expires: dict[str, float] = {}
+
+    def add(self, sids, expires_at: float | None = None) -> None:
+        """Deny `sids` until `expires_at` (default: one access-token lifetime from now)."""
+        if expires_at is None:
+            expires_at = time.time() + settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+        for sid in sids:
+            self._expires[sid] = max(expires_at, self._expires.get(sid, 0.0))
+
+    def is_revoked(self, sid: str | None) -> bool:
+        """Whether access tokens carrying `sid` must be refused."""
+        if sid is None:
+            return False
+        expires_at = self._expires.get(sid)
+        return expires_at is not None and expires_at > time.time()
+
+    def merge(self, entries: dict[str, float]) -> None:
+        """Fold in a snapshot from Redis (resync), dropping every sid that has expired.
+
+        A merge, not a swap: a sid announced moments ago stays denied even if the snapshot
+        was read just before it was recorded.
+        """
+        now = time.time()
+        merged = {sid: exp for sid, exp in self._expires.items() if exp > now}
+        for sid, exp in entries.items():
+            merged[sid] = max(exp, merged.get(sid, 0.0))
+        self._expires = merged
+
+    def clear(self) -> None:
+        """Forget every revocation (tests)."""
+        self._expires.clear()
+
+    def __len__(self) -> int:
+        """Number of sids currently held."""
+        return len(self._expires)
+
+
+revoked_sessions = RevokedSessions()
+
+
+async def publish(redis, sids) -> None:
+    """Deny `sids` here at once, then record and broadcast them for every other worker."""
+    sids = [str(s) for s in sids]
+    if not sids:
+        return
+    now = time.time()
+    expires_at = now + settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+    revoked_sessions.add(sids, expires_at)
+    async with redis.pipeline(transaction=False) as pipe:
+        pipe.zadd(REVOKED_KEY, dict.fromkeys(sids, expires_at))
+        pipe.zremrangebyscore(REVOKED_KEY, "-inf", now)
+        pipe.publish(CHANNEL, " ".join(sids))
+        await pipe.execute()
+
+
+async def resync(redis) -> None:
+    """Load every still-relevant sid recorded in Redis into the local denylist."""
+    rows = await redis.zrangebyscore(REVOKED_KEY, time.time(), "+inf", withscores=True)
+    revoked_sessions.merge({
+        (sid.decode() if isinstance(sid, bytes) else sid): score for sid, score in rows
+    })
+
+
+class RevocationListener:
+    """Background task keeping `revoked_sessions` in step with every other worker."""
+
+    def __init__(self, redis, resync_seconds: int = settings.REVOCATION_RESYNC_SECONDS):
+        """Bind to `redis`; nothing runs until `start`."""
+        self.redis = redis
+        self.resync_seconds = resync_seconds
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        """Begin listening in the background."""
+        self._task = asyncio.create_task(self._run(), name="revocation-listener")
+
+    async def stop(self) -> None:
+        """Cancel the listener and wait for it to finish."""
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self._listen()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.warning("revocation listener lost Redis; retrying in 5s", exc_info=True)
+                await asyncio.sleep(5)
+
+    async def _listen(self) -> None:
+        async with self.redis.pubsub(ignore_subscribe_messages=True) as pubsub:
+            await pubsub.subscribe(CHANNEL)
+            # Subscribe first, then load: a revocation landing in between is seen either way.
+            await resync(self.redis)
+            next_resync = time.monotonic() + self.resync_seconds
+            while True:
+                message = await pubsub.get_message(timeout=1.0)
+                if message is not None:
+                    data = message["data"]
+                    revoked_sessions.add((data.decode() if isinstance(data, bytes) else data).split())
+                if time.monotonic() >= next_resync:
+                    await resync(self.redis)
+                    next_resync = time.monotonic() + self.resync_seconds
@@ -1,8 +1,14 @@
 """Authentication, password hashing, JWT token handling, and RBAC permission checking."""
 
+import asyncio
 import hashlib
 import hmac
+import logging
 import secrets
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 from typing import Protocol
 
@@ -11,13 +17,21 @@ from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError, jwt
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core import user_cache
 from app.core.config import settings
+from app.core.context import request_access_claims
 from app.core.permissions import Perm
 from app.core.rbac_scopes import Scope
+from app.core.redis import app_redis
+from app.core.revocation import revoked_sessions
+from app.core.token_cache import verified_tokens
+from app.core.user_cache import CachedUser
 from app.db.session import SessionLocal
 from app.models.auth import User
 from app.repositories.auth_repository import user_repository
 
+logger = logging.getLogger(__name__)
+
 # --- 密碼處理框架 ---
 
 class PasswordHandler(Protocol):
@@ -79,13 +93,107 @@ class PBKDF2SHA256Handler:
         return parts[2] if len(parts) >= 3 else None
 
 
+@dataclass(frozen=True)
+class PasswordPoolStats:
+    """Point-in-time counters for the password hashing pool."""
+
+    concurrency: int
+    running: int
+    queued: int
+    peak_queued: int
+    completed: int
+
+
+class PasswordHashPool:
+    """Bounded thread pool running password hashing off the event loop.
+
+    Threads, not processes: `hashlib.pbkdf2_hmac` releases the GIL for the whole derivation,
+    so N threads hash on N cores with no pickling or fork. At most `concurrency` hashes run
+    at once; the rest wait in the executor's queue (`queued`), so a login burst queues here
+    instead of stalling every other request on the event loop. Nothing here is bound to an
+    event loop, so one module-level pool serves every worker loop (and every test's loop).
+
+    When `warn_queued` hashes are waiting, `run` logs a warning with the pool's stats, at
+    most once per `_WARN_INTERVAL` seconds: a backed-up queue shows up in the worker's logs
+    as slow logins, before anyone thinks to run scripts/bench_password_hashing.py.
+    """
+
+    _WARN_INTERVAL = 60.0
+
+    def __init__(self, concurrency: int, warn_queued: int | None = None):
+        """Size the pool; the executor itself is created on first use."""
+        self.concurrency = concurrency
+        self.warn_queued = settings.PASSWORD_HASH_QUEUE_WARN if warn_queued is None else warn_queued
+        self._warned_at = float("-inf")
+        self._executor: ThreadPoolExecutor | None = None
+        self._lock = threading.Lock()
+        self._submitted = 0
+        self._started = 0
+        self._completed = 0
+        self._peak_queued = 0
+
+    def _track(self, fn, args):
+        with self._lock:
+            self._started += 1
+        try:
+            return fn(*args)
+        finally:
+            with self._lock:
+                self._completed += 1
+
+    async def run(self, fn, *args):
+        """Run `fn(*args)` on a pool thread and return its result."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="pwhash")
+            self._submitted += 1
+            in_flight = self._submitted - self._completed
+            self._peak_queued = max(self._peak_queued, in_flight - self.concurrency)
+            executor = self._executor
+            warn = self._should_warn(in_flight - self.concurrency)
+        if warn:
+            logger.warning("password hashing queue is backing up: %s", self.stats())
+        return await asyncio.get_running_loop().run_in_executor(executor, self._track, fn, args)
+
+    def _should_warn(self, queued: int) -> bool:
+        """Whether `run` should log the backlog now; call with `_lock` held."""
+        now = time.monotonic()
+        if queued < self.warn_queued or now - self._warned_at < self._WARN_INTERVAL:
+            return False
+        self._warned_at = now
+        return True
+
+    def stats(self) -> PasswordPoolStats:
+        """Return the current queue depth and throughput counters."""
+        with self._lock:
+            return PasswordPoolStats(
+                concurrency=self.concurrency,
+                running=self._started - self._completed,
+                queued=self._submitted - self._started,
+                peak_queued=self._peak_queued,
+                completed=self._completed,
+            )
+
+    def shutdown(self) -> None:
+        """Stop the worker threads (app shutdown); the next `run` starts a fresh executor."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
 class PasswordManager:
-    """Registry and dispatcher for password hash handlers."""
+    """Registry and dispatcher for password hash handlers.
+
+    `hash`/`verify` run inline and suit scripts and tests; request handlers use
+    `hash_async`/`verify_async`, which run the same handler on `pool`.
+    """
 
-    def __init__(self):
-        """Initialize with an empty handler registry."""
+    def __init__(self, pool: PasswordHashPool | None = None):
+        """Initialize with an empty handler registry and the pool the async methods use."""
         self._handlers: dict[str, PasswordHandler] = {}
         self._default_handler: str | None = None
+        self.pool = pool or PasswordHashPool(settings.PASSWORD_HASH_CONCURRENCY)
 
     def register(self, handler: PasswordHandler, default: bool = False):
         """Register a handler, optionally setting it as the default."""
@@ -112,6 +220,14 @@ class PasswordManager:
         algorithm = hashed_password_db.split('$', 1)[0]
         return self._get_handler(algorithm).verify(password, hashed_password_db)
 
+    async def hash_async(self, password: str, salt_frontend: str, algorithm: str | None = None) -> str:
+        """`hash`, run on the password pool instead of the event loop."""
+        return await self.pool.run(self.hash, password, salt_frontend, algorithm)
+
+    async def verify_async(self, password: str, hashed_password_db: str) -> bool:
+        """`verify`, run on the password pool instead of the event loop."""
+        return await self.pool.run(self.verify, password, hashed_password_db)
+
     def get_salt_frontend(self, hashed_password_db: str) -> str | None:
         """Extract the frontend salt from a stored hash string."""
         if not hashed_password_db or '$' not in hashed_password_db:
@@ -136,6 +252,16 @@ def verify_password(hash_password_frontend: str, hashed_password_db: str) -> boo
     return pwd_manager.verify(hash_password_frontend, hashed_password_db)
 
 
+async def get_password_hash_async(hash_password_frontend: str, salt_frontend: str) -> str:
+    """`get_password_hash` for request handlers: hashes on the pool, not the event loop."""
+    return await pwd_manager.hash_async(hash_password_frontend, salt_frontend)
+
+
+async def verify_password_async(hash_password_frontend: str, hashed_password_db: str) -> bool:
+    """`verify_password` for request handlers: verifies on the pool, not the event loop."""
+    return await pwd_manager.verify_async(hash_password_frontend, hashed_password_db)
+
+
 def parse_salt_frontend(hashed_password_db: str) -> str | None:
     """Extract the frontend salt from a stored hash."""
     return pwd_manager.get_salt_frontend(hashed_password_db)
@@ -193,23 +319,47 @@ def _credentials_exception() -> HTTPException:
 
 
 def _decode_access_payload(token: str) -> dict:
-    """Decode and validate an access JWT, returning its payload. Raises 401 on any failure."""
+    """Decode and validate an access JWT, returning its payload. Raises 401 on any failure.
+
+    Reuses the claims AuditContextMiddleware already verified for this request when it saw
+    the same token; otherwise goes through the process-wide verified-token LRU. Those claims
+    live as long as the connection, so `exp` is checked again here: a websocket re-validates
+    its token per subscription push (app/graphql/subscriptions.py). A token whose session
+    has been revoked is refused via the in-memory denylist (app/core/revocation.py).
+    """
+    seen = request_access_claims.get()
     try:
-        payload = jwt.decode(token, settings.JWT_SIGNING_KEY, algorithms=[settings.ALGORITHM])
+        payload = dict(seen[1]) if seen is not None and seen[0] == token else verified_tokens.decode(token)
     except JWTError as err:
         raise _credentials_exception() from err
     if payload.get("sub") is None or payload.get("type") != "access":
         raise _credentials_exception()
+    if payload.get("exp") is not None and payload["exp"] <= time.time():
+        raise _credentials_exception()
+    if revoked_sessions.is_revoked(payload.get("sid")):
+        raise _credentials_exception()
     return payload
 
 
-async def get_current_user(db: AsyncSession = Depends(get_db), token: str = Depends(oauth2_scheme)) -> User:
-    """FastAPI dependency resolving the current authenticated user from JWT."""
+async def get_current_user(
+        request: Request, db: AsyncSession = Depends(get_db), token: str = Depends(oauth2_scheme)
+) -> CachedUser:
+    """FastAPI dependency resolving the current authenticated user from JWT.
+
+    Served from the Redis user snapshot when present (app/core/user_cache.py); a miss loads
+    the row and fills the snapshot. Call `.load(db)` on the result for the live ORM User.
+    """
     payload = _decode_access_payload(token)
+    redis = app_redis(request)
+    cached = await user_cache.get(redis, payload["sub"])
+    if cached is not None:
+        return cached
     user = await user_repository.get_by_uuid(db, payload["sub"])
     if user is None:
         raise _credentials_exception()
-    return user
+    current = CachedUser.from_model(user)
+    await user_cache.put(redis, current)
+    return current
 
 
 async def get_current_session(token: str = Depends(oauth2_scheme)) -> tuple[str, str | None]:
@@ -0,0 +1,64 @@
+"""Bounded LRU of verified access-token claims, so a hot token is HMAC-checked once.
+
+A client polling every few seconds presents the same access token for its whole 15-minute
+life, and every request used to pay `jwt.decode` twice (audit middleware, then
+`get_current_user`). Entries are keyed by the token's SHA-256 — never the raw token — and
+evicted at the token's own `exp`, so a cache hit is never more permissive than a fresh
+decode would be.
+
+Deliberately free of app imports beyond config: app.core.context imports this, and
+app.db.session imports context, so anything heavier here would be a cycle.
+"""
+
+import hashlib
+import time
+from collections import OrderedDict
+
+from jose import jwt
+
+from app.core.config import settings
+
+
+class VerifiedTokenCache:
+    """Token-hash -> claims map, least-recently-used evicted past `maxsize`.
+
+    Not locked: every caller runs on the worker's single event-loop thread, and nothing in
+    `decode` awaits.
+    """
+
+    def __init__(self, maxsize: int = 4096):
+        """Start empty, holding at most `maxsize` tokens."""
+        self.maxsize = maxsize
+        self._entries: OrderedDict[bytes, dict] = OrderedDict()
+
+    def decode(self, token: str) -> dict:
+        """Return the token's verified claims, from cache when still unexpired.
+
+        Raises `jose.JWTError` exactly as `jwt.decode` would; failures are never cached. The
+        returned dict is a copy, so a caller mutating it cannot poison the next hit.
+        """
+        key = hashlib.sha256(token.encode("utf-8")).digest()
+        claims = self._entries.get(key)
+        if claims is not None:
+            if claims.get("exp", 0) > time.time():
+                self._entries.move_to_end(key)
+                return dict(claims)
+            del self._entries[key]
+
+        claims = jwt.decode(token, settings.JWT_SIGNING_KEY, algorithms=[settings.ALGORITHM])
+        if "exp" in claims:  # a token without exp has no safe eviction point — don't keep it
+            self._entries[key] = claims
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return dict(claims)
+
+    def clear(self) -> None:
+        """Drop every entry (tests, or after rotating SECRET_KEY in-process)."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        """Number of cached tokens."""
+        return len(self._entries)
+
+
+verified_tokens = VerifiedTokenCache()
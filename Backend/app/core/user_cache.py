@@ -0,0 +1,119 @@
+"""Read-through Redis cache of the authenticated caller's User fields.
+
+Every authenticated REST call and every authenticated GraphQL request used to turn the
+token's `sub` into a User with a primary-key SELECT. Authz and the services only ever read
+a handful of columns off that row (`uuid`, `team_uuid`, `credibility_score`, plus `name` /
+`created_at` for /users/me), so those are snapshotted in Redis and served from there.
+
+The TTL is the access-token lifetime, so a snapshot never outlives the token that first
+loaded it. Anything that changes a snapshotted column — profile edits, team membership —
+must call `invalidate` after committing; other columns (last_login_at, credentials,
+contacts) are not cached and need nothing. Role and permission grants are not part of the
+snapshot either: resolve_scope still reads them fresh per request.
+
+Best-effort like the tile cache: a missing client or a Redis error is a cache miss, never a
+failed request.
+"""
+
+import json
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.auth import User
+
+logger = logging.getLogger(__name__)
+
+_KEY = "user_snapshot:"
+
+
+@dataclass(slots=True, eq=False)
+class CachedUser:
+    """The caller as authz sees it — the User columns every permission check reads.
+
+    Quacks like `User` for `require_scope`, `in_scope` and the services. Code that must
+    write the row (or read a column not carried here) calls `load(db)` for the live ORM
+    object, fetched at most once per request.
+    """
+
+    uuid: UUID
+    name: str
+    team_uuid: UUID | None
+    credibility_score: float
+    created_at: datetime
+    _orm: User | None = field(default=None, repr=False)
+
+    @classmethod
+    def from_model(cls, user: User) -> "CachedUser":
+        """Snapshot a loaded User, keeping the instance so `load` needs no query."""
+        return cls(
+            uuid=user.uuid,
+            name=user.name,
+            team_uuid=user.team_uuid,
+            credibility_score=user.credibility_score,
+            created_at=user.created_at,
+            _orm=user,
+        )
+
+    async def load(self, db: AsyncSession) -> User:
+        """Return the live ORM User, querying only the first time per request."""
+        if self._orm is None:
+            self._orm = await db.get(User, self.uuid)
+        return self._orm
+
+    def _dump(self) -> str:
+        return json.dumps({
+            "uuid": str(self.uuid),
+            "name": self.name,
+            "team_uuid": str(self.team_uuid) if self.team_uuid else None,
+            "credibility_score": self.credibility_score,
+            "created_at": self.created_at.isoformat(),
+        })
+
+    @classmethod
+    def _parse(cls, raw: bytes | str) -> "CachedUser":
+        data = json.loads(raw)
+        return cls(
+            uuid=UUID(data["uuid"]),
+            name=data["name"],
+            team_uuid=UUID(data["team_uuid"]) if data["team_uuid"] else None,
+            credibility_score=data["credibility_score"],
+            created_at=datetime.fromisoformat(data["created_at"]),
+        )
+
+
+async def get(redis, user_uuid: str) -> CachedUser | None:
+    """Return the cached snapshot for `user_uuid`, or None on a miss."""
+    if redis is None:
+        return None
+    try:
+        raw = await redis.get(_KEY + str(user_uuid))
+    except Exception:
+        logger.warning("user cache read failed; falling back to the database", exc_info=True)
+        return None
+    return CachedUser._parse(raw) if raw else None
+
+
+async def put(redis, user: CachedUser) -> None:
+    """Store `user`'s snapshot for one access-token lifetime."""
+    if redis is None:
+        return
+    try:
+        await redis.set(_KEY + str(user.uuid), user._dump(), ex=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60)
+    except Exception:
+        logger.warning("user cache write failed", exc_info=True)
+
+
+async def invalidate(redis, *user_uuids) -> None:
+    """Drop the snapshots of `user_uuids`; call after committing a change to a cached column."""
+    if redis is None or not user_uuids:
+        return
+    try:
+        await redis.delete(*(_KEY + str(u) for u in user_uuids))
+    except Exception:
+        # A failed invalidation leaves at most one token lifetime of staleness (the TTL).
+        logger.warning("user cache invalidation failed for %s", user_uuids, exc_info=True)
@@ -6,7 +6,7 @@ import strawberry
 
 from app.core.permissions import Perm
 from app.graphql.announcements.types import AnnouncementFilter, AnnouncementType
-from app.graphql.context import check_permission
+from app.graphql.context import check_permission, read_session
 from app.repositories.announcements_repository import announcement_repository
 
 
@@ -28,7 +28,7 @@ class AnnouncementQuery:
         if filter is AnnouncementFilter.ALL:
             await check_permission(info, Perm.ANN_EDIT)
         items = await announcement_repository.list_announcements(
-            info.context["db"], only_active=(filter is AnnouncementFilter.ACTIVE)
+            read_session(info), only_active=(filter is AnnouncementFilter.ACTIVE)
         )
         return [AnnouncementType.from_model(a) for a in items]
 
@@ -41,7 +41,7 @@ class AnnouncementQuery:
         Active announcements are public; reading an inactive one requires announcement.edit.
         Returns None if not found or soft-deleted.
         """
-        m = await announcement_repository.get_by_uuid_active(info.context["db"], uuid)
+        m = await announcement_repository.get_by_uuid_active(read_session(info), uuid)
         if m and not m.active:
             await check_permission(info, Perm.ANN_EDIT)
         return AnnouncementType.from_model(m) if m else None
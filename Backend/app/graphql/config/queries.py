@@ -9,7 +9,7 @@ import strawberry
 
 from app.core.permissions import Perm
 from app.graphql.config.types import StationPropertyConfigType, TaskPropertyConfigType
-from app.graphql.context import check_permission
+from app.graphql.context import check_permission, read_session
 from app.repositories.config_repository import (
     station_property_config_repository,
     task_property_config_repository,
@@ -30,7 +30,7 @@ class PropertyConfigQuery:
         """
         await check_permission(info, Perm.FIELD_VIEW)
         items = await station_property_config_repository.list_by_type(
-            info.context["db"], station_type
+            read_session(info), station_type
         )
         return [StationPropertyConfigType.from_model(c) for c in items]
 
@@ -44,6 +44,6 @@ class PropertyConfigQuery:
         """
         await check_permission(info, Perm.FIELD_VIEW)
         items = await task_property_config_repository.list_by_type(
-            info.context["db"], task_type
+            read_session(info), task_type
         )
         return [TaskPropertyConfigType.from_model(c) for c in items]
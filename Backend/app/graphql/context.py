@@ -1,21 +1,29 @@
 """GraphQL request context factory and RBAC permission helper (two-checkpoint model, ADR-022)."""
 
 from fastapi import HTTPException, status
-from starlette.requests import Request
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.requests import HTTPConnection
+from strawberry.extensions import SchemaExtension
+from strawberry.types.graphql import OperationType
 
+from app.core.config import settings
 from app.core.permissions import PUBLIC_PERMS, Perm
+from app.core.rate_limit import RateLimit, client_ip
 from app.core.rbac_scopes import Scope
+from app.core.redis import app_redis
 from app.core.security import get_current_user, get_db
+from app.db.session import SessionLocal
 from app.graphql.loaders import build_loaders
 from app.models.auth import User
 from app.services.authz import require_scope
 
 
-async def get_context(request: Request):
+async def get_context(request: HTTPConnection):
     """Create per-request GraphQL context with DB session and optional user.
 
     Reuses security.get_db for session lifecycle and security.get_current_user
-    for JWT authentication.
+    for JWT authentication. Also runs once per websocket, at connect, for subscriptions
+    (`request` is then the WebSocket); see app/graphql/subscriptions.py.
 
     Errors:
         - Invalid/expired token: raises HTTPException(401) from get_current_user
@@ -27,26 +35,89 @@ async def get_context(request: Request):
     db_gen = get_db()
     db = await anext(db_gen)
     try:
-        # graphql-core resolves sibling root fields concurrently, and they all share this
-        # one AsyncSession. The session must have already acquired its connection before
-        # any resolver runs, or two sibling resolvers race to provision it and SQLAlchemy
-        # raises "This session is provisioning a new connection; concurrent operations are
-        # not permitted" on the second one. Below, the auth lookup incidentally warms the
-        # connection for authenticated callers (it issues a query), but anonymous callers
-        # skip that path entirely — so without this explicit warm-up, any anonymous query
-        # selecting 2+ root fields fails. Do this unconditionally so both paths are
-        # equally warmed and this doesn't silently regress if the auth lookup ever changes.
-        await db.connection()
         auth = request.headers.get("Authorization", "")
         token = auth[7:] if auth.startswith("Bearer ") else ""
         user = None
         if token:
-            user = await get_current_user(db=db, token=token)
+            user = await get_current_user(request=request, db=db, token=token)
         yield {"db": db, "user": user, "loaders": build_loaders(db), "_rbac_cache": {}}
     finally:
         await db_gen.aclose()
 
 
+class WarmSession(SchemaExtension):
+    """Acquire the request session's connection before any resolver runs.
+
+    graphql-core resolves sibling root fields concurrently, and they all share the context's
+    one AsyncSession. The session must have already acquired its connection before any
+    resolver runs, or two sibling resolvers race to provision it and SQLAlchemy raises "This
+    session is provisioning a new connection; concurrent operations are not permitted" on
+    the second one. The auth lookup in `get_context` can't be relied on to warm it:
+    anonymous callers skip it entirely, and an authenticated caller whose user snapshot is
+    cached (app/core/user_cache.py) never queries either — so without this explicit
+    warm-up, any query selecting 2+ root fields could fail.
+
+    Runs after `ResponseCache` and skips the warm-up when that already supplied the result,
+    so a cached response never checks out a Postgres connection. Skips subscriptions too:
+    they check out a connection only while handling each change (app/graphql/subscriptions.py).
+    """
+
+    async def on_execute(self):
+        """Warm the session unless the operation's result is already known."""
+        ctx = self.execution_context
+        if ctx.result is None and ctx.operation_type is not OperationType.SUBSCRIPTION:
+            await ctx.context["db"].connection()
+        yield
+
+
+class ReadSessions(SchemaExtension):
+    """With GRAPHQL_CONCURRENT_READS, give a query's root fields and loaders their own sessions.
+
+    All root fields share the request's one session by default, and one session is one
+    connection: a dashboard asking for `stations`, `tickets`, `closureAreas` and
+    `announcements` runs their SQL back to back. For a query operation this hands each root
+    field a pooled session of its own (`read_session`) and rebuilds the loaders so every
+    batch borrows one too, letting independent fields query in parallel. Auth, RBAC checks
+    and mutations stay on the request session, so a mutation is still one transaction.
+    """
+
+    async def on_execute(self):
+        """Open per-root-field sessions for a query; close them once it has executed."""
+        ctx = self.execution_context
+        if (
+            not settings.GRAPHQL_CONCURRENT_READS
+            or ctx.result is not None
+            or ctx.operation_type is not OperationType.QUERY
+        ):
+            yield
+            return
+        sessions: dict[str, AsyncSession] = {}
+        ctx.context["_read_sessions"] = sessions
+        ctx.context["loaders"] = build_loaders(ctx.context["db"], open_session=SessionLocal)
+        try:
+            yield
+        finally:
+            for session in sessions.values():
+                await session.close()
+
+
+def read_session(info) -> AsyncSession:
+    """The session a read-only root resolver should query on.
+
+    Its own pooled session, one per root field (by response key), when `ReadSessions` is
+    active; the request session otherwise.
+    """
+    sessions = info.context.get("_read_sessions")
+    if sessions is None:
+        return info.context["db"]
+    path = info.path
+    while path.prev is not None:
+        path = path.prev
+    if path.key not in sessions:
+        sessions[path.key] = SessionLocal()
+    return sessions[path.key]
+
+
 async def check_permission(info, perm: Perm, resource=None) -> Scope:
     """Two-checkpoint RBAC check (ADR-022).
 
@@ -91,3 +162,19 @@ def require_authenticated(info) -> User:
             headers={"WWW-Authenticate": "Bearer"},
         )
     return user
+
+
+async def rate_limit(info, limit: RateLimit, name: str) -> None:
+    """Apply a shared Redis rate limit to a resolver; raises 429 when over it.
+
+    The REST `RateLimit` dependency, reached from GraphQL: bucket `name` (normally the
+    mutation name) keyed by user uuid for a logged-in caller — one account cannot spread
+    a flood across many IPs, and users behind one shelter NAT do not share a quota — and
+    by client IP for a Guest.
+    """
+    request = info.context["request"]
+    user = info.context["user"]
+    if user is not None:
+        await limit.check(app_redis(request), f"graphql:{name}", subject=str(user.uuid))
+    else:
+        await limit.check(app_redis(request), f"graphql:{name}", ip=client_ip(request))
@@ -9,8 +9,10 @@ from uuid import UUID
 
 import strawberry
 
-from app.graphql.context import require_authenticated
+from app.core.rate_limit import RateLimit
+from app.graphql.context import rate_limit, require_authenticated
 from app.graphql.geo.types import (
+    BulkStationsResult,
     ClosureAreaType,
     CreateClosureAreaInput,
     CreateCrowdSourcingInput,
@@ -23,11 +25,37 @@ from app.graphql.geo.types import (
     UpdateStationInput,
     UpdateStationPropertyInput,
 )
+from app.graphql.shared import BulkRowError
 from app.graphql.tickets.types import PhotoType
 from app.services import closure_area as closure_area_service
 from app.services import photo as photo_service
 from app.services import station as station_service
 
+# Ratings are crowd input; a rating every 2s per user is far above honest use.
+CROWD_SOURCING_RATE = RateLimit(30, 60)
+
+
+def _station_fields(input: CreateStationInput) -> dict:
+    """`create_station`'s keyword arguments from its GraphQL input."""
+    sl_dict = None
+    if input.secondary_location is not None:
+        sl = input.secondary_location
+        sl_dict = {
+            "location_type": sl.location_type,
+            "county": sl.county, "city": sl.city, "lane": sl.lane, "alley": sl.alley,
+            "no": sl.no, "floor": sl.floor, "room": sl.room,
+            "pole_id": sl.pole_id, "pole_type": sl.pole_type, "pole_note": sl.pole_note,
+        }
+    return {
+        "geometry": input.geometry,
+        "type": input.type, "name": input.name, "description": input.description,
+        "op_hour": input.op_hour, "level": input.level, "comment": input.comment,
+        "source": input.source, "visibility": input.visibility.value,
+        "contact_name": input.contact_name, "contact_email": input.contact_email,
+        "contact_phone": input.contact_phone,
+        "secondary_location": sl_dict,
+    }
+
 
 @strawberry.type
 class GeoMutation:
@@ -41,28 +69,30 @@ class GeoMutation:
         attaches a secondary address or pole location. Requires station.add permission.
         Returns the created station.
         """
-        sl_dict = None
-        if input.secondary_location is not None:
-            sl = input.secondary_location
-            sl_dict = {
-                "location_type": sl.location_type,
-                "county": sl.county, "city": sl.city, "lane": sl.lane, "alley": sl.alley,
-                "no": sl.no, "floor": sl.floor, "room": sl.room,
-                "pole_id": sl.pole_id, "pole_type": sl.pole_type, "pole_note": sl.pole_note,
-            }
         station = await station_service.create_station(
-            info.context["db"],
-            actor=require_authenticated(info),
-            geometry=input.geometry,
-            type=input.type, name=input.name, description=input.description,
-            op_hour=input.op_hour, level=input.level, comment=input.comment,
-            source=input.source, visibility=input.visibility.value,
-            contact_name=input.contact_name, contact_email=input.contact_email,
-            contact_phone=input.contact_phone,
-            secondary_location=sl_dict,
+            info.context["db"], actor=require_authenticated(info), **_station_fields(input)
         )
         return StationType.from_model(station)
 
+    @strawberry.mutation
+    async def bulk_create_stations(
+        self, info: strawberry.types.Info, inputs: list[CreateStationInput]
+    ) -> BulkStationsResult:
+        """Create up to BULK_CREATE_MAX_ROWS stations in one transaction.
+
+        For importing an agency's spreadsheet of shelters or supply points. Requires
+        station.add permission, checked once. Rows that fail validation (geometry, contact
+        lengths) are skipped and listed in `errors`; the rest are created.
+        """
+        result = await station_service.bulk_create_stations(
+            info.context["db"], actor=require_authenticated(info),
+            rows=[_station_fields(i) for i in inputs],
+        )
+        return BulkStationsResult(
+            created=[StationType.from_model(m) for m in result.created],
+            errors=[BulkRowError(index=e.index, message=e.message) for e in result.errors],
+        )
+
     @strawberry.mutation
     async def attach_station_photo(
         self, info: strawberry.types.Info, station_uuid: UUID, url: str
@@ -238,6 +268,7 @@ class StationPropertyMutation:
         matching prior behavior — same tier as map:create previously required).
         Returns the created or updated CrowdSourcingType.
         """
+        await rate_limit(info, CROWD_SOURCING_RATE, "createCrowdSourcing")
         cs = await station_service.rate_station_property(
             info.context["db"], actor=require_authenticated(info),
             station_uuid=input.station_uuid, item_uuid=input.item_uuid,
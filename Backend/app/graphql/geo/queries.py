@@ -12,14 +12,16 @@ import strawberry
 
 from app.core.permissions import Perm
 from app.core.rbac_scopes import Scope, in_scope, scope_filter
-from app.graphql.context import check_permission
+from app.graphql.context import check_permission, read_session
 from app.graphql.geo.types import (
+    STATION_READS,
     BoundsInput,
     ClosureAreaConnection,
     ClosureAreaType,
     StationConnection,
     StationType,
 )
+from app.graphql.projection import projected_columns
 from app.graphql.shared import PageInfo
 from app.models.geo import ClosureArea, Station
 from app.repositories.geo_repository import closure_area_repository, station_repository
@@ -51,18 +53,21 @@ class GeoQuery:
         Returns:
             StationConnection with items and total count / pagination metadata.
         """
-        db = info.context["db"]
+        db = read_session(info)
         scope = await check_permission(info, Perm.STATION_VIEW)
         extra_filters = scope_filter(scope, actor=info.context["user"], model=Station)
         total = await station_repository.count_active(
             db, bounds=bounds, station_type=station_type, extra_filters=extra_filters
         )
-        items = await station_repository.list_active(
-            db, bounds=bounds, station_type=station_type, skip=skip, limit=limit,
-            extra_filters=extra_filters,
-        )
+        page = {
+            "bounds": bounds, "station_type": station_type, "skip": skip, "limit": limit,
+            "extra_filters": extra_filters,
+        }
+        columns = projected_columns(info, Station, STATION_READS)
+        rows = await station_repository.list_active_rows(db, columns, **page)
+        build = StationType.from_model if columns is None else StationType.from_row
         return StationConnection(
-            items=[StationType.from_model(m) for m in items],
+            items=[build(row) for row in rows],
             page_info=PageInfo(
                 total_count=total,
                 has_next_page=(skip + limit) < total,
@@ -77,7 +82,7 @@ class GeoQuery:
         Returns None if not found, soft-deleted, or outside the caller's scope (a scope
         mismatch is indistinguishable from "not found" — no separate error).
         """
-        db = info.context["db"]
+        db = read_session(info)
         scope = await check_permission(info, Perm.STATION_VIEW)
         m = await station_repository.get_by_uuid_active(db, uuid)
         if not m:
@@ -98,11 +103,11 @@ class GeoQuery:
 
         Requires map.view permission (public — Guest may call this).
         """
-        db = info.context["db"]
+        db = read_session(info)
         scope = await check_permission(info, Perm.MAP_VIEW)
         extra_filters = scope_filter(scope, actor=info.context["user"], model=ClosureArea)
         total = await closure_area_repository.count_active(db, bounds=bounds, extra_filters=extra_filters)
-        items = await closure_area_repository.list_active(
+        items = await closure_area_repository.list_active_rows(
             db, bounds=bounds, skip=skip, limit=limit, extra_filters=extra_filters
         )
         return ClosureAreaConnection(
@@ -120,7 +125,7 @@ class GeoQuery:
 
         Returns None if not found, soft-deleted, or outside the caller's scope.
         """
-        db = info.context["db"]
+        db = read_session(info)
         scope = await check_permission(info, Perm.MAP_VIEW)
         m = await closure_area_repository.get_by_uuid_active(db, uuid)
         if not m:
@@ -0,0 +1,41 @@
+"""GraphQL subscription for live station changes.
+
+Read-checked like `stations` (see geo/queries.py): station.view at subscribe time, then each
+change goes through checkpoint 1 again and the object-level `in_scope` check. The pushed
+object is the ordinary StationType, so contact fields are redacted per subscriber.
+"""
+
+from collections.abc import AsyncGenerator
+
+import strawberry
+
+from app.core.permissions import Perm
+from app.graphql.geo.types import BoundsInput, StationChange, StationType
+from app.graphql.subscriptions import changes, watch
+from app.repositories.geo_repository import station_repository
+
+
+@strawberry.type
+class StationSubscription:
+    """GraphQL subscriptions for map stations."""
+
+    @strawberry.subscription
+    async def station_changed(
+        self, info: strawberry.types.Info,
+        bounds: BoundsInput | None = None,
+        zone_uuid: str | None = None,
+    ) -> AsyncGenerator[StationChange]:
+        """Push every station created, updated, rated or deleted from now on.
+
+        Optionally narrowed to stations intersecting `bounds` and/or work zone `zone_uuid`.
+        Stations outside the caller's station.view scope are never pushed.
+        """
+        watching = await watch(info, Perm.STATION_VIEW, bounds, zone_uuid)
+        async for change in changes(info, "station"):
+            m = await station_repository.get_by_uuid(info.context["db"], change.uuid)
+            if m is None or not await watching.sees(info, m):
+                continue
+            deleted = change.op == "deleted" or m.delete_at is not None
+            yield StationChange(
+                op=change.op, uuid=m.uuid, station=None if deleted else StationType.from_model(m)
+            )
@@ -11,8 +11,9 @@ from app.core.permissions import Perm
 from app.core.rbac_scopes import Scope, in_scope
 from app.core.security import resolve_scope
 from app.graphql.masking import mask_email, mask_name, mask_phone
+from app.graphql.projection import PII_COLUMNS, row_values
 from app.graphql.scalars import GeoJSON, geom_to_geojson
-from app.graphql.shared import PageInfo, Visibility
+from app.graphql.shared import BulkRowError, PageInfo, Visibility
 from app.graphql.tickets.types import PhotoType
 
 
@@ -251,6 +252,22 @@ class StationType:
             _geometry_raw=m.geometry,
         )
 
+    @classmethod
+    def from_row(cls, row) -> "StationType":
+        """Build from a projected row holding only the selected columns (app/graphql/projection.py)."""
+        return cls(**row_values(row))
+
+
+# StationType fields whose resolvers read something other than their same-named column.
+STATION_READS: dict[str, tuple[str, ...]] = {
+    "contact_name": ("contact_name", *PII_COLUMNS),
+    "contact_email": ("contact_email", *PII_COLUMNS),
+    "contact_phone": ("contact_phone", *PII_COLUMNS),
+    "photos": (),
+    "secondary_location": (),
+    "properties": (),
+}
+
 
 @strawberry.type
 class StationConnection:
@@ -260,6 +277,25 @@ class StationConnection:
     page_info: PageInfo
 
 
+@strawberry.type
+class BulkStationsResult:
+    """Outcome of `bulkCreateStations`."""
+
+    created: list[StationType] = strawberry.field(
+        description="The new stations, in input order, without the rows listed in `errors`"
+    )
+    errors: list[BulkRowError]
+
+
+@strawberry.type
+class StationChange:
+    """One change pushed by `stationChanged`."""
+
+    op: str = strawberry.field(description="'created', 'updated' or 'deleted'")
+    uuid: UUID
+    station: StationType | None = strawberry.field(description="The station as it is now; null once deleted")
+
+
 @strawberry.input
 class CreateStationInput:
     """Input for creating a new map station."""
@@ -5,11 +5,19 @@ Each loader collapses an N+1 access pattern into a single
 Loaders are constructed fresh by :func:`build_loaders` for every GraphQL
 request via ``app.graphql.context.get_context``; they must NOT be cached
 across requests because DataLoaders memoise their own results.
+
+Loaders are read-only, so they select ``read_columns(model)`` and build the
+Strawberry types straight from Core rows rather than ORM instances. Each batch
+borrows its session: the request's own, or — with GRAPHQL_CONCURRENT_READS — a
+pooled session of its own, so batches of different loaders run in parallel.
 """
 
 from collections import defaultdict
+from collections.abc import Callable
+from contextlib import AbstractAsyncContextManager, nullcontext
+from typing import NamedTuple
 
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from strawberry.dataloader import DataLoader
 
@@ -25,58 +33,72 @@ from app.graphql.tickets.types import (
     TicketTaskType,
 )
 from app.graphql.work_zone.types import AssignedTeamType
+from app.infrastructure.repository.base import read_columns
 from app.models.photo import Photo
 from app.models.secondary_location import SecondaryLocation
 from app.models.station_property import CrowdSourcing, StationProperty
 from app.models.ticket_task import TaskAssignment, TaskProperty, TicketTask
 from app.repositories.team_repository import team_zone_assign_repository
 
+Borrow = Callable[[], AbstractAsyncContextManager[AsyncSession]]
+
 
-def build_loaders(db: AsyncSession) -> dict[str, DataLoader]:
+def build_loaders(db: AsyncSession, open_session: Borrow | None = None) -> dict[str, DataLoader]:
     """Build all nested-field loaders for a single GraphQL request.
 
     Returns a dict keyed by loader name so resolvers can do
-    ``info.context["loaders"]["photos_by_ticket"].load(uuid)``.
+    ``info.context["loaders"]["photos_by_ticket"].load(uuid)``. Batches query on `db`
+    unless `open_session` is given, in which case each batch runs in a session of its own
+    (``async with open_session() as session``).
     """
+    borrow = open_session or (lambda: nullcontext(db))
     return {
         "secondary_location_by_geometry": DataLoader(
             load_fn=_make_one_to_one_loader(
-                db, SecondaryLocation, "geometry_uuid", SecondaryLocationType
+                borrow, SecondaryLocation, "geometry_uuid", SecondaryLocationType
             )
         ),
         "station_properties_by_station": DataLoader(
             load_fn=_make_one_to_many_loader(
-                db, StationProperty, "station_uuid", StationPropertyType
+                borrow, StationProperty, "station_uuid", StationPropertyType
             )
         ),
         "crowd_sourcings_by_property": DataLoader(
             load_fn=_make_one_to_many_loader(
-                db, CrowdSourcing, "item_uuid", CrowdSourcingType
+                borrow, CrowdSourcing, "item_uuid", CrowdSourcingType
             )
         ),
-        "photos_by_ticket": DataLoader(load_fn=_make_photos_by_geometry_loader(db)),
-        "photos_by_station": DataLoader(load_fn=_make_photos_by_geometry_loader(db)),
+        "photos_by_ticket": DataLoader(load_fn=_make_photos_by_geometry_loader(borrow)),
+        "photos_by_station": DataLoader(load_fn=_make_photos_by_geometry_loader(borrow)),
         "tasks_by_ticket": DataLoader(
             load_fn=_make_one_to_many_loader(
-                db, TicketTask, "ticket_uuid", TicketTaskType, soft_delete=True
+                borrow, TicketTask, "ticket_uuid", TicketTaskType, soft_delete=True
             )
         ),
         "task_properties_by_task": DataLoader(
             load_fn=_make_one_to_many_loader(
-                db, TaskProperty, "task_uuid", TaskPropertyType, soft_delete=True
+                borrow, TaskProperty, "task_uuid", TaskPropertyType, soft_delete=True
             )
         ),
         "task_assignments_by_task": DataLoader(
             load_fn=_make_one_to_many_loader(
-                db, TaskAssignment, "task_uuid", TaskAssignmentType
+                borrow, TaskAssignment, "task_uuid", TaskAssignmentType
             )
         ),
-        "teams_by_zone": DataLoader(load_fn=_make_teams_by_zone_loader(db)),
+        "task_progress_by_task": DataLoader(load_fn=_make_task_progress_loader(borrow)),
+        "teams_by_zone": DataLoader(load_fn=_make_teams_by_zone_loader(borrow)),
     }
 
 
+class TaskProgress(NamedTuple):
+    """Assignment counts for one task."""
+
+    assigned: int
+    completed: int
+
+
 def _make_one_to_many_loader(
-    db: AsyncSession, model, parent_column: str, gql_type, soft_delete: bool = False
+    borrow: Borrow, model, parent_column: str, gql_type, soft_delete: bool = False
 ):
     """Build a load function: ``list[parent_uuid] -> list[list[gql_type]]``.
 
@@ -87,10 +109,11 @@ def _make_one_to_many_loader(
     column = getattr(model, parent_column)
 
     async def load_fn(parent_uuids: list[str]) -> list[list]:
-        stmt = select(model).where(column.in_(parent_uuids))
+        stmt = select(*read_columns(model)).where(column.in_(parent_uuids))
         if soft_delete:
             stmt = stmt.where(model.delete_at.is_(None))
-        rows = (await db.execute(stmt)).scalars().all()
+        async with borrow() as db:
+            rows = (await db.execute(stmt)).all()
         grouped: dict[str, list] = defaultdict(list)
         for row in rows:
             grouped[str(getattr(row, parent_column))].append(gql_type.from_model(row))
@@ -100,22 +123,23 @@ def _make_one_to_many_loader(
 
 
 def _make_one_to_one_loader(
-    db: AsyncSession, model, parent_column: str, gql_type
+    borrow: Borrow, model, parent_column: str, gql_type
 ):
     """Build a load function: ``list[parent_uuid] -> list[gql_type | None]``."""
     column = getattr(model, parent_column)
 
     async def load_fn(parent_uuids: list[str]) -> list:
-        rows = (
-            await db.execute(select(model).where(column.in_(parent_uuids)))
-        ).scalars().all()
+        async with borrow() as db:
+            rows = (
+                await db.execute(select(*read_columns(model)).where(column.in_(parent_uuids)))
+            ).all()
         by_parent = {str(getattr(r, parent_column)): gql_type.from_model(r) for r in rows}
         return [by_parent.get(str(uuid)) for uuid in parent_uuids]
 
     return load_fn
 
 
-def _make_photos_by_geometry_loader(db: AsyncSession):
+def _make_photos_by_geometry_loader(borrow: Borrow):
     """Polymorphic photos: filter by ``ref_type='geometry'`` in addition to ref_uuid.
 
     ``ref_uuid`` is a base_geometries.uuid, which is also a ticket's or a station's own
@@ -124,15 +148,13 @@ def _make_photos_by_geometry_loader(db: AsyncSession):
     """
 
     async def load_fn(geometry_uuids: list[str]) -> list[list[PhotoType]]:
-        rows = (
-            await db.execute(
-                select(Photo).where(
-                    Photo.ref_type == "geometry",
-                    Photo.ref_uuid.in_(geometry_uuids),
-                    Photo.delete_at.is_(None),
-                )
-            )
-        ).scalars().all()
+        stmt = select(*read_columns(Photo)).where(
+            Photo.ref_type == "geometry",
+            Photo.ref_uuid.in_(geometry_uuids),
+            Photo.delete_at.is_(None),
+        )
+        async with borrow() as db:
+            rows = (await db.execute(stmt)).all()
         grouped: dict[str, list[PhotoType]] = defaultdict(list)
         for row in rows:
             grouped[str(row.ref_uuid)].append(PhotoType.from_model(row))
@@ -141,11 +163,37 @@ def _make_photos_by_geometry_loader(db: AsyncSession):
     return load_fn
 
 
-def _make_teams_by_zone_loader(db: AsyncSession):
+def _make_task_progress_loader(borrow: Borrow):
+    """Count each task's assignments, and the completed ones, in one ``GROUP BY`` query.
+
+    Backs ``assignedCount`` / ``completedCount`` / ``progress`` without loading the
+    assignment rows themselves; a task with none gets ``TaskProgress(0, 0)``.
+    """
+
+    async def load_fn(task_uuids: list[str]) -> list[TaskProgress]:
+        stmt = (
+            select(
+                TaskAssignment.task_uuid,
+                func.count(),
+                func.count().filter(TaskAssignment.status == "completed"),
+            )
+            .where(TaskAssignment.task_uuid.in_(task_uuids))
+            .group_by(TaskAssignment.task_uuid)
+        )
+        async with borrow() as db:
+            rows = (await db.execute(stmt)).all()
+        by_task = {str(task_uuid): TaskProgress(total, completed) for task_uuid, total, completed in rows}
+        return [by_task.get(str(uuid), TaskProgress(0, 0)) for uuid in task_uuids]
+
+    return load_fn
+
+
+def _make_teams_by_zone_loader(borrow: Borrow):
     """Batch-load the teams each work zone is delegated to (soft-deleted teams excluded)."""
 
     async def load_fn(zone_uuids: list[str]) -> list[list[AssignedTeamType]]:
-        pairs = await team_zone_assign_repository.teams_by_zones(db, list(zone_uuids))
+        async with borrow() as db:
+            pairs = await team_zone_assign_repository.teams_by_zones(db, list(zone_uuids))
         grouped: dict[str, list[AssignedTeamType]] = defaultdict(list)
         for zone_uuid, team in pairs:
             grouped[zone_uuid].append(AssignedTeamType.from_model(team))
@@ -0,0 +1,178 @@
+"""Automatic persisted queries and a parsed-document cache for the GraphQL endpoint.
+
+The frontend sends the same few dozen operations over and over. Two costs went into every
+one of them: the full query text in the request (mobile clients upload it on every call),
+and graphql-core parsing and validating that text from scratch.
+
+`PersistedQueries` implements Apollo's automatic persisted queries. A client sends
+`extensions.persistedQuery.sha256Hash` in place of `query`, via POST or a CDN-cacheable
+GET. On `PersistedQueryNotFound` it retries once with the text, and we register the text
+in Redis under its hash (`apq:<sha256>`). A build-time manifest
+(GRAPHQL_PERSISTED_QUERY_MANIFEST, Apollo's `persisted-query-manifest.json` format) is
+known without registration.
+
+Every document that passes validation is kept, parsed, in a per-process LRU keyed by its
+hash. This covers persisted and plain requests alike. A repeat skips both parsing and
+validation, and a hash-only request skips Redis too.
+
+With GRAPHQL_PERSISTED_ONLY set (production), only manifest operations execute, whether
+sent by hash or as text. Nothing can be registered.
+"""
+
+import hashlib
+import json
+import logging
+from collections import OrderedDict
+from functools import cache
+
+from strawberry.extensions import SchemaExtension
+
+from app.core.config import settings
+from app.core.redis import app_redis
+
+# First-party block per Ruff (see the note in app/graphql/schema.py).
+from graphql import DocumentNode, GraphQLError
+
+logger = logging.getLogger(__name__)
+
+_KEY = "apq:"
+REGISTRY_TTL = 30 * 24 * 3600
+
+_documents: "OrderedDict[str, DocumentNode]" = OrderedDict()
+
+
+def _error(message: str, code: str) -> GraphQLError:
+    return GraphQLError(message, extensions={"code": code})
+
+
+def sha256(query: str) -> str:
+    """The hex sha256 of a query text, as APQ clients compute it."""
+    return hashlib.sha256(query.encode()).hexdigest()
+
+
+@cache
+def manifest() -> dict[str, str]:
+    """Hash -> query text from GRAPHQL_PERSISTED_QUERY_MANIFEST, read once per process.
+
+    Entries whose id is not the sha256 of their body are dropped with a warning, so a
+    stale manifest cannot map a hash to a different operation.
+    """
+    if not settings.GRAPHQL_PERSISTED_QUERY_MANIFEST:
+        return {}
+    with open(settings.GRAPHQL_PERSISTED_QUERY_MANIFEST, encoding="utf-8") as fh:
+        operations = json.load(fh)["operations"]
+    queries = {}
+    for op in operations:
+        if op["id"] == sha256(op["body"]):
+            queries[op["id"]] = op["body"]
+        else:
+            logger.warning("persisted query manifest: id of %r is not its sha256; skipped", op.get("name"))
+    return queries
+
+
+def _require_allowed(query_hash: str) -> None:
+    """In allow-list mode, reject any operation that is not in the manifest."""
+    if settings.GRAPHQL_PERSISTED_ONLY and query_hash not in manifest():
+        raise _error("Only persisted queries are accepted.", "PERSISTED_QUERY_REQUIRED")
+
+
+def cached_document(query_hash: str) -> DocumentNode | None:
+    """The validated document for `query_hash`, marking it most recently used."""
+    document = _documents.get(query_hash)
+    if document is not None:
+        _documents.move_to_end(query_hash)
+    return document
+
+
+def remember_document(query_hash: str, document: DocumentNode) -> None:
+    """Keep a validated document, evicting the least recently used past the cache size."""
+    _documents[query_hash] = document
+    _documents.move_to_end(query_hash)
+    while len(_documents) > settings.GRAPHQL_DOCUMENT_CACHE_SIZE:
+        _documents.popitem(last=False)
+
+
+class PersistedQueries(SchemaExtension):
+    """Resolve persisted-query hashes and serve validated documents from the LRU.
+
+    Must run before every other extension: it may supply the query text, or the parsed
+    document, the others read.
+    """
+
+    _hash: str | None = None  # set when a freshly parsed document should be cached
+    _register: str | None = None  # query text to register once it has validated
+
+    async def on_operation(self):
+        """Turn the request into a (hash, query or cached document) before parsing runs."""
+        ctx = self.execution_context
+        persisted = (ctx.operation_extensions or {}).get("persistedQuery")
+        if ctx.query is None and not isinstance(persisted, dict):
+            yield  # strawberry reports the missing query
+            return
+        query_hash = await self._resolve(persisted)
+        document = cached_document(query_hash)
+        if document is not None:
+            ctx.graphql_document = document
+            ctx.pre_execution_errors = []  # validated when it was cached
+        else:
+            self._hash = query_hash
+        yield
+
+    async def on_validate(self):
+        """Cache a freshly parsed document, and register its text, once it has passed validation."""
+        yield
+        ctx = self.execution_context
+        if self._hash is None or ctx.graphql_document is None or ctx.pre_execution_errors:
+            return
+        remember_document(self._hash, ctx.graphql_document)
+        if self._register is not None:
+            await self._store(self._hash, self._register)
+
+    async def _resolve(self, persisted: dict | None) -> str:
+        """Return the operation's hash, filling in `query` from the registry when absent."""
+        ctx = self.execution_context
+        if persisted is None:
+            query_hash = sha256(ctx.query)
+            _require_allowed(query_hash)
+            return query_hash
+
+        query_hash = persisted.get("sha256Hash")
+        if persisted.get("version") != 1 or not isinstance(query_hash, str):
+            raise _error("Unsupported persisted query version.", "PERSISTED_QUERY_NOT_SUPPORTED")
+        if ctx.query is not None:
+            if sha256(ctx.query) != query_hash:
+                raise _error("provided sha does not match query", "PERSISTED_QUERY_HASH_MISMATCH")
+            _require_allowed(query_hash)
+            if query_hash not in manifest():
+                self._register = ctx.query
+            return query_hash
+
+        if cached_document(query_hash) is not None:
+            return query_hash
+        query = manifest().get(query_hash)
+        if query is None and not settings.GRAPHQL_PERSISTED_ONLY:
+            query = await self._lookup(query_hash)
+        if query is None:
+            raise _error("PersistedQueryNotFound", "PERSISTED_QUERY_NOT_FOUND")
+        ctx.query = query
+        return query_hash
+
+    async def _store(self, query_hash: str, query: str) -> None:
+        redis = app_redis(self.execution_context.context["request"])
+        if redis is None:
+            return
+        try:
+            await redis.set(_KEY + query_hash, query, ex=REGISTRY_TTL)
+        except Exception:
+            logger.warning("persisted query registration failed", exc_info=True)
+
+    async def _lookup(self, query_hash: str) -> str | None:
+        redis = app_redis(self.execution_context.context["request"])
+        if redis is None:
+            return None
+        try:
+            query = await redis.get(_KEY + query_hash)
+        except Exception:
+            logger.warning("persisted query lookup failed", exc_info=True)
+            return None
+        return query.decode() if isinstance(query, bytes) else query
@@ -0,0 +1,82 @@
+"""Selection-aware column projection for list resolvers.
+
+`stations` and `tickets` used to load whole ORM entities through joined-table inheritance
+(`base_geometries` JOIN `stations`/`tickets`) — every text column, plus a geometry decoded
+into GeoJSON — even when the client asked for `items { uuid name }`. These helpers read
+the connection's `items` selection, map it to the model columns those fields need, and
+build the `*Type` straight from the projected Core rows, skipping the identity map and
+(when `geometry` is not selected) the WKB decode.
+"""
+
+from collections.abc import Mapping
+
+from strawberry.types import Info
+from strawberry.types.nodes import FragmentSpread, InlineFragment, SelectedField
+from strawberry.utils.str_converters import to_snake_case
+
+from app.graphql.scalars import geom_to_geojson
+
+# Always loaded: every `*Type` requires them, and the nested loaders key on `uuid`.
+_ALWAYS = ("uuid", "property_name")
+# Masked contact fields, held privately on the type as `_<column>_raw`.
+_PII = ("contact_name", "contact_email", "contact_phone")
+# What the contact_* resolvers read besides their own column: `in_scope` checks a zone
+# scope against the row's geometry and an own scope against its creator.
+PII_COLUMNS = ("created_by", "geometry")
+
+
+def _fields(selections, names: set[str]) -> None:
+    for selection in selections:
+        if isinstance(selection, SelectedField):
+            if not selection.name.startswith("__"):
+                names.add(selection.name)
+        elif isinstance(selection, FragmentSpread | InlineFragment):
+            _fields(selection.selections, names)
+
+
+def _items(selections) -> list | None:
+    """The selections under the connection's `items`, merged across fragments."""
+    found = None
+    for selection in selections:
+        if isinstance(selection, SelectedField) and selection.name == "items":
+            found = (found or []) + selection.selections
+        elif isinstance(selection, FragmentSpread | InlineFragment):
+            nested = _items(selection.selections)
+            if nested is not None:
+                found = (found or []) + nested
+    return found
+
+
+def projected_columns(info: Info, model, reads: Mapping[str, tuple[str, ...]]) -> list | None:
+    """Model columns the connection's selected `items` fields need, or None to load them all.
+
+    `reads` maps a field (snake_case) to the columns its resolver reads when that is not
+    just the same-named column — `()` for loader-backed fields keyed on `uuid`. A selected
+    field that is neither in `reads` nor a mapped column returns None, so an unmapped new
+    field falls back to every column instead of rendering empty.
+    """
+    mapped = model.__mapper__.column_attrs
+    items = _items(info.selected_fields[0].selections)
+    names: set[str] = set()
+    _fields(items or [], names)
+    columns = set(_ALWAYS)
+    for name in map(to_snake_case, names):
+        if name in reads:
+            columns.update(reads[name])
+        elif name in mapped:
+            columns.add(name)
+        else:
+            return None
+    return [getattr(model, column) for column in sorted(columns)]
+
+
+def row_values(row) -> dict:
+    """Constructor kwargs for a `*Type` from a projected row (see StationType.from_row)."""
+    values = dict(row._mapping)
+    if "geometry" in values:
+        values["_geometry_raw"] = values["geometry"]
+        values["geometry"] = geom_to_geojson(values["geometry"])
+    for column in _PII:
+        if column in values:
+            values[f"_{column}_raw"] = values.pop(column)
+    return values
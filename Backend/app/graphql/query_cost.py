@@ -0,0 +1,181 @@
+"""Per-request cost and depth limits for GraphQL operations.
+
+Nothing used to bound one request: `tickets(limit: 10000) { items { tasks { assignments } } }`
+fans out into loader batches over ten thousand tickets, across as many root fields as the
+caller likes, all on the one AsyncSession from `get_context`. `QueryCost` prices the
+operation once it has validated, before any resolver runs, and rejects it when its cost or
+depth exceeds the caller's tier: Guests get the lower GRAPHQL_MAX_*_GUEST limits, logged-in
+callers the GRAPHQL_MAX_*_AUTHENTICATED ones.
+
+The cost is, roughly, how many objects the response can hold. An object field costs the
+number of objects it can return times (its weight plus its own selection's cost); a scalar
+costs its weight. Weights come from FIELD_WEIGHTS, else 1 for objects and 0 for scalars.
+A list's size is:
+
+- the `limit` / `first` argument (literal, variable or schema default), on the list
+  itself or on the connection field above it (`tickets(limit: 50) { items { ... } }`);
+- ASSUMED_LIST_SIZE for any other list, such as a ticket's `tasks` or `photos`.
+
+Depth counts nested fields, ignoring fragments and introspection (`__schema`, `__type`).
+The price is reported under `extensions.cost` in every response, for tuning the limits.
+"""
+
+from strawberry.extensions import SchemaExtension
+
+from app.core.config import settings
+
+# First-party block per Ruff (see the note in app/graphql/schema.py).
+from graphql import (
+    ExecutionResult,
+    FieldNode,
+    FragmentDefinitionNode,
+    FragmentSpreadNode,
+    GraphQLError,
+    GraphQLObjectType,
+    InlineFragmentNode,
+    VariableNode,
+    get_named_type,
+    get_nullable_type,
+    is_list_type,
+)
+from graphql.utilities import get_operation_ast, value_from_ast_untyped
+
+ASSUMED_LIST_SIZE = 10
+_SIZE_ARGS = ("limit", "first")
+
+# "Type.field" -> weight, for fields whose cost is not the default. Scalars listed here
+# are loader- or scope-backed: each one can add a query per batch of parents.
+FIELD_WEIGHTS: dict[str, int] = {
+    "TicketTaskType.assignedCount": 1,
+    "TicketTaskType.completedCount": 1,
+    "TicketTaskType.progress": 1,
+    "TicketType.contactName": 1,
+    "TicketType.contactEmail": 1,
+    "TicketType.contactPhone": 1,
+    "StationType.contactName": 1,
+    "StationType.contactEmail": 1,
+    "StationType.contactPhone": 1,
+}
+
+
+class _Pricer:
+    """Walks one operation's selections, summing cost and tracking the deepest field."""
+
+    def __init__(self, schema, fragments: dict, variables: dict):
+        """Price against `schema` with the request's fragments and variables."""
+        self.schema = schema
+        self.fragments = fragments
+        self.variables = variables
+        self.depth = 0
+
+    def selections(
+        self, parent: GraphQLObjectType, selection_set, depth: int, page: int | None = None
+    ) -> int:
+        """Cost of `selection_set` on `parent`, whose fields sit at `depth`.
+
+        `page` is the `limit` of the connection field that returned `parent`; it sizes the
+        connection's list field.
+        """
+        cost = 0
+        for selection in selection_set.selections:
+            if isinstance(selection, FieldNode):
+                cost += self.field(parent, selection, depth, page)
+            elif isinstance(selection, InlineFragmentNode):
+                condition = selection.type_condition
+                target = self.schema.get_type(condition.name.value) if condition else parent
+                cost += self.selections(target, selection.selection_set, depth, page)
+            elif isinstance(selection, FragmentSpreadNode):
+                fragment = self.fragments[selection.name.value]
+                target = self.schema.get_type(fragment.type_condition.name.value)
+                cost += self.selections(target, fragment.selection_set, depth, page)
+        return cost
+
+    def field(self, parent: GraphQLObjectType, node: FieldNode, depth: int, page: int | None) -> int:
+        """Objects the field can return times (their weight plus their selection's cost)."""
+        name = node.name.value
+        if name.startswith("__"):
+            return 0
+        self.depth = max(self.depth, depth)
+        definition = parent.fields[name]
+        weight = FIELD_WEIGHTS.get(f"{parent.name}.{name}", 1 if node.selection_set else 0)
+        if not node.selection_set:
+            return weight
+        limit = self.limit(definition, node)
+        if is_list_type(get_nullable_type(definition.type)):
+            size = next(n for n in (limit, page, ASSUMED_LIST_SIZE) if n is not None)
+            limit = None
+        else:
+            size = 1  # a connection: its list field takes `limit`
+        child = self.selections(get_named_type(definition.type), node.selection_set, depth + 1, limit)
+        return size * (weight + child)
+
+    def limit(self, definition, node: FieldNode) -> int | None:
+        """The field's `limit` / `first`: literal, variable, or schema default."""
+        for arg in _SIZE_ARGS:
+            if arg in definition.args:
+                value = self.argument(node, arg, definition.args[arg].default_value)
+                if isinstance(value, int):
+                    return max(value, 0)
+        return None
+
+    def argument(self, node: FieldNode, name: str, default):
+        """The argument's literal or variable value, else the schema default."""
+        for argument in node.arguments or ():
+            if argument.name.value == name:
+                if isinstance(argument.value, VariableNode):
+                    value = self.variables.get(argument.value.name.value)
+                else:
+                    value = value_from_ast_untyped(argument.value)
+                return default if value is None else value
+        return default
+
+
+def _limits(user) -> tuple[int, int]:
+    if user is None:
+        return settings.GRAPHQL_MAX_COST_GUEST, settings.GRAPHQL_MAX_DEPTH_GUEST
+    return settings.GRAPHQL_MAX_COST_AUTHENTICATED, settings.GRAPHQL_MAX_DEPTH_AUTHENTICATED
+
+
+class QueryCost(SchemaExtension):
+    """Reject operations over the caller's cost or depth limit; report the price."""
+
+    _result: dict | None = None
+
+    async def on_execute(self):
+        """Price the validated operation; over a limit, answer with the error instead of running it."""
+        ctx = self.execution_context
+        operation = get_operation_ast(ctx.graphql_document, ctx.operation_name)
+        if operation is None or ctx.result is not None:
+            yield
+            return
+        fragments = {
+            d.name.value: d for d in ctx.graphql_document.definitions
+            if isinstance(d, FragmentDefinitionNode)
+        }
+        schema = ctx.schema._schema
+        variables = {
+            d.variable.name.value: value_from_ast_untyped(d.default_value)
+            for d in operation.variable_definitions or () if d.default_value is not None
+        }
+        pricer = _Pricer(schema, fragments, {**variables, **(ctx.variables or {})})
+        cost = pricer.selections(schema.get_root_type(operation.operation), operation.selection_set, 1)
+        max_cost, max_depth = _limits(ctx.context.get("user"))
+        self._result = {
+            "requested": cost, "maximum": max_cost, "depth": pricer.depth, "maximumDepth": max_depth,
+        }
+        if pricer.depth > max_depth:
+            ctx.result = ExecutionResult(data=None, errors=[GraphQLError(
+                f"Query depth {pricer.depth} exceeds the limit of {max_depth}.",
+                extensions={"code": "QUERY_TOO_DEEP", "depth": pricer.depth, "maximumDepth": max_depth},
+            )])
+        elif cost > max_cost:
+            ctx.result = ExecutionResult(data=None, errors=[GraphQLError(
+                f"Query cost {cost} exceeds the limit of {max_cost}; request fewer items"
+                " (a smaller `limit`) or fewer nested fields.",
+                extensions={"code": "QUERY_TOO_COSTLY", "cost": cost, "maximumCost": max_cost},
+            )])
+        yield
+
+    def get_results(self) -> dict:
+        """Expose the operation's price under `extensions.cost`."""
+        return {"cost": self._result} if self._result is not None else {}
@@ -0,0 +1,206 @@
+"""Redis cache of anonymous GraphQL query responses, invalidated by per-entity version counters.
+
+A Guest holds exactly PUBLIC_PERMS at `Scope.ALL` (ADR-025) and every PII field masks for
+them, so an anonymous response depends only on the document, the operation name and the
+variables — never on who asked. The public map and ticket board reload the same handful of
+queries constantly; `ResponseCache` serves repeats from Redis without running a resolver or
+checking out a Postgres connection.
+
+Keys:
+
+- `gqlcache:v:<tag>` — an integer version per entity tag (TAGS), INCRed by every mutation
+  that can change that entity.
+- `gqlcache:r:<sha256>` — the JSON `data` of one response, keyed by the normalized document
+  (`print_ast`, so whitespace and comments don't matter), operation name, canonical
+  variables and the current versions of the tags the operation reads. Bumping a version
+  changes the key, so stale entries are never read again and simply expire.
+
+Only query operations whose root fields are all in CACHEABLE_QUERIES are cached, and only
+when they resolved without errors. A mutation field missing from MUTATION_TAGS bumps every
+tag: a new mutation can make the cache miss more often, never serve stale data. Writes made
+outside GraphQL must call `bump` themselves; RESPONSE_CACHE_TTL_SECONDS bounds the damage
+of one that doesn't.
+
+Best-effort like the user cache: a missing client or a Redis error is a miss, never a
+failed request.
+"""
+
+import hashlib
+import json
+import logging
+
+from strawberry.extensions import SchemaExtension
+
+from app.core.config import settings
+from app.core.redis import app_redis
+
+# First-party block per Ruff (see the note in app/graphql/schema.py).
+from graphql import (
+    ExecutionResult,
+    FieldNode,
+    FragmentDefinitionNode,
+    FragmentSpreadNode,
+    InlineFragmentNode,
+    print_ast,
+)
+from graphql.language import OperationType
+from graphql.utilities import get_operation_ast
+
+logger = logging.getLogger(__name__)
+
+_VERSION = "gqlcache:v:"
+_RESPONSE = "gqlcache:r:"
+
+TAGS = ("geo", "tickets", "announcements")
+
+# Root query field -> the tags its response (nested fields included) can depend on.
+CACHEABLE_QUERIES: dict[str, tuple[str, ...]] = {
+    "stations": ("geo",),
+    "station": ("geo",),
+    "closureAreas": ("geo",),
+    "closureArea": ("geo",),
+    "tickets": ("tickets",),
+    "ticket": ("tickets",),
+    "ticketTasks": ("tickets",),
+    "taskProperties": ("tickets",),
+    "announcements": ("announcements",),
+    "announcement": ("announcements",),
+}
+
+# Root mutation field -> the tags it can change. Empty: nothing a Guest can read.
+MUTATION_TAGS: dict[str, tuple[str, ...]] = {
+    "createStation": ("geo",),
+    "bulkCreateStations": ("geo",),
+    "updateStation": ("geo",),
+    "deleteStation": ("geo",),
+    "attachStationPhoto": ("geo",),
+    "detachStationPhoto": ("geo",),
+    "createClosureArea": ("geo",),
+    "updateClosureArea": ("geo",),
+    "deleteClosureArea": ("geo",),
+    "createStationProperty": ("geo",),
+    "updateStationProperty": ("geo",),
+    "createCrowdSourcing": ("geo",),
+    "createStationSuggestion": (),
+    "reviewStationSuggestion": ("geo",),
+    "createTicket": ("tickets",),
+    "bulkCreateTickets": ("tickets",),
+    "updateTicket": ("tickets",),
+    "reviewTicket": ("tickets",),
+    "deleteTicket": ("tickets",),
+    "createTicketTask": ("tickets",),
+    "bulkCreateTicketTasks": ("tickets",),
+    "updateTicketTask": ("tickets",),
+    "createTaskProperty": ("tickets",),
+    "updateTaskProperty": ("tickets",),
+    "assignTaskActor": ("tickets",),
+    "updateTaskAssignment": ("tickets",),
+    "unassignTaskActor": ("tickets",),
+    "createAnnouncement": ("announcements",),
+    "updateAnnouncement": ("announcements",),
+    "moveAnnouncement": ("announcements",),
+    "setAnnouncementActive": ("announcements",),
+    "deleteAnnouncement": ("announcements",),
+    "upsertStationPropertyConfig": (),
+    "upsertTaskPropertyConfig": (),
+    "createWorkZone": (),
+    "updateWorkZone": (),
+    "assignZoneToTeam": (),
+    "removeZoneFromTeam": (),
+    "deleteWorkZone": (),
+}
+
+
+async def bump(redis, tags) -> None:
+    """Invalidate every cached response that read any of `tags`."""
+    if redis is None or not tags:
+        return
+    try:
+        async with redis.pipeline(transaction=False) as pipe:
+            for tag in tags:
+                pipe.incr(_VERSION + tag)
+            await pipe.execute()
+    except Exception:
+        logger.warning("response cache: version bump for %s failed", sorted(tags), exc_info=True)
+
+
+def _root_fields(selection_set, fragments: dict) -> list[str]:
+    """Names of the operation's root fields, looking through fragments; `__typename` skipped."""
+    names = []
+    for selection in selection_set.selections:
+        if isinstance(selection, FieldNode):
+            if selection.name.value != "__typename":
+                names.append(selection.name.value)
+        elif isinstance(selection, InlineFragmentNode):
+            names += _root_fields(selection.selection_set, fragments)
+        elif isinstance(selection, FragmentSpreadNode):
+            fragment = fragments.get(selection.name.value)
+            if fragment is not None:
+                names += _root_fields(fragment.selection_set, fragments)
+    return names
+
+
+class ResponseCache(SchemaExtension):
+    """Serve repeated anonymous public queries from Redis; bump versions after mutations."""
+
+    async def on_execute(self):
+        """Short-circuit on a hit; store the result on a miss; bump tags after a mutation."""
+        ctx = self.execution_context
+        document = ctx.graphql_document
+        operation = get_operation_ast(document, ctx.operation_name) if document else None
+        if operation is None:
+            yield
+            return
+        fragments = {
+            d.name.value: d for d in document.definitions if isinstance(d, FragmentDefinitionNode)
+        }
+        fields = _root_fields(operation.selection_set, fragments)
+        redis = app_redis(ctx.context["request"])
+
+        if operation.operation is OperationType.MUTATION:
+            yield
+            tags = set()
+            for name in fields:
+                tags.update(MUTATION_TAGS.get(name, TAGS))
+            await bump(redis, tags)
+            return
+
+        cacheable = (
+            ctx.result is None  # e.g. already rejected by QueryCost
+            and operation.operation is OperationType.QUERY
+            and redis is not None
+            and ctx.context["user"] is None
+            and fields
+            and all(name in CACHEABLE_QUERIES for name in fields)
+        )
+        if not cacheable:
+            yield
+            return
+
+        tags = sorted({tag for name in fields for tag in CACHEABLE_QUERIES[name]})
+        key = None
+        try:
+            versions = await redis.mget([_VERSION + tag for tag in tags])
+            key = _RESPONSE + hashlib.sha256(json.dumps(
+                [print_ast(document), ctx.operation_name, ctx.variables, tags, versions],
+                sort_keys=True, default=str,
+            ).encode()).hexdigest()
+            cached = await redis.get(key)
+        except Exception:
+            logger.warning("response cache: lookup failed", exc_info=True)
+            cached = None
+        if cached is not None:
+            ctx.result = ExecutionResult(data=json.loads(cached))
+            yield
+            return
+
+        yield
+        result = ctx.result
+        if key is None or not isinstance(result, ExecutionResult) or result.errors or result.data is None:
+            return
+        try:
+            await redis.set(
+                key, json.dumps(result.data, separators=(",", ":")), ex=settings.RESPONSE_CACHE_TTL_SECONDS
+            )
+        except Exception:
+            logger.warning("response cache: store failed", exc_info=True)
@@ -1,4 +1,4 @@
-"""GraphQL schema definition — composes Query and Mutation types from sub-modules."""
+"""GraphQL schema definition — composes Query, Mutation and Subscription types from sub-modules."""
 
 import strawberry
 from fastapi import HTTPException
@@ -8,12 +8,18 @@ from app.graphql.announcements.mutations import AnnouncementMutation
 from app.graphql.announcements.queries import AnnouncementQuery
 from app.graphql.config.mutations import PropertyConfigMutation
 from app.graphql.config.queries import PropertyConfigQuery
+from app.graphql.context import ReadSessions, WarmSession
 from app.graphql.geo.mutations import GeoMutation, StationPropertyMutation
 from app.graphql.geo.queries import GeoQuery
+from app.graphql.geo.subscriptions import StationSubscription
+from app.graphql.persisted_queries import PersistedQueries
+from app.graphql.query_cost import QueryCost
+from app.graphql.response_cache import ResponseCache
 from app.graphql.suggestions.mutations import SuggestionMutation
 from app.graphql.suggestions.queries import SuggestionQuery
 from app.graphql.tickets.mutations import RequestMutation, TicketTaskMutation
 from app.graphql.tickets.queries import RequestQuery, TicketTaskQuery
+from app.graphql.tickets.subscriptions import TicketSubscription
 from app.graphql.work_zone.mutations import WorkZoneMutation
 from app.graphql.work_zone.queries import WorkZoneQuery
 
@@ -32,6 +38,11 @@ class Mutation(GeoMutation, StationPropertyMutation, RequestMutation, TicketTask
     """Root mutation type composing all domain mutation mixins."""
 
 
+@strawberry.type
+class Subscription(TicketSubscription, StationSubscription):
+    """Root subscription type composing the live-change mixins (served over websockets)."""
+
+
 def _should_mask(error: GraphQLError) -> bool:
     """Allow-list the errors this API raises deliberately; replace every other message.
 
@@ -66,5 +77,12 @@ def _should_mask(error: GraphQLError) -> bool:
 schema = strawberry.Schema(
     query=Query,
     mutation=Mutation,
-    extensions=[MaskErrors(should_mask_error=_should_mask)],
+    subscription=Subscription,
+    # Order matters: PersistedQueries may supply the query or parsed document every later
+    # extension reads; QueryCost (a rejection) or ResponseCache (a hit) may supply the
+    # result, and then no later extension runs a query for it.
+    extensions=[
+        PersistedQueries, QueryCost, ResponseCache, WarmSession, ReadSessions,
+        MaskErrors(should_mask_error=_should_mask),
+    ],
 )
@@ -27,3 +27,11 @@ class PageInfo:
     has_previous_page: bool = strawberry.field(
         description="True if there are records before the current page"
     )
+
+
+@strawberry.type
+class BulkRowError:
+    """An input row a bulk create skipped, and why."""
+
+    index: int = strawberry.field(description="0-based position of the row in the input list")
+    message: str
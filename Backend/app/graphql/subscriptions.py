@@ -0,0 +1,150 @@
+"""Shared plumbing for the live-change subscriptions (tickets/ and geo/ subscriptions.py).
+
+A subscription runs on the websocket's context, built once at connect by `get_context`:
+one AsyncSession, one RBAC cache and one set of loaders for the socket's lifetime, shared
+by every operation multiplexed over it. Three consequences shape these helpers:
+
+- The session must not pin a Postgres connection while the subscriber idles, so each
+  change is handled between an `open` and a `close` of the session (`changes`), and the
+  RBAC check and area lookup at subscribe time likewise (`watch`).
+- Operations on one socket would otherwise run queries on that session concurrently,
+  which SQLAlchemy forbids; a per-socket lock serialises them.
+- Loaders memoise for their lifetime, so each change gets a fresh set: a subscriber must
+  see the row as it is now, not as it was at the previous change.
+- Likewise authorization: before each change the subscriber's token is re-checked
+  (expiry, revoked session) and its user reloaded, and the RBAC cache starts empty, so a
+  revoked grant or a move out of a team or zone applies to the next push, row scope and
+  PII masking alike. An expired or revoked token ends the subscription with a 401.
+
+Browsers cannot set headers on a websocket, so a caller who did not send `Authorization`
+on the upgrade can send it in the `connection_init` payload instead, as clients such as
+graphql-ws do with `connectionParams: {Authorization: "Bearer ..."}`.
+"""
+
+import asyncio
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+
+from fastapi import HTTPException
+from geoalchemy2.shape import to_shape
+from shapely.geometry import box
+from shapely.geometry.base import BaseGeometry
+
+from app.core.live_events import Change, live_events
+from app.core.permissions import Perm
+from app.core.rbac_scopes import Scope, in_scope
+from app.core.security import get_current_user
+from app.graphql.context import check_permission
+from app.graphql.geo.types import BoundsInput
+from app.graphql.loaders import build_loaders
+from app.repositories.team_repository import work_zone_repository
+
+
+def _lock(info) -> asyncio.Lock:
+    return info.context.setdefault("_live_lock", asyncio.Lock())
+
+
+def _bearer(context) -> str:
+    """The socket's access token: the upgrade's Authorization header, else connection_init's."""
+    request = context.get("request")
+    auth = request.headers.get("Authorization", "") if request is not None else ""
+    if not auth.startswith("Bearer "):
+        auth = (context.get("connection_params") or {}).get("Authorization", "")
+    return auth[7:] if auth.startswith("Bearer ") else ""
+
+
+@dataclass
+class Watch:
+    """What one subscriber asked for: the capability a pushed row needs and the area."""
+
+    perm: Perm
+    area: BaseGeometry | None
+
+    def covers(self, geometry) -> bool:
+        """Whether `geometry` falls in the watched area (always, when none was asked for)."""
+        return self.area is None or (geometry is not None and self.area.intersects(to_shape(geometry)))
+
+    async def scope(self, info) -> Scope:
+        """The subscriber's scope for `perm` as of the change being handled; NONE once revoked."""
+        try:
+            return await check_permission(info, self.perm)
+        except HTTPException:
+            return Scope.NONE
+
+    async def sees(self, info, resource) -> bool:
+        """Whether a changed row reaches this subscriber: in the area and in its current scope."""
+        if not self.covers(resource.geometry):
+            return False
+        scope = await self.scope(info)
+        if scope in (Scope.ALL, Scope.NONE):
+            return scope == Scope.ALL
+        user = info.context["user"]
+        db = info.context["db"]
+        return user is not None and await in_scope(scope, actor=user, resource=resource, db=db)
+
+
+async def watch(info, perm: Perm, bounds: BoundsInput | None, zone_uuid: str | None) -> Watch:
+    """Authenticate the socket if needed, run checkpoint 1 and resolve the watched area.
+
+    Raises:
+        HTTPException: 401 for a bad `connection_init` token, 403 without `perm`.
+        ValueError: "Work zone not found" for an unknown or deleted `zone_uuid`.
+    """
+    context = info.context
+    async with _lock(info):
+        try:
+            if context["user"] is None and (token := _bearer(context)):
+                context["user"] = await get_current_user(
+                    request=context["request"], db=context["db"], token=token
+                )
+            await check_permission(info, perm)
+            shapes = []
+            if bounds is not None:
+                shapes.append(box(bounds.min_lng, bounds.min_lat, bounds.max_lng, bounds.max_lat))
+            if zone_uuid is not None:
+                zone = await work_zone_repository.get_by_uuid(context["db"], zone_uuid)
+                if zone is None or zone.delete_at is not None:
+                    raise ValueError("Work zone not found")
+                shapes.append(to_shape(zone.geometry))
+        finally:
+            await context["db"].close()
+    area = None
+    for shape in shapes:
+        area = shape if area is None else area.intersection(shape)
+    return Watch(perm, area)
+
+
+async def _reauthenticate(context) -> None:
+    """Re-validate a signed-in subscriber's token and reload its user for the next change.
+
+    Raises:
+        HTTPException: 401 once the token has expired or its session was revoked.
+    """
+    if context["user"] is not None:
+        context["user"] = await get_current_user(
+            request=context["request"], db=context["db"], token=_bearer(context)
+        )
+
+
+async def changes(info, kind: str) -> AsyncIterator[Change]:
+    """Each `kind` change committed from now on, with the socket's auth, session and loaders fresh.
+
+    The subscriber handles a change between one yield and the next, holding the socket's
+    lock; the session is closed (its connection returned to the pool) afterwards.
+
+    Raises:
+        HTTPException: 401 when the subscriber's token expired or was revoked since the
+            previous change; the subscription ends with it.
+    """
+    context = info.context
+    async with live_events.subscribe(kind) as queue:
+        while True:
+            change = await queue.get()
+            async with _lock(info):
+                try:
+                    await _reauthenticate(context)
+                    context["_rbac_cache"] = {}
+                    context["loaders"] = build_loaders(context["db"])
+                    yield change
+                finally:
+                    await context["db"].close()
@@ -8,13 +8,17 @@ from uuid import UUID
 
 import strawberry
 
-from app.graphql.context import require_authenticated
+from app.core.rate_limit import RateLimit
+from app.graphql.context import rate_limit, require_authenticated
 from app.graphql.suggestions.types import (
     CreateStationSuggestionInput,
     StationSuggestionType,
 )
 from app.services import suggestion as suggestion_service
 
+# Crowd input is the spam target after a disaster; one suggestion every 2s per user is plenty.
+SUGGESTION_RATE = RateLimit(30, 60)
+
 
 @strawberry.type
 class SuggestionMutation:
@@ -30,6 +34,7 @@ class SuggestionMutation:
         unlike station.review). Verifies the target exists and that the field/value are
         valid for the target type. The suggestion starts in 'pending' until an admin reviews it.
         """
+        await rate_limit(info, SUGGESTION_RATE, "createStationSuggestion")
         suggestion = await suggestion_service.create_station_suggestion(
             info.context["db"], actor=require_authenticated(info),
             target_type=input.target_type, target_uuid=str(input.target_uuid),
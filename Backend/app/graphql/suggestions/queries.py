@@ -3,7 +3,7 @@
 import strawberry
 
 from app.core.permissions import Perm
-from app.graphql.context import check_permission, require_authenticated
+from app.graphql.context import check_permission, read_session, require_authenticated
 from app.graphql.suggestions.fields import SUGGESTABLE_FIELDS, VALID_TARGET_TYPES
 from app.graphql.suggestions.types import StationSuggestionType, SuggestableFieldType
 from app.repositories.geo_repository import station_suggestion_repository
@@ -40,6 +40,6 @@ class SuggestionQuery:
         require_authenticated(info)  # STATION_VIEW is in PUBLIC_PERMS; the review queue is not public
         await check_permission(info, Perm.STATION_VIEW)
         items = await station_suggestion_repository.list_active(
-            info.context["db"], status=status, target_uuid=target_uuid, skip=skip, limit=limit
+            read_session(info), status=status, target_uuid=target_uuid, skip=skip, limit=limit
         )
         return [StationSuggestionType.from_model(s) for s in items]
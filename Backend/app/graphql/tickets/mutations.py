@@ -10,7 +10,10 @@ from uuid import UUID
 import strawberry
 
 from app.graphql.context import require_authenticated
+from app.graphql.shared import BulkRowError
 from app.graphql.tickets.types import (
+    BulkTicketsResult,
+    BulkTicketTasksResult,
     CreateTaskPropertyInput,
     CreateTicketInput,
     CreateTicketTaskInput,
@@ -26,6 +29,26 @@ from app.graphql.tickets.types import (
 from app.services import ticket as ticket_service
 
 
+def _ticket_fields(input: CreateTicketInput) -> dict:
+    """`create_ticket`'s keyword arguments from its GraphQL input."""
+    return {
+        "geometry": input.geometry, "title": input.title, "description": input.description,
+        "contact_name": input.contact_name, "contact_email": input.contact_email,
+        "contact_phone": input.contact_phone, "priority": input.priority,
+        "task_type": input.task_type, "visibility": input.visibility.value,
+        "disaster_type": input.disaster_type,
+    }
+
+
+def _task_fields(input: CreateTicketTaskInput) -> dict:
+    """`create_ticket_task`'s keyword arguments from its GraphQL input."""
+    return {
+        "ticket_uuid": input.ticket_uuid, "task_type": input.task_type, "task_name": input.task_name,
+        "task_description": input.task_description, "quantity": input.quantity,
+        "source": input.source, "visibility": input.visibility.value, "route_uuid": input.route_uuid,
+    }
+
+
 @strawberry.type
 class RequestMutation:
     """Mutations for creating and updating disaster relief support tickets."""
@@ -37,15 +60,28 @@ class RequestMutation:
         Requires ticket.add permission. Returns the created TicketType.
         """
         ticket = await ticket_service.create_ticket(
-            info.context["db"], actor=require_authenticated(info),
-            geometry=input.geometry, title=input.title, description=input.description,
-            contact_name=input.contact_name, contact_email=input.contact_email,
-            contact_phone=input.contact_phone, priority=input.priority,
-            task_type=input.task_type, visibility=input.visibility.value,
-            disaster_type=input.disaster_type,
+            info.context["db"], actor=require_authenticated(info), **_ticket_fields(input)
         )
         return TicketType.from_model(ticket)
 
+    @strawberry.mutation
+    async def bulk_create_tickets(
+        self, info: strawberry.types.Info, inputs: list[CreateTicketInput]
+    ) -> BulkTicketsResult:
+        """Create up to BULK_CREATE_MAX_ROWS tickets in one transaction.
+
+        Requires ticket.add permission, checked once. Rows that fail validation are
+        skipped and listed in `errors`; the rest are created.
+        """
+        result = await ticket_service.bulk_create_tickets(
+            info.context["db"], actor=require_authenticated(info),
+            rows=[_ticket_fields(i) for i in inputs],
+        )
+        return BulkTicketsResult(
+            created=[TicketType.from_model(m) for m in result.created],
+            errors=[BulkRowError(index=e.index, message=e.message) for e in result.errors],
+        )
+
     @strawberry.mutation
     async def update_ticket(
         self, info: strawberry.types.Info, uuid: UUID, input: UpdateTicketInput
@@ -120,13 +156,28 @@ class TicketTaskMutation:
         Returns the created TicketTaskType.
         """
         task = await ticket_service.create_ticket_task(
-            info.context["db"], actor=require_authenticated(info),
-            ticket_uuid=input.ticket_uuid, task_type=input.task_type, task_name=input.task_name,
-            task_description=input.task_description, quantity=input.quantity,
-            source=input.source, visibility=input.visibility.value, route_uuid=input.route_uuid,
+            info.context["db"], actor=require_authenticated(info), **_task_fields(input)
         )
         return TicketTaskType.from_model(task)
 
+    @strawberry.mutation
+    async def bulk_create_ticket_tasks(
+        self, info: strawberry.types.Info, inputs: list[CreateTicketTaskInput]
+    ) -> BulkTicketTasksResult:
+        """Create up to BULK_CREATE_MAX_ROWS tasks, under any number of tickets, in one transaction.
+
+        Requires ticket.add permission, checked once. Rows whose ticket does not exist are
+        skipped and listed in `errors`; the rest are created.
+        """
+        result = await ticket_service.bulk_create_ticket_tasks(
+            info.context["db"], actor=require_authenticated(info),
+            rows=[_task_fields(i) for i in inputs],
+        )
+        return BulkTicketTasksResult(
+            created=[TicketTaskType.from_model(m) for m in result.created],
+            errors=[BulkRowError(index=e.index, message=e.message) for e in result.errors],
+        )
+
     @strawberry.mutation
     async def update_ticket_task(
         self, info: strawberry.types.Info, uuid: UUID, input: UpdateTicketTaskInput
@@ -13,10 +13,12 @@ import strawberry
 
 from app.core.permissions import Perm
 from app.core.rbac_scopes import Scope, in_scope, scope_filter
-from app.graphql.context import check_permission
+from app.graphql.context import check_permission, read_session
 from app.graphql.geo.types import BoundsInput
+from app.graphql.projection import projected_columns
 from app.graphql.shared import PageInfo
 from app.graphql.tickets.types import (
+    TICKET_READS,
     TaskPropertyType,
     TicketConnection,
     TicketTaskType,
@@ -52,18 +54,21 @@ class RequestQuery:
         separately in tickets/types.py (contact_* resolvers). (gov/ngo scope was removed
         in ADR-049.)
         """
-        db = info.context["db"]
+        db = read_session(info)
         scope = await check_permission(info, Perm.TICKET_VIEW)
         extra_filters = scope_filter(scope, actor=info.context["user"], model=Tickets)
         total = await ticket_repository.count_active(
             db, bounds=bounds, status=status, priority=priority, extra_filters=extra_filters
         )
-        items = await ticket_repository.list_active(
-            db, bounds=bounds, status=status, priority=priority, skip=skip, limit=limit,
-            extra_filters=extra_filters,
-        )
+        page = {
+            "bounds": bounds, "status": status, "priority": priority, "skip": skip, "limit": limit,
+            "extra_filters": extra_filters,
+        }
+        columns = projected_columns(info, Tickets, TICKET_READS)
+        rows = await ticket_repository.list_active_rows(db, columns, **page)
+        build = TicketType.from_model if columns is None else TicketType.from_row
         return TicketConnection(
-            items=[TicketType.from_model(m) for m in items],
+            items=[build(row) for row in rows],
             page_info=PageInfo(
                 total_count=total,
                 has_next_page=(skip + limit) < total,
@@ -80,7 +85,7 @@ class RequestQuery:
         fields are separately redacted per-field regardless of this check — see
         TicketType.contact_name/contact_email/contact_phone.
         """
-        db = info.context["db"]
+        db = read_session(info)
         scope = await check_permission(info, Perm.TICKET_VIEW)
         m = await ticket_repository.get_by_uuid_active(db, uuid)
         if not m:
@@ -111,7 +116,7 @@ class TicketTaskQuery:
         """
         await check_permission(info, Perm.TICKET_VIEW)
         items = await ticket_task_repository.list_by_ticket(
-            info.context["db"], ticket_uuid, status=status, skip=skip, limit=limit
+            read_session(info), ticket_uuid, status=status, skip=skip, limit=limit
         )
         return [TicketTaskType.from_model(t) for t in items]
 
@@ -124,5 +129,5 @@ class TicketTaskQuery:
         Requires ticket.view permission (public — Guest may call this). Checkpoint 1 only.
         """
         await check_permission(info, Perm.TICKET_VIEW)
-        items = await task_property_repository.list_by_task(info.context["db"], task_uuid)
+        items = await task_property_repository.list_by_task(read_session(info), task_uuid)
         return [TaskPropertyType.from_model(p) for p in items]
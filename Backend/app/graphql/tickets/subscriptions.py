@@ -0,0 +1,75 @@
+"""GraphQL subscriptions for live ticket and ticket-task changes.
+
+Read-checked like the queries (see tickets/queries.py): ticket.view at subscribe time, then
+each ticket change goes through it again and the object-level `in_scope` check of `ticket`.
+Task changes need checkpoint 1 only, as `ticketTasks` does, re-checked per change. The
+pushed objects are the ordinary TicketType / TicketTaskType, so contact fields are redacted
+per subscriber.
+"""
+
+from collections.abc import AsyncGenerator
+
+import strawberry
+
+from app.core.permissions import Perm
+from app.core.rbac_scopes import Scope
+from app.graphql.geo.types import BoundsInput
+from app.graphql.subscriptions import changes, watch
+from app.graphql.tickets.types import TaskChange, TicketChange, TicketTaskType, TicketType
+from app.repositories.tickets_repository import ticket_repository, ticket_task_repository
+
+
+@strawberry.type
+class TicketSubscription:
+    """GraphQL subscriptions for support tickets and their tasks."""
+
+    @strawberry.subscription
+    async def ticket_changed(
+        self, info: strawberry.types.Info,
+        bounds: BoundsInput | None = None,
+        zone_uuid: str | None = None,
+    ) -> AsyncGenerator[TicketChange]:
+        """Push every ticket created, updated or deleted from now on.
+
+        Optionally narrowed to tickets intersecting `bounds` and/or work zone `zone_uuid`.
+        Tickets outside the caller's ticket.view scope are never pushed.
+        """
+        watching = await watch(info, Perm.TICKET_VIEW, bounds, zone_uuid)
+        async for change in changes(info, "ticket"):
+            m = await ticket_repository.get_by_uuid(info.context["db"], change.uuid)
+            if m is None or not await watching.sees(info, m):
+                continue
+            deleted = change.op == "deleted" or m.delete_at is not None
+            yield TicketChange(
+                op=change.op, uuid=m.uuid, ticket=None if deleted else TicketType.from_model(m)
+            )
+
+    @strawberry.subscription
+    async def task_changed(
+        self, info: strawberry.types.Info,
+        ticket_uuid: str | None = None,
+        bounds: BoundsInput | None = None,
+        zone_uuid: str | None = None,
+    ) -> AsyncGenerator[TaskChange]:
+        """Push every ticket-task change (including its properties and assignments) from now on.
+
+        Optionally narrowed to one ticket's tasks, and/or to tasks whose ticket intersects
+        `bounds` / work zone `zone_uuid`.
+        """
+        watching = await watch(info, Perm.TICKET_VIEW, bounds, zone_uuid)
+        async for change in changes(info, "task"):
+            if await watching.scope(info) == Scope.NONE:
+                continue
+            db = info.context["db"]
+            m = await ticket_task_repository.get_by_uuid(db, change.uuid)
+            if m is None or (ticket_uuid is not None and str(m.ticket_uuid) != ticket_uuid):
+                continue
+            if watching.area is not None:
+                ticket = await ticket_repository.get_by_uuid(db, m.ticket_uuid)
+                if ticket is None or not watching.covers(ticket.geometry):
+                    continue
+            deleted = change.op == "deleted" or m.delete_at is not None
+            yield TaskChange(
+                op=change.op, uuid=m.uuid, ticket_uuid=str(m.ticket_uuid),
+                task=None if deleted else TicketTaskType.from_model(m),
+            )
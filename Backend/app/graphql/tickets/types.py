@@ -12,8 +12,9 @@ from app.core.permissions import Perm
 from app.core.rbac_scopes import Scope, in_scope
 from app.core.security import resolve_scope
 from app.graphql.masking import mask_email, mask_name, mask_phone
+from app.graphql.projection import PII_COLUMNS, row_values
 from app.graphql.scalars import GeoJSON, geom_to_geojson
-from app.graphql.shared import PageInfo, Visibility
+from app.graphql.shared import BulkRowError, PageInfo, Visibility
 
 
 @strawberry.enum
@@ -182,14 +183,14 @@ class TicketTaskType:
     @strawberry.field
     async def assigned_count(self, info: strawberry.types.Info) -> int:
         """Number of people currently linked to this task."""
-        rows = await info.context["loaders"]["task_assignments_by_task"].load(str(self.uuid))
-        return len(rows)
+        counts = await info.context["loaders"]["task_progress_by_task"].load(str(self.uuid))
+        return counts.assigned
 
     @strawberry.field
     async def completed_count(self, info: strawberry.types.Info) -> int:
         """Number of assignments that have reached 'completed' status."""
-        rows = await info.context["loaders"]["task_assignments_by_task"].load(str(self.uuid))
-        return sum(1 for a in rows if a.status == "completed")
+        counts = await info.context["loaders"]["task_progress_by_task"].load(str(self.uuid))
+        return counts.completed
 
     @strawberry.field
     async def progress(self, info: strawberry.types.Info) -> float | None:
@@ -200,9 +201,8 @@ class TicketTaskType:
         """
         if not self.quantity:
             return None
-        rows = await info.context["loaders"]["task_assignments_by_task"].load(str(self.uuid))
-        completed = sum(1 for a in rows if a.status == "completed")
-        return min(1.0, completed / self.quantity)
+        counts = await info.context["loaders"]["task_progress_by_task"].load(str(self.uuid))
+        return min(1.0, counts.completed / self.quantity)
 
     @classmethod
     def from_model(cls, m) -> "TicketTaskType":
@@ -453,6 +453,21 @@ class TicketType:
             _geometry_raw=m.geometry,
         )
 
+    @classmethod
+    def from_row(cls, row) -> "TicketType":
+        """Build from a projected row holding only the selected columns (app/graphql/projection.py)."""
+        return cls(**row_values(row))
+
+
+# TicketType fields whose resolvers read something other than their same-named column.
+TICKET_READS: dict[str, tuple[str, ...]] = {
+    "contact_name": ("contact_name", *PII_COLUMNS),
+    "contact_email": ("contact_email", *PII_COLUMNS),
+    "contact_phone": ("contact_phone", *PII_COLUMNS),
+    "photos": (),
+    "tasks": (),
+}
+
 
 @strawberry.type
 class TicketConnection:
@@ -462,6 +477,45 @@ class TicketConnection:
     page_info: PageInfo
 
 
+@strawberry.type
+class BulkTicketsResult:
+    """Outcome of `bulkCreateTickets`."""
+
+    created: list[TicketType] = strawberry.field(
+        description="The new tickets, in input order, without the rows listed in `errors`"
+    )
+    errors: list[BulkRowError]
+
+
+@strawberry.type
+class BulkTicketTasksResult:
+    """Outcome of `bulkCreateTicketTasks`."""
+
+    created: list[TicketTaskType] = strawberry.field(
+        description="The new tasks, in input order, without the rows listed in `errors`"
+    )
+    errors: list[BulkRowError]
+
+
+@strawberry.type
+class TicketChange:
+    """One change pushed by `ticketChanged`."""
+
+    op: str = strawberry.field(description="'created', 'updated' or 'deleted'")
+    uuid: UUID
+    ticket: TicketType | None = strawberry.field(description="The ticket as it is now; null once deleted")
+
+
+@strawberry.type
+class TaskChange:
+    """One change pushed by `taskChanged`."""
+
+    op: str = strawberry.field(description="'created', 'updated' or 'deleted'")
+    uuid: UUID
+    ticket_uuid: str
+    task: TicketTaskType | None = strawberry.field(description="The task as it is now; null once deleted")
+
+
 @strawberry.input
 class CreateTicketInput:
     """Input for creating a new support ticket."""
@@ -14,7 +14,7 @@ from uuid import UUID
 import strawberry
 
 from app.core.permissions import Perm
-from app.graphql.context import check_permission
+from app.graphql.context import check_permission, read_session
 from app.graphql.shared import PageInfo
 from app.graphql.work_zone.types import WorkZoneConnection, WorkZoneType
 from app.repositories.team_repository import work_zone_repository
@@ -29,7 +29,7 @@ class WorkZoneQuery:
         self, info: strawberry.types.Info, skip: int = 0, limit: int = 50,
     ) -> WorkZoneConnection:
         """List work zones, newest first. Requires work_zone.view permission."""
-        db = info.context["db"]
+        db = read_session(info)
         await check_permission(info, Perm.ZONE_VIEW)
         total = await work_zone_repository.count_all(db)
         items = await work_zone_repository.list_all(db, skip=skip, limit=limit)
@@ -45,7 +45,7 @@ class WorkZoneQuery:
     @strawberry.field
     async def work_zone(self, info: strawberry.types.Info, uuid: UUID) -> WorkZoneType | None:
         """Fetch a single non-deleted work zone by UUID. Requires work_zone.view permission."""
-        db = info.context["db"]
+        db = read_session(info)
         await check_permission(info, Perm.ZONE_VIEW)
         m = await work_zone_repository.get_by_uuid_active(db, uuid)
         return WorkZoneType.from_model(m) if m else None
@@ -66,7 +66,7 @@ class WorkZoneQuery:
         (design §4.3). A real mitigation needs a new predicate meaning "zones delegated to my
         team" plus this resolver consuming the scope it is handed.
         """
-        db = info.context["db"]
+        db = read_session(info)
         await check_permission(info, Perm.ZONE_VIEW)
         total = await work_zone_repository.count_by_team(db, team_uuid=str(team_uuid))
         items = await work_zone_repository.list_by_team(
@@ -1,8 +1,15 @@
-"""Generic async SQLAlchemy repository providing standard CRUD operations."""
+"""Generic async SQLAlchemy repository providing standard CRUD operations.
 
+Read-only list paths can skip the ORM: `read_columns(model)` selects every mapped column
+as a plain Core select, returning `Row`s — no instance construction, attribute
+instrumentation or identity-map entry per row. A `Row` exposes the same attribute names
+as the entity, so the GraphQL `from_model` builders accept either.
+"""
+
+from functools import cache
 from typing import Any, Generic, TypeVar
 
-from sqlalchemy import asc, delete, desc, func, select
+from sqlalchemy import asc, delete, desc, func, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.session import Base
@@ -10,6 +17,12 @@ from app.db.session import Base
 ModelType = TypeVar("ModelType", bound=Base)
 
 
+@cache
+def read_columns(model) -> tuple:
+    """Every mapped column attribute of `model`, for a Core select that yields `Row`s."""
+    return tuple(getattr(model, attr.key) for attr in model.__mapper__.column_attrs)
+
+
 class GenericRepository(Generic[ModelType]):
     """Base repository with get, list, count, create, update, and delete."""
 
@@ -34,8 +47,27 @@ class GenericRepository(Generic[ModelType]):
             sort_desc: bool = False
     ) -> list[ModelType]:
         """DataTable 核心邏輯：支援動態過濾、分頁與排序。"""
-        query = select(self.model)
+        query = self._multi_query(select(self.model), filters, sort_by, sort_desc)
+        result = await db.execute(query.offset(skip).limit(limit))
+        return result.scalars().all()
 
+    async def get_multi_rows(
+            self,
+            db: AsyncSession,
+            columns=None,
+            *,
+            skip: int = 0,
+            limit: int = 100,
+            filters: dict[str, Any] | None = None,
+            sort_by: str | None = None,
+            sort_desc: bool = False
+    ) -> list:
+        """`get_multi` for read-only callers: `Row`s of `columns` (default all), no ORM instances."""
+        query = self._multi_query(select(*(columns or read_columns(self.model))), filters, sort_by, sort_desc)
+        result = await db.execute(query.offset(skip).limit(limit))
+        return result.all()
+
+    def _multi_query(self, query, filters: dict[str, Any] | None, sort_by: str | None, sort_desc: bool):
         # 1. 處理過濾 (簡單的等值過濾，可擴充為更複雜的運算)
         if filters:
             for field, value in filters.items():
@@ -45,17 +77,11 @@ class GenericRepository(Generic[ModelType]):
         # 2. 處理排序
         if sort_by and hasattr(self.model, sort_by):
             order_fn = desc if sort_desc else asc
-            query = query.order_by(order_fn(getattr(self.model, sort_by)))
-        else:
-            # 預設排序 (若有 created_at)
-            if hasattr(self.model, "created_at"):
-                query = query.order_by(desc(self.model.created_at))
-
-        # 3. 分頁
-        query = query.offset(skip).limit(limit)
-
-        result = await db.execute(query)
-        return result.scalars().all()
+            return query.order_by(order_fn(getattr(self.model, sort_by)))
+        # 預設排序 (若有 created_at)
+        if hasattr(self.model, "created_at"):
+            return query.order_by(desc(self.model.created_at))
+        return query
 
     async def count(self, db: AsyncSession, filters: dict[str, Any] = None) -> int:
         """Count records matching optional equality filters."""
@@ -79,6 +105,18 @@ class GenericRepository(Generic[ModelType]):
         await db.flush()
         return db_obj
 
+    async def add_many(self, db: AsyncSession, rows: list[dict[str, Any]]) -> list[ModelType]:
+        """Insert `rows` as multi-row INSERT ... RETURNING statements, flush-only like `add`.
+
+        One statement per table, not one per row: a joined-table model (Station, Tickets)
+        inserts its `base_geometries` rows first and its own table's second. Returns the
+        new instances, every column loaded from RETURNING, in `rows` order.
+        """
+        if not rows:
+            return []
+        query = insert(self.model).returning(self.model, sort_by_parameter_order=True)
+        return list((await db.scalars(query, rows)).all())
+
     async def create(self, db: AsyncSession, *, obj_in: dict[str, Any]) -> ModelType:
         """Insert a new record and return the refreshed instance."""
         db_obj = self.model(**obj_in)
@@ -1,14 +1,12 @@
 """FastAPI application entry point — wires up middleware, routers, and startup lifecycle."""
 
 import logging
-import os
 import sys
 from contextlib import asynccontextmanager
 
 import redis.asyncio as aioredis
 from fastapi import Depends, FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from pyrate_limiter import Duration, Limiter, Rate
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -16,8 +14,17 @@ from app.api.v1.api import api_router
 from app.core import security
 from app.core.config import settings
 from app.core.context import AuditContextMiddleware
+from app.core.http_clients import HttpClients
+from app.core.live_events import live_events
 from app.core.redis import get_redis
+from app.core.revocation import RevocationListener
+from app.core.security import pwd_manager
 from app.graphql.router import graphql_router
+from app.messaging.email import build_email_sender
+from app.messaging.outbox import Outbox, OutboxWorker
+from app.messaging.sms import build_sms_sender
+from app.repositories.session_repository import SessionRepository
+from app.repositories.verification_repository import VerificationRepository
 
 # Route the app's loggers (e.g. the app.email / app.sms console senders) to stdout at INFO so dev
 # verification codes are visible in `docker compose logs backend`. uvicorn configures only its own
@@ -36,14 +43,27 @@ if not _app_logger.handlers:
 async def lifespan(app: FastAPI):
     """Manage application startup and shutdown lifecycle."""
     # --- startup (previously @app.on_event("startup")) ---
-    env = os.getenv("ENV", "development")
-    rate_val = 100 if env != "testing" else 999999
-    app.state.limiter = Limiter(Rate(rate_val, Duration.MINUTE))
     app.state.redis = aioredis.from_url(settings.REDIS_URL, decode_responses=False)
+    await SessionRepository.load_scripts(app.state.redis)
+    await VerificationRepository.load_scripts(app.state.redis)
+    revocation_listener = RevocationListener(app.state.redis)
+    revocation_listener.start()
+    live_events.start(app.state.redis)
+    app.state.http_clients = HttpClients()
+    app.state.outbox = Outbox(app.state.redis)
+    outbox_worker = OutboxWorker(app.state.redis, {
+        "email": build_email_sender(app.state.http_clients), "sms": build_sms_sender(),
+    })
+    outbox_worker.start()
     yield
     # --- shutdown (previously @app.on_event("shutdown")) ---
+    await outbox_worker.stop()
+    await live_events.stop()
+    await revocation_listener.stop()
+    await app.state.http_clients.aclose()
     if hasattr(app.state, "redis"):
         await app.state.redis.aclose()
+    pwd_manager.pool.shutdown()
 
 
 app = FastAPI(
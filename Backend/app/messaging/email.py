@@ -9,9 +9,14 @@ inline attachment by the SMTP2Go adapter) so it renders without any external ima
 """
 
 import logging
+from collections.abc import Callable
 from typing import Protocol
 
+from fastapi import Depends, Request
+
 from app.core.config import settings
+from app.core.http_clients import HttpClients, get_http_clients
+from app.messaging.outbox import OutboxEmailSender
 
 logger = logging.getLogger("app.email")
 
@@ -100,8 +105,8 @@ def _render_email(*, h1: str, notices: list[str], footer_lines: list[str],
     )
 
 
-def build_verification_email(code: str) -> tuple[str, str, str]:
-    """Return (subject, html, text) for the registration verification code."""
+def _verification_email(code: str) -> tuple[str, str, str]:
+    """Source of the registration verification email; compiled once into `_CompiledEmail` below."""
     subject = f"【{_BRAND_ZH}】您的 OTP 驗證碼 Your verification code"
     html = _render_email(
         h1="請驗證您的身分 Verify your identity",
@@ -133,8 +138,8 @@ def build_verification_email(code: str) -> tuple[str, str, str]:
     return subject, html, text
 
 
-def build_contact_verification_email(code: str) -> tuple[str, str, str]:
-    """Return (subject, html, text) for verifying a newly added email contact (already logged in)."""
+def _contact_verification_email(code: str) -> tuple[str, str, str]:
+    """Source of the add-contact verification email; compiled once into `_CompiledEmail` below."""
     subject = f"【{_BRAND_ZH}】您的 OTP 驗證碼 Your verification code"
     html = _render_email(
         h1="驗證您的電子郵件 Verify your email",
@@ -163,8 +168,8 @@ def build_contact_verification_email(code: str) -> tuple[str, str, str]:
     return subject, html, text
 
 
-def build_password_reset_email(code: str) -> tuple[str, str, str]:
-    """Return (subject, html, text) for the password-reset code."""
+def _password_reset_email(code: str) -> tuple[str, str, str]:
+    """Source of the password-reset email; compiled once into `_CompiledEmail` below."""
     subject = f"【{_BRAND_ZH}】重設您的密碼 Reset your password"
     html = _render_email(
         h1="重設您的密碼 Reset your password",
@@ -193,8 +198,8 @@ def build_password_reset_email(code: str) -> tuple[str, str, str]:
     return subject, html, text
 
 
-def build_sso_notice_email() -> tuple[str, str, str]:
-    """Return (subject, html, text) telling an SSO-only user there is no password to reset (no code)."""
+def _sso_notice_email(_code: str) -> tuple[str, str, str]:
+    """Source of the SSO-only password-reset notice (carries no code)."""
     subject = f"【{_BRAND_ZH}】關於密碼重設 Password reset"
     html = _render_email(
         h1="關於密碼重設 Password reset",
@@ -220,9 +225,61 @@ def build_sso_notice_email() -> tuple[str, str, str]:
     return subject, html, text
 
 
-def get_email_sender() -> EmailSender:
-    """FastAPI dependency selecting the configured email sender."""
+class _CompiledEmail:
+    """An email rendered once with a placeholder code, kept as the static fragments around it.
+
+    Rendering a message is then one `str.join` per part instead of rebuilding the whole
+    inline-CSS body from f-strings on every send.
+    """
+
+    _SLOT = "\x00code\x00"
+
+    def __init__(self, source: Callable[[str], tuple[str, str, str]]):
+        """Render `source` (code -> subject, html, text) once and split it on the code slot."""
+        self._parts = tuple(part.split(self._SLOT) for part in source(self._SLOT))
+
+    def render(self, code: str) -> tuple[str, str, str]:
+        """Return (subject, html, text) carrying `code`."""
+        subject, html, text = (code.join(fragments) for fragments in self._parts)
+        return subject, html, text
+
+
+# The emails are bilingual (zh + en in one body), so there is one compiled form per template.
+_VERIFICATION = _CompiledEmail(_verification_email)
+_CONTACT_VERIFICATION = _CompiledEmail(_contact_verification_email)
+_PASSWORD_RESET = _CompiledEmail(_password_reset_email)
+_SSO_NOTICE = _CompiledEmail(_sso_notice_email)
+
+
+def build_verification_email(code: str) -> tuple[str, str, str]:
+    """Return (subject, html, text) for the registration verification code."""
+    return _VERIFICATION.render(code)
+
+
+def build_contact_verification_email(code: str) -> tuple[str, str, str]:
+    """Return (subject, html, text) for verifying a newly added email contact (already logged in)."""
+    return _CONTACT_VERIFICATION.render(code)
+
+
+def build_password_reset_email(code: str) -> tuple[str, str, str]:
+    """Return (subject, html, text) for the password-reset code."""
+    return _PASSWORD_RESET.render(code)
+
+
+def build_sso_notice_email() -> tuple[str, str, str]:
+    """Return (subject, html, text) telling an SSO-only user there is no password to reset (no code)."""
+    return _SSO_NOTICE.render("")
+
+
+def build_email_sender(http: HttpClients) -> EmailSender:
+    """The configured provider's sender, delivering immediately (the outbox worker uses this)."""
     if settings.EMAIL_PROVIDER == "smtp2go":
         from app.messaging.smtp2go import Smtp2goEmailSender  # noqa: PLC0415 — optional adapter
-        return Smtp2goEmailSender()
+        return Smtp2goEmailSender(http.get("smtp2go"))
     return ConsoleEmailSender()
+
+
+def get_email_sender(request: Request, http: HttpClients = Depends(get_http_clients)) -> EmailSender:
+    """FastAPI dependency: queue through the app's outbox, or send inline when none runs (tests)."""
+    outbox = getattr(request.app.state, "outbox", None)
+    return OutboxEmailSender(outbox) if outbox is not None else build_email_sender(http)
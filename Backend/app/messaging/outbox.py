@@ -0,0 +1,261 @@
+"""Durable outbox for email and SMS: request handlers enqueue, background workers deliver.
+
+Sending inline made every registration, contact and password-reset request wait on the
+provider's HTTP call, and a slow provider tied up the worker serving it. Now, when the app
+lifespan runs (`app.state.outbox`), `get_email_sender` / `get_sms_sender` hand endpoints an
+`OutboxEmailSender` / `OutboxSmsSender` whose `send` only records the message in Redis:
+
+- `outbox:msg:<id>` — a hash with the message's status, attempts, timestamps, last error
+  and (until it is delivered or given up on) its JSON payload. Kept STATUS_TTL for support.
+- `outbox:stream` — a stream of message ids, read by the `outbox` consumer group.
+- `outbox:to:<recipient>` — the recipient's most recent message ids, for support lookups.
+- `outbox:retry` — ids waiting out a backoff, scored by when they are due.
+
+`OutboxWorker` (one per app process) reads batches from the group, delivers them through
+the real provider senders with a concurrency cap per channel, and retries failures with
+exponential backoff up to OUTBOX_MAX_ATTEMPTS. Entries a crashed worker had claimed are
+reclaimed after RECLAIM_IDLE_MS. The payload — which carries the OTP in clear — is deleted
+as soon as the message reaches a final state.
+"""
+
+import asyncio
+import contextlib
+import json
+import logging
+import os
+import socket
+import time
+import uuid
+from datetime import UTC, datetime
+
+from redis.commands.core import AsyncScript
+from redis.exceptions import ResponseError
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+STREAM = "outbox:stream"
+GROUP = "outbox"
+MSG = "outbox:msg:"
+TO = "outbox:to:"
+RETRY = "outbox:retry"
+STATUS_TTL = 7 * 24 * 3600
+RECENT_PER_RECIPIENT = 50
+RECLAIM_IDLE_MS = 60_000
+
+# KEYS: retry zset, stream. ARGV: max ids to move. Moves every due retry back onto the
+# stream; ZREM and XADD in one script, so two workers can never both re-queue an id.
+_PROMOTE = AsyncScript(None, b"""
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+local ids = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', now, 'LIMIT', 0, tonumber(ARGV[1]))
+for _, id in ipairs(ids) do
+    redis.call('ZREM', KEYS[1], id)
+    redis.call('XADD', KEYS[2], '*', 'id', id)
+end
+return #ids
+""")
+
+
+def _now() -> str:
+    return datetime.now(UTC).isoformat()
+
+
+def _text(value) -> str:
+    return value.decode() if isinstance(value, bytes) else value
+
+
+class Outbox:
+    """Enqueue messages and look up their delivery status."""
+
+    def __init__(self, redis):
+        """Bind to the app's Redis client."""
+        self.redis = redis
+
+    async def enqueue(self, channel: str, to: str, **payload) -> str:
+        """Record one message for `channel` ("email" | "sms") and queue it; return its id.
+
+        `payload` is the channel sender's `send` keyword arguments besides `to`.
+        """
+        message_id = uuid.uuid4().hex
+        now = _now()
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.hset(MSG + message_id, mapping={
+                "id": message_id, "channel": channel, "to": to, "status": "queued", "attempts": 0,
+                "created_at": now, "updated_at": now, "payload": json.dumps(payload),
+            })
+            pipe.expire(MSG + message_id, STATUS_TTL)
+            pipe.zadd(TO + to, {message_id: time.time()})
+            pipe.zremrangebyrank(TO + to, 0, -RECENT_PER_RECIPIENT - 1)
+            pipe.expire(TO + to, STATUS_TTL)
+            pipe.xadd(STREAM, {"id": message_id})
+            await pipe.execute()
+        return message_id
+
+    async def status(self, message_id: str) -> dict | None:
+        """The message's status record (never its payload), or None once expired."""
+        record = await self.redis.hgetall(MSG + message_id)
+        return _public(record) if record else None
+
+    async def recent(self, to: str, limit: int = 20) -> list[dict]:
+        """Status records of the latest messages sent to `to`, newest first."""
+        ids = await self.redis.zrevrange(TO + to, 0, limit - 1)
+        if not ids:
+            return []
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for message_id in ids:
+                pipe.hgetall(MSG + _text(message_id))
+            records = await pipe.execute()
+        return [_public(r) for r in records if r]
+
+
+def _public(record: dict) -> dict:
+    """Decode a message hash and drop the payload."""
+    out = {_text(k): _text(v) for k, v in record.items()}
+    out.pop("payload", None)
+    out["attempts"] = int(out.get("attempts", 0))
+    out.setdefault("last_error", None)
+    return out
+
+
+class OutboxEmailSender:
+    """EmailSender that queues the message instead of calling the provider."""
+
+    def __init__(self, outbox: Outbox):
+        """Queue through `outbox`."""
+        self.outbox = outbox
+
+    async def send(self, to: str, subject: str, html: str, text: str) -> None:
+        """Queue one email for the outbox worker."""
+        await self.outbox.enqueue("email", to, subject=subject, html=html, text=text)
+
+
+class OutboxSmsSender:
+    """SmsSender that queues the message instead of calling the provider."""
+
+    def __init__(self, outbox: Outbox):
+        """Queue through `outbox`."""
+        self.outbox = outbox
+
+    async def send(self, to: str, body: str) -> None:
+        """Queue one SMS for the outbox worker."""
+        await self.outbox.enqueue("sms", to, body=body)
+
+
+class OutboxWorker:
+    """Background task delivering queued messages through the real provider senders."""
+
+    def __init__(
+        self,
+        redis,
+        senders: dict,
+        *,
+        concurrency: dict[str, int] | None = None,
+        batch_size: int = settings.OUTBOX_BATCH_SIZE,
+        max_attempts: int = settings.OUTBOX_MAX_ATTEMPTS,
+        backoff_seconds: float = 5.0,
+        consumer: str | None = None,
+    ):
+        """Deliver via `senders` (channel -> sender); nothing runs until `start`.
+
+        `concurrency` caps in-flight sends per channel (default: the OUTBOX_*_CONCURRENCY
+        settings). Retry n waits `backoff_seconds * 2**(n-1)`, capped at five minutes.
+        """
+        self.redis = redis
+        self.senders = senders
+        concurrency = concurrency or {
+            "email": settings.OUTBOX_EMAIL_CONCURRENCY, "sms": settings.OUTBOX_SMS_CONCURRENCY,
+        }
+        self._slots = {channel: asyncio.Semaphore(concurrency.get(channel, 1)) for channel in senders}
+        self.batch_size = batch_size
+        self.max_attempts = max_attempts
+        self.backoff_seconds = backoff_seconds
+        self.consumer = consumer or f"{socket.gethostname()}-{os.getpid()}"
+        self._task: asyncio.Task | None = None
+        self._next_reclaim = 0.0
+
+    def start(self) -> None:
+        """Begin delivering in the background."""
+        self._task = asyncio.create_task(self._run(), name="outbox-worker")
+
+    async def stop(self) -> None:
+        """Cancel the worker and wait for it; undelivered entries stay queued for the next one."""
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.run_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.warning("outbox worker lost Redis; retrying in 5s", exc_info=True)
+                await asyncio.sleep(5)
+
+    async def run_once(self, block_ms: int = 1000) -> int:
+        """One cycle: re-queue due retries, reclaim stale entries, deliver one batch.
+
+        Returns how many messages were attempted.
+        """
+        await self._ensure_group()
+        await _PROMOTE(keys=[RETRY, STREAM], args=[self.batch_size], client=self.redis)
+        entries = []
+        if time.monotonic() >= self._next_reclaim:
+            self._next_reclaim = time.monotonic() + RECLAIM_IDLE_MS / 1000
+            _, entries, *_ = await self.redis.xautoclaim(
+                STREAM, GROUP, self.consumer, RECLAIM_IDLE_MS, "0-0", count=self.batch_size
+            )
+        if not entries:
+            streams = await self.redis.xreadgroup(
+                GROUP, self.consumer, {STREAM: ">"}, count=self.batch_size, block=block_ms
+            )
+            entries = [entry for _, batch in streams or [] for entry in batch]
+        await asyncio.gather(*(self._deliver(entry_id, fields) for entry_id, fields in entries))
+        return len(entries)
+
+    async def _ensure_group(self) -> None:
+        try:
+            await self.redis.xgroup_create(STREAM, GROUP, id="0", mkstream=True)
+        except ResponseError as err:
+            if "BUSYGROUP" not in str(err):
+                raise
+
+    async def _deliver(self, entry_id, fields: dict | None) -> None:
+        """Send one message and record the outcome, acking its stream entry either way."""
+        fields = {_text(k): _text(v) for k, v in (fields or {}).items()}
+        key = MSG + fields.get("id", "")
+        record = {_text(k): _text(v) for k, v in (await self.redis.hgetall(key)).items()}
+        if "payload" not in record:
+            # expired, or already final (a worker that stalled mid-ack had it reclaimed)
+            await self.redis.xack(STREAM, GROUP, entry_id)
+            await self.redis.xdel(STREAM, entry_id)
+            return
+        channel, attempts, error = record["channel"], int(record["attempts"]) + 1, None
+        try:
+            async with self._slots[channel]:
+                await self.senders[channel].send(record["to"], **json.loads(record["payload"]))
+        except Exception as err:
+            error = f"{type(err).__name__}: {err}"[:500]
+            logger.warning(
+                "outbox %s to %s failed (attempt %d)", channel, record["to"], attempts, exc_info=True
+            )
+        update = {"attempts": attempts, "updated_at": _now()}
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.xack(STREAM, GROUP, entry_id)
+            pipe.xdel(STREAM, entry_id)
+            if error is None:
+                pipe.hset(key, mapping={**update, "status": "sent"})
+                pipe.hdel(key, "payload", "last_error")
+            elif attempts < self.max_attempts:
+                pipe.hset(key, mapping={**update, "status": "retrying", "last_error": error})
+                delay = min(self.backoff_seconds * 2 ** (attempts - 1), 300)
+                pipe.zadd(RETRY, {record["id"]: (time.time() + delay) * 1000})
+            else:
+                pipe.hset(key, mapping={**update, "status": "failed", "last_error": error})
+                pipe.hdel(key, "payload")
+            await pipe.execute()
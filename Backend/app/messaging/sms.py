@@ -3,6 +3,10 @@
 import logging
 from typing import Protocol
 
+from fastapi import Request
+
+from app.messaging.outbox import OutboxSmsSender
+
 logger = logging.getLogger("app.sms")
 
 _BRAND_ZH = "島嶼守望"
@@ -43,6 +47,16 @@ def build_sso_notice_sms() -> str:
             "please sign in with that provider.")
 
 
-def get_sms_sender() -> SmsSender:
-    """FastAPI dependency selecting the configured SMS sender (console for now)."""
+def build_sms_sender() -> SmsSender:
+    """The configured provider's sender, delivering immediately (console for now).
+
+    A real provider adapter takes its client like smtp2go does: accept an `HttpClients`
+    here and pass `http.get("sms")`.
+    """
     return ConsoleSmsSender()
+
+
+def get_sms_sender(request: Request) -> SmsSender:
+    """FastAPI dependency: queue through the app's outbox, or send inline when none runs (tests)."""
+    outbox = getattr(request.app.state, "outbox", None)
+    return OutboxSmsSender(outbox) if outbox is not None else build_sms_sender()
@@ -1,6 +1,8 @@
 """SMTP2Go transactional-email adapter (HTTP API; works on GCP where SMTP ports are blocked)."""
 
 import base64
+import functools
+import json
 import logging
 from pathlib import Path
 
@@ -22,23 +24,38 @@ else:
     logger.warning("logo asset missing at %s; emails will render without the inline logo", _LOGO_PATH)
 
 
+@functools.lru_cache(maxsize=4)
+def _payload_prefix(sender: str) -> bytes:
+    """The JSON payload's per-process constant head — sender plus the logo blob — serialized once.
+
+    The logo is by far the largest part of every request; `send` splices the per-message
+    fields after this prefix instead of re-encoding the blob each time.
+    """
+    head: dict = {"sender": sender}
+    if _LOGO_B64:
+        head["inlines"] = [{"filename": "logo", "fileblob": _LOGO_B64, "mimetype": "image/png"}]
+    return json.dumps(head)[:-1].encode() + b","
+
+
+def _payload(to: str, subject: str, html: str, text: str) -> bytes:
+    """The complete JSON request body for one email."""
+    fields = {"to": [to], "subject": subject, "html_body": html, "text_body": text}
+    sender = f"{settings.EMAIL_FROM_NAME} <{settings.EMAIL_FROM}>"
+    return _payload_prefix(sender) + json.dumps(fields)[1:].encode()
+
+
 class Smtp2goEmailSender:
     """Sends email via SMTP2Go's v3 HTTP API using the configured API key."""
 
+    def __init__(self, client: httpx.AsyncClient):
+        """Send through `client`, the app's shared keep-alive pool for SMTP2Go."""
+        self._client = client
+
     async def send(self, to: str, subject: str, html: str, text: str) -> None:
         """POST one multipart email (HTML + text) to SMTP2Go; raise on non-2xx. Logo rides along as cid."""
         if not settings.SMTP2GO_API_KEY:
             raise RuntimeError("SMTP2GO_API_KEY is required when EMAIL_PROVIDER=smtp2go")
-        payload = {
-            "sender": f"{settings.EMAIL_FROM_NAME} <{settings.EMAIL_FROM}>",
-            "to": [to],
-            "subject": subject,
-            "html_body": html,
-            "text_body": text,
-        }
-        if _LOGO_B64:
-            payload["inlines"] = [{"filename": "logo", "fileblob": _LOGO_B64, "mimetype": "image/png"}]
         headers = {"X-Smtp2go-Api-Key": settings.SMTP2GO_API_KEY, "Content-Type": "application/json"}
-        async with httpx.AsyncClient(timeout=10) as client:
-            resp = await client.post(_SMTP2GO_URL, json=payload, headers=headers)
-            resp.raise_for_status()
+        body = _payload(to, subject, html, text)
+        resp = await self._client.post(_SMTP2GO_URL, content=body, headers=headers)
+        resp.raise_for_status()
@@ -25,6 +25,6 @@ from app.models.station_property import (  # noqa: F401
     StationProperty,
     StationUpdateSuggestion,
 )
-from app.models.team import Team, TeamZoneAssign, WorkZone  # noqa: F401
+from app.models.team import Team, TeamZoneAssign, WorkZone, WorkZonePart  # noqa: F401
 from app.models.ticket_task import TaskAssignment, TaskProperty, TicketTask  # noqa: F401
 
@@ -3,7 +3,7 @@
 from datetime import datetime
 
 from geoalchemy2 import Geometry
-from sqlalchemy import Boolean, DateTime, Float, ForeignKey, String
+from sqlalchemy import Boolean, DateTime, Float, ForeignKey, String, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import Base, TimestampMixin, UUIDPKMixin
@@ -19,7 +19,12 @@ class BaseGeometry(Base, UUIDPKMixin, TimestampMixin):
     # No `team_uuid` here (ADR-049, 乙): a geo resource's jurisdiction is decided by geography
     # — whether its point falls inside a WorkZone polygon assigned to a team (`zone` scope) —
     # not by a stored owning-org. Removed to keep authorization purely capability + own + zone.
+    # Where an imported row came from (app/services/geo_import.py): the dataset's name and the
+    # row's id in it. NULL for rows created in the app; re-imports upsert on the pair.
+    external_source: Mapped[str | None] = mapped_column(String(100))
+    external_id: Mapped[str | None] = mapped_column(String(200))
 
+    __table_args__ = (UniqueConstraint("external_source", "external_id", name="uq_base_geometries_external"),)
     __mapper_args__ = {
         "polymorphic_on": property_name,
         "polymorphic_identity": "base",
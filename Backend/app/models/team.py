@@ -3,7 +3,18 @@
 from datetime import datetime
 
 from geoalchemy2 import Geometry
-from sqlalchemy import DateTime, ForeignKey, String, UniqueConstraint, func
+from sqlalchemy import (
+    DateTime,
+    ForeignKey,
+    String,
+    UniqueConstraint,
+    delete,
+    event,
+    func,
+    insert,
+    inspect,
+    select,
+)
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.models.base import Base, TimestampMixin, UUIDPKMixin
@@ -34,6 +45,62 @@ class WorkZone(Base, UUIDPKMixin, TimestampMixin):
     created_by: Mapped[str | None] = mapped_column(ForeignKey("users.uuid"), nullable=True)
 
 
+# Vertex cap per subdivided piece. ST_Subdivide's default (256) still leaves coastline-heavy
+# pieces with loose bboxes; 64 keeps each GiST entry tight at the cost of a few more rows.
+WORK_ZONE_PART_MAX_VERTICES = 64
+
+
+class WorkZonePart(Base, UUIDPKMixin):
+    """One `ST_Subdivide`d piece of a WorkZone, for fast point-in-zone tests.
+
+    A gov-drawn zone can carry thousands of vertices, and its single bbox covers so much
+    that the GiST index on work_zones barely prunes; `ST_Contains` then walks every edge.
+    The zone scope (rbac_scopes.py) tests points against these small, tightly-boxed pieces
+    instead. Derived data only: rebuilt from `work_zones.geometry` by the mapper events
+    below, never written directly, and deliberately not audited.
+    """
+
+    __tablename__ = "work_zone_parts"
+    zone_uuid: Mapped[str] = mapped_column(
+        ForeignKey("work_zones.uuid", ondelete="CASCADE"), index=True
+    )
+    geometry = mapped_column(Geometry("GEOMETRY", srid=4326))
+
+
+def _rebuild_work_zone_parts(connection, zone_uuid) -> None:
+    """Replace the subdivided pieces of one zone with a fresh `ST_Subdivide` of its geometry."""
+    parts = WorkZonePart.__table__
+    zones = WorkZone.__table__
+    connection.execute(delete(parts).where(parts.c.zone_uuid == zone_uuid))
+    connection.execute(
+        insert(parts).from_select(
+            ["uuid", "zone_uuid", "geometry"],
+            select(
+                func.gen_random_uuid(),
+                zones.c.uuid,
+                func.ST_Subdivide(zones.c.geometry, WORK_ZONE_PART_MAX_VERTICES),
+            ).where(zones.c.uuid == zone_uuid, zones.c.geometry.is_not(None)),
+        )
+    )
+
+
+@event.listens_for(WorkZone, "after_insert")
+def _work_zone_parts_on_insert(mapper, connection, target):
+    """Subdivide a new zone in the same flush that inserts it.
+
+    A mapper event rather than a call in services/work_zone.py, so zones inserted through
+    the ORM anywhere else (seed scripts, test fixtures) can never lack their pieces.
+    """
+    _rebuild_work_zone_parts(connection, target.uuid)
+
+
+@event.listens_for(WorkZone, "after_update")
+def _work_zone_parts_on_update(mapper, connection, target):
+    """Re-subdivide a zone whose boundary changed; renames and soft-deletes leave pieces alone."""
+    if inspect(target).attrs.geometry.history.has_changes():
+        _rebuild_work_zone_parts(connection, target.uuid)
+
+
 class TeamZoneAssign(Base, UUIDPKMixin):
     """Junction table: a gov assigns a WorkZone to a Team for `zone` scope.
 
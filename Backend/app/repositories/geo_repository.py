@@ -1,9 +1,9 @@
 """Repositories for stations, closure areas, station properties, and crowd sourcing."""
 
 from sqlalchemy import func, select
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncResult, AsyncSession
 
-from app.infrastructure.repository.base import GenericRepository
+from app.infrastructure.repository.base import GenericRepository, read_columns
 from app.models.geo import ClosureArea, Station
 from app.models.secondary_location import SecondaryLocation
 from app.models.station_property import (
@@ -24,13 +24,9 @@ class StationRepository(GenericRepository[Station]):
         """Initialize with Station as the managed model."""
         super().__init__(Station)
 
-    async def list_active(
-        self, db: AsyncSession, *,
-        bounds=None, station_type: str | None = None,
-        skip: int = 0, limit: int = 50, extra_filters=(),
-    ) -> list[Station]:
-        """List active stations with optional bbox/type filter and RBAC scope_filter conditions."""
-        query = select(self.model).where(self.model.delete_at.is_(None), *extra_filters)
+    def _active(self, query, *, bounds=None, station_type: str | None = None, extra_filters=()):
+        """Apply the active/bbox/type/scope filters shared by the list and count queries."""
+        query = query.where(self.model.delete_at.is_(None), *extra_filters)
         if bounds:
             bbox = func.ST_MakeEnvelope(
                 bounds.min_lng, bounds.min_lat, bounds.max_lng, bounds.max_lat, 4326
@@ -38,25 +34,64 @@ class StationRepository(GenericRepository[Station]):
             query = query.where(func.ST_Intersects(self.model.geometry, bbox))
         if station_type:
             query = query.where(self.model.type == station_type)
-        result = await db.execute(
-            query.order_by(
-                self.model.priority_score.desc().nulls_last(), self.model.created_at.desc()
-            ).offset(skip).limit(limit)
+        return query
+
+    def _page(self, query, skip: int, limit: int):
+        return query.order_by(
+            self.model.priority_score.desc().nulls_last(), self.model.created_at.desc()
+        ).offset(skip).limit(limit)
+
+    async def list_active(
+        self, db: AsyncSession, *,
+        bounds=None, station_type: str | None = None,
+        skip: int = 0, limit: int = 50, extra_filters=(),
+    ) -> list[Station]:
+        """List active stations with optional bbox/type filter and RBAC scope_filter conditions.
+
+        ORM instances; the app reads `list_active_rows`. Kept as the entity baseline that
+        scripts/bench_orm_rows.py measures the Row path against.
+        """
+        query = self._active(
+            select(self.model), bounds=bounds, station_type=station_type, extra_filters=extra_filters
         )
+        result = await db.execute(self._page(query, skip, limit))
         return result.scalars().all()
 
+    async def list_active_rows(
+        self, db: AsyncSession, columns=None, *,
+        bounds=None, station_type: str | None = None,
+        skip: int = 0, limit: int = 50, extra_filters=(),
+    ) -> list:
+        """`list_active` without the ORM: `Row`s of `columns` (Station attributes, default all)."""
+        query = self._active(
+            select(*(columns or read_columns(self.model))),
+            bounds=bounds, station_type=station_type, extra_filters=extra_filters,
+        )
+        result = await db.execute(self._page(query, skip, limit))
+        return result.all()
+
+    async def stream_active_rows(
+        self, db: AsyncSession, columns, *,
+        bounds=None, station_type: str | None = None, extra_filters=(), yield_per: int = 1000,
+    ) -> AsyncResult:
+        """`list_active_rows` over every match, unpaged, read `yield_per` rows at a time.
+
+        A server-side cursor, so an export of every station holds one batch in memory, not
+        the table. Oldest first, which keeps the order stable while rows are being added.
+        """
+        query = self._active(
+            select(*columns), bounds=bounds, station_type=station_type, extra_filters=extra_filters
+        )
+        query = query.order_by(self.model.created_at, self.model.uuid)
+        return await db.stream(query.execution_options(yield_per=yield_per))
+
     async def count_active(
         self, db: AsyncSession, *, bounds=None, station_type: str | None = None, extra_filters=()
     ) -> int:
         """Count active stations with optional bbox/type filter and RBAC scope_filter conditions."""
-        query = select(self.model).where(self.model.delete_at.is_(None), *extra_filters)
-        if bounds:
-            bbox = func.ST_MakeEnvelope(
-                bounds.min_lng, bounds.min_lat, bounds.max_lng, bounds.max_lat, 4326
-            )
-            query = query.where(func.ST_Intersects(self.model.geometry, bbox))
-        if station_type:
-            query = query.where(self.model.type == station_type)
+        query = self._active(
+            select(self.model), bounds=bounds, station_type=station_type, extra_filters=extra_filters
+        )
         return await db.scalar(select(func.count()).select_from(query.subquery()))
 
     async def get_high_level_stations(self, db: AsyncSession, min_level: int) -> list[Station]:
@@ -74,29 +109,32 @@ class ClosureAreaRepository(GenericRepository[ClosureArea]):
         """Initialize with ClosureArea as the managed model."""
         super().__init__(ClosureArea)
 
-    async def list_active(
-        self, db: AsyncSession, *, bounds=None, skip: int = 0, limit: int = 50, extra_filters=()
-    ) -> list[ClosureArea]:
-        """List active closure areas with optional bbox filter and RBAC scope_filter conditions."""
-        query = select(self.model).where(self.model.delete_at.is_(None), *extra_filters)
+    def _active(self, query, *, bounds=None, extra_filters=()):
+        """Apply the active/bbox/scope filters shared by the list and count queries."""
+        query = query.where(self.model.delete_at.is_(None), *extra_filters)
         if bounds:
             bbox = func.ST_MakeEnvelope(
                 bounds.min_lng, bounds.min_lat, bounds.max_lng, bounds.max_lat, 4326
             )
             query = query.where(func.ST_Intersects(self.model.geometry, bbox))
+        return query
+
+    async def list_active_rows(
+        self, db: AsyncSession, *, bounds=None, skip: int = 0, limit: int = 50, extra_filters=()
+    ) -> list:
+        """List active closure areas with optional bbox filter and RBAC scope_filter conditions.
+
+        Returns `Row`s of every ClosureArea column, not ORM instances.
+        """
+        query = self._active(select(*read_columns(self.model)), bounds=bounds, extra_filters=extra_filters)
         result = await db.execute(
             query.order_by(self.model.created_at.desc()).offset(skip).limit(limit)
         )
-        return result.scalars().all()
+        return result.all()
 
     async def count_active(self, db: AsyncSession, *, bounds=None, extra_filters=()) -> int:
         """Count active closure areas with optional bbox filter and RBAC scope_filter conditions."""
-        query = select(self.model).where(self.model.delete_at.is_(None), *extra_filters)
-        if bounds:
-            bbox = func.ST_MakeEnvelope(
-                bounds.min_lng, bounds.min_lat, bounds.max_lng, bounds.max_lat, 4326
-            )
-            query = query.where(func.ST_Intersects(self.model.geometry, bbox))
+        query = self._active(select(self.model), bounds=bounds, extra_filters=extra_filters)
         return await db.scalar(select(func.count()).select_from(query.subquery()))
 
 
@@ -1,12 +1,97 @@
-"""Redis-backed session + refresh-token store with rotation and reuse detection."""
+"""Redis-backed session + refresh-token store with rotation and reuse detection.
+
+Every multi-key operation (create, rotate, revoke) is one server-side Lua script: one
+EVALSHA round trip, and atomic, so a crash or a concurrent rotation can never observe or
+leave a half-written session. Keys a script derives from a stored record (the session of a
+refresh token, the refresh token of a session) are built inside the script, so this is
+single-instance Redis only, not Cluster — the same constraint the deployment already has.
+"""
 
 import json
+import logging
 import uuid
 from datetime import UTC, datetime
 
+from redis.commands.core import AsyncScript
+
+from app.core import revocation
 from app.core.config import settings
 from app.core.security import generate_refresh_token, hash_refresh_token
 
+logger = logging.getLogger(__name__)
+
+# ARGV[1..4] of every script: the key prefixes below, so Lua and Python share one source.
+# Shared by _ROTATE (on reuse) and _REVOKE: drop a session, its current refresh token and
+# its user_sessions membership. Returns 1 if the session existed.
+_REVOKE_FN = """
+local function revoke(sid)
+    local raw = redis.call('GET', ARGV[1] .. sid)
+    redis.call('DEL', ARGV[1] .. sid)
+    if not raw then return 0 end
+    local session = cjson.decode(raw)
+    redis.call('DEL', ARGV[2] .. session['current_rt_hash'])
+    redis.call('SREM', ARGV[3] .. session['user_uuid'], sid)
+    return 1
+end
+"""
+
+# ARGV[5..]: sid, user_uuid, rt_hash, session_json, ttl
+_CREATE = AsyncScript(None, b"""
+local sid, user_uuid, rt_hash, session, ttl = ARGV[5], ARGV[6], ARGV[7], ARGV[8], ARGV[9]
+redis.call('SET', ARGV[1] .. sid, session, 'EX', ttl)
+redis.call('SET', ARGV[2] .. rt_hash, cjson.encode({sid = sid, user_uuid = user_uuid}), 'EX', ttl)
+redis.call('SADD', ARGV[3] .. user_uuid, sid)
+redis.call('EXPIRE', ARGV[3] .. user_uuid, ttl)
+return 1
+""")
+
+# ARGV[5..]: presented rt_hash, new rt_hash, now (ISO), ttl
+# Returns {status, sid, user_uuid} with status 'ok' | 'invalid' | 'reuse'.
+_ROTATE = AsyncScript(None, (_REVOKE_FN + """
+local rt_hash, new_hash, now, ttl = ARGV[5], ARGV[6], ARGV[7], ARGV[8]
+local raw = redis.call('GET', ARGV[2] .. rt_hash)
+if not raw then return {'invalid', '', ''} end
+local rec = cjson.decode(raw)
+local sid, user_uuid = rec['sid'], rec['user_uuid']
+-- claim the presented token; only its first rotation gets here with the flag unset.
+-- any replay finds it set -> theft signal -> the whole session goes.
+if not redis.call('SET', ARGV[4] .. rt_hash, '1', 'NX', 'EX', ttl) then
+    revoke(sid)
+    return {'reuse', sid, user_uuid}
+end
+local session_raw = redis.call('GET', ARGV[1] .. sid)
+if not session_raw then return {'invalid', sid, user_uuid} end
+local session = cjson.decode(session_raw)
+session['current_rt_hash'] = new_hash
+session['last_used_at'] = now
+redis.call('SET', ARGV[2] .. new_hash, cjson.encode({sid = sid, user_uuid = user_uuid}), 'EX', ttl)
+redis.call('SET', ARGV[1] .. sid, cjson.encode(session), 'EX', ttl)
+redis.call('EXPIRE', ARGV[3] .. user_uuid, ttl)
+return {'ok', sid, user_uuid}
+""").encode())
+
+# ARGV[5]: sid
+_REVOKE = AsyncScript(None, (_REVOKE_FN + "return revoke(ARGV[5])\n").encode())
+
+# ARGV[5..]: user_uuids. Revokes every session of every listed user; returns their sids.
+_REVOKE_USERS = AsyncScript(None, (_REVOKE_FN + """
+local revoked = {}
+for i = 5, #ARGV do
+    local key = ARGV[3] .. ARGV[i]
+    for _, sid in ipairs(redis.call('SMEMBERS', key)) do
+        if revoke(sid) == 1 then table.insert(revoked, sid) end
+    end
+    redis.call('DEL', key)
+end
+return revoked
+""").encode())
+
+_SCRIPTS = (_CREATE, _ROTATE, _REVOKE, _REVOKE_USERS)
+
+# Users per _REVOKE_USERS call: a script blocks Redis while it runs, so a team-wide revoke is
+# cut into calls that each stay short (a few ms even for users with many devices).
+REVOKE_BATCH_SIZE = 100
+
 
 class InvalidRefreshToken(Exception):
     """Raised when a refresh token is unknown or already revoked."""
@@ -39,6 +124,25 @@ class SessionRepository:
         """Decode a JSON record stored in Redis, or return None if absent."""
         return json.loads(raw) if raw else None
 
+    @staticmethod
+    async def load_scripts(redis) -> None:
+        """SCRIPT LOAD every session script, so the first login after a deploy is one round trip.
+
+        Optional: each call falls back to loading its script on NOSCRIPT (e.g. after a
+        Redis restart), so a failure here is logged, not raised.
+        """
+        try:
+            for script in _SCRIPTS:
+                await redis.script_load(script.script)
+        except Exception:
+            logger.warning("preloading session scripts failed; they will load on first use", exc_info=True)
+
+    async def _run(self, script: AsyncScript, *args):
+        """EVALSHA `script` with the key prefixes followed by `args`."""
+        return await script(
+            args=(self.SESSION, self.REFRESH, self.USER_SESSIONS, self.USED, *args), client=self.redis
+        )
+
     async def create_session(self, user_uuid: str, device: str) -> tuple[str, str]:
         """Create a new session; return (sid, raw_refresh_token)."""
         sid = str(uuid.uuid4())
@@ -49,14 +153,7 @@ class SessionRepository:
             "user_uuid": user_uuid, "current_rt_hash": rt_hash, "device": device,
             "created_at": now, "last_used_at": now,
         }
-        await self.redis.set(self.SESSION + sid, json.dumps(session), ex=self.ttl)
-        await self.redis.set(
-            self.REFRESH + rt_hash,
-            json.dumps({"sid": sid, "user_uuid": user_uuid}),
-            ex=self.ttl,
-        )
-        await self.redis.sadd(self.USER_SESSIONS + user_uuid, sid)
-        await self.redis.expire(self.USER_SESSIONS + user_uuid, self.ttl)
+        await self._run(_CREATE, sid, user_uuid, rt_hash, json.dumps(session), self.ttl)
         return sid, raw
 
     async def get_refresh(self, rt_hash: str) -> dict | None:
@@ -67,53 +164,42 @@ class SessionRepository:
         """Validate + rotate a refresh token. Returns (sid, user_uuid, new_raw_token).
 
         Raises InvalidRefreshToken if unknown/revoked; RefreshTokenReuse if replayed (and
-        revokes the whole session as a side effect).
+        revokes the whole session as a side effect). Claim, reuse check and the swap to the
+        new token happen in one script, so concurrent rotations of one token serialize on
+        the server: exactly one wins, the rest are replays.
         """
-        rt_hash = self._hash(raw_token)
-        rec = await self.get_refresh(rt_hash)
-        if rec is None:
-            raise InvalidRefreshToken
-        sid = rec["sid"]
-        user_uuid = rec["user_uuid"]
-        # atomically claim this token: only the first rotation sets the NX flag and proceeds.
-        # any later (or concurrent-losing) rotation finds it already set -> replay -> revoke session.
-        claimed = await self.redis.set(self.USED + rt_hash, b"1", nx=True, ex=self.ttl)
-        if not claimed:
-            await self.revoke_session(sid)
-            raise RefreshTokenReuse
-        # NOTE: the claim is atomic, but mint-new-token + update-pointer below are not transactional with it.
-        # A crash between the claim and the new-token write is a SAFE failure: the old token is trapped, no
-        # new token is issued -> the user re-logs in. There is no window where two valid chains coexist.
-        # load session after the claim; a missing session fails before we mint a new token
-        session = self._load(await self.redis.get(self.SESSION + sid))
-        if session is None:
-            raise InvalidRefreshToken
-        # issue new token
         new_raw = generate_refresh_token()
-        new_hash = self._hash(new_raw)
-        await self.redis.set(
-            self.REFRESH + new_hash,
-            json.dumps({"sid": sid, "user_uuid": user_uuid}),
-            ex=self.ttl,
+        status, sid, user_uuid = await self._run(
+            _ROTATE, self._hash(raw_token), self._hash(new_raw), datetime.now(UTC).isoformat(), self.ttl
         )
-        # update session pointer + sliding TTL
-        session["current_rt_hash"] = new_hash
-        session["last_used_at"] = datetime.now(UTC).isoformat()
-        await self.redis.set(self.SESSION + sid, json.dumps(session), ex=self.ttl)
-        await self.redis.expire(self.USER_SESSIONS + user_uuid, self.ttl)
-        return sid, user_uuid, new_raw
+        if status == b"reuse":
+            await revocation.publish(self.redis, [sid.decode()])
+            raise RefreshTokenReuse
+        if status != b"ok":
+            raise InvalidRefreshToken
+        return sid.decode(), user_uuid.decode(), new_raw
 
     async def revoke_session(self, sid: str) -> None:
-        """Delete a single session and its current refresh token."""
-        session = self._load(await self.redis.get(self.SESSION + sid))
-        if session is not None:
-            await self.redis.delete(self.REFRESH + session["current_rt_hash"])
-            await self.redis.srem(self.USER_SESSIONS + session["user_uuid"], sid)
-        await self.redis.delete(self.SESSION + sid)
-
-    async def revoke_all_for_user(self, user_uuid: str) -> None:
-        """Delete every session belonging to the user (global logout)."""
-        members = await self.redis.smembers(self.USER_SESSIONS + user_uuid)
-        for m in members:
-            await self.revoke_session(m.decode() if isinstance(m, bytes) else m)
-        await self.redis.delete(self.USER_SESSIONS + user_uuid)
+        """Delete a single session and its current refresh token; deny its access tokens."""
+        if await self._run(_REVOKE, sid):
+            await revocation.publish(self.redis, [sid])
+
+    async def revoke_all_for_user(self, user_uuid: str) -> int:
+        """Delete every session belonging to the user (global logout); return how many."""
+        return await self.revoke_all_for_users([user_uuid])
+
+    async def revoke_all_for_users(self, user_uuids) -> int:
+        """Delete every session of every listed user in one round trip per batch.
+
+        Sessions, their current refresh tokens and the user_sessions sets all go in the same
+        script call, so lockout of a many-device account (or a whole team) is not one
+        round trip per session. The revoked sids are then broadcast to every worker's
+        access-token denylist. Returns the number of sessions revoked.
+        """
+        user_uuids = [str(u) for u in user_uuids]
+        revoked = 0
+        for start in range(0, len(user_uuids), REVOKE_BATCH_SIZE):
+            sids = await self._run(_REVOKE_USERS, *user_uuids[start:start + REVOKE_BATCH_SIZE])
+            await revocation.publish(self.redis, [sid.decode() for sid in sids])
+            revoked += len(sids)
+        return revoked
@@ -1,9 +1,9 @@
 """Repositories for tickets, ticket tasks, and task properties."""
 
 from sqlalchemy import func, select
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncResult, AsyncSession
 
-from app.infrastructure.repository.base import GenericRepository
+from app.infrastructure.repository.base import GenericRepository, read_columns
 from app.models.request import Tickets
 from app.models.ticket_task import TaskAssignment, TaskProperty, TicketTask
 
@@ -15,9 +15,23 @@ class TicketRepository(GenericRepository[Tickets]):
         """Initialize with Tickets as the managed model."""
         super().__init__(Tickets)
 
-    async def list_active(
+    def _active(self, query, *, bounds=None, status: str | None = None, priority: str | None = None,
+                extra_filters=()):
+        """Apply the active/bbox/status/priority/scope filters shared by the list and count queries."""
+        query = query.where(self.model.delete_at.is_(None), *extra_filters)
+        if bounds:
+            bbox = func.ST_MakeEnvelope(bounds.min_lng, bounds.min_lat, bounds.max_lng, bounds.max_lat, 4326)
+            query = query.where(func.ST_Intersects(self.model.geometry, bbox))
+        if status:
+            query = query.where(self.model.status == status)
+        if priority:
+            query = query.where(self.model.priority == priority)
+        return query
+
+    async def list_active_rows(
         self,
         db: AsyncSession,
+        columns=None,
         *,
         bounds=None,
         status: str | None = None,
@@ -25,18 +39,38 @@ class TicketRepository(GenericRepository[Tickets]):
         skip: int = 0,
         limit: int = 50,
         extra_filters=(),
-    ) -> list[Tickets]:
-        """List active tickets with optional bbox/status/priority filter and RBAC scope_filter conditions."""
-        query = select(self.model).where(self.model.delete_at.is_(None), *extra_filters)
-        if bounds:
-            bbox = func.ST_MakeEnvelope(bounds.min_lng, bounds.min_lat, bounds.max_lng, bounds.max_lat, 4326)
-            query = query.where(func.ST_Intersects(self.model.geometry, bbox))
-        if status:
-            query = query.where(self.model.status == status)
-        if priority:
-            query = query.where(self.model.priority == priority)
+    ) -> list:
+        """List active tickets with optional bbox/status/priority filter and RBAC scope_filter conditions.
+
+        Returns `Row`s of `columns` (Tickets attributes, default all), not ORM instances.
+        """
+        query = self._active(
+            select(*(columns or read_columns(self.model))),
+            bounds=bounds, status=status, priority=priority, extra_filters=extra_filters,
+        )
         result = await db.execute(query.order_by(self.model.created_at.desc()).offset(skip).limit(limit))
-        return result.scalars().all()
+        return result.all()
+
+    async def stream_active_rows(
+        self,
+        db: AsyncSession,
+        columns,
+        *,
+        bounds=None,
+        status: str | None = None,
+        priority: str | None = None,
+        extra_filters=(),
+        yield_per: int = 1000,
+    ) -> AsyncResult:
+        """`list_active_rows` over every match, unpaged, read `yield_per` rows at a time.
+
+        A server-side cursor, as in StationRepository.stream_active_rows (export).
+        """
+        query = self._active(
+            select(*columns), bounds=bounds, status=status, priority=priority, extra_filters=extra_filters
+        )
+        query = query.order_by(self.model.created_at, self.model.uuid)
+        return await db.stream(query.execution_options(yield_per=yield_per))
 
     async def count_active(
         self,
@@ -48,16 +82,16 @@ class TicketRepository(GenericRepository[Tickets]):
         extra_filters=(),
     ) -> int:
         """Count active tickets with optional bbox/status/priority filter and RBAC scope_filter conditions."""
-        query = select(self.model).where(self.model.delete_at.is_(None), *extra_filters)
-        if bounds:
-            bbox = func.ST_MakeEnvelope(bounds.min_lng, bounds.min_lat, bounds.max_lng, bounds.max_lat, 4326)
-            query = query.where(func.ST_Intersects(self.model.geometry, bbox))
-        if status:
-            query = query.where(self.model.status == status)
-        if priority:
-            query = query.where(self.model.priority == priority)
+        query = self._active(
+            select(self.model), bounds=bounds, status=status, priority=priority, extra_filters=extra_filters
+        )
         return await db.scalar(select(func.count()).select_from(query.subquery()))
 
+    async def active_uuids(self, db: AsyncSession, uuids) -> set[str]:
+        """Which of `uuids` name an active ticket, in one query (for bulk task creation)."""
+        query = select(self.model.uuid).where(self.model.uuid.in_(set(uuids)), self.model.delete_at.is_(None))
+        return {str(uuid) for uuid in await db.scalars(query)}
+
 
 class TicketTaskRepository(GenericRepository[TicketTask]):
     """Repository for ticket task queries."""
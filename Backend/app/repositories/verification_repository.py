@@ -4,19 +4,58 @@ Keys:
   pending_reg:{type}:{value}                  -> registration payload (creates an account on verify)
   pending_contact:{user_uuid}:{type}:{value}  -> contact payload (attaches a contact to that user on verify)
 Both share the same code lifecycle: 6-digit code, OTP_TTL_SECONDS, MAX_OTP_ATTEMPTS, keepttl on wrong guess.
+
+Consume and reissue are single Lua scripts (one EVALSHA, atomic), so the record read, the
+hash comparison and the attempt counter can never interleave with a concurrent guess.
+Only hashes cross the wire; the plaintext code never reaches Redis.
 """
 
 import json
+import logging
 import secrets
 
+from redis.commands.core import AsyncScript
+
 from app.core.config import settings
 from app.core.security import hash_refresh_token
 
+logger = logging.getLogger(__name__)
+
 PENDING_REG = "pending_reg:"
 PENDING_CONTACT = "pending_contact:"
 PENDING_PWRESET = "pending_pwreset:"
 MAX_OTP_ATTEMPTS = 5
 
+# KEYS: pending key, its :attempts key. ARGV: hash of the presented code, MAX_OTP_ATTEMPTS, ttl.
+# Returns the pending record on a match (and deletes it); nil otherwise. A wrong guess bumps
+# the counter, which shares the record's lifetime, and burns the record at the cap.
+_CONSUME = AsyncScript(None, b"""
+local raw = redis.call('GET', KEYS[1])
+if not raw then return false end
+if cjson.decode(raw)['code_hash'] == ARGV[1] then
+    redis.call('DEL', KEYS[1], KEYS[2])
+    return raw
+end
+local n = redis.call('INCR', KEYS[2])
+if n == 1 then redis.call('EXPIRE', KEYS[2], ARGV[3]) end
+if n >= tonumber(ARGV[2]) then redis.call('DEL', KEYS[1], KEYS[2]) end
+return false
+""")
+
+# KEYS: pending key, its :attempts key. ARGV: hash of the new code, ttl.
+# Swaps in the new code hash, restarts the TTL and clears the counter; 0 if nothing pending.
+_REISSUE = AsyncScript(None, b"""
+local raw = redis.call('GET', KEYS[1])
+if not raw then return 0 end
+local record = cjson.decode(raw)
+record['code_hash'] = ARGV[1]
+redis.call('SET', KEYS[1], cjson.encode(record), 'EX', ARGV[2])
+redis.call('DEL', KEYS[2])
+return 1
+""")
+
+_SCRIPTS = (_CONSUME, _REISSUE)
+
 
 def _gen_code() -> str:
     """Generate a zero-padded 6-digit numeric code."""
@@ -31,9 +70,21 @@ class VerificationRepository:
         self.redis = redis
         self.ttl = settings.OTP_TTL_SECONDS
 
+    @staticmethod
+    async def load_scripts(redis) -> None:
+        """SCRIPT LOAD the OTP scripts at startup; on failure they load on first use instead."""
+        try:
+            for script in _SCRIPTS:
+                await redis.script_load(script.script)
+        except Exception:
+            logger.warning("preloading OTP scripts failed; they will load on first use", exc_info=True)
+
     # --- generic core (key-agnostic) ---
     async def _issue(self, key: str, payload: dict) -> str:
-        """Store a pending record under `key` with a fresh code; return the plaintext code."""
+        """Store a pending record under `key` with a fresh code; return the plaintext code.
+
+        Already one atomic SET, so unlike consume/reissue it needs no script.
+        """
         code = _gen_code()
         record = {**payload, "code_hash": hash_refresh_token(code)}
         await self.redis.set(key, json.dumps(record), ex=self.ttl)
@@ -42,34 +93,23 @@ class VerificationRepository:
     async def _consume(self, key: str, code: str) -> dict | None:
         """Verify a code. Correct → delete + return payload. Wrong → count, burn at cap. None on fail.
 
-        Wrong-guess counting uses an atomic `INCR` on a separate `:attempts` key so concurrent wrong
-        guesses cannot lose increments and slip past the cap (a non-atomic read-modify-write would).
+        Lookup, comparison and the `:attempts` INCR run as one script, so concurrent wrong
+        guesses can neither lose increments nor slip a guess past the cap.
         """
-        raw = await self.redis.get(key)
-        if raw is None:
-            return None
-        record = json.loads(raw)
-        if hash_refresh_token(code) == record["code_hash"]:
-            await self.redis.delete(key, key + ":attempts")
-            return record
-        n = await self.redis.incr(key + ":attempts")
-        if n == 1:
-            await self.redis.expire(key + ":attempts", self.ttl)
-        if n >= MAX_OTP_ATTEMPTS:
-            await self.redis.delete(key, key + ":attempts")
-        return None
+        raw = await _CONSUME(
+            keys=(key, key + ":attempts"),
+            args=(hash_refresh_token(code), MAX_OTP_ATTEMPTS, self.ttl),
+            client=self.redis,
+        )
+        return json.loads(raw) if raw else None
 
     async def _reissue(self, key: str) -> str | None:
         """Mint a new code for a still-pending record (resets the attempt counter). None if none pending."""
-        raw = await self.redis.get(key)
-        if raw is None:
-            return None
-        record = json.loads(raw)
         code = _gen_code()
-        record["code_hash"] = hash_refresh_token(code)
-        await self.redis.set(key, json.dumps(record), ex=self.ttl)
-        await self.redis.delete(key + ":attempts")
-        return code
+        reissued = await _REISSUE(
+            keys=(key, key + ":attempts"), args=(hash_refresh_token(code), self.ttl), client=self.redis
+        )
+        return code if reissued else None
 
     # --- registration (verify-then-create) ---
     async def issue_registration(
@@ -1,5 +1,6 @@
 """Pydantic schemas for the minimal admin API (list users, assign role, manage team members)."""
 
+from datetime import datetime
 from typing import Literal
 from uuid import UUID
 
@@ -43,6 +44,26 @@ class TeamMemberResponse(BaseModel):
     team_uuid: UUID | None
 
 
+class RevokeSessionsResponse(BaseModel):
+    """How many users were signed out, and how many sessions that ended."""
+
+    user_count: int
+    session_count: int
+
+
+class OutboxMessageStatus(BaseModel):
+    """Delivery status of one queued email or SMS (never its body), for support lookups."""
+
+    id: str
+    channel: Literal["email", "sms"]
+    to: str
+    status: Literal["queued", "retrying", "sent", "failed"]
+    attempts: int
+    created_at: datetime
+    updated_at: datetime
+    last_error: str | None = None
+
+
 _UBN_WEIGHTS = (1, 2, 1, 2, 1, 2, 4, 1)
 
 
@@ -90,3 +111,26 @@ class TeamResponse(BaseModel):
     type: str
     status: str
     tax_id: str | None = None
+
+
+class ImportRowError(BaseModel):
+    """A feature an import skipped (0-based `index` in the file), and why."""
+
+    index: int
+    message: str
+
+
+class ImportReportResponse(BaseModel):
+    """What an open-data import did; `errors` lists at most the first 100 skipped features.
+
+    `rejected` counts features that failed validation; `skipped` counts valid ones whose id
+    belongs to a row deleted in the app or of the other kind.
+    """
+
+    read: int
+    created: int
+    updated: int
+    unchanged: int
+    skipped: int
+    rejected: int
+    errors: list[ImportRowError]
@@ -0,0 +1,89 @@
+"""Pydantic schemas for the bulk create REST API (stations, tickets, ticket tasks).
+
+Field for field the GraphQL `Create*Input`s. Lengths and geometry are deliberately not
+constrained here: the service checks them per row and reports the rows it skipped, where
+a pydantic constraint would reject the whole batch with one 422.
+"""
+
+from typing import Any, Literal
+from uuid import UUID
+
+from pydantic import BaseModel
+
+Visibility = Literal["public", "restricted", "internal"]
+
+
+class SecondaryLocationIn(BaseModel):
+    """A secondary address or pole location to attach to a new station."""
+
+    location_type: str = "address"
+    county: str | None = None
+    city: str | None = None
+    lane: str | None = None
+    alley: str | None = None
+    no: str | None = None
+    floor: str | None = None
+    room: str | None = None
+    pole_id: str | None = None
+    pole_type: str | None = None
+    pole_note: str | None = None
+
+
+class StationIn(BaseModel):
+    """One station to create; see the GraphQL CreateStationInput."""
+
+    geometry: dict[str, Any]
+    type: str | None = None
+    name: str | None = None
+    description: str | None = None
+    op_hour: str | None = None
+    level: int = 0
+    comment: str | None = None
+    source: str = "user"
+    visibility: Visibility = "public"
+    contact_name: str | None = None
+    contact_email: str | None = None
+    contact_phone: str | None = None
+    secondary_location: SecondaryLocationIn | None = None
+
+
+class TicketIn(BaseModel):
+    """One ticket to create; see the GraphQL CreateTicketInput."""
+
+    geometry: dict[str, Any]
+    title: str
+    description: str | None = None
+    contact_name: str
+    contact_email: str | None = None
+    contact_phone: str | None = None
+    priority: str = "low"
+    task_type: str | None = None
+    visibility: Visibility = "public"
+    disaster_type: str | None = None
+
+
+class TicketTaskIn(BaseModel):
+    """One ticket task to create; see the GraphQL CreateTicketTaskInput."""
+
+    ticket_uuid: str
+    task_type: str
+    task_name: str
+    task_description: str | None = None
+    quantity: int | None = None
+    source: str = "user"
+    visibility: Visibility = "public"
+    route_uuid: str | None = None
+
+
+class BulkRowErrorOut(BaseModel):
+    """An input row that was skipped (0-based `index`), and why."""
+
+    index: int
+    message: str
+
+
+class BulkCreateResponse(BaseModel):
+    """The uuids created, in input order without the skipped rows, and the skipped rows."""
+
+    created: list[UUID]
+    errors: list[BulkRowErrorOut]
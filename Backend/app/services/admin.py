@@ -1,4 +1,4 @@
-"""Admin write actions (assign role / add & remove team member).
+"""Admin write actions (assign role / add & remove team member / revoke a team's sessions).
 
 Same flat-service style as station.py (T117). Raises AdminNotFoundError / AdminConflictError
 (both ValueError subclasses) so the REST endpoint can map them to 404 / 409 respectively
@@ -192,3 +192,23 @@ async def list_teams(db: AsyncSession, *, actor: User, scope: Scope) -> list[Tea
     """List teams within the caller's team.view scope (all / own team / none, ADR-053)."""
     filters = scope_filter(scope, actor=actor, model=Team)
     return await team_repository.list_active(db, extra_filters=filters)
+
+
+async def team_member_uuids(db: AsyncSession, *, actor: User, team_uuid: str) -> list[str]:
+    """Return the uuids of a team's members, for a team-wide action (checkpoint 1 + 2).
+
+    Same team.member.manage gate as add/remove member: an admin who may change a team's
+    membership may also sign all of its members out.
+    """
+    team = await db.get(Team, team_uuid)
+    if team is None:
+        raise AdminNotFoundError("Team not found")
+
+    await require_scope(
+        actor,
+        Perm.TEAM_MEMBER_MANAGE,
+        db,
+        resource=SimpleNamespace(created_by=None, team_uuid=team.uuid, geometry=None),
+    )
+    rows = await db.scalars(select(User.uuid).where(User.team_uuid == team.uuid))
+    return [str(u) for u in rows]
@@ -0,0 +1,55 @@
+"""Result shape and per-row checks shared by the bulk create use-cases (station.py, ticket.py).
+
+A bulk create checks authorization once, validates every row, then inserts the rows that
+passed in one transaction with multi-row INSERT ... RETURNING (`GenericRepository.add_many`).
+A row that fails validation is skipped and reported by its index instead of failing the
+batch; a database error still rolls the whole batch back. That is why `check_lengths`
+runs per row: one over-long cell in a 2,000-row spreadsheet would otherwise reach the
+INSERT and fail every row with it.
+"""
+
+from dataclasses import dataclass, field
+from functools import cache
+
+from app.core.config import settings
+
+
+@dataclass
+class RowError:
+    """Why the input row at `index` (0-based) was not created."""
+
+    index: int
+    message: str
+
+
+@dataclass
+class BulkResult[T]:
+    """What a bulk create made: `created` in input order without the failed rows."""
+
+    created: list[T] = field(default_factory=list)
+    errors: list[RowError] = field(default_factory=list)
+
+
+def check_batch_size(rows: list) -> None:
+    """Raise ValueError if `rows` is empty or longer than BULK_CREATE_MAX_ROWS."""
+    if not rows:
+        raise ValueError("At least one row is required")
+    if len(rows) > settings.BULK_CREATE_MAX_ROWS:
+        raise ValueError(f"At most {settings.BULK_CREATE_MAX_ROWS} rows per request")
+
+
+@cache
+def _lengths(model) -> dict[str, int]:
+    return {
+        attr.key: attr.columns[0].type.length
+        for attr in model.__mapper__.column_attrs
+        if getattr(attr.columns[0].type, "length", None)
+    }
+
+
+def check_lengths(model, values: dict) -> None:
+    """Raise ValueError naming the first string in `values` too long for its `model` column."""
+    lengths = _lengths(model)
+    for name, value in values.items():
+        if isinstance(value, str) and name in lengths and len(value) > lengths[name]:
+            raise ValueError(f"{name} must be at most {lengths[name]} characters")
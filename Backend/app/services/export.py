@@ -0,0 +1,242 @@
+"""Full data dumps of stations and tickets, streamed as GeoJSON, NDJSON or CSV.
+
+Government partners report from complete extracts, and the GraphQL API serves 50 rows a
+page. An export reads the layer through a server-side cursor (`stream_active_rows`) and
+encodes one batch at a time, so memory stays flat however large the table is, and the
+first bytes go out before the last row is read.
+
+An export shows a caller exactly what the GraphQL list shows them (ADR-027/028/049):
+
+- rows are narrowed by `scope_filter` for the layer's view capability, as in the
+  `stations`/`tickets` queries;
+- contact fields are masked with app/graphql/masking.py unless the caller's view_pii scope
+  covers the row. StationType/TicketType decide that per row with `in_scope`. Here the same
+  policy is a `scope_filter` boolean in the SELECT, so a zone-scoped caller does not cost a
+  round trip per row;
+- the columns are the GraphQL type's scalar fields, in snake_case.
+
+GeoJSON and NDJSON carry the geometry as PostGIS renders it (`ST_AsGeoJSON`), spliced in
+without a parse; NDJSON is one Feature per line. CSV carries it as a `wkt` column, the shape
+the open-data import reads back (app/services/geo_import.py), and starts with a byte-order
+mark so Excel opens the Chinese text as UTF-8. Since it is opened in Excel, user-written
+text that starts like a formula (`=`, `+`, `-`, `@`, tab, CR) is prefixed with `'`, which
+the import strips again.
+"""
+
+import csv
+import io
+import json
+import zlib
+from collections.abc import AsyncIterator, Callable
+from dataclasses import dataclass
+from datetime import datetime
+from types import SimpleNamespace
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import and_, func, true
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.permissions import Perm
+from app.core.rbac_scopes import scope_filter
+from app.core.security import resolve_scope
+from app.db.session import SessionLocal
+from app.graphql.masking import mask_email, mask_name, mask_phone
+from app.models.auth import User
+from app.models.geo import Station
+from app.models.request import Tickets
+from app.repositories.geo_repository import station_repository
+from app.repositories.tickets_repository import ticket_repository
+from app.services.authz import require_scope
+from app.services.geo_import import FORMULA_PREFIXES
+
+_FETCH_ROWS = 1000
+_CONTACTS: dict[str, Callable[[str | None], str | None]] = {
+    "contact_name": mask_name, "contact_email": mask_email, "contact_phone": mask_phone,
+}
+
+
+@dataclass(frozen=True)
+class _Layer:
+    """One exportable table: its columns, filters and capabilities."""
+
+    model: type
+    repository: Any
+    fields: tuple[str, ...]
+    filters: tuple[str, ...]  # keyword filters its `stream_active_rows` takes
+    view: Perm
+    view_pii: Perm
+
+
+LAYERS = {
+    "stations": _Layer(
+        model=Station,
+        repository=station_repository,
+        fields=(
+            "uuid", "type", "name", "description", "op_hour", "level", "comment", "source",
+            "visibility", "verification_status", "confidence_score", "is_duplicate", "is_temporary",
+            "is_official", "priority_score", "created_by", "created_at", "updated_at", *_CONTACTS,
+        ),
+        filters=("station_type",),
+        view=Perm.STATION_VIEW,
+        view_pii=Perm.STATION_VIEW_PII,
+    ),
+    "tickets": _Layer(
+        model=Tickets,
+        repository=ticket_repository,
+        fields=(
+            "uuid", "title", "description", "status", "priority", "task_type", "visibility",
+            "verification_status", "review_note", "disaster_type", "created_by", "created_at",
+            "updated_at", *_CONTACTS,
+        ),
+        filters=("status", "priority"),
+        view=Perm.TICKET_VIEW,
+        view_pii=Perm.TICKET_VIEW_PII,
+    ),
+}
+
+# format -> (media type, file extension)
+FORMATS = {
+    "geojson": ("application/geo+json", "geojson"),
+    "ndjson": ("application/x-ndjson", "ndjson"),
+    "csv": ("text/csv; charset=utf-8", "csv"),
+}
+
+
+@dataclass
+class ExportPlan:
+    """An authorized export, ready to stream: the layer, what to select and how to filter it."""
+
+    layer: _Layer
+    format: str
+    columns: tuple
+    filters: dict[str, Any]
+
+
+def parse_bbox(text: str) -> SimpleNamespace:
+    """Parse `min_lng,min_lat,max_lng,max_lat` into the bounds the repositories filter on."""
+    try:
+        min_lng, min_lat, max_lng, max_lat = (float(part) for part in text.split(","))
+    except ValueError:
+        raise ValueError("bbox must be min_lng,min_lat,max_lng,max_lat") from None
+    return SimpleNamespace(min_lng=min_lng, min_lat=min_lat, max_lng=max_lng, max_lat=max_lat)
+
+
+async def plan_export(
+    db: AsyncSession,
+    *,
+    actor: User,
+    layer: str,
+    format: str,
+    bounds: SimpleNamespace | None = None,
+    filters: dict[str, str] | None = None,
+) -> ExportPlan:
+    """Authorize an export of `layer` for `actor` and build its query (checkpoint 1, then scope_filter).
+
+    Runs before the response starts, so a 403 or a bad filter is still a proper status code.
+    `filters` holds the layer's own list filters (station_type; status, priority).
+    """
+    spec = LAYERS[layer]
+    filters = {name: value for name, value in (filters or {}).items() if value is not None}
+    for name in filters.keys() - set(spec.filters):
+        raise ValueError(f"{layer} cannot be filtered by {name}")
+    scope = await require_scope(actor, spec.view, db)
+    pii_scope = await resolve_scope(actor, spec.view_pii, db)
+    model = spec.model
+    geometry = func.ST_AsText(model.geometry) if format == "csv" else func.ST_AsGeoJSON(model.geometry)
+    columns = (
+        *(getattr(model, name) for name in spec.fields),
+        geometry.label("geometry"),
+        # scope_filter is in_scope as SQL; NONE comes back as false(), ALL as no condition.
+        and_(true(), *scope_filter(pii_scope, actor=actor, model=model)).label("pii_visible"),
+    )
+    filters["bounds"] = bounds
+    filters["extra_filters"] = scope_filter(scope, actor=actor, model=model)
+    return ExportPlan(spec, format, columns, filters)
+
+
+def _json_default(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def _record(layer: _Layer, row) -> dict[str, Any]:
+    """The row's exported fields, contact fields masked unless PII is visible for it."""
+    values = {name: getattr(row, name) for name in layer.fields}
+    if not row.pii_visible:
+        for name, mask in _CONTACTS.items():
+            values[name] = mask(values[name])
+    return values
+
+
+def _feature(layer: _Layer, row) -> str:
+    properties = json.dumps(_record(layer, row), default=_json_default, ensure_ascii=False)
+    return f'{{"type":"Feature","geometry":{row.geometry or "null"},"properties":{properties}}}'
+
+
+async def _geojson(layer: _Layer, result) -> AsyncIterator[str]:
+    yield '{"type":"FeatureCollection","features":['
+    separator = ""
+    async for rows in result.partitions():
+        if rows:
+            yield separator + ",".join(_feature(layer, row) for row in rows)
+            separator = ","
+    yield "]}\n"
+
+
+async def _ndjson(layer: _Layer, result) -> AsyncIterator[str]:
+    async for rows in result.partitions():
+        yield "".join(_feature(layer, row) + "\n" for row in rows)
+
+
+def _csv_value(value):
+    """A CSV cell; text Excel would run as a formula gets a leading `'` (CSV injection).
+
+    Text already starting with quotes before such a character gets one more, so the
+    importer, which takes exactly one off, reads every value back unchanged.
+    """
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, str) and value.lstrip("'").startswith(FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+
+async def _csv(layer: _Layer, result) -> AsyncIterator[str]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow([*layer.fields, "wkt"])
+    yield "\ufeff" + buffer.getvalue()
+    async for rows in result.partitions():
+        buffer.seek(0)
+        buffer.truncate()
+        for row in rows:
+            writer.writerow([*map(_csv_value, _record(layer, row).values()), row.geometry])
+        yield buffer.getvalue()
+
+
+_ENCODERS = {"geojson": _geojson, "ndjson": _ndjson, "csv": _csv}
+
+
+async def stream_export(plan: ExportPlan, *, gzip: bool = False) -> AsyncIterator[bytes]:
+    """Encode every row `plan` selects, one fetched batch per chunk, optionally gzipped.
+
+    Opens its own session: the response body is sent after the endpoint (and its request
+    session) has returned, and the cursor must stay open until the last batch.
+    """
+    compressor = zlib.compressobj(wbits=zlib.MAX_WBITS | 16) if gzip else None
+    async with SessionLocal() as db:
+        result = await plan.layer.repository.stream_active_rows(
+            db, plan.columns, yield_per=_FETCH_ROWS, **plan.filters
+        )
+        async for text in _ENCODERS[plan.format](plan.layer, result):
+            chunk = text.encode()
+            if compressor is not None:
+                chunk = compressor.compress(chunk)
+            if chunk:
+                yield chunk
+    if compressor is not None:
+        yield compressor.flush()
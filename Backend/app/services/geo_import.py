@@ -0,0 +1,519 @@
+"""Open-data import: stations and closure areas from GeoJSON or CSV feeds, safe to re-run.
+
+Government shelter lists and road-closure feeds arrive as files of tens of thousands of
+features, and are imported again every time they are republished. An import:
+
+1. streams the file (`read_geojson`, `read_csv`) instead of loading it whole;
+2. validates and normalises each batch of IMPORT_BATCH_ROWS features with Shapely 2 array
+   operations (`normalize_batch`): parse, drop Z, repair invalid polygons, check bounds and
+   type, and snap coordinates to a GRID_SIZE grid so that an unchanged feed produces
+   identical geometries on every run;
+3. COPYs the valid rows into a temporary staging table with asyncpg's
+   `copy_records_to_table`, which is far cheaper than INSERTing them;
+4. merges the staging table: one INSERT ... ON CONFLICT (external_source, external_id) into
+   base_geometries, then one INSERT ... ON CONFLICT (uuid) into stations or closure_areas.
+   Rows whose values did not change are left alone.
+
+The whole import is one transaction, so a failed run leaves nothing behind, and re-running
+the same file creates and updates nothing. A transaction-scoped advisory lock serialises
+imports of the same source. A row someone soft-deleted in the app stays deleted; the feed
+does not bring it back. Nor does a station import touch a closure area that holds the same
+id under the same source, or the reverse. Such ids are reported as `skipped`, each with its
+reason, not as unchanged. Within one file the last row with a given id wins.
+
+Rows that fail validation are skipped and reported as `RowError`s, as in the bulk create
+use-cases (app/services/bulk.py). A file that cannot be parsed at all raises ValueError.
+"""
+
+import asyncio
+import csv
+import json
+import math
+import re
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
+from functools import cache
+from itertools import islice
+from typing import Any, TextIO
+
+import shapely
+from fastapi import HTTPException, status
+from sqlalchemy import (
+    UUID,
+    Column,
+    Integer,
+    LargeBinary,
+    MetaData,
+    String,
+    Table,
+    Text,
+    cast,
+    distinct,
+    func,
+    literal,
+    literal_column,
+    select,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.live_events import live_events
+from app.core.permissions import Perm
+from app.core.rbac_scopes import Scope
+from app.models.auth import User
+from app.models.geo import BaseGeometry, ClosureArea, Station
+from app.services.authz import require_scope
+from app.services.bulk import RowError, check_lengths
+from app.services.geo_validation import CONTACT_FIELDS, normalize_contact_fields
+
+GRID_SIZE = 1e-7  # degrees, about 1 cm on the ground
+_MAX_REPORTED_ERRORS = 100
+# A CSV export quotes text starting with one of these with a leading `'`, so Excel does not
+# run it as a formula (app/services/export.py); `_text` takes that quote off again.
+FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+
+@dataclass(frozen=True)
+class _Target:
+    """How one kind of feature is validated, staged and merged."""
+
+    model: type[BaseGeometry]
+    entity: str
+    type_message: str
+    polygonal: bool
+    columns: tuple[str, ...]  # what the feed sets; merged on every run
+    defaults: dict[str, Any]  # for columns the feed leaves empty
+    fixed: dict[str, Any]  # set when the row is first created, never updated
+    add: Perm
+    edit: Perm
+    live_kind: str | None  # app/core/live_events.py kind, if subscribers watch it
+
+
+TARGETS = {
+    "station": _Target(
+        model=Station,
+        entity="Station",
+        type_message="Station geometry must be a Point",
+        polygonal=False,
+        columns=(
+            "type", "name", "description", "op_hour", "level", "comment", "visibility", *CONTACT_FIELDS,
+        ),
+        defaults={"level": 0, "visibility": "public"},
+        fixed={"source": "official", "is_official": True, "is_duplicate": False, "is_temporary": False},
+        add=Perm.STATION_ADD,
+        edit=Perm.STATION_EDIT,
+        live_kind="station",
+    ),
+    "closure_area": _Target(
+        model=ClosureArea,
+        entity="Closure area",
+        type_message="Closure area geometry must be Polygon or MultiPolygon",
+        polygonal=True,
+        columns=("status", "information_source", "comment"),
+        defaults={"status": "active"},
+        fixed={},
+        add=Perm.MAP_ADD,
+        edit=Perm.MAP_EDIT,
+        live_kind=None,
+    ),
+}
+
+
+@dataclass
+class FeatureReader:
+    """The `(geometry, properties)` pairs of one file, and how its geometries are encoded.
+
+    `geometry_format` is "geojson" (a GeoJSON geometry dict), "wkt" (a WKT string) or
+    "lonlat" (a `(lon, lat)` pair of strings).
+    """
+
+    geometry_format: str
+    features: Iterator[tuple[Any, dict]]
+
+
+_FEATURES = re.compile(r'"features"\s*:\s*\[')
+_SEPARATOR = re.compile(r"[\s,]*")
+
+
+def read_geojson(stream: TextIO, *, chunk_size: int = 1 << 16) -> FeatureReader:
+    """Stream the features of a GeoJSON FeatureCollection, one object at a time.
+
+    Reads `chunk_size` characters at a time and decodes each feature as soon as it is
+    complete, so memory stays at one chunk plus one feature however large the file is. A
+    feature's top-level `id`, if any, is available as the `id` property.
+    """
+    return FeatureReader("geojson", _geojson_features(stream, chunk_size))
+
+
+def _geojson_features(stream: TextIO, chunk_size: int) -> Iterator[tuple[Any, dict]]:
+    decoder = json.JSONDecoder()
+    buffer = ""
+    while (start := _FEATURES.search(buffer)) is None:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            raise ValueError("Not a GeoJSON FeatureCollection")
+        buffer += chunk
+    pos, eof = start.end(), False
+    while True:
+        pos = _SEPARATOR.match(buffer, pos).end()
+        if buffer.startswith("]", pos):
+            return
+        try:
+            feature, pos = decoder.raw_decode(buffer, pos)
+        except json.JSONDecodeError:
+            # Usually a feature cut off at the end of the buffer: read on and retry. Only at
+            # the end of the file is it really malformed.
+            if eof:
+                raise ValueError("Malformed or truncated GeoJSON") from None
+            chunk = stream.read(chunk_size)
+            buffer, pos, eof = buffer[pos:] + chunk, 0, not chunk
+            continue
+        if not isinstance(feature, dict):
+            feature = {}  # reported as a row with no geometry, like any other bad feature
+        properties = feature.get("properties")
+        properties = dict(properties) if isinstance(properties, dict) else {}
+        if feature.get("id") is not None:
+            properties.setdefault("id", feature["id"])
+        yield feature.get("geometry"), properties
+
+
+def read_csv(
+    stream: TextIO, *, wkt_field: str = "wkt", lon_field: str = "lon", lat_field: str = "lat"
+) -> FeatureReader:
+    """Stream the rows of a CSV file with a header row.
+
+    Geometries come from the `wkt_field` column if there is one, otherwise from the
+    `lon_field` and `lat_field` columns. Every other column is a property.
+    """
+    reader = csv.DictReader(stream)
+    columns = reader.fieldnames or []
+    if wkt_field in columns:
+        return FeatureReader("wkt", ((row.pop(wkt_field), row) for row in reader))
+    if lon_field in columns and lat_field in columns:
+        return FeatureReader(
+            "lonlat", (((row.pop(lon_field), row.pop(lat_field)), row) for row in reader)
+        )
+    raise ValueError(f"CSV needs a {wkt_field} column, or {lon_field} and {lat_field} columns")
+
+
+def format_for(filename: str | None) -> str:
+    """Guess the file format ("csv" or "geojson") from its name; GeoJSON unless it ends in .csv."""
+    return "csv" if (filename or "").lower().endswith(".csv") else "geojson"
+
+
+def parse_field_map(pairs: list[str]) -> dict[str, str]:
+    """Turn `column=property` pairs into a mapping, raising ValueError on a malformed pair."""
+    mapping = {}
+    for pair in pairs:
+        column, sep, name = pair.partition("=")
+        if not sep or not column.strip() or not name.strip():
+            raise ValueError(f"Expected column=property, got {pair!r}")
+        mapping[column.strip()] = name.strip()
+    return mapping
+
+
+def _float(value) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return math.nan
+
+
+def _parse(geometry_format: str, raw: list):
+    if geometry_format == "geojson":
+        return shapely.from_geojson(
+            [json.dumps(g) if isinstance(g, dict) else None for g in raw], on_invalid="ignore"
+        )
+    if geometry_format == "wkt":
+        return shapely.from_wkt([g or None for g in raw], on_invalid="ignore")
+    return shapely.points([[_float(x), _float(y)] for x, y in raw])
+
+
+def _text(value) -> str | None:
+    if value is None:
+        return None
+    value = str(value)
+    if value.startswith("'") and value.lstrip("'").startswith(FORMULA_PREFIXES):
+        value = value[1:]
+    return value.strip() or None
+
+
+def normalize_batch(
+    kind: str,
+    geometry_format: str,
+    features: list[tuple[Any, dict]],
+    *,
+    id_field: str = "id",
+    fields: dict[str, str] | None = None,
+    start: int = 0,
+) -> tuple[list[tuple], list[RowError]]:
+    """Validate and normalise one batch of features into staging records.
+
+    The geometry work runs as whole-batch Shapely operations; only reading the properties
+    is per row. `fields` maps a column to the property that feeds it, for columns not named
+    the same in the feed. `start` is the index of the first feature in the file, used for
+    the records' order and the errors' indexes. Returns `(records, errors)`: one
+    `(index, external_id, wkb, *columns)` tuple per valid feature, in the staging table's
+    column order, and a RowError per skipped one.
+    """
+    target = TARGETS[kind]
+    fields = fields or {}
+    geoms = shapely.force_2d(_parse(geometry_format, [geometry for geometry, _ in features]))
+    missing = shapely.is_missing(geoms)
+    xmin, ymin, xmax, ymax = shapely.bounds(geoms).T  # NaN where missing or empty
+    in_bounds = (xmin >= -180) & (xmax <= 180) & (ymin >= -90) & (ymax <= 90) | shapely.is_empty(geoms)
+    geoms[~in_bounds] = None
+    if target.polygonal:
+        broken = ~shapely.is_valid(geoms) & in_bounds
+        geoms[broken] = shapely.make_valid(geoms[broken])
+        type_id = shapely.get_type_id(geoms)
+        right_type = (type_id == shapely.GeometryType.POLYGON) | (
+            type_id == shapely.GeometryType.MULTIPOLYGON
+        )
+    else:
+        right_type = shapely.get_type_id(geoms) == shapely.GeometryType.POINT
+    geoms[~right_type] = None
+    # Snapping can collapse a sliver polygon to nothing, so emptiness is checked after it.
+    geoms = shapely.set_precision(geoms, GRID_SIZE)
+    right_type &= ~shapely.is_empty(geoms)
+    wkbs = shapely.to_wkb(geoms)
+
+    records, errors = [], []
+    for offset, (_, properties) in enumerate(features):
+        index = start + offset
+        try:
+            if missing[offset]:
+                raise ValueError(f"{target.entity} geometry is missing or invalid")
+            if not in_bounds[offset]:
+                raise ValueError("Invalid coordinates")
+            if not right_type[offset]:
+                raise ValueError(target.type_message)
+            external_id, values = _row_values(target, properties, id_field, fields)
+        except ValueError as exc:
+            errors.append(RowError(index, str(exc)))
+            continue
+        records.append((index, external_id, wkbs[offset], *values.values()))
+    return records, errors
+
+
+def _row_values(target: _Target, properties: dict, id_field: str, fields: dict[str, str]):
+    """The external id and column values of one feature, raising ValueError if unusable."""
+    external_id = _text(properties.get(id_field))
+    if external_id is None:
+        raise ValueError(f"{id_field} is required")
+    values = {}
+    for column in target.columns:
+        value = _text(properties.get(fields.get(column, column)))
+        values[column] = target.defaults.get(column) if value is None else value
+    if "level" in values:
+        try:
+            values["level"] = int(values["level"])
+        except ValueError:
+            raise ValueError("level must be an integer") from None
+    values = normalize_contact_fields(values)
+    check_lengths(target.model, {"external_id": external_id, **values})
+    return external_id, values
+
+
+@cache
+def _staging(kind: str) -> Table:
+    """The temporary table one import COPYs into; dropped when the transaction ends."""
+    return Table(
+        f"import_{kind}",
+        MetaData(),
+        Column("seq", Integer),
+        Column("external_id", Text),
+        Column("wkb", LargeBinary),
+        *(Column(name, Integer if name == "level" else Text) for name in TARGETS[kind].columns),
+        prefixes=["TEMPORARY"],
+        postgresql_on_commit="DROP",
+    )
+
+
+@dataclass
+class ImportReport:
+    """Running counts for one import; `errors` keeps the first skipped rows, `rejected` counts all."""
+
+    read: int = 0
+    staged: int = 0
+    rejected: int = 0
+    created: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    skipped: int = 0  # valid rows the merge refused; their reasons are in `errors` too
+    errors: list[RowError] = field(default_factory=list)
+
+
+def _next_batch(kind: str, reader: FeatureReader, start: int, **options) -> tuple[int, list, list]:
+    batch = list(islice(reader.features, settings.IMPORT_BATCH_ROWS))
+    if not batch:
+        return 0, [], []
+    return len(batch), *normalize_batch(kind, reader.geometry_format, batch, start=start, **options)
+
+
+async def import_features(
+    db: AsyncSession,
+    *,
+    actor: User | None,
+    kind: str,
+    source: str,
+    reader: FeatureReader,
+    id_field: str = "id",
+    fields: dict[str, str] | None = None,
+    on_progress: Callable[[ImportReport], None] | None = None,
+) -> ImportReport:
+    """Import every feature `reader` yields as a `kind` ("station" or "closure_area") from `source`.
+
+    `source` names the dataset (e.g. "moi-shelters"); together with each feature's
+    `id_field` property it identifies the row on later runs. An import creates and updates
+    rows anywhere, so `actor` needs the add capability and the edit capability at `all`
+    scope. `actor=None` is a trusted operator (scripts/import_geo.py) and is not checked.
+    `on_progress` is called with the running report after each batch.
+    """
+    target = TARGETS.get(kind)
+    if target is None:
+        raise ValueError(f"Unknown import kind {kind!r}")
+    source = source.strip()
+    if not source:
+        raise ValueError("source is required")
+    check_lengths(BaseGeometry, {"external_source": source})
+    if actor is not None:
+        await require_scope(actor, target.add, db)
+        if await require_scope(actor, target.edit, db) != Scope.ALL:
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Permission Denied.")
+
+    staging = _staging(kind)
+    conn = await db.connection()
+    await conn.execute(select(func.pg_advisory_xact_lock(func.hashtext(f"geo_import:{source}"))))
+    await conn.run_sync(staging.create)
+    driver = (await conn.get_raw_connection()).driver_connection
+    report = ImportReport()
+    options = {"id_field": id_field, "fields": fields}
+    while True:
+        count, records, errors = await asyncio.to_thread(_next_batch, kind, reader, report.read, **options)
+        if not count:
+            break
+        if records:
+            await driver.copy_records_to_table(
+                staging.name, records=records, columns=[c.name for c in staging.columns]
+            )
+        report.read += count
+        report.staged += len(records)
+        report.rejected += len(errors)
+        report.errors.extend(errors[: _MAX_REPORTED_ERRORS - len(report.errors)])
+        if on_progress is not None:
+            on_progress(report)
+
+    created, updated = await _merge(conn, target, staging, kind=kind, source=source, actor=actor)
+    distinct_ids = await conn.scalar(select(func.count(distinct(staging.c.external_id))))
+    await _report_refused(conn, report, staging, kind=kind, source=source)
+    await db.commit()
+
+    report.created, report.updated = len(created), len(updated)
+    report.unchanged = distinct_ids - report.created - report.updated - report.skipped
+    if target.live_kind is not None:
+        await live_events.publish_many(target.live_kind, created, "created")
+        await live_events.publish_many(target.live_kind, updated)
+    return report
+
+
+def _refusal(deleted: bool, taken_by: str) -> str:
+    if deleted:
+        return "Deleted in the app; not re-imported"
+    return f"id is already used by a {taken_by.replace('_', ' ')} from this source"
+
+
+async def _report_refused(conn, report: ImportReport, staging: Table, *, kind: str, source: str) -> None:
+    """Count the staged ids `_merge` left alone as `skipped`, and report why for each.
+
+    Those are ids whose row was deleted in the app, or is held by the other kind under the
+    same source. Each is reported at the file index of its id's last feature.
+    """
+    base = BaseGeometry.__table__
+    latest = (
+        select(staging.c.external_id, func.max(staging.c.seq).label("seq"))
+        .group_by(staging.c.external_id)
+        .subquery()
+    )
+    refused = (
+        select(latest.c.seq, base.c.delete_at.is_not(None), base.c.property_name)
+        .join(base, (base.c.external_source == source) & (base.c.external_id == latest.c.external_id))
+        .where(base.c.delete_at.is_not(None) | (base.c.property_name != kind))
+        .order_by(latest.c.seq)
+    )
+    report.skipped = await conn.scalar(select(func.count()).select_from(refused.subquery()))
+    if report.skipped and len(report.errors) < _MAX_REPORTED_ERRORS:
+        rows = await conn.execute(refused.limit(_MAX_REPORTED_ERRORS - len(report.errors)))
+        report.errors.extend(RowError(seq, _refusal(deleted, taken_by)) for seq, deleted, taken_by in rows)
+
+
+async def _merge(conn, target: _Target, staging: Table, *, kind: str, source: str, actor: User | None):
+    """Upsert the staged rows into base_geometries, then into the kind's table.
+
+    Returns the uuids created and the uuids updated. PostgreSQL sets `xmax` to 0 on a row
+    the INSERT created, and to the updating transaction on one ON CONFLICT updated, which
+    is how the RETURNING clauses tell the two apart.
+    """
+    base = BaseGeometry.__table__
+    table = target.model.__table__
+    latest = (
+        select(staging)
+        .distinct(staging.c.external_id)
+        .order_by(staging.c.external_id, staging.c.seq.desc())
+        .subquery()
+    )
+    inserted = literal_column("xmax = 0")
+
+    upsert = insert(base).from_select(
+        ["uuid", "property_name", "geometry", "created_by", "external_source", "external_id"],
+        select(
+            func.gen_random_uuid(),
+            literal(kind, String),
+            func.ST_GeomFromWKB(latest.c.wkb, 4326),
+            cast(literal(actor.uuid if actor else None), UUID),
+            literal(source, String),
+            latest.c.external_id,
+        ),
+    )
+    upsert = upsert.on_conflict_do_update(
+        constraint="uq_base_geometries_external",
+        set_={"geometry": upsert.excluded.geometry, "updated_at": func.now()},
+        where=(
+            base.c.delete_at.is_(None)
+            & (base.c.property_name == kind)
+            & base.c.geometry.is_distinct_from(upsert.excluded.geometry)
+        ),
+    ).returning(base.c.uuid, inserted)
+    rows = (await conn.execute(upsert)).all()
+    created = [uuid for uuid, new in rows if new]
+    moved = {uuid for uuid, new in rows if not new}
+
+    columns = [*target.columns, *target.fixed]
+    upsert = insert(table).from_select(
+        ["uuid", *columns],
+        select(
+            base.c.uuid,
+            *(latest.c[name] for name in target.columns),
+            *(literal(value) for value in target.fixed.values()),
+        )
+        .join(
+            base,
+            (base.c.external_source == source) & (base.c.external_id == latest.c.external_id),
+        )
+        .where(base.c.delete_at.is_(None), base.c.property_name == kind),
+    )
+    current = tuple_(*(table.c[name] for name in target.columns))
+    incoming = tuple_(*(upsert.excluded[name] for name in target.columns))
+    upsert = upsert.on_conflict_do_update(
+        index_elements=["uuid"],
+        set_={name: upsert.excluded[name] for name in target.columns},
+        where=current.is_distinct_from(incoming),
+    ).returning(table.c.uuid, inserted)
+    edited = {uuid for uuid, new in (await conn.execute(upsert)).all() if not new} - moved
+    if edited:
+        # The changed columns live in the kind's table; keep base_geometries.updated_at honest.
+        await conn.execute(update(base).where(base.c.uuid.in_(edited)).values(updated_at=func.now()))
+    return created, [*moved, *edited]
@@ -5,6 +5,10 @@ business logic, so it moved into the use-case layer along with everything else t
 resolver did.
 """
 
+import json
+
+import shapely
+from geoalchemy2.shape import from_shape
 from shapely.geometry import shape
 
 
@@ -22,6 +26,34 @@ def validate_point(geojson: dict, *, entity: str = "Station") -> None:
         raise ValueError("Invalid coordinates")
 
 
+def validate_points(geojsons: list[dict], *, entity: str = "Station") -> tuple[list, list[str | None]]:
+    """`validate_point` over a whole batch, plus the geometries ready to insert.
+
+    Parses every GeoJSON in one `shapely.from_geojson` call and checks type and lon/lat
+    bounds as array operations, instead of a `shape()` and a Python check per row. Returns
+    `(geometries, errors)`, both in input order: a WKBElement (SRID 4326) and None for a
+    valid Point, None and `validate_point`'s message for anything else.
+    """
+    geoms = shapely.from_geojson([json.dumps(g) for g in geojsons], on_invalid="ignore")
+    is_point = (shapely.get_type_id(geoms) == shapely.GeometryType.POINT) & ~shapely.is_empty(geoms)
+    points = geoms.copy()
+    points[~is_point] = None
+    x, y = shapely.get_x(points), shapely.get_y(points)  # NaN where not a Point
+    in_bounds = (abs(x) <= 180) & (abs(y) <= 90)
+    geometries, errors = [], []
+    for geom, point, valid in zip(geoms, is_point, in_bounds, strict=True):
+        if not point:
+            geometries.append(None)
+            errors.append(f"{entity} geometry must be a Point")
+        elif not valid:
+            geometries.append(None)
+            errors.append("Invalid coordinates")
+        else:
+            geometries.append(from_shape(geom, srid=4326))
+            errors.append(None)
+    return geometries, errors
+
+
 def validate_polygon(geojson: dict, *, entity: str = "Closure area") -> None:
     """Raise ValueError if geojson is not a Polygon or MultiPolygon.
 
@@ -36,6 +68,7 @@ def validate_polygon(geojson: dict, *, entity: str = "Closure area") -> None:
 _CONTACT_LIMITS = {  # stations.contact_* / tickets.contact_* — same widths in both tables
     "contact_name": 100, "contact_email": 100, "contact_phone": 50,
 }
+CONTACT_FIELDS = tuple(_CONTACT_LIMITS)
 
 
 def normalize_contact_fields(fields: dict, *, required: frozenset[str] = frozenset()) -> dict:
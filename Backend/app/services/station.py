@@ -3,7 +3,8 @@
 Same service layer as auth_account.py: flat functions, `db` first then keyword-only args,
 each owns its own authz (require_scope) + validation + persistence so resolvers stay thin
 (ADR-014). Repos are pure CRUD (ADR-015); multi-table orchestration (station +
-secondary_location) lives here.
+secondary_location) lives here. Each write announces the station it changed, after
+commit, for the GraphQL subscriptions (app/core/live_events.py).
 """
 
 from types import SimpleNamespace
@@ -11,10 +12,12 @@ from types import SimpleNamespace
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.live_events import live_events
 from app.core.permissions import Perm
 from app.graphql.scalars import geojson_to_geom
 from app.models.auth import User
 from app.models.geo import Station
+from app.models.secondary_location import SecondaryLocation
 from app.models.station_property import CrowdSourcing, StationProperty
 from app.repositories.geo_repository import (
     crowd_sourcing_repository,
@@ -23,7 +26,13 @@ from app.repositories.geo_repository import (
     station_repository,
 )
 from app.services.authz import require_scope
-from app.services.geo_validation import normalize_contact_fields, validate_point
+from app.services.bulk import BulkResult, RowError, check_batch_size, check_lengths
+from app.services.geo_validation import (
+    CONTACT_FIELDS,
+    normalize_contact_fields,
+    validate_point,
+    validate_points,
+)
 
 
 async def create_station(
@@ -85,9 +94,58 @@ async def create_station(
 
     await db.commit()
     await db.refresh(station)
+    await live_events.publish("station", station.uuid, "created")
     return station
 
 
+_STATION_FIELDS = ("type", "name", "description", "op_hour", "level", "comment", "source", "visibility")
+
+
+async def bulk_create_stations(db: AsyncSession, *, actor: User, rows: list[dict]) -> BulkResult[Station]:
+    """Create many stations at once (a spreadsheet import), in one transaction.
+
+    Each row holds `create_station`'s keyword arguments. station.add is checked once for
+    the batch, the geometries are validated together (`validate_points`), and the valid
+    rows go in as one multi-row INSERT per table, secondary locations included. A row that
+    fails validation is reported in `errors` and skipped; see app/services/bulk.py.
+    """
+    check_batch_size(rows)
+    await require_scope(actor, Perm.STATION_ADD, db)
+    geometries, messages = validate_points([row["geometry"] for row in rows])
+    result: BulkResult[Station] = BulkResult()
+    values, secondary = [], []
+    for index, (row, geometry, message) in enumerate(zip(rows, geometries, messages, strict=True)):
+        location = row.get("secondary_location")
+        try:
+            if message is not None:
+                raise ValueError(message)
+            station = {
+                "geometry": geometry,
+                "created_by": str(actor.uuid),
+                **{name: row.get(name) for name in _STATION_FIELDS},
+                **normalize_contact_fields({name: row.get(name) for name in CONTACT_FIELDS}),
+            }
+            check_lengths(Station, station)
+            if location:
+                check_lengths(SecondaryLocation, location)
+        except ValueError as exc:
+            result.errors.append(RowError(index, str(exc)))
+            continue
+        values.append(station)
+        secondary.append(location)
+    if not values:
+        return result
+
+    result.created = await station_repository.add_many(db, values)
+    await secondary_location_repository.add_many(db, [
+        {"geometry_uuid": str(station.uuid), **location}
+        for station, location in zip(result.created, secondary, strict=True) if location
+    ])
+    await db.commit()
+    await live_events.publish_many("station", [station.uuid for station in result.created], "created")
+    return result
+
+
 async def update_station(
     db: AsyncSession, *, actor: User, uuid: str, geometry: dict | None = None, changes: dict
 ) -> Station:
@@ -105,7 +163,9 @@ async def update_station(
     if geometry is not None:
         validate_point(geometry)
         obj_in["geometry"] = geojson_to_geom(geometry)
-    return await station_repository.update(db, db_obj=station, obj_in=obj_in)
+    station = await station_repository.update(db, db_obj=station, obj_in=obj_in)
+    await live_events.publish("station", station.uuid)
+    return station
 
 
 async def delete_station(db: AsyncSession, *, actor: User, uuid: str) -> None:
@@ -115,6 +175,7 @@ async def delete_station(db: AsyncSession, *, actor: User, uuid: str) -> None:
         raise ValueError("Station not found")
     await require_scope(actor, Perm.STATION_DELETE, db, resource=station)
     await station_repository.soft_delete(db, db_obj=station)
+    await live_events.publish("station", uuid, "deleted")
 
 
 async def create_station_property(
@@ -135,7 +196,7 @@ async def create_station_property(
     await require_scope(actor, Perm.STATION_CONTRIBUTE, db)
     if not await station_repository.get_by_uuid_active(db, station_uuid):
         raise ValueError("Station not found")
-    return await station_property_repository.create(
+    prop = await station_property_repository.create(
         db,
         obj_in={
             "station_uuid": station_uuid,
@@ -147,6 +208,8 @@ async def create_station_property(
             "created_by": str(actor.uuid),
         },
     )
+    await live_events.publish("station", station_uuid)
+    return prop
 
 
 async def _property_scope_target(db: AsyncSession, prop: StationProperty) -> SimpleNamespace:
@@ -181,7 +244,9 @@ async def update_station_property(
     await require_scope(
         actor, Perm.STATION_EDIT, db, resource=await _property_scope_target(db, prop)
     )
-    return await station_property_repository.update(db, db_obj=prop, obj_in=changes)
+    prop = await station_property_repository.update(db, db_obj=prop, obj_in=changes)
+    await live_events.publish("station", prop.station_uuid)
+    return prop
 
 
 async def rate_station_property(
@@ -209,7 +274,7 @@ async def rate_station_property(
     if not result.scalar_one_or_none():
         raise ValueError("Item not found for this station")
 
-    return await crowd_sourcing_repository.upsert(
+    cs = await crowd_sourcing_repository.upsert(
         db,
         station_uuid=station_uuid,
         item_uuid=item_uuid,
@@ -218,3 +283,5 @@ async def rate_station_property(
         rating=rating,
         distance=distance_from_geometry,
     )
+    await live_events.publish("station", station_uuid)
+    return cs
@@ -1,14 +1,18 @@
 """Ticket write actions (ticket / task / task-property / assignment).
 
 Same flat-service style as station.py: `db` first, keyword-only args, each function owns
-its own authz + validation + persistence (ADR-013/014/015/022).
+its own authz + validation + persistence (ADR-013/014/015/022). Each write announces the
+ticket or task it changed, after commit, for the GraphQL subscriptions (app/core/live_events.py).
 """
 
+import contextlib
 from types import SimpleNamespace
+from uuid import UUID
 
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.live_events import live_events
 from app.core.permissions import Perm
 from app.graphql.scalars import geojson_to_geom
 from app.models.auth import User
@@ -22,7 +26,13 @@ from app.repositories.tickets_repository import (
     ticket_task_repository,
 )
 from app.services.authz import require_scope
-from app.services.geo_validation import normalize_contact_fields, validate_point
+from app.services.bulk import BulkResult, RowError, check_batch_size, check_lengths
+from app.services.geo_validation import (
+    CONTACT_FIELDS,
+    normalize_contact_fields,
+    validate_point,
+    validate_points,
+)
 
 # Business rule (ADR-020): status transitions live here, not in the RBAC layer.
 VALID_TRANSITIONS = {
@@ -95,7 +105,7 @@ async def create_ticket(
         # whitespace-only value has to be refused here rather than normalized to None.
         required=frozenset({"contact_name"}),
     )
-    return await ticket_repository.create(
+    ticket = await ticket_repository.create(
         db,
         obj_in={
             "property_name": "request",
@@ -112,6 +122,48 @@ async def create_ticket(
             "disaster_type": disaster_type,
         },
     )
+    await live_events.publish("ticket", ticket.uuid, "created")
+    return ticket
+
+
+_TICKET_FIELDS = ("title", "description", "priority", "task_type", "visibility", "disaster_type")
+
+
+async def bulk_create_tickets(db: AsyncSession, *, actor: User, rows: list[dict]) -> BulkResult[Tickets]:
+    """Create many tickets at once, in one transaction (same batch rules as bulk_create_stations).
+
+    Each row holds `create_ticket`'s keyword arguments; ticket.add is checked once.
+    """
+    check_batch_size(rows)
+    await require_scope(actor, Perm.TICKET_ADD, db)
+    geometries, messages = validate_points([row["geometry"] for row in rows], entity="Ticket")
+    result: BulkResult[Tickets] = BulkResult()
+    values = []
+    for index, (row, geometry, message) in enumerate(zip(rows, geometries, messages, strict=True)):
+        try:
+            if message is not None:
+                raise ValueError(message)
+            contacts = normalize_contact_fields(
+                {name: row.get(name) for name in CONTACT_FIELDS}, required=frozenset({"contact_name"})
+            )
+            ticket = {
+                "property_name": "request",
+                "geometry": geometry,
+                "created_by": str(actor.uuid),
+                **{name: row.get(name) for name in _TICKET_FIELDS},
+                **contacts,
+                "status": "pending",
+            }
+            check_lengths(Tickets, ticket)
+        except ValueError as exc:
+            result.errors.append(RowError(index, str(exc)))
+            continue
+        values.append(ticket)
+    if values:
+        result.created = await ticket_repository.add_many(db, values)
+        await db.commit()
+        await live_events.publish_many("ticket", [ticket.uuid for ticket in result.created], "created")
+    return result
 
 
 async def update_ticket(
@@ -133,7 +185,9 @@ async def update_ticket(
         if status not in allowed:
             raise ValueError(f"Cannot transition from '{ticket.status}' to '{status}'")
         obj_in["status"] = status
-    return await ticket_repository.update(db, db_obj=ticket, obj_in=obj_in)
+    ticket = await ticket_repository.update(db, db_obj=ticket, obj_in=obj_in)
+    await live_events.publish("ticket", ticket.uuid)
+    return ticket
 
 
 async def review_ticket(
@@ -152,7 +206,9 @@ async def review_ticket(
     obj_in = {"verification_status": verification_status}
     if review_note is not None:
         obj_in["review_note"] = review_note
-    return await ticket_repository.update(db, db_obj=ticket, obj_in=obj_in)
+    ticket = await ticket_repository.update(db, db_obj=ticket, obj_in=obj_in)
+    await live_events.publish("ticket", ticket.uuid)
+    return ticket
 
 
 async def delete_ticket(db: AsyncSession, *, actor: User, uuid: str) -> None:
@@ -166,6 +222,7 @@ async def delete_ticket(db: AsyncSession, *, actor: User, uuid: str) -> None:
         raise ValueError("Ticket not found")
     await require_scope(actor, Perm.TICKET_DELETE, db, resource=ticket)
     await ticket_repository.soft_delete(db, db_obj=ticket)
+    await live_events.publish("ticket", uuid, "deleted")
 
 
 async def create_ticket_task(
@@ -185,7 +242,7 @@ async def create_ticket_task(
     await require_scope(actor, Perm.TICKET_ADD, db)
     if not await ticket_repository.get_by_uuid_active(db, ticket_uuid):
         raise ValueError("Ticket not found")
-    return await ticket_task_repository.create(
+    task = await ticket_task_repository.create(
         db,
         obj_in={
             "ticket_uuid": ticket_uuid,
@@ -199,6 +256,52 @@ async def create_ticket_task(
             "created_by": str(actor.uuid),
         },
     )
+    await live_events.publish("task", task.uuid, "created")
+    return task
+
+
+_TASK_FIELDS = (
+    "task_type", "task_name", "task_description", "quantity", "source", "visibility", "route_uuid",
+)
+
+
+async def bulk_create_ticket_tasks(
+    db: AsyncSession, *, actor: User, rows: list[dict]
+) -> BulkResult[TicketTask]:
+    """Create many tasks at once, across any number of tickets, in one transaction.
+
+    Each row holds `create_ticket_task`'s keyword arguments; ticket.add is checked once
+    and every parent ticket is looked up in one query. A row whose ticket is missing or
+    deleted is reported as "Ticket not found" and skipped.
+    """
+    check_batch_size(rows)
+    await require_scope(actor, Perm.TICKET_ADD, db)
+    parents = {}
+    for index, row in enumerate(rows):
+        with contextlib.suppress(ValueError, TypeError, AttributeError):
+            parents[index] = str(UUID(str(row["ticket_uuid"])))
+    found = await ticket_repository.active_uuids(db, parents.values())
+    result: BulkResult[TicketTask] = BulkResult()
+    values = []
+    for index, row in enumerate(rows):
+        task = {
+            "ticket_uuid": parents.get(index),
+            **{name: row.get(name) for name in _TASK_FIELDS},
+            "created_by": str(actor.uuid),
+        }
+        try:
+            if task["ticket_uuid"] not in found:
+                raise ValueError("Ticket not found")
+            check_lengths(TicketTask, task)
+        except ValueError as exc:
+            result.errors.append(RowError(index, str(exc)))
+            continue
+        values.append(task)
+    if values:
+        result.created = await ticket_task_repository.add_many(db, values)
+        await db.commit()
+        await live_events.publish_many("task", [task.uuid for task in result.created], "created")
+    return result
 
 
 async def update_ticket_task(db: AsyncSession, *, actor: User, uuid: str, changes: dict) -> TicketTask:
@@ -210,7 +313,9 @@ async def update_ticket_task(db: AsyncSession, *, actor: User, uuid: str, change
     if not task:
         raise ValueError("Ticket task not found")
     await require_scope(actor, Perm.TICKET_EDIT, db, resource=await _task_scope_target(db, task))
-    return await ticket_task_repository.update(db, db_obj=task, obj_in=changes)
+    task = await ticket_task_repository.update(db, db_obj=task, obj_in=changes)
+    await live_events.publish("task", task.uuid)
+    return task
 
 
 async def create_task_property(
@@ -227,7 +332,7 @@ async def create_task_property(
     await require_scope(actor, Perm.TICKET_ADD, db)
     if not await ticket_task_repository.get_by_uuid_active(db, task_uuid):
         raise ValueError("Ticket task not found")
-    return await task_property_repository.create(
+    prop = await task_property_repository.create(
         db,
         obj_in={
             "task_uuid": task_uuid,
@@ -237,6 +342,8 @@ async def create_task_property(
             "comment": comment,
         },
     )
+    await live_events.publish("task", task_uuid)
+    return prop
 
 
 async def update_task_property(db: AsyncSession, *, actor: User, uuid: str, changes: dict) -> TaskProperty:
@@ -248,7 +355,9 @@ async def update_task_property(db: AsyncSession, *, actor: User, uuid: str, chan
     if not task:
         raise ValueError("Ticket task not found")
     await require_scope(actor, Perm.TICKET_EDIT, db, resource=await _task_scope_target(db, task))
-    return await task_property_repository.update(db, db_obj=prop, obj_in=changes)
+    prop = await task_property_repository.update(db, db_obj=prop, obj_in=changes)
+    await live_events.publish("task", task.uuid)
+    return prop
 
 
 async def assign_task_actor(
@@ -276,7 +385,7 @@ async def assign_task_actor(
         raise ValueError("Actor already assigned to this task")
 
     try:
-        return await task_assignment_repository.create(
+        assignment = await task_assignment_repository.create(
             db,
             obj_in={
                 "task_uuid": task_uuid,
@@ -290,6 +399,8 @@ async def assign_task_actor(
         # surface the same clean domain error instead of a raw 500.
         await db.rollback()
         raise ValueError("Actor already assigned to this task") from exc
+    await live_events.publish("task", task_uuid)
+    return assignment
 
 
 async def unassign_task_actor(db: AsyncSession, *, actor: User, uuid: str) -> None:
@@ -301,6 +412,7 @@ async def unassign_task_actor(db: AsyncSession, *, actor: User, uuid: str) -> No
         actor, Perm.TICKET_ASSIGN, db, resource=await _assignment_scope_target(db, assignment)
     )
     await task_assignment_repository.remove(db, uuid=uuid)
+    await live_events.publish("task", assignment.task_uuid)
 
 
 async def update_task_assignment(
@@ -313,4 +425,6 @@ async def update_task_assignment(
     await require_scope(
         actor, Perm.TICKET_ASSIGN, db, resource=await _assignment_scope_target(db, assignment)
     )
-    return await task_assignment_repository.update(db, db_obj=assignment, obj_in=changes)
+    assignment = await task_assignment_repository.update(db, db_obj=assignment, obj_in=changes)
+    await live_events.publish("task", assignment.task_uuid)
+    return assignment
@@ -3,8 +3,16 @@ from dataclasses import dataclass
 from typing import Protocol
 
 import anyio
+import httpx
+from fastapi import Depends
+from jose import JWTError
 
 from app.core.config import settings
+from app.core.http_clients import HttpClients, get_http_clients
+from app.sso.jwks import JwksCache, verify_locally
+
+GOOGLE_ISSUERS = ("accounts.google.com", "https://accounts.google.com")
+google_jwks = JwksCache("https://www.googleapis.com/oauth2/v3/certs")
 
 
 @dataclass
@@ -30,14 +38,37 @@ class GoogleTokenVerifier(Protocol):
 
 
 class GoogleOidcVerifier:
-    """Real verifier using google-auth (checks signature, aud, iss, exp)."""
+    """Real verifier: RS256 against cached Google JWKS, google-auth on a key-id miss.
+
+    Both paths check signature, aud, iss and exp.
+    """
 
-    def __init__(self, client_id: str):
-        """Store the expected audience (our OAuth client id)."""
+    def __init__(self, client_id: str, client: httpx.AsyncClient, jwks: JwksCache = google_jwks):
+        """Store the expected audience (our OAuth client id), the shared client and the key cache."""
         self._client_id = client_id
+        self._client = client
+        self._jwks = jwks
 
     async def verify(self, id_token: str) -> GoogleIdentity:
         """Verify a real Google id_token against the configured client id."""
+        try:
+            claims = await verify_locally(
+                id_token, self._jwks, self._client,
+                algorithms=["RS256"], audience=self._client_id, issuer=GOOGLE_ISSUERS,
+            )
+        except JWTError as err:
+            raise GoogleTokenVerificationError(str(err)) from err
+        if claims is None:
+            claims = await self._verify_remote(id_token)
+        return GoogleIdentity(
+            sub=str(claims["sub"]),
+            email=claims.get("email", ""),
+            email_verified=bool(claims.get("email_verified", False)),
+            name=claims.get("name"),
+        )
+
+    async def _verify_remote(self, id_token: str) -> dict:
+        """Verify with google-auth, which fetches Google's certs itself."""
         from google.auth.transport import requests as ga_requests
         from google.oauth2 import id_token as ga_id_token
         try:
@@ -48,14 +79,9 @@ class GoogleOidcVerifier:
             )
         except Exception as err:  # google-auth raises ValueError subclasses
             raise GoogleTokenVerificationError(str(err)) from err
-        return GoogleIdentity(
-            sub=str(claims["sub"]),
-            email=claims.get("email", ""),
-            email_verified=bool(claims.get("email_verified", False)),
-            name=claims.get("name"),
-        )
+        return claims
 
 
-def get_google_verifier() -> GoogleTokenVerifier:
+def get_google_verifier(http: HttpClients = Depends(get_http_clients)) -> GoogleTokenVerifier:
     """FastAPI dependency: always the real Google OIDC verifier (tests inject a fake double)."""
-    return GoogleOidcVerifier(settings.GOOGLE_CLIENT_ID)
+    return GoogleOidcVerifier(settings.GOOGLE_CLIENT_ID, client=http.get("google"))
@@ -3,8 +3,15 @@ from dataclasses import dataclass
 from typing import Protocol
 
 import httpx
+from fastapi import Depends
+from jose import JWTError
 
 from app.core.config import settings
+from app.core.http_clients import HttpClients, get_http_clients
+from app.sso.jwks import JwksCache, verify_locally
+
+LINE_ISSUER = "https://access.line.me"
+line_jwks = JwksCache("https://api.line.me/oauth2/v2.1/certs")
 
 
 @dataclass
@@ -29,22 +36,43 @@ class LineTokenVerifier(Protocol):
 
 
 class LineVerifyApiVerifier:
-    """Real verifier: validates a LINE id_token via LINE's official verify endpoint."""
+    """Real verifier: ES256 against cached LINE JWKS, LINE's verify endpoint otherwise.
+
+    Tokens LINE signs with the channel secret (HS256) or with a key not in the JWKS go to the
+    verify endpoint. Both paths check signature, aud and exp.
+    """
 
     VERIFY_URL = "https://api.line.me/oauth2/v2.1/verify"
 
-    def __init__(self, channel_id: str):
-        """Store the channel id used as the expected audience (client_id)."""
+    def __init__(self, channel_id: str, client: httpx.AsyncClient, jwks: JwksCache = line_jwks):
+        """Store the expected audience (client_id), the shared client and the key cache."""
         self._channel_id = channel_id
+        self._client = client
+        self._jwks = jwks
 
     async def verify(self, id_token: str) -> LineIdentity:
+        """Verify the token locally when its key is cached, else via LINE's verify endpoint."""
+        try:
+            claims = await verify_locally(
+                id_token, self._jwks, self._client,
+                algorithms=["ES256"], audience=self._channel_id, issuer=LINE_ISSUER,
+            )
+        except JWTError as err:
+            raise LineTokenVerificationError(str(err)) from err
+        if claims is None:
+            claims = await self._verify_remote(id_token)
+        sub = claims.get("sub")
+        if not sub:
+            raise LineTokenVerificationError("LINE id_token missing sub")
+        return LineIdentity(sub=str(sub), name=claims.get("name"), email=claims.get("email"))
+
+    async def _verify_remote(self, id_token: str) -> dict:
         """POST the token to LINE's verify endpoint; LINE checks signature/aud/exp."""
         try:
-            async with httpx.AsyncClient(timeout=8) as client:
-                resp = await client.post(
-                    self.VERIFY_URL,
-                    data={"id_token": id_token, "client_id": self._channel_id},
-                )
+            resp = await self._client.post(
+                self.VERIFY_URL,
+                data={"id_token": id_token, "client_id": self._channel_id},
+            )
         except httpx.HTTPError as err:
             raise LineTokenVerificationError(f"LINE verify request failed: {err}") from err
         if resp.status_code != 200:
@@ -55,12 +83,9 @@ class LineVerifyApiVerifier:
             claims = resp.json()
         except ValueError as err:
             raise LineTokenVerificationError("LINE verify returned non-JSON") from err
-        sub = claims.get("sub")
-        if not sub:
-            raise LineTokenVerificationError("LINE verify response missing sub")
-        return LineIdentity(sub=str(sub), name=claims.get("name"), email=claims.get("email"))
+        return claims
 
 
-def get_line_verifier() -> LineTokenVerifier:
+def get_line_verifier(http: HttpClients = Depends(get_http_clients)) -> LineTokenVerifier:
     """FastAPI dependency: always the real LINE verify-endpoint verifier (tests inject a fake)."""
-    return LineVerifyApiVerifier(settings.LINE_CHANNEL_ID)
+    return LineVerifyApiVerifier(settings.LINE_CHANNEL_ID, client=http.get("line"))
@@ -0,0 +1,139 @@
+"""Benchmark: requests/sec through AuditContextMiddleware, BaseHTTPMiddleware vs raw ASGI.
+
+Builds two otherwise identical apps — the real API router plus `/health` — one wrapped in
+the old BaseHTTPMiddleware implementation (reproduced below for comparison), the other in
+the current raw-ASGI `AuditContextMiddleware` — and drives each in-process through httpx's
+ASGITransport, so the numbers measure the middleware and routing stack, not a network.
+
+The tile route is served from a warm cache: Redis is replaced by an in-memory stub holding
+one tile, so no upstream fetch and no Redis server are needed. Every request carries a
+Bearer token, so both variants also pay the token-decode path.
+
+    cd Backend
+    PYTHONPATH=. python scripts/bench_audit_middleware.py --requests 5000 --concurrency 50
+"""
+
+import argparse
+import asyncio
+import time
+
+from fastapi import FastAPI, Request
+from httpx import ASGITransport, AsyncClient
+from jose import JWTError
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from app.api.v1.api import api_router
+from app.core.context import (
+    AuditContextMiddleware,
+    request_access_claims,
+    request_client_ip,
+    request_user_uuid,
+)
+from app.core.security import create_access_token
+from app.core.token_cache import verified_tokens
+from app.services.tile_proxy import BLANK_TILE, build_cache_key
+
+TILE_PATH = "/api/v1/map/tile/road/osm/10/857/434"
+
+
+class LegacyAuditContextMiddleware(BaseHTTPMiddleware):
+    """The pre-ASGI implementation, kept here only as the benchmark's baseline."""
+
+    async def dispatch(self, request: Request, call_next):
+        """Populate the context variables, then proceed through BaseHTTPMiddleware."""
+        client_ip = request.client.host if request.client else None
+        if "x-forwarded-for" in request.headers:
+            client_ip = request.headers["x-forwarded-for"].split(",")[0].strip()
+        user_uuid = None
+        claims = None
+        auth_header = request.headers.get("authorization")
+        if auth_header and auth_header.lower().startswith("bearer "):
+            token = auth_header[7:]
+            try:
+                payload = verified_tokens.decode(token)
+                claims = (token, payload)
+                if payload.get("type") == "access":
+                    user_uuid = payload.get("sub")
+            except JWTError:
+                pass
+        token_user = request_user_uuid.set(user_uuid)
+        token_ip = request_client_ip.set(client_ip)
+        token_claims = request_access_claims.set(claims)
+        try:
+            return await call_next(request)
+        finally:
+            request_user_uuid.reset(token_user)
+            request_client_ip.reset(token_ip)
+            request_access_claims.reset(token_claims)
+
+
+class _WarmTileRedis:
+    """Just enough of redis.asyncio for fetch_tile's cache-hit path."""
+
+    def __init__(self):
+        """Hold one cached tile under the key the benchmark requests."""
+        key = build_cache_key("osm", "road", 10, 857, 434, {})
+        self._tiles = {key: {b"data": BLANK_TILE, b"ct": b"image/png"}}
+
+    async def hgetall(self, key):
+        """Return the cached tile hash (empty dict on a miss)."""
+        return self._tiles.get(key, {})
+
+
+def _build_app(middleware) -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(middleware)
+    app.include_router(api_router, prefix="/api/v1")
+
+    @app.get("/health")
+    async def health_check():
+        return {"status": "ok"}
+
+    app.state.redis = _WarmTileRedis()
+    return app
+
+
+async def _run(app: FastAPI, path: str, *, requests: int, concurrency: int, headers: dict) -> float:
+    """Fire `requests` GETs at `path` with `concurrency` in flight; return requests/sec."""
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://bench") as client:
+        for _ in range(50):  # warm-up: route compilation, token cache, imports
+            (await client.get(path, headers=headers)).raise_for_status()
+
+        remaining = requests
+
+        async def worker():
+            nonlocal remaining
+            while remaining > 0:
+                remaining -= 1
+                (await client.get(path, headers=headers)).raise_for_status()
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        return requests / (time.perf_counter() - start)
+
+
+async def main(requests: int, concurrency: int) -> None:
+    """Benchmark both middleware variants on both paths and print a comparison table."""
+    headers = {"Authorization": f"Bearer {create_access_token(data={'sub': 'bench-user'})}"}
+    variants = {
+        "BaseHTTPMiddleware": _build_app(LegacyAuditContextMiddleware),
+        "raw ASGI": _build_app(AuditContextMiddleware),
+    }
+    print(f"{'path':<42} {'middleware':<20} {'req/s':>10}")
+    for path in ("/health", TILE_PATH):
+        results = {}
+        for name, app in variants.items():
+            results[name] = await _run(
+                app, path, requests=requests, concurrency=concurrency, headers=headers
+            )
+            print(f"{path:<42} {name:<20} {results[name]:>10.0f}")
+        gain = results["raw ASGI"] / results["BaseHTTPMiddleware"] - 1
+        print(f"{'':<42} {'change':<20} {gain:>+10.1%}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.concurrency))
@@ -0,0 +1,59 @@
+"""Benchmark: verification emails rendered per second, full f-string render vs precompiled templates.
+
+Renders `--messages` verification emails with fresh codes, then serializes each into the
+SMTP2Go request body. The baseline rebuilds the inline-CSS HTML from scratch for every
+message (`_verification_email`, what every send used to do) and JSON-encodes the whole
+payload including the logo blob; the current path joins the precompiled fragments around
+the code and splices the per-message fields after the pre-serialized payload prefix.
+
+    cd Backend
+    PYTHONPATH=. python scripts/bench_email_rendering.py --messages 50000
+"""
+
+import argparse
+import json
+import random
+import time
+
+from app.core.config import settings
+from app.messaging.email import _verification_email, build_verification_email
+from app.messaging.smtp2go import _LOGO_B64, _payload
+
+
+def _legacy_payload(to: str, subject: str, html: str, text: str) -> bytes:
+    """The whole payload as a dict, JSON-encoded per message (httpx `json=` did this)."""
+    payload = {
+        "sender": f"{settings.EMAIL_FROM_NAME} <{settings.EMAIL_FROM}>",
+        "to": [to], "subject": subject, "html_body": html, "text_body": text,
+    }
+    if _LOGO_B64:
+        payload["inlines"] = [{"filename": "logo", "fileblob": _LOGO_B64, "mimetype": "image/png"}]
+    return json.dumps(payload).encode()
+
+
+def _rate(fn, codes: list[str]) -> float:
+    start = time.perf_counter()
+    for code in codes:
+        fn(code)
+    return len(codes) / (time.perf_counter() - start)
+
+
+def main(messages: int) -> None:
+    """Time render-only and render+serialize for both paths and print messages/sec."""
+    codes = [f"{random.randrange(10**6):06d}" for _ in range(messages)]
+    variants = {
+        "f-string": (_verification_email, _legacy_payload),
+        "precompiled": (build_verification_email, _payload),
+    }
+    print(f"{'implementation':<16} {'render msg/s':>14} {'render+payload msg/s':>22}")
+    for name, (render, serialize) in variants.items():
+        render_rate = _rate(render, codes)
+        full_rate = _rate(lambda code, r=render, s=serialize: s("volunteer@bench.local", *r(code)), codes)
+        print(f"{name:<16} {render_rate:>14.0f} {full_rate:>22.0f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--messages", type=int, default=50_000)
+    args = parser.parse_args()
+    main(args.messages)
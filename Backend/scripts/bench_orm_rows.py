@@ -0,0 +1,76 @@
+"""Benchmark: station list rows/sec, ORM entities vs Core rows vs projected rows.
+
+Inserts `--rows` stations inside a transaction that is rolled back at the end, then reads
+them back as one page, `--rounds` times per path, each round in a fresh session:
+
+- orm: `StationRepository.list_active` + `StationType.from_model` (what `stations` did);
+- rows: `list_active_rows` with every column + `StationType.from_model` on the rows;
+- projected: `list_active_rows` with only the columns of `items { uuid name createdAt }`.
+
+Reports rows/sec including the query round trip, which the three paths share.
+Needs a PostGIS database with the schema migrated (SQLALCHEMY_DATABASE_URL).
+
+    cd Backend
+    PYTHONPATH=. python scripts/bench_orm_rows.py --rows 500 --rounds 50
+"""
+
+import argparse
+import asyncio
+import time
+
+from geoalchemy2.shape import from_shape
+from shapely.geometry import Point
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.session import engine
+from app.graphql.geo.types import StationType
+from app.models.geo import Station
+from app.repositories.geo_repository import station_repository
+
+_PROJECTED = [Station.created_at, Station.name, Station.property_name, Station.uuid]
+
+
+async def _orm(db: AsyncSession, rows: int) -> int:
+    return len([StationType.from_model(m) for m in await station_repository.list_active(db, limit=rows)])
+
+
+async def _rows(db: AsyncSession, rows: int) -> int:
+    return len([StationType.from_model(r) for r in await station_repository.list_active_rows(db, limit=rows)])
+
+
+async def _projected(db: AsyncSession, rows: int) -> int:
+    page = await station_repository.list_active_rows(db, _PROJECTED, limit=rows)
+    return len([StationType.from_row(r) for r in page])
+
+
+async def main(rows: int, rounds: int) -> None:
+    """Seed the stations, time each path, and print rows/sec."""
+    async with engine.connect() as conn:
+        await conn.begin()
+        async with AsyncSession(bind=conn) as db:
+            db.add_all(
+                Station(
+                    geometry=from_shape(Point(121.5 + i * 1e-4, 25.0), srid=4326),
+                    type="shelter", name=f"bench station {i}", description="d" * 200,
+                    op_hour="24h", contact_name="bench", contact_email="bench@bench.local",
+                )
+                for i in range(rows)
+            )
+            await db.flush()
+        print(f"{'path':<12} {'rows/s':>12}")
+        for name, read in {"orm": _orm, "rows": _rows, "projected": _projected}.items():
+            loaded = 0
+            start = time.perf_counter()
+            for _ in range(rounds):
+                async with AsyncSession(bind=conn) as db:
+                    loaded += await read(db, rows)
+            print(f"{name:<12} {loaded / (time.perf_counter() - start):>12.0f}")
+        await conn.rollback()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=500)
+    parser.add_argument("--rounds", type=int, default=50)
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.rounds))
@@ -0,0 +1,118 @@
+"""Benchmark: OTP verification surge, per-command VerificationRepository vs the Lua scripts.
+
+Models a mass-registration surge: `--users` pending registrations, each verified with
+`--wrong` mistyped codes before the right one, `--concurrency` verifications in flight,
+plus one resend per user. The baseline is the previous implementation, one Redis call per
+step (reproduced below); the current repository runs consume and reissue as one EVALSHA
+each. Reports users verified per second and Redis commands per user.
+
+Needs a running Redis; the benchmark flushes the database it points at.
+
+    cd Backend
+    PYTHONPATH=. python scripts/bench_otp_verification.py --redis-url redis://localhost:6379/15
+"""
+
+import argparse
+import asyncio
+import json
+import time
+
+import redis.asyncio as aioredis
+
+from app.core.security import hash_refresh_token
+from app.repositories.verification_repository import (
+    MAX_OTP_ATTEMPTS,
+    VerificationRepository,
+    _gen_code,
+)
+
+
+class LegacyVerificationRepository(VerificationRepository):
+    """The per-command implementation, kept here only as the benchmark's baseline."""
+
+    async def _consume(self, key: str, code: str) -> dict | None:
+        """GET, compare, then DELETE or INCR/EXPIRE/DELETE as separate calls."""
+        raw = await self.redis.get(key)
+        if raw is None:
+            return None
+        record = json.loads(raw)
+        if hash_refresh_token(code) == record["code_hash"]:
+            await self.redis.delete(key, key + ":attempts")
+            return record
+        n = await self.redis.incr(key + ":attempts")
+        if n == 1:
+            await self.redis.expire(key + ":attempts", self.ttl)
+        if n >= MAX_OTP_ATTEMPTS:
+            await self.redis.delete(key, key + ":attempts")
+        return None
+
+    async def _reissue(self, key: str) -> str | None:
+        """GET, SET, DELETE as separate calls."""
+        raw = await self.redis.get(key)
+        if raw is None:
+            return None
+        record = json.loads(raw)
+        code = _gen_code()
+        record["code_hash"] = hash_refresh_token(code)
+        await self.redis.set(key, json.dumps(record), ex=self.ttl)
+        await self.redis.delete(key + ":attempts")
+        return code
+
+
+class _CountingRedis(aioredis.Redis):
+    """Redis client that counts the commands it sends."""
+
+    commands = 0
+
+    async def execute_command(self, *args, **options):
+        """Count, then send the command as usual."""
+        type(self).commands += 1
+        return await super().execute_command(*args, **options)
+
+
+async def _surge(repo: VerificationRepository, users: int, wrong: int, concurrency: int) -> dict:
+    slots = asyncio.Semaphore(concurrency)
+
+    async def volunteer(i: int) -> None:
+        value = f"volunteer-{i}@bench.local"
+        async with slots:
+            await repo.issue_registration(type_="email", value=value, password_hash="h", name=None)
+            code = await repo.reissue_registration(type_="email", value=value)
+            for _ in range(wrong):
+                wrong_code = "000000" if code != "000000" else "111111"
+                assert await repo.consume_registration(type_="email", value=value, code=wrong_code) is None
+            assert await repo.consume_registration(type_="email", value=value, code=code) is not None
+
+    _CountingRedis.commands = 0
+    start = time.perf_counter()
+    await asyncio.gather(*(volunteer(i) for i in range(users)))
+    elapsed = time.perf_counter() - start
+    return {"users/s": users / elapsed, "cmds/user": _CountingRedis.commands / users}
+
+
+async def main(redis_url: str, users: int, wrong: int, concurrency: int) -> None:
+    """Run the surge against both implementations and print a comparison table."""
+    redis = _CountingRedis.from_url(redis_url, decode_responses=False)
+    try:
+        await VerificationRepository.load_scripts(redis)
+        print(f"{'implementation':<16} {'users/s':>10} {'cmds/user':>10}")
+        variants = {"per-command": LegacyVerificationRepository(redis), "lua": VerificationRepository(redis)}
+        for name, repo in variants.items():
+            await redis.flushdb()
+            result = await _surge(repo, users, wrong, concurrency)
+            print(f"{name:<16} {result['users/s']:>10.0f} {result['cmds/user']:>10.1f}")
+        await redis.flushdb()
+    finally:
+        await redis.aclose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--redis-url", default="redis://localhost:6379/15")
+    parser.add_argument("--users", type=int, default=5000)
+    parser.add_argument(
+        "--wrong", type=int, default=1, help=f"mistyped codes per user (< {MAX_OTP_ATTEMPTS})"
+    )
+    parser.add_argument("--concurrency", type=int, default=100)
+    args = parser.parse_args()
+    asyncio.run(main(args.redis_url, args.users, args.wrong, args.concurrency))
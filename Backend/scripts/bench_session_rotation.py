@@ -0,0 +1,139 @@
+"""Benchmark: refresh-token storm, per-command SessionRepository vs the Lua scripts.
+
+Creates `--sessions` sessions, then rotates every session's refresh token `--rounds` times
+with `--concurrency` rotations in flight — the load a fleet of clients produces when their
+access tokens expire together. The baseline is the previous implementation, one Redis call
+per step (reproduced below); the current repository runs each operation as one EVALSHA.
+Reports rotations/sec, p99 latency, and Redis commands per rotation.
+
+Needs a running Redis; the benchmark flushes the database it points at.
+
+    cd Backend
+    PYTHONPATH=. python scripts/bench_session_rotation.py --redis-url redis://localhost:6379/15
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from datetime import UTC, datetime
+
+import redis.asyncio as aioredis
+
+from app.core.security import generate_refresh_token
+from app.repositories.session_repository import (
+    InvalidRefreshToken,
+    RefreshTokenReuse,
+    SessionRepository,
+)
+
+
+class LegacySessionRepository(SessionRepository):
+    """The per-command implementation, kept here only as the benchmark's baseline."""
+
+    async def create_session(self, user_uuid: str, device: str) -> tuple[str, str]:
+        """Create a session with four sequential calls."""
+        sid = f"legacy-{generate_refresh_token()[:16]}"
+        raw = generate_refresh_token()
+        rt_hash = self._hash(raw)
+        now = datetime.now(UTC).isoformat()
+        session = {
+            "user_uuid": user_uuid, "current_rt_hash": rt_hash, "device": device,
+            "created_at": now, "last_used_at": now,
+        }
+        await self.redis.set(self.SESSION + sid, json.dumps(session), ex=self.ttl)
+        await self.redis.set(
+            self.REFRESH + rt_hash, json.dumps({"sid": sid, "user_uuid": user_uuid}), ex=self.ttl
+        )
+        await self.redis.sadd(self.USER_SESSIONS + user_uuid, sid)
+        await self.redis.expire(self.USER_SESSIONS + user_uuid, self.ttl)
+        return sid, raw
+
+    async def rotate(self, raw_token: str) -> tuple[str, str, str]:
+        """Rotate with a GET, SET NX claim, GET, two SETs and an EXPIRE."""
+        rt_hash = self._hash(raw_token)
+        rec = await self.get_refresh(rt_hash)
+        if rec is None:
+            raise InvalidRefreshToken
+        sid, user_uuid = rec["sid"], rec["user_uuid"]
+        if not await self.redis.set(self.USED + rt_hash, b"1", nx=True, ex=self.ttl):
+            await self.revoke_session(sid)
+            raise RefreshTokenReuse
+        session = self._load(await self.redis.get(self.SESSION + sid))
+        if session is None:
+            raise InvalidRefreshToken
+        new_raw = generate_refresh_token()
+        new_hash = self._hash(new_raw)
+        await self.redis.set(
+            self.REFRESH + new_hash, json.dumps({"sid": sid, "user_uuid": user_uuid}), ex=self.ttl
+        )
+        session["current_rt_hash"] = new_hash
+        session["last_used_at"] = datetime.now(UTC).isoformat()
+        await self.redis.set(self.SESSION + sid, json.dumps(session), ex=self.ttl)
+        await self.redis.expire(self.USER_SESSIONS + user_uuid, self.ttl)
+        return sid, user_uuid, new_raw
+
+
+class _CountingRedis(aioredis.Redis):
+    """Redis client that counts the commands it sends."""
+
+    commands = 0
+
+    async def execute_command(self, *args, **options):
+        """Count, then send the command as usual."""
+        type(self).commands += 1
+        return await super().execute_command(*args, **options)
+
+
+async def _storm(repo: SessionRepository, sessions: int, rounds: int, concurrency: int) -> dict:
+    tokens = [(await repo.create_session(f"user-{i % 50}", "bench"))[1] for i in range(sessions)]
+    slots = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+
+    async def rotate(i: int) -> None:
+        async with slots:
+            start = time.perf_counter()
+            _, _, tokens[i] = await repo.rotate(tokens[i])
+            latencies.append((time.perf_counter() - start) * 1000)
+
+    _CountingRedis.commands = 0
+    start = time.perf_counter()
+    for _ in range(rounds):
+        await asyncio.gather(*(rotate(i) for i in range(sessions)))
+    elapsed = time.perf_counter() - start
+    total = sessions * rounds
+    return {
+        "rotations/s": total / elapsed,
+        "p99 ms": statistics.quantiles(latencies, n=100, method="inclusive")[98],
+        "cmds/rotation": _CountingRedis.commands / total,
+    }
+
+
+async def main(redis_url: str, sessions: int, rounds: int, concurrency: int) -> None:
+    """Run the storm against both implementations and print a comparison table."""
+    redis = _CountingRedis.from_url(redis_url, decode_responses=False)
+    try:
+        await SessionRepository.load_scripts(redis)
+        print(f"{'implementation':<16} {'rotations/s':>12} {'p99 ms':>8} {'cmds/rotation':>14}")
+        variants = {"per-command": LegacySessionRepository(redis), "lua": SessionRepository(redis)}
+        for name, repo in variants.items():
+            await redis.flushdb()
+            result = await _storm(repo, sessions, rounds, concurrency)
+            print(
+                f"{name:<16} {result['rotations/s']:>12.0f} {result['p99 ms']:>8.2f} "
+                f"{result['cmds/rotation']:>14.1f}"
+            )
+        await redis.flushdb()
+    finally:
+        await redis.aclose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--redis-url", default="redis://localhost:6379/15")
+    parser.add_argument("--sessions", type=int, default=1000)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--concurrency", type=int, default=100)
+    args = parser.parse_args()
+    asyncio.run(main(args.redis_url, args.sessions, args.rounds, args.concurrency))
@@ -0,0 +1,97 @@
+"""Import an open-data GeoJSON or CSV file as stations or closure areas (app/services/geo_import.py).
+
+    python -m scripts.import_geo station shelters.geojson --source moi-shelters --id-field SHELTER_ID
+    python -m scripts.import_geo closure_area closures.csv --source road-closures --map status=STATE
+
+Safe to re-run on the next copy of the same feed: rows are matched on `--source` plus the
+feature's id, so they are updated in place, and an unchanged file changes nothing. Progress
+goes to stderr after every batch; the skipped features and the final counts follow.
+
+Runs as a trusted operator, so no RBAC check applies, and the rows it creates have
+created_by=NULL (and, with no request context, audit actor=NULL, as in
+scripts/bootstrap_admin.py). Afterwards it bumps the anonymous GraphQL response cache and
+announces the changed stations to the API workers' subscribers over Redis. Both steps are
+best-effort, so an unreachable Redis does not fail an import that already committed.
+"""
+
+import argparse
+import asyncio
+import sys
+
+import redis.asyncio as aioredis
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core.config import settings
+from app.core.live_events import live_events
+from app.graphql.response_cache import bump
+from app.services import geo_import
+
+
+def _progress(report: geo_import.ImportReport) -> None:
+    print(f"read {report.read}, staged {report.staged}, rejected {report.rejected}", file=sys.stderr)
+
+
+async def run(args: argparse.Namespace, reader: geo_import.FeatureReader) -> geo_import.ImportReport:
+    """Import what `reader` yields in one transaction, then notify the running API."""
+    engine = create_async_engine(settings.SQLALCHEMY_DATABASE_URL, echo=False)
+    async_session = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    redis = aioredis.from_url(settings.REDIS_URL, decode_responses=False)
+    live_events.start(redis)
+    try:
+        async with async_session() as db:
+            report = await geo_import.import_features(
+                db, actor=None, kind=args.kind, source=args.source, reader=reader,
+                id_field=args.id_field, fields=geo_import.parse_field_map(args.map),
+                on_progress=_progress,
+            )
+        if report.created or report.updated:
+            await bump(redis, ("geo",))
+        return report
+    finally:
+        await live_events.stop()
+        await redis.aclose()
+        await engine.dispose()
+
+
+def main() -> None:
+    """Parse CLI args, run the import and print its report."""
+    parser = argparse.ArgumentParser(description="Import stations or closure areas from an open-data file")
+    parser.add_argument("kind", choices=sorted(geo_import.TARGETS))
+    parser.add_argument("path")
+    parser.add_argument("--source", required=True, help="dataset name; re-runs upsert on it plus the id")
+    parser.add_argument("--id-field", default="id", help="property holding each feature's id in the feed")
+    parser.add_argument(
+        "--map", action="append", default=[], metavar="COLUMN=PROPERTY",
+        help="read COLUMN from the feed's PROPERTY (repeatable)",
+    )
+    parser.add_argument("--format", choices=["geojson", "csv"], help="default: from the file extension")
+    parser.add_argument("--encoding", default="utf-8-sig")
+    parser.add_argument("--wkt-field", default="wkt", help="CSV column holding WKT geometries")
+    parser.add_argument("--lon-field", default="lon", help="CSV longitude column, when there is no WKT")
+    parser.add_argument("--lat-field", default="lat", help="CSV latitude column, when there is no WKT")
+    args = parser.parse_args()
+    try:
+        with open(args.path, encoding=args.encoding, newline="") as stream:
+            if (args.format or geo_import.format_for(args.path)) == "csv":
+                reader = geo_import.read_csv(
+                    stream, wkt_field=args.wkt_field, lon_field=args.lon_field, lat_field=args.lat_field
+                )
+            else:
+                reader = geo_import.read_geojson(stream)
+            report = asyncio.run(run(args, reader))
+    except ValueError as err:
+        raise SystemExit(f"Import failed: {err}") from err
+    for error in report.errors:
+        print(f"skipped feature {error.index}: {error.message}", file=sys.stderr)
+    if report.rejected + report.skipped > len(report.errors):
+        more = report.rejected + report.skipped - len(report.errors)
+        print(f"... and {more} more skipped", file=sys.stderr)
+    print(
+        f"{report.read} read: {report.created} created, {report.updated} updated, "
+        f"{report.unchanged} unchanged, {report.rejected} invalid, {report.skipped} skipped"
+    )
+
+
+if __name__ == "__main__":
+    main()
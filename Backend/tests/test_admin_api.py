@@ -126,6 +126,8 @@ async def test_list_users_returns_role_info(client, db_session):
     rows = {row["uuid"]: row for row in resp.json()}
     assert admin_uuid in rows
     assert rows[admin_uuid]["platform_role"] == "super_admin"
+    assert set(rows[admin_uuid]) == {"uuid", "name", "team_uuid", "platform_role", "team_role"}
+    assert rows[admin_uuid]["name"]
 
 
 @pytest.mark.asyncio
@@ -403,3 +405,56 @@ async def test_list_teams_denied_without_team_view(client, db_session):
     plain_uuid = await _make_plain_user(db_session)
     resp = await client.get("/api/v1/admin/teams", headers=_auth_header(plain_uuid))
     assert resp.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_revoke_team_sessions_signs_out_only_that_team(client, db_session, redis):
+    """Revoking a team's sessions kills every member's refresh tokens, not outsiders'."""
+    from app.repositories.session_repository import SessionRepository
+
+    admin_uuid = await _make_super_admin(db_session)
+    team_uuid = await _make_team(db_session, name="Team A", type_="gov")
+    member_1 = await _make_plain_user(db_session, name="M1", team_uuid=team_uuid)
+    member_2 = await _make_plain_user(db_session, name="M2", team_uuid=team_uuid)
+    outsider = await _make_plain_user(db_session, name="Outsider")
+
+    repo = SessionRepository(redis)
+    for user_uuid in (member_1, member_1, member_2, outsider):
+        await repo.create_session(user_uuid, device="pytest")
+
+    resp = await client.post(
+        f"/api/v1/admin/teams/{team_uuid}/sessions/revoke", headers=_auth_header(admin_uuid)
+    )
+    assert resp.status_code == 200, resp.json()
+    assert resp.json() == {"user_count": 2, "session_count": 3}
+    assert await redis.scard(repo.USER_SESSIONS + outsider) == 1
+
+
+@pytest.mark.asyncio
+async def test_outbox_lookup_shows_delivery_status_without_bodies(client, db_session, redis):
+    """Support sees a recipient's queued messages by (normalized) address, never their contents."""
+    from app.messaging.outbox import Outbox
+
+    admin_uuid = await _make_super_admin(db_session)
+    await Outbox(redis).enqueue("email", "alice@example.com", subject="s", html="h", text="code 123456")
+
+    resp = await client.get(
+        "/api/v1/admin/outbox", params={"type": "email", "value": "Alice@Example.com"},
+        headers=_auth_header(admin_uuid),
+    )
+    assert resp.status_code == 200, resp.json()
+    (message,) = resp.json()
+    assert message["to"] == "alice@example.com"
+    assert message["status"] == "queued" and message["attempts"] == 0
+    assert "123456" not in resp.text
+
+
+@pytest.mark.asyncio
+async def test_outbox_lookup_requires_user_view(client, db_session):
+    """A user without user.view cannot read delivery status."""
+    user_uuid = await _make_plain_user(db_session)
+    resp = await client.get(
+        "/api/v1/admin/outbox", params={"type": "email", "value": "alice@example.com"},
+        headers=_auth_header(user_uuid),
+    )
+    assert resp.status_code == 403
@@ -8,8 +8,12 @@ This test goes through the full ASGI stack (real Bearer token, real middleware)
 
 import pytest
 import pytest_asyncio
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from httpx import ASGITransport, AsyncClient
 from sqlalchemy import select, text
 
+from app.core.context import AuditContextMiddleware, request_client_ip, request_user_uuid
 from app.core.security import create_access_token
 from app.db.triggers import AUDIT_TRIGGER_FUNC_SQL, get_audit_trigger_sql
 from app.models.audit import AuditLog
@@ -63,3 +67,27 @@ async def test_authenticated_request_attributes_audit_log_to_the_real_caller(cli
     ).scalars().all()
     assert len(logs) == 1
     assert str(logs[0].user_uuid) == actor_uuid
+
+
+@pytest.mark.asyncio
+async def test_middleware_sets_context_for_streamed_responses_without_wrapping_them():
+    """The raw-ASGI middleware exposes caller + IP while a streamed body is being generated."""
+    probe = FastAPI()
+    probe.add_middleware(AuditContextMiddleware)
+
+    @probe.get("/stream")
+    async def stream():
+        async def body():
+            yield f"{request_user_uuid.get()}|".encode()
+            yield f"{request_client_ip.get()}".encode()
+
+        return StreamingResponse(body(), media_type="text/plain")
+
+    token = create_access_token(data={"sub": "streaming-user"})
+    async with AsyncClient(transport=ASGITransport(app=probe), base_url="http://test") as ac:
+        resp = await ac.get(
+            "/stream",
+            headers={"Authorization": f"Bearer {token}", "X-Forwarded-For": "203.0.113.7, 10.0.0.1"},
+        )
+    assert resp.status_code == 200
+    assert resp.text == "streaming-user|203.0.113.7"
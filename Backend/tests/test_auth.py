@@ -1,6 +1,9 @@
 """Integration tests for authentication endpoints: register, verify, login, and salt retrieval."""
 
+import asyncio
+import logging
 import os
+import threading
 import uuid
 
 import pytest
@@ -80,3 +83,46 @@ async def test_malformed_password_logic():
     assert security.verify_password("p", "invalid_string") is False
     # 分割部分不足
     assert security.verify_password("p", "pbkdf2_sha256$600000$salt") is False
+
+
+class _QuickPBKDF2(security.PBKDF2SHA256Handler):
+    """Same format, fewer rounds — still slow enough that 8 submissions overlap."""
+
+    default_iterations = 100_000
+
+
+@pytest.mark.asyncio
+async def test_async_password_helpers_match_sync_and_run_on_the_pool():
+    """hash/verify on the pool produce the same results as the inline versions."""
+    pool = security.PasswordHashPool(concurrency=2)
+    manager = security.PasswordManager(pool=pool)
+    manager.register(_QuickPBKDF2(), default=True)
+    try:
+        hashed = await manager.hash_async("pw", "salt")
+        assert manager.verify("pw", hashed) is True
+        assert await manager.verify_async("pw", hashed) is True
+        assert await manager.verify_async("wrong", hashed) is False
+
+        await asyncio.gather(*(manager.verify_async("pw", hashed) for _ in range(8)))
+        stats = pool.stats()
+        assert stats.completed == 11
+        assert stats.running == 0 and stats.queued == 0
+        assert 0 < stats.peak_queued <= 6
+    finally:
+        pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_password_pool_logs_its_stats_once_when_the_queue_backs_up(caplog):
+    """Past `warn_queued` waiting hashes the pool logs a warning, rate-limited to one per interval."""
+    pool = security.PasswordHashPool(concurrency=1, warn_queued=2)
+    release = threading.Event()
+    try:
+        with caplog.at_level(logging.WARNING, logger="app.core.security"):
+            waiting = [pool.run(release.wait) for _ in range(4)]  # 1 running, then 1, 2, 3 queued
+            await asyncio.gather(*waiting, asyncio.to_thread(release.set))
+        warnings = [r.getMessage() for r in caplog.records if "backing up" in r.getMessage()]
+        assert len(warnings) == 1
+        assert "concurrency=1" in warnings[0]
+    finally:
+        pool.shutdown()
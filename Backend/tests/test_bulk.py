@@ -0,0 +1,50 @@
+"""Tests for the per-row checks behind the bulk create use-cases (app/services/bulk.py, geo_validation.py)."""
+
+import pytest
+
+from app.core.config import settings
+from app.models.request import Tickets
+from app.services.bulk import check_batch_size, check_lengths
+from app.services.geo_validation import validate_point, validate_points
+
+_ROWS = [
+    {"type": "Point", "coordinates": [121.5, 25.0]},
+    {"type": "Point", "coordinates": [181, 25.0]},
+    {"type": "Polygon", "coordinates": [[[0, 0], [1, 0], [1, 1], [0, 0]]]},
+    {"type": "Point", "coordinates": []},
+    {"type": "Point"},
+]
+
+
+def test_validate_points_matches_validate_point_row_by_row():
+    """The batch gives each row the message validate_point raises for it, and a geometry when valid."""
+    geometries, errors = validate_points(_ROWS, entity="Ticket")
+    for geojson, geometry, error in zip(_ROWS, geometries, errors, strict=True):
+        try:
+            validate_point(geojson, entity="Ticket")
+        except Exception as exc:  # noqa: BLE001 — shapely raises its own types for malformed input
+            expected = str(exc) if isinstance(exc, ValueError) else "Ticket geometry must be a Point"
+            assert (geometry, error) == (None, expected)
+        else:
+            assert error is None and geometry.srid == 4326
+    assert errors == [
+        None, "Invalid coordinates", "Ticket geometry must be a Point",
+        "Ticket geometry must be a Point", "Ticket geometry must be a Point",
+    ]
+
+
+def test_check_lengths_names_the_column():
+    """Strings over their column's varchar length fail the row with a domain message."""
+    check_lengths(Tickets, {"title": "x" * 200, "description": "x" * 10_000, "geometry": object()})
+    with pytest.raises(ValueError, match="title must be at most 200 characters"):
+        check_lengths(Tickets, {"title": "x" * 201})
+
+
+def test_check_batch_size(monkeypatch):
+    """An empty batch or one over BULK_CREATE_MAX_ROWS is refused as a whole."""
+    monkeypatch.setattr(settings, "BULK_CREATE_MAX_ROWS", 2)
+    check_batch_size([{}, {}])
+    with pytest.raises(ValueError, match="At least one row"):
+        check_batch_size([])
+    with pytest.raises(ValueError, match="At most 2 rows"):
+        check_batch_size([{}, {}, {}])
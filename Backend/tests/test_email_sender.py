@@ -4,11 +4,13 @@ import logging
 
 import pytest
 
+from app.core.http_clients import HttpClients
+from app.messaging import email as email_module
 from app.messaging.email import (
     ConsoleEmailSender,
     build_contact_verification_email,
+    build_email_sender,
     build_verification_email,
-    get_email_sender,
 )
 
 
@@ -40,18 +42,32 @@ def test_build_contact_verification_email_has_code_and_distinct_copy():
     assert "驗證此電子郵件" in text
 
 
-def test_get_email_sender_defaults_to_console(monkeypatch):
-    """get_email_sender returns a ConsoleEmailSender for the console provider."""
+@pytest.mark.parametrize(
+    ("builder", "source"),
+    [
+        ("build_verification_email", "_verification_email"),
+        ("build_contact_verification_email", "_contact_verification_email"),
+        ("build_password_reset_email", "_password_reset_email"),
+    ],
+)
+def test_compiled_templates_match_a_full_render(builder, source):
+    """Each precompiled builder returns exactly what rendering its template from scratch does."""
+    for code in ("000000", "482913"):
+        assert getattr(email_module, builder)(code) == getattr(email_module, source)(code)
+
+
+def test_build_email_sender_defaults_to_console(monkeypatch):
+    """build_email_sender returns a ConsoleEmailSender for the console provider."""
     from app.core.config import settings
 
     monkeypatch.setattr(settings, "EMAIL_PROVIDER", "console")
-    assert isinstance(get_email_sender(), ConsoleEmailSender)
+    assert isinstance(build_email_sender(HttpClients()), ConsoleEmailSender)
 
 
-def test_get_email_sender_returns_smtp2go_when_configured(monkeypatch):
-    """get_email_sender returns the SMTP2Go adapter when EMAIL_PROVIDER is 'smtp2go'."""
+def test_build_email_sender_returns_smtp2go_when_configured(monkeypatch):
+    """build_email_sender returns the SMTP2Go adapter when EMAIL_PROVIDER is 'smtp2go'."""
     from app.core.config import settings
     from app.messaging.smtp2go import Smtp2goEmailSender
 
     monkeypatch.setattr(settings, "EMAIL_PROVIDER", "smtp2go")
-    assert isinstance(get_email_sender(), Smtp2goEmailSender)
+    assert isinstance(build_email_sender(HttpClients()), Smtp2goEmailSender)
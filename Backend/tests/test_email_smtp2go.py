@@ -1,5 +1,7 @@
 """Tests for the SMTP2Go HTTP-API email adapter."""
 
+import json
+
 import httpx
 import pytest
 
@@ -11,37 +13,16 @@ async def test_smtp2go_posts_to_api(monkeypatch):
     """send() POSTs to the SMTP2Go v3 endpoint with the api-key header and recipient."""
     captured = {}
 
-    class FakeResp:
-        """Stand-in httpx response with a no-op status check."""
-
-        status_code = 200
-
-        def raise_for_status(self):
-            """No-op for a 2xx response."""
-
-    class FakeClient:
-        """Async context-manager double recording the POST arguments."""
-
-        def __init__(self, *a, **k):
-            """Accept and ignore client args."""
-
-        async def __aenter__(self):
-            """Enter the async context and return self."""
-            return self
-
-        async def __aexit__(self, *a):
-            """Exit the async context without suppressing exceptions."""
-            return False
+    def handler(request: httpx.Request) -> httpx.Response:
+        """Record the request and accept it."""
+        captured["url"], captured["headers"] = str(request.url), request.headers
+        captured["json"] = json.loads(request.content)
+        return httpx.Response(200, json={"data": {"succeeded": 1}})
 
-        async def post(self, url, json, headers):
-            """Record the POST arguments and return a fake response."""
-            captured["url"], captured["json"], captured["headers"] = url, json, headers
-            return FakeResp()
-
-    monkeypatch.setattr(httpx, "AsyncClient", FakeClient)
     monkeypatch.setattr("app.messaging.smtp2go.settings.SMTP2GO_API_KEY", "api-test", raising=False)
 
-    await Smtp2goEmailSender().send("alice@x.com", "Verify", "<p>html 123456</p>", "code 123456")
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    await Smtp2goEmailSender(client).send("alice@x.com", "Verify", "<p>html 123456</p>", "code 123456")
     body = captured["json"]
     assert captured["url"] == "https://api.smtp2go.com/v3/email/send"
     assert captured["headers"]["X-Smtp2go-Api-Key"] == "api-test"
@@ -58,4 +39,25 @@ async def test_smtp2go_fails_fast_on_missing_api_key(monkeypatch):
     """An empty SMTP2GO_API_KEY raises a clear config error instead of a generic HTTP failure."""
     monkeypatch.setattr("app.messaging.smtp2go.settings.SMTP2GO_API_KEY", "", raising=False)
     with pytest.raises(RuntimeError, match="SMTP2GO_API_KEY"):
-        await Smtp2goEmailSender().send("alice@x.com", "Verify", "<p>html</p>", "text")
+        await Smtp2goEmailSender(httpx.AsyncClient()).send("alice@x.com", "Verify", "<p>html</p>", "text")
+
+
+@pytest.mark.asyncio
+async def test_smtp2go_payload_splices_per_message_fields(monkeypatch):
+    """The pre-serialized prefix and the per-message fields form one valid JSON document."""
+    bodies = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        """Keep the parsed request body."""
+        bodies.append(json.loads(request.content))
+        return httpx.Response(200)
+
+    monkeypatch.setattr("app.messaging.smtp2go.settings.SMTP2GO_API_KEY", "api-test", raising=False)
+    sender = Smtp2goEmailSender(httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+    for to in ("a@x.com", "b@x.com"):
+        await sender.send(to, "【島嶼守望】驗證碼", '<p style="x">"quoted"</p>', "line1\nline2")
+    assert [b["to"] for b in bodies] == [["a@x.com"], ["b@x.com"]]
+    assert bodies[1]["subject"] == "【島嶼守望】驗證碼"
+    assert bodies[1]["html_body"] == '<p style="x">"quoted"</p>'
+    assert bodies[1]["text_body"] == "line1\nline2"
+    assert bodies[0]["sender"] == bodies[1]["sender"]
@@ -0,0 +1,143 @@
+"""Tests for the export encoders, masking and gzip framing (app/services/export.py)."""
+
+import csv
+import dataclasses
+import gzip
+import io
+import json
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from uuid import UUID
+
+import pytest
+
+from app.services import export, geo_import
+
+_UUID = UUID("12345678-1234-5678-1234-567812345678")
+
+
+def _ticket(pii_visible: bool, geometry: str | None, **values) -> SimpleNamespace:
+    row = dict.fromkeys(export.LAYERS["tickets"].fields)
+    row.update(
+        uuid=_UUID, title="斷橋", created_at=datetime(2026, 1, 2, 3, 4, 5, tzinfo=UTC),
+        contact_name="王小明", contact_email="john@example.com", contact_phone="0912345678",
+        **values,
+    )
+    return SimpleNamespace(**row, geometry=geometry, pii_visible=pii_visible)
+
+
+_POINT = '{"type":"Point","coordinates":[121.5,25]}'
+
+
+class _Result:
+    """Stands in for the AsyncResult of `stream_active_rows`: rows in fetched batches."""
+
+    def __init__(self, *batches):
+        self.batches = batches
+
+    async def partitions(self):
+        for batch in self.batches:
+            yield list(batch)
+
+
+async def _encode(fmt: str, *batches) -> str:
+    encoder = export._ENCODERS[fmt]
+    return "".join([chunk async for chunk in encoder(export.LAYERS["tickets"], _Result(*batches))])
+
+
+@pytest.mark.asyncio
+async def test_geojson_is_one_feature_collection_across_batches():
+    """Batches join with commas; the PostGIS geometry is spliced in as-is, a missing one as null."""
+    batches = [_ticket(True, _POINT)], [], [_ticket(False, None), _ticket(True, _POINT)]
+    text = await _encode("geojson", *batches)
+    collection = json.loads(text)
+    assert collection["type"] == "FeatureCollection"
+    assert [f["geometry"] for f in collection["features"]] == [json.loads(_POINT), None, json.loads(_POINT)]
+    first = collection["features"][0]["properties"]
+    assert (first["uuid"], first["title"], first["created_at"]) == (
+        str(_UUID), "斷橋", "2026-01-02T03:04:05+00:00",
+    )
+    assert json.loads(await _encode("geojson")) == {"type": "FeatureCollection", "features": []}
+
+
+@pytest.mark.asyncio
+async def test_contacts_are_masked_unless_pii_is_visible_for_the_row():
+    """The masking of app/graphql/masking.py, row by row on the query's pii_visible column."""
+    lines = (await _encode("ndjson", [_ticket(True, _POINT), _ticket(False, _POINT)])).splitlines()
+    visible, masked = (json.loads(line)["properties"] for line in lines)
+    assert (visible["contact_name"], visible["contact_email"], visible["contact_phone"]) == (
+        "王小明", "john@example.com", "0912345678",
+    )
+    assert masked["contact_name"] == "王◯◯"
+    assert masked["contact_email"] != "john@example.com"
+    assert masked["contact_phone"] != "0912345678"
+
+
+@pytest.mark.asyncio
+async def test_csv_has_a_bom_header_and_wkt_column():
+    """Excel-friendly UTF-8, the layer's fields in order, then the geometry as WKT."""
+    text = await _encode("csv", [_ticket(True, "POINT(121.5 25)")], [_ticket(False, None)])
+    assert text.startswith("\ufeff")
+    header, first, second = csv.reader(io.StringIO(text[1:]))
+    assert header == [*export.LAYERS["tickets"].fields, "wkt"]
+    assert (first[0], first[-1], second[-1]) == (str(_UUID), "POINT(121.5 25)", "")
+    assert first[header.index("created_at")] == "2026-01-02T03:04:05+00:00"
+
+
+@pytest.mark.asyncio
+async def test_csv_neutralises_cells_excel_would_run_as_formulas():
+    """User text starting with = + - @ tab or CR gets a leading quote; other cells are untouched."""
+    hostile = ["=HYPERLINK(\"http://x\")", "+1+1", "-2", "@SUM(A1)", "\tcmd", "\rcmd"]
+    rows = [_ticket(True, "POINT(121.5 25)", description=text) for text in hostile]
+    rows.append(_ticket(True, "POINT(121.5 25)", description="a = b"))
+    text = await _encode("csv", rows)
+    header, *cells = csv.reader(io.StringIO(text[1:]))
+    descriptions = [row[header.index("description")] for row in cells]
+    assert descriptions == [*("'" + text for text in hostile), "a = b"]
+    assert cells[0][header.index("title")] == "斷橋"
+
+
+def test_csv_quoting_round_trips_through_the_import():
+    """What the export quotes, the open-data import reads back as the original text."""
+    for text in ["=1+1", "+886912345678", "-2 floors", "@home", "'=quoted", "''+x", "'plain", "a = b"]:
+        assert geo_import._text(export._csv_value(text)) == text
+
+
+@pytest.mark.asyncio
+async def test_stream_export_gzips_the_whole_body(monkeypatch):
+    """With gzip=True the chunks concatenate into one valid gzip member of the plain body."""
+    result = _Result([_ticket(True, _POINT)], [_ticket(False, _POINT)])
+
+    async def stream_active_rows(db, columns, **kwargs):
+        return result
+
+    repository = SimpleNamespace(stream_active_rows=stream_active_rows)
+
+    @asynccontextmanager
+    async def session():
+        yield None
+
+    monkeypatch.setattr(export, "SessionLocal", session)
+    layer = dataclasses.replace(export.LAYERS["tickets"], repository=repository)
+    plan = export.ExportPlan(layer, format="ndjson", columns=(), filters={})
+    plain = b"".join([chunk async for chunk in export.stream_export(plan)])
+    zipped = b"".join([chunk async for chunk in export.stream_export(plan, gzip=True)])
+    assert gzip.decompress(zipped) == plain
+    assert len(plain.splitlines()) == 2
+
+
+def test_parse_bbox():
+    """Four comma-separated numbers; anything else is a ValueError (a 400 at the endpoint)."""
+    bounds = export.parse_bbox("121, 25, 121.5,25.5")
+    assert (bounds.min_lng, bounds.min_lat, bounds.max_lng, bounds.max_lat) == (121, 25, 121.5, 25.5)
+    for text in ("121,25,121.5", "a,b,c,d"):
+        with pytest.raises(ValueError, match="bbox must be"):
+            export.parse_bbox(text)
+
+
+@pytest.mark.asyncio
+async def test_plan_export_refuses_another_layers_filter_before_authz():
+    """`status` is a ticket filter; asking stations for it fails without touching the database."""
+    with pytest.raises(ValueError, match="stations cannot be filtered by status"):
+        await export.plan_export(None, actor=None, layer="stations", format="csv", filters={"status": "open"})
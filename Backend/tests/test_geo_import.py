@@ -0,0 +1,121 @@
+"""Tests for the streaming readers and batch normalisation of the open-data import (geo_import.py)."""
+
+import io
+import json
+
+import pytest
+import shapely
+
+from app.services import geo_import
+from app.services.bulk import RowError
+
+
+def _collection(features: list[dict]) -> str:
+    return json.dumps({"type": "FeatureCollection", "name": "shelters", "features": features})
+
+
+def _point(lng: float, lat: float = 25.0, **properties) -> dict:
+    geometry = {"type": "Point", "coordinates": [lng, lat]}
+    return {"type": "Feature", "geometry": geometry, "properties": properties}
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 1 << 16])
+def test_read_geojson_streams_features_across_chunk_boundaries(chunk_size):
+    """Features split anywhere by the read size decode the same; a top-level id becomes `id`."""
+    text = _collection([_point(121.5, id="a", name="甲"), {**_point(121.6, name="乙"), "id": 7}])
+    reader = geo_import.read_geojson(io.StringIO(text), chunk_size=chunk_size)
+    assert reader.geometry_format == "geojson"
+    assert [properties for _, properties in reader.features] == [
+        {"id": "a", "name": "甲"}, {"id": 7, "name": "乙"},
+    ]
+
+
+def test_read_geojson_rejects_other_documents():
+    """Not a FeatureCollection, or cut off before its closing bracket: the file fails as a whole."""
+    with pytest.raises(ValueError, match="Not a GeoJSON FeatureCollection"):
+        list(geo_import.read_geojson(io.StringIO('{"type": "Point", "coordinates": [0, 0]}')).features)
+    truncated = _collection([_point(121.5, id="a"), _point(121.6, id="b")])[:-20]
+    features = geo_import.read_geojson(io.StringIO(truncated), chunk_size=16).features
+    assert next(features)[1] == {"id": "a"}
+    with pytest.raises(ValueError, match="Malformed or truncated GeoJSON"):
+        next(features)
+
+
+def test_read_csv_takes_wkt_or_lon_lat_columns():
+    """A WKT column wins over lon/lat; without either the file is refused."""
+    reader = geo_import.read_csv(io.StringIO("id,wkt,lon,lat\na,POINT (1 2),3,4\n"))
+    assert reader.geometry_format == "wkt"
+    assert list(reader.features) == [("POINT (1 2)", {"id": "a", "lon": "3", "lat": "4"})]
+    reader = geo_import.read_csv(io.StringIO("code,x,y\na,121.5,25\n"), lon_field="x", lat_field="y")
+    assert (reader.geometry_format, list(reader.features)) == ("lonlat", [(("121.5", "25"), {"code": "a"})])
+    with pytest.raises(ValueError, match="CSV needs a wkt column, or lon and lat columns"):
+        geo_import.read_csv(io.StringIO("id,name\na,b\n"))
+
+
+def test_normalize_batch_reports_each_bad_feature_and_stages_the_rest():
+    """Every rejected feature names its file index and reason; the valid ones become staging records."""
+    features = [
+        ({"type": "Point", "coordinates": [121.5, 25.0, 30.0]}, {"id": 1, "name": " Shelter ", "level": "2"}),
+        ({"type": "Point", "coordinates": [500, 25.0]}, {"id": "b"}),
+        (None, {"id": "c"}),
+        ({"type": "LineString", "coordinates": [[0, 0], [1, 1]]}, {"id": "d"}),
+        ({"type": "Point", "coordinates": [121.5, 25.0]}, {"name": "no id"}),
+        ({"type": "Point", "coordinates": [121.5, 25.0]}, {"id": "f", "level": "ground"}),
+        ({"type": "Point", "coordinates": [121.5, 25.0]}, {"id": "g", "SHELTER_PHONE": "  02-1234  "}),
+    ]
+    records, errors = geo_import.normalize_batch(
+        "station", "geojson", features, fields={"contact_phone": "SHELTER_PHONE"}, start=100
+    )
+    assert errors == [
+        RowError(101, "Invalid coordinates"),
+        RowError(102, "Station geometry is missing or invalid"),
+        RowError(103, "Station geometry must be a Point"),
+        RowError(104, "id is required"),
+        RowError(105, "level must be an integer"),
+    ]
+    columns = ["seq", "external_id", "wkb", *geo_import.TARGETS["station"].columns]
+    first, last = (dict(zip(columns, record, strict=True)) for record in records)
+    assert (first["seq"], first["external_id"], first["name"], first["level"]) == (100, "1", "Shelter", 2)
+    assert shapely.from_wkb(first["wkb"]).equals(shapely.Point(121.5, 25.0))  # Z dropped
+    assert (last["visibility"], last["level"], last["contact_phone"]) == ("public", 0, "02-1234")
+
+
+def test_normalize_batch_repairs_polygons_and_snaps_to_the_grid():
+    """A bow-tie is repaired rather than rejected, and re-importing jittered coordinates is a no-op."""
+    bow_tie = "POLYGON ((0 0, 1 1, 1 0, 0 1, 0 0))"
+    square = "POLYGON ((121 25, 121.001 25, 121.001 25.001, 121 25.001, 121 25))"
+    jittered = "POLYGON ((121.00000000001 25, 121.001 25, 121.001 25.001, 121 25.001, 121.00000000001 25))"
+    features = [(wkt, {"id": str(i)}) for i, wkt in enumerate([bow_tie, square, jittered, "POINT (1 1)"])]
+    records, errors = geo_import.normalize_batch("closure_area", "wkt", features)
+    assert errors == [RowError(3, "Closure area geometry must be Polygon or MultiPolygon")]
+    repaired, snapped, snapped_again = (record[2] for record in records)
+    assert shapely.from_wkb(repaired).geom_type == "MultiPolygon"
+    assert snapped == snapped_again
+    assert [record[3] for record in records] == ["active"] * 3  # status default
+
+
+def test_normalize_batch_lon_lat_rejects_unparseable_coordinates():
+    """A CSV cell that is not a number fails the row as out of bounds, not the batch."""
+    records, errors = geo_import.normalize_batch(
+        "station", "lonlat", [(("121.5", "25"), {"id": "a"}), (("east", "25"), {"id": "b"})]
+    )
+    assert [record[1] for record in records] == ["a"]
+    assert errors == [RowError(1, "Invalid coordinates")]
+
+
+def test_parse_field_map():
+    """`column=property` pairs, whitespace trimmed; anything else is refused."""
+    pairs = ["name = 名稱", "op_hour=HOURS"]
+    assert geo_import.parse_field_map(pairs) == {"name": "名稱", "op_hour": "HOURS"}
+    with pytest.raises(ValueError, match="Expected column=property"):
+        geo_import.parse_field_map(["name"])
+
+
+@pytest.mark.asyncio
+async def test_import_features_refuses_unknown_kinds_before_touching_the_database():
+    """A bad kind or an empty source is a ValueError (a 400 at the endpoint), with no db use."""
+    reader = geo_import.read_geojson(io.StringIO(_collection([])))
+    with pytest.raises(ValueError, match="Unknown import kind 'ticket'"):
+        await geo_import.import_features(None, actor=None, kind="ticket", source="x", reader=reader)
+    with pytest.raises(ValueError, match="source is required"):
+        await geo_import.import_features(None, actor=None, kind="station", source="  ", reader=reader)
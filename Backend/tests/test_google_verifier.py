@@ -1,8 +1,11 @@
 """Tests for the Google id_token verifier adapters and the dependency selector."""
 import json
 
+import httpx
 import pytest
+from jose import jwt
 
+from app.core.http_clients import HttpClients
 from app.sso.google import (
     GoogleIdentity,
     GoogleOidcVerifier,
@@ -37,7 +40,15 @@ async def test_fake_verifier_requires_sub():
 
 def test_get_google_verifier_returns_oidc():
     """The dependency always returns the real OIDC verifier (tests inject the fake separately)."""
-    assert isinstance(get_google_verifier(), GoogleOidcVerifier)
+    assert isinstance(get_google_verifier(HttpClients()), GoogleOidcVerifier)
+
+
+# No kid and not RS256, so the verifier skips the JWKS cache and goes straight to google-auth.
+_REMOTE_TOKEN = jwt.encode({"sub": "123"}, "secret", algorithm="HS256")
+
+
+def _oidc_verifier() -> GoogleOidcVerifier:
+    return GoogleOidcVerifier("client-123", client=httpx.AsyncClient())
 
 
 @pytest.mark.asyncio
@@ -49,7 +60,7 @@ async def test_oidc_verifier_parses_claims(monkeypatch):
         lambda token, request, audience: {
             "sub": 123, "email": "a@x.com", "email_verified": True, "name": "Al"},
     )
-    gid = await GoogleOidcVerifier("client-123").verify("any-token")
+    gid = await _oidc_verifier().verify(_REMOTE_TOKEN)
     assert gid == GoogleIdentity(sub="123", email="a@x.com", email_verified=True, name="Al")
 
 
@@ -63,4 +74,4 @@ async def test_oidc_verifier_wraps_errors(monkeypatch):
 
     monkeypatch.setattr(ga_id_token, "verify_oauth2_token", _boom)
     with pytest.raises(GoogleTokenVerificationError):
-        await GoogleOidcVerifier("client-123").verify("any-token")
+        await _oidc_verifier().verify(_REMOTE_TOKEN)
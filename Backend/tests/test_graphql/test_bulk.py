@@ -0,0 +1,137 @@
+"""Integration tests for the bulk create mutations and their REST equivalent."""
+
+import uuid as uuid_mod
+
+import pytest
+from sqlalchemy import event, func, select
+
+from app.db.session import engine as app_engine
+from app.models.geo import Station
+from app.models.secondary_location import SecondaryLocation
+from tests.test_graphql.conftest import auth_header
+from tests.test_graphql.conftest import test_db as _test_db_ctx
+
+BULK_STATIONS = """
+mutation ($inputs: [CreateStationInput!]!) {
+    bulkCreateStations(inputs: $inputs) { created { uuid name contactName } errors { index message } }
+}
+"""
+
+BULK_TASKS = """
+mutation ($inputs: [CreateTicketTaskInput!]!) {
+    bulkCreateTicketTasks(inputs: $inputs) { created { uuid ticketUuid taskName } errors { index message } }
+}
+"""
+
+
+def _station(name: str, lng: float = 121.5, **extra) -> dict:
+    return {"geometry": {"type": "Point", "coordinates": [lng, 25.0]}, "name": name, **extra}
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_stations_skips_bad_rows_and_inserts_the_rest_in_batches(
+    client, coordinator_auth
+):
+    """Bad rows come back as errors; the good ones, with their secondary locations, are created."""
+    _, token = coordinator_auth
+    tag = uuid_mod.uuid4().hex[:8]
+    inputs = [
+        _station(f"{tag} a", secondaryLocation={"locationType": "address", "city": "Hualien"}),
+        _station(f"{tag} off the map", lng=500),
+        _station(f"{tag} b", contactName="  Shelter Desk  "),
+        _station(f"{tag} long", opHour="x" * 101),
+        _station(f"{tag} c"),
+    ]
+    inserts = []
+
+    def _count(conn, cursor, statement, *args):
+        if statement.lstrip().upper().startswith("INSERT"):
+            inserts.append(statement)
+
+    event.listen(app_engine.sync_engine, "before_cursor_execute", _count)
+    try:
+        resp = await client.post(
+            "/graphql", json={"query": BULK_STATIONS, "variables": {"inputs": inputs}},
+            headers=auth_header(token),
+        )
+    finally:
+        event.remove(app_engine.sync_engine, "before_cursor_execute", _count)
+    body = resp.json()
+    assert "errors" not in body, body
+    result = body["data"]["bulkCreateStations"]
+    assert [s["name"] for s in result["created"]] == [f"{tag} a", f"{tag} b", f"{tag} c"]
+    assert result["created"][1]["contactName"] == "Shelter Desk"
+    assert result["errors"] == [
+        {"index": 1, "message": "Invalid coordinates"},
+        {"index": 3, "message": "op_hour must be at most 100 characters"},
+    ]
+    # base_geometries, stations, secondary_locations: one statement each, not one per row.
+    assert len(inserts) == 3
+
+    async with _test_db_ctx() as db:
+        first = result["created"][0]["uuid"]
+        located = select(func.count()).select_from(SecondaryLocation)
+        assert await db.scalar(located.where(SecondaryLocation.geometry_uuid == first)) == 1
+        assert await db.scalar(
+            select(func.count()).select_from(Station).where(Station.name.like(f"{tag}%"))
+        ) == 3
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_stations_needs_station_add(client, login_user_auth):
+    """Checked once for the batch: without station.add nothing is created."""
+    _, token = login_user_auth
+    resp = await client.post(
+        "/graphql", json={"query": BULK_STATIONS, "variables": {"inputs": [_station("nope")]}},
+        headers=auth_header(token),
+    )
+    body = resp.json()
+    assert body["data"] is None
+    assert body["errors"][0]["message"] == "Permission Denied."
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_ticket_tasks_reports_missing_tickets(client, coordinator_auth, sample_ticket):
+    """Tasks under a missing ticket (or a malformed uuid) are skipped; the rest are created."""
+    _, token = coordinator_auth
+    inputs = [
+        {"ticketUuid": sample_ticket, "taskType": "hr", "taskName": "Sandbags"},
+        {"ticketUuid": str(uuid_mod.uuid4()), "taskType": "hr", "taskName": "Orphan"},
+        {"ticketUuid": "not-a-uuid", "taskType": "hr", "taskName": "Garbled"},
+        {"ticketUuid": sample_ticket, "taskType": "supply", "taskName": "Water"},
+    ]
+    resp = await client.post(
+        "/graphql", json={"query": BULK_TASKS, "variables": {"inputs": inputs}},
+        headers=auth_header(token),
+    )
+    body = resp.json()
+    assert "errors" not in body, body
+    result = body["data"]["bulkCreateTicketTasks"]
+    assert [(t["ticketUuid"], t["taskName"]) for t in result["created"]] == [
+        (sample_ticket, "Sandbags"), (sample_ticket, "Water"),
+    ]
+    assert result["errors"] == [
+        {"index": 1, "message": "Ticket not found"}, {"index": 2, "message": "Ticket not found"},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_rest_bulk_create_tickets(client, coordinator_auth):
+    """POST /api/v1/bulk/tickets returns the created uuids and the skipped rows."""
+    _, token = coordinator_auth
+    point = {"type": "Point", "coordinates": [121.5, 25.0]}
+    resp = await client.post(
+        "/api/v1/bulk/tickets",
+        json=[
+            {"geometry": point, "title": "Bulk one", "contact_name": "A"},
+            {"geometry": point, "title": "Bulk two", "contact_name": "   "},
+        ],
+        headers=auth_header(token),
+    )
+    assert resp.status_code == 201, resp.text
+    body = resp.json()
+    assert len(body["created"]) == 1
+    assert body["errors"] == [{"index": 1, "message": "contact_name is required"}]
+
+    resp = await client.post("/api/v1/bulk/tickets", json=[], headers=auth_header(token))
+    assert resp.status_code == 400
@@ -0,0 +1,77 @@
+"""Integration tests for the streaming export endpoint (GET /api/v1/export/{layer})."""
+
+import csv
+import gzip
+import io
+import json
+
+import pytest
+from geoalchemy2.shape import from_shape
+from shapely.geometry import Point
+
+from app.models.request import Tickets
+from tests.test_graphql.conftest import auth_header
+from tests.test_graphql.conftest import test_db as _test_db_ctx
+
+
+async def _seed_ticket(user_uuid: str, title: str) -> str:
+    async with _test_db_ctx() as db:
+        ticket = Tickets(
+            geometry=from_shape(Point(121.5, 25.0), srid=4326),
+            created_by=user_uuid,
+            title=title, contact_name="Contact Person",
+            contact_email="contact@example.com", contact_phone="0912345678",
+            status="pending", priority="high", task_type="hr", visibility="public",
+        )
+        db.add(ticket)
+        await db.flush()
+        return str(ticket.uuid)
+
+
+@pytest.mark.asyncio
+async def test_ticket_export_masks_pii_outside_the_callers_scope(client, coordinator_auth, login_user_auth):
+    """ticket.view_pii=own: the caller's own ticket comes out in clear, a coordinator's masked."""
+    coordinator_uuid, _ = coordinator_auth
+    login_uuid, token = login_user_auth
+    theirs = await _seed_ticket(coordinator_uuid, "Export theirs")
+    own = await _seed_ticket(login_uuid, "Export own")
+
+    resp = await client.get(
+        "/api/v1/export/tickets", params={"format": "ndjson"}, headers=auth_header(token)
+    )
+    assert resp.status_code == 200, resp.text
+    assert resp.headers["content-type"].startswith("application/x-ndjson")
+    features = {f["properties"]["uuid"]: f for f in map(json.loads, resp.text.splitlines())}
+    assert features[own]["properties"]["contact_name"] == "Contact Person"
+    assert features[theirs]["properties"]["contact_name"] == "Contact P."
+    assert features[theirs]["properties"]["contact_phone"] == "09*****678"
+    assert features[own]["geometry"] == {"type": "Point", "coordinates": [121.5, 25]}
+
+
+@pytest.mark.asyncio
+async def test_station_export_as_gzipped_csv(client, coordinator_auth, sample_station):
+    """gzip=true wraps the CSV in a .gz attachment; the geometry is a WKT column."""
+    _, token = coordinator_auth
+    resp = await client.get(
+        "/api/v1/export/stations",
+        params={"format": "csv", "gzip": "true", "station_type": "shelter"},
+        headers=auth_header(token),
+    )
+    assert resp.status_code == 200, resp.text
+    assert resp.headers["content-type"] == "application/gzip"
+    assert resp.headers["content-disposition"].endswith('.csv.gz"')
+    text = gzip.decompress(resp.content).decode("utf-8-sig")
+    rows = {row["uuid"]: row for row in csv.DictReader(io.StringIO(text))}
+    assert rows[sample_station]["wkt"] == "POINT(121.5 25)"
+    assert {row["type"] for row in rows.values()} == {"shelter"}
+
+
+@pytest.mark.asyncio
+async def test_export_rejects_bad_filters_and_anonymous_callers(client, coordinator_auth):
+    """A filter of the other layer or a malformed bbox is a 400; no token is a 401."""
+    _, token = coordinator_auth
+    resp = await client.get("/api/v1/export/stations", params={"status": "open"}, headers=auth_header(token))
+    assert resp.status_code == 400
+    resp = await client.get("/api/v1/export/tickets", params={"bbox": "1,2,3"}, headers=auth_header(token))
+    assert resp.status_code == 400
+    assert (await client.get("/api/v1/export/tickets")).status_code == 401
@@ -0,0 +1,134 @@
+"""Integration tests for the open-data import endpoint (POST /api/v1/admin/imports/{kind})."""
+
+import json
+import uuid as uuid_mod
+
+import pytest
+from sqlalchemy import func, select, update
+
+from app.models.geo import BaseGeometry, ClosureArea, Station
+from tests.test_graphql.conftest import auth_header
+from tests.test_graphql.conftest import test_db as _test_db_ctx
+
+
+def _feed(*features: tuple[str, float, str]) -> bytes:
+    return json.dumps({
+        "type": "FeatureCollection",
+        "features": [
+            {
+                "type": "Feature",
+                "geometry": {"type": "Point", "coordinates": [lng, 25.0]},
+                "properties": {"SHELTER_ID": shelter_id, "NAME": name},
+            }
+            for shelter_id, lng, name in features
+        ],
+    }).encode()
+
+
+async def _upload(client, token, kind: str, source: str, body: bytes, filename: str, **params):
+    return await client.post(
+        f"/api/v1/admin/imports/{kind}",
+        params={"source": source, **params},
+        files={"file": (filename, body)},
+        headers=auth_header(token),
+    )
+
+
+@pytest.mark.asyncio
+async def test_station_import_is_idempotent_and_updates_in_place(client, coordinator_auth):
+    """A re-run of the same feed changes nothing; a changed feed updates rows instead of adding them."""
+    _, token = coordinator_auth
+    source = f"shelters-{uuid_mod.uuid4().hex[:8]}"
+    params = {"id_field": "SHELTER_ID", "map": "name=NAME"}
+    feed = _feed(("s1", 121.5, "North school"), ("s2", 121.6, "South school"), ("s3", 999, "Nowhere"))
+
+    first = await _upload(client, token, "station", source, feed, "shelters.geojson", **params)
+    assert first.status_code == 200, first.text
+    assert first.json() == {
+        "read": 3, "created": 2, "updated": 0, "unchanged": 0, "skipped": 0, "rejected": 1,
+        "errors": [{"index": 2, "message": "Invalid coordinates"}],
+    }
+    again = await _upload(client, token, "station", source, feed, "shelters.geojson", **params)
+    assert (again.json()["created"], again.json()["updated"], again.json()["unchanged"]) == (0, 0, 2)
+
+    moved = _feed(("s1", 121.5, "North school (annex)"), ("s2", 121.7, "South school"))
+    third = await _upload(client, token, "station", source, moved, "shelters.geojson", **params)
+    assert (third.json()["created"], third.json()["updated"], third.json()["unchanged"]) == (0, 2, 0)
+
+    async with _test_db_ctx() as db:
+        rows = (
+            await db.execute(
+                select(Station.external_id, Station.name, Station.source, func.ST_X(Station.geometry))
+                .where(Station.external_source == source)
+                .order_by(Station.external_id)
+            )
+        ).all()
+    assert [tuple(row) for row in rows] == [
+        ("s1", "North school (annex)", "official", 121.5), ("s2", "South school", "official", 121.7),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_closure_area_import_from_csv(client, coordinator_auth):
+    """CSV with a WKT column; the status column falls back to 'active' when the feed leaves it blank."""
+    _, token = coordinator_auth
+    source = f"closures-{uuid_mod.uuid4().hex[:8]}"
+    body = (
+        b"id,wkt,status\n"
+        b'c1,"POLYGON ((121 25, 121.01 25, 121.01 25.01, 121 25.01, 121 25))",block\n'
+        b'c2,"POLYGON ((121 25, 121.01 25, 121.01 25.01, 121 25.01, 121 25))",\n'
+    )
+    resp = await _upload(client, token, "closure_area", source, body, "closures.csv")
+    assert resp.status_code == 200, resp.text
+    assert resp.json()["created"] == 2
+
+    async with _test_db_ctx() as db:
+        statuses = (
+            await db.scalars(
+                select(ClosureArea.status)
+                .where(ClosureArea.external_source == source)
+                .order_by(ClosureArea.external_id)
+            )
+        ).all()
+    assert statuses == ["block", "active"]
+
+
+@pytest.mark.asyncio
+async def test_ids_the_merge_refuses_are_skipped_with_a_reason(client, coordinator_auth):
+    """A row deleted in the app, or an id the other kind holds, is skipped, not counted unchanged."""
+    _, token = coordinator_auth
+    source = f"mixed-{uuid_mod.uuid4().hex[:8]}"
+    feed = _feed(("s1", 121.5, "Kept"), ("s2", 121.6, "Deleted"))
+    assert (await _upload(client, token, "station", source, feed, "x.geojson")).json()["created"] == 2
+    async with _test_db_ctx() as db:
+        await db.execute(
+            update(BaseGeometry)
+            .where(BaseGeometry.external_source == source, BaseGeometry.external_id == "s2")
+            .values(delete_at=func.now())
+        )
+
+    again = (await _upload(client, token, "station", source, feed, "x.geojson")).json()
+    assert (again["unchanged"], again["skipped"], again["rejected"]) == (1, 1, 0)
+    assert again["errors"] == [{"index": 1, "message": "Deleted in the app; not re-imported"}]
+
+    body = b'id,wkt\ns1,"POLYGON ((121 25, 121.01 25, 121.01 25.01, 121 25.01, 121 25))"\n'
+    closures = (await _upload(client, token, "closure_area", source, body, "x.csv")).json()
+    assert (closures["created"], closures["unchanged"], closures["skipped"]) == (0, 0, 1)
+    assert closures["errors"] == [{"index": 0, "message": "id is already used by a station from this source"}]
+
+
+@pytest.mark.asyncio
+async def test_import_needs_edit_at_all_scope(client, login_user_auth):
+    """An import rewrites rows anywhere, so station.add alone (or no grant) is refused."""
+    _, token = login_user_auth
+    resp = await _upload(client, token, "station", "x", _feed(("s1", 121.5, "a")), "x.geojson")
+    assert resp.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_unreadable_file_is_a_400(client, coordinator_auth):
+    """A file that is not a FeatureCollection fails as a whole, before anything is written."""
+    _, token = coordinator_auth
+    resp = await _upload(client, token, "station", "x", b'{"type": "Point"}', "x.geojson")
+    assert resp.status_code == 400
+    assert resp.json()["detail"] == "Not a GeoJSON FeatureCollection"
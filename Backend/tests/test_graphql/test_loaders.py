@@ -17,6 +17,7 @@ from app.models.photo import Photo
 from app.models.rbac import Permission, Role, RolePermissionAssign, UserRoleAssign
 from app.models.request import Tickets
 from app.models.team import Team, TeamZoneAssign, WorkZone
+from app.models.ticket_task import TaskAssignment, TicketTask
 from tests.test_graphql.conftest import auth_header
 from tests.test_graphql.conftest import test_db as _test_db_ctx
 
@@ -128,6 +129,60 @@ async def test_stations_photos_uses_single_batched_query(client, coordinator_aut
     )
 
 
+@pytest.mark.asyncio
+async def test_task_counts_use_one_aggregate_query(client, coordinator_auth):
+    """assignedCount/completedCount/progress across N tasks: one GROUP BY, no assignment rows.
+
+    ``task_progress_by_task`` counts in SQL, so the only SELECT against task_assignments is
+    the aggregate — the per-assignment ``task_assignments_by_task`` loader never runs.
+    """
+    user_uuid, _ = coordinator_auth
+
+    async with _test_db_ctx() as db:
+        ticket = Tickets(
+            geometry=from_shape(Point(121.7, 25.0), srid=4326),
+            created_by=user_uuid, title="hr", description="d",
+            status="pending", priority="medium", task_type="hr", visibility="public",
+        )
+        db.add(ticket)
+        await db.flush()
+        tasks = [
+            TicketTask(ticket_uuid=ticket.uuid, task_type="hr", task_name=f"shift {i}",
+                       quantity=4, created_by=user_uuid)
+            for i in range(3)
+        ]
+        db.add_all(tasks)
+        await db.flush()
+        volunteers = [User(name=f"vol_{uuid_mod.uuid4().hex[:8]}") for _ in range(3)]
+        db.add_all(volunteers)
+        await db.flush()
+        # Task i has i assignments, the first of which is completed.
+        for i, task in enumerate(tasks):
+            for j, volunteer in enumerate(volunteers[:i]):
+                db.add(TaskAssignment(
+                    task_uuid=task.uuid, actor_uuid=volunteer.uuid,
+                    status="completed" if j == 0 else "accepted",
+                ))
+        await db.flush()
+        ticket_uuid = str(ticket.uuid)
+
+    with _SelectCounter("task_assignments") as counter:
+        resp = await client.post("/graphql", json={"query": """
+            query($uuid: UUID!) {
+              ticket(uuid: $uuid) { tasks { taskName assignedCount completedCount progress } }
+            }""", "variables": {"uuid": ticket_uuid}})
+
+    assert resp.status_code == 200
+    body = resp.json()
+    assert "errors" not in body, body
+    counts = sorted(
+        (t["taskName"], t["assignedCount"], t["completedCount"], t["progress"])
+        for t in body["data"]["ticket"]["tasks"]
+    )
+    assert counts == [("shift 0", 0, 0, 0.0), ("shift 1", 1, 1, 0.25), ("shift 2", 2, 1, 0.25)]
+    assert counter.count == 1, f"expected 1 aggregate SELECT, got {counter.count}"
+
+
 async def _make_gov_viewer() -> str:
     """Create a user holding a role granting work_zone.view at 'all', return its token.
 
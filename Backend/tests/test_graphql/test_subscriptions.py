@@ -0,0 +1,108 @@
+"""Integration tests for the live-change subscriptions (ticketChanged)."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import select, update
+
+from app.core.security import get_current_user
+from app.graphql.loaders import build_loaders
+from app.graphql.schema import schema
+from app.main import app
+from app.models.rbac import Role, UserRoleAssign
+from tests.test_graphql.conftest import auth_header
+from tests.test_graphql.conftest import test_db as _test_db_ctx
+
+TICKET_CHANGED = """
+subscription ($bounds: BoundsInput) {
+    ticketChanged(bounds: $bounds) { op uuid ticket { title contactName } }
+}
+"""
+
+CREATE_TICKET = """
+mutation ($input: CreateTicketInput!) { createTicket(input: $input) { uuid } }
+"""
+
+DELETE_TICKET = """
+mutation ($uuid: UUID!) { deleteTicket(uuid: $uuid) }
+"""
+
+
+async def _create_ticket(client, token: str, title: str, lng: float) -> str:
+    resp = await client.post(
+        "/graphql",
+        json={
+            "query": CREATE_TICKET,
+            "variables": {"input": {
+                "title": title,
+                "geometry": {"type": "Point", "coordinates": [lng, 25.0]},
+                "contactName": "Contact Person",
+            }},
+        },
+        headers=auth_header(token),
+    )
+    return resp.json()["data"]["createTicket"]["uuid"]
+
+
+@pytest.mark.asyncio
+async def test_guest_is_pushed_tickets_in_its_bounds_with_pii_masked(client, coordinator_auth):
+    """Only changes inside `bounds` arrive; the ticket is re-read under the Guest's masking."""
+    _, token = coordinator_auth
+    bounds = {"minLat": 24.9, "maxLat": 25.1, "minLng": 121.4, "maxLng": 121.6}
+    async with _test_db_ctx() as db:
+        context = {"db": db, "user": None, "loaders": build_loaders(db), "_rbac_cache": {}}
+        stream = await schema.subscribe(
+            TICKET_CHANGED, variable_values={"bounds": bounds}, context_value=context
+        )
+        pending = asyncio.ensure_future(anext(stream))
+        await asyncio.sleep(0.1)  # let the subscription register
+
+        await _create_ticket(client, token, "Far away", lng=120.0)
+        inside = await _create_ticket(client, token, "Nearby", lng=121.5)
+        pushed = (await asyncio.wait_for(pending, timeout=5)).data["ticketChanged"]
+        assert pushed == {
+            "op": "created", "uuid": inside,
+            "ticket": {"title": "Nearby", "contactName": "Contact P."},
+        }
+
+        await client.post(
+            "/graphql",
+            json={"query": DELETE_TICKET, "variables": {"uuid": inside}},
+            headers=auth_header(token),
+        )
+        pushed = (await asyncio.wait_for(anext(stream), timeout=5)).data["ticketChanged"]
+        assert pushed == {"op": "deleted", "uuid": inside, "ticket": None}
+        await stream.aclose()
+
+
+@pytest.mark.asyncio
+async def test_a_role_change_applies_to_the_next_push(client, coordinator_auth, login_user_auth):
+    """Demoted mid-stream from ticket.view_pii=all to =own, the subscriber's next push is masked."""
+    subscriber_uuid, subscriber_token = coordinator_auth
+    _, author_token = login_user_auth
+    request = SimpleNamespace(headers=auth_header(subscriber_token), app=app)
+    async with _test_db_ctx() as db:
+        user = await get_current_user(request=request, db=db, token=subscriber_token)
+        context = {
+            "db": db, "user": user, "request": request, "loaders": build_loaders(db), "_rbac_cache": {},
+        }
+        stream = await schema.subscribe(TICKET_CHANGED, context_value=context)
+        pending = asyncio.ensure_future(anext(stream))
+        await asyncio.sleep(0.1)  # let the subscription register
+
+        await _create_ticket(client, author_token, "Before", lng=121.5)
+        pushed = (await asyncio.wait_for(pending, timeout=5)).data["ticketChanged"]
+        assert pushed["ticket"] == {"title": "Before", "contactName": "Contact Person"}
+
+        async with _test_db_ctx() as admin_db:
+            login_role = await admin_db.scalar(select(Role.uuid).where(Role.name == "Login User"))
+            await admin_db.execute(
+                update(UserRoleAssign)
+                .where(UserRoleAssign.user_uuid == subscriber_uuid)
+                .values(role_uuid=login_role)
+            )
+        await _create_ticket(client, author_token, "After", lng=121.5)
+        pushed = (await asyncio.wait_for(anext(stream), timeout=5)).data["ticketChanged"]
+        assert pushed["ticket"] == {"title": "After", "contactName": "Contact P."}
+        await stream.aclose()
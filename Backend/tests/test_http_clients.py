@@ -0,0 +1,115 @@
+"""Tests for the shared outbound HTTP client registry, against a local keep-alive stub server."""
+
+import asyncio
+import json
+
+import pytest
+from jose import jwt
+
+from app.core.http_clients import ClientProfile, HttpClients
+from app.messaging.smtp2go import Smtp2goEmailSender
+from app.sso.line import LineTokenVerificationError, LineVerifyApiVerifier
+
+# Not locally verifiable, so LINE verification always reaches the (stub) verify endpoint.
+_HS256_TOKEN = jwt.encode({"sub": "U1"}, "channel-secret", algorithm="HS256")
+
+
+class _StubServer:
+    """Minimal HTTP/1.1 keep-alive server answering every request with a fixed JSON body."""
+
+    def __init__(self, body: dict, delay: float = 0.0):
+        """Answer with `body` after `delay` seconds."""
+        self.body = json.dumps(body).encode()
+        self.delay = delay
+        self.connections = 0
+        self.requests: list[bytes] = []
+
+    async def __aenter__(self):
+        """Listen on an ephemeral localhost port."""
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        self.url = f"http://127.0.0.1:{self._server.sockets[0].getsockname()[1]}"
+        return self
+
+    async def __aexit__(self, *exc):
+        """Stop listening."""
+        self._server.close()
+
+    async def _handle(self, reader, writer):
+        self.connections += 1
+        try:
+            while head := await reader.readuntil(b"\r\n\r\n"):
+                length = next(
+                    (int(line.split(b":")[1]) for line in head.split(b"\r\n")
+                     if line.lower().startswith(b"content-length:")),
+                    0,
+                )
+                self.requests.append(await reader.readexactly(length))
+                await asyncio.sleep(self.delay)
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                    b"Content-Length: %d\r\n\r\n%s" % (len(self.body), self.body)
+                )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+
+def test_registry_returns_one_client_per_upstream():
+    """The same name yields the same pooled client; different upstreams get separate pools."""
+    clients = HttpClients()
+    assert clients.get("line") is clients.get("line")
+    assert clients.get("line") is not clients.get("smtp2go")
+    with pytest.raises(KeyError):
+        clients.get("unknown")
+
+
+@pytest.mark.asyncio
+async def test_line_verifications_reuse_one_connection(monkeypatch):
+    """Sequential LINE verifications through the registry share a single keep-alive connection."""
+    clients = HttpClients()
+    async with _StubServer({"sub": "U1", "name": "Mei"}) as server:
+        monkeypatch.setattr(LineVerifyApiVerifier, "VERIFY_URL", server.url + "/verify")
+        for _ in range(5):
+            verifier = LineVerifyApiVerifier("chan", client=clients.get("line"))
+            assert (await verifier.verify(_HS256_TOKEN)).sub == "U1"
+        await clients.aclose()
+    assert len(server.requests) == 5
+    assert server.connections == 1
+
+
+@pytest.mark.asyncio
+async def test_smtp2go_sends_reuse_one_connection(monkeypatch):
+    """Email sends through the registry's smtp2go client share a single keep-alive connection."""
+    monkeypatch.setattr("app.messaging.smtp2go.settings.SMTP2GO_API_KEY", "api-test", raising=False)
+    clients = HttpClients()
+    async with _StubServer({"data": {"succeeded": 1}}) as server:
+        monkeypatch.setattr("app.messaging.smtp2go._SMTP2GO_URL", server.url + "/v3/email/send")
+        for i in range(3):
+            await Smtp2goEmailSender(clients.get("smtp2go")).send(f"u{i}@x.com", "s", "<p>h</p>", "t")
+        await clients.aclose()
+    assert [json.loads(body)["to"] for body in server.requests] == [[f"u{i}@x.com"] for i in range(3)]
+    assert server.connections == 1
+
+
+@pytest.mark.asyncio
+async def test_profile_timeout_applies(monkeypatch):
+    """A slow upstream fails after the profile's timeout, surfaced as the adapter's own error."""
+    clients = HttpClients({"line": ClientProfile(timeout=0.05)})
+    async with _StubServer({"sub": "U1"}, delay=1.0) as server:
+        monkeypatch.setattr(LineVerifyApiVerifier, "VERIFY_URL", server.url + "/verify")
+        with pytest.raises(LineTokenVerificationError):
+            await LineVerifyApiVerifier("chan", client=clients.get("line")).verify(_HS256_TOKEN)
+        await clients.aclose()
+
+
+@pytest.mark.asyncio
+async def test_aclose_releases_clients():
+    """aclose() closes every opened client and later lookups open fresh ones."""
+    clients = HttpClients()
+    first = clients.get("line")
+    await clients.aclose()
+    assert first.is_closed
+    assert clients.get("line") is not first
+    await clients.aclose()
@@ -0,0 +1,196 @@
+"""Tests for the JWKS cache and local Google/LINE id_token verification."""
+
+import time
+
+import httpx
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec, rsa
+from jose import jwk, jwt
+
+from app.sso.google import GoogleOidcVerifier, GoogleTokenVerificationError
+from app.sso.jwks import JwksCache, _max_age
+from app.sso.line import LineTokenVerificationError, LineVerifyApiVerifier
+
+CERTS_URL = "https://idp.test/certs"
+
+
+class _Signer:
+    """A private key that signs id_tokens, plus its public JWK."""
+
+    def __init__(self, alg: str, kid: str):
+        """Generate an RS256 or ES256 key pair published under `kid`."""
+        if alg == "RS256":
+            key = rsa.generate_private_key(65537, 2048)
+        else:
+            key = ec.generate_private_key(ec.SECP256R1())
+        self.alg, self.kid = alg, kid
+        self._pem = key.private_bytes(
+            serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+        )
+        public = key.public_key().public_bytes(
+            serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo
+        )
+        self.jwk = {**jwk.construct(public, alg).to_dict(), "kid": kid}
+
+    def token(self, **claims) -> str:
+        """Sign `claims` (defaults: one hour of validity) with this key."""
+        claims = {"exp": int(time.time()) + 3600, **claims}
+        return jwt.encode(claims, self._pem, algorithm=self.alg, headers={"kid": self.kid})
+
+
+class _Provider:
+    """MockTransport handler serving a JWKS and a LINE-style verify endpoint, counting calls."""
+
+    def __init__(self, *signers: _Signer, cache_control: str = "public, max-age=3600"):
+        """Publish `signers`' public keys."""
+        self.keys = [s.jwk for s in signers]
+        self.cache_control = cache_control
+        self.certs_calls = 0
+        self.verify_calls = 0
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        """Answer a JWKS GET or a verify POST."""
+        if request.url.path == "/certs":
+            self.certs_calls += 1
+            headers = {"cache-control": self.cache_control}
+            return httpx.Response(200, json={"keys": self.keys}, headers=headers)
+        self.verify_calls += 1
+        return httpx.Response(200, json={"sub": "U-remote"})
+
+    def client(self) -> httpx.AsyncClient:
+        """An httpx client routed to this provider."""
+        return httpx.AsyncClient(transport=httpx.MockTransport(self))
+
+
+def _google(provider: _Provider) -> GoogleOidcVerifier:
+    return GoogleOidcVerifier("client-123", client=provider.client(), jwks=JwksCache(CERTS_URL))
+
+
+def _line(provider: _Provider, jwks: JwksCache | None = None) -> LineVerifyApiVerifier:
+    return LineVerifyApiVerifier("chan", client=provider.client(), jwks=jwks or JwksCache(CERTS_URL))
+
+
+@pytest.mark.asyncio
+async def test_google_token_verified_locally(monkeypatch):
+    """A Google RS256 token is verified against the cached JWKS; google-auth is never called."""
+    from google.oauth2 import id_token as ga_id_token
+
+    def _remote(*_a):
+        raise AssertionError("google-auth should not be called")
+
+    monkeypatch.setattr(ga_id_token, "verify_oauth2_token", _remote)
+    signer = _Signer("RS256", "g1")
+    provider = _Provider(signer)
+    verifier = _google(provider)
+    for i in range(3):
+        token = signer.token(
+            sub=f"g-{i}", aud="client-123", iss="https://accounts.google.com",
+            email="a@x.com", email_verified=True, at_hash="unchecked",
+        )
+        gid = await verifier.verify(token)
+        assert gid.sub == f"g-{i}" and gid.email_verified
+    assert provider.certs_calls == 1
+
+
+@pytest.mark.asyncio
+async def test_line_token_verified_locally():
+    """A LINE ES256 token is verified locally; the verify endpoint is never hit."""
+    signer = _Signer("ES256", "l1")
+    provider = _Provider(signer)
+    lid = await _line(provider).verify(
+        signer.token(sub="U1", aud="chan", iss="https://access.line.me", name="Mei")
+    )
+    assert lid.sub == "U1" and lid.name == "Mei" and lid.email is None
+    assert (provider.certs_calls, provider.verify_calls) == (1, 0)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "claims",
+    [
+        {"aud": "other-channel", "iss": "https://access.line.me"},
+        {"aud": "chan", "iss": "https://evil.example"},
+        {"aud": "chan", "iss": "https://access.line.me", "exp": int(time.time()) - 60},
+    ],
+    ids=["aud", "iss", "exp"],
+)
+async def test_local_claim_checks_reject(claims):
+    """Wrong aud, wrong iss or an expired token is rejected locally, without a remote retry."""
+    signer = _Signer("ES256", "l1")
+    provider = _Provider(signer)
+    with pytest.raises(LineTokenVerificationError):
+        await _line(provider).verify(signer.token(sub="U1", **claims))
+    assert provider.verify_calls == 0
+
+
+@pytest.mark.asyncio
+async def test_forged_signature_rejected():
+    """A token signed by a different key under a published kid fails the signature check."""
+    published, forger = _Signer("RS256", "g1"), _Signer("RS256", "g1")
+    provider = _Provider(published)
+    token = forger.token(sub="g", aud="client-123", iss="accounts.google.com")
+    with pytest.raises(GoogleTokenVerificationError):
+        await _google(provider).verify(token)
+
+
+@pytest.mark.asyncio
+async def test_kid_miss_refetches_once_then_falls_back_to_remote():
+    """An unknown kid forces one JWKS refetch, then the verify endpoint; later misses don't refetch."""
+    known, unknown = _Signer("ES256", "l1"), _Signer("ES256", "l2")
+    provider = _Provider(known)
+    verifier = _line(provider)
+    good = known.token(sub="U1", aud="chan", iss="https://access.line.me")
+    assert (await verifier.verify(good)).sub == "U1"
+    rogue = unknown.token(sub="U2", aud="chan", iss="https://access.line.me")
+    for _ in range(2):
+        assert (await verifier.verify(rogue)).sub == "U-remote"
+    # first fetch, then nothing: the miss came within min_refetch_seconds of it
+    assert (provider.certs_calls, provider.verify_calls) == (1, 2)
+
+
+@pytest.mark.asyncio
+async def test_rotated_key_found_by_refetch():
+    """After the provider rotates in a new key, the forced refetch picks it up and verifies locally."""
+    old, new = _Signer("ES256", "l1"), _Signer("ES256", "l2")
+    provider = _Provider(old)
+    verifier = _line(provider, JwksCache(CERTS_URL, min_refetch_seconds=0))
+    await verifier.verify(old.token(sub="U1", aud="chan", iss="https://access.line.me"))
+    provider.keys.append(new.jwk)
+    lid = await verifier.verify(new.token(sub="U2", aud="chan", iss="https://access.line.me"))
+    assert lid.sub == "U2"
+    assert (provider.certs_calls, provider.verify_calls) == (2, 0)
+
+
+@pytest.mark.asyncio
+async def test_stale_set_serves_while_refreshing_in_background():
+    """Past max-age the cached keys still answer; a single background refetch replaces them."""
+    signer = _Signer("ES256", "l1")
+    provider = _Provider(signer, cache_control="max-age=0")
+    jwks = JwksCache(CERTS_URL)
+    client = provider.client()
+    assert await jwks.get("l1", client) is not None
+    assert await jwks.get("l1", client) is not None
+    assert await jwks.get("l1", client) is not None
+    await jwks._task
+    assert provider.certs_calls == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_refetch_keeps_cached_keys():
+    """A JWKS endpoint outage keeps serving the last good key set."""
+    signer = _Signer("ES256", "l1")
+    provider = _Provider(signer, cache_control="max-age=0")
+    jwks = JwksCache(CERTS_URL)
+    assert await jwks.get("l1", provider.client()) is not None
+    down = httpx.AsyncClient(transport=httpx.MockTransport(lambda req: httpx.Response(503)))
+    assert await jwks.get("l1", down) is not None
+    await jwks._task
+    assert await jwks.get("l1", down) is not None
+
+
+def test_max_age_honours_cache_control_and_age():
+    """Freshness is max-age minus Age, or the default when the provider sends no max-age."""
+    assert _max_age(httpx.Response(200, headers={"cache-control": "public, max-age=300"}), 60) == 300
+    assert _max_age(httpx.Response(200, headers={"cache-control": "max-age=300", "age": "100"}), 60) == 200
+    assert _max_age(httpx.Response(200), 60) == 60
@@ -3,8 +3,9 @@ import json
 
 import httpx
 import pytest
+from jose import jwt
 
-from app.sso import line as line_verifier
+from app.core.http_clients import HttpClients
 from app.sso.line import (
     LineIdentity,
     LineTokenVerificationError,
@@ -38,65 +39,64 @@ async def test_fake_line_verifier_requires_sub():
 
 def test_get_line_verifier_returns_real():
     """The dependency returns the real verify-endpoint verifier."""
-    assert isinstance(get_line_verifier(), LineVerifyApiVerifier)
+    assert isinstance(get_line_verifier(HttpClients()), LineVerifyApiVerifier)
 
 
-def _patch_client(monkeypatch, handler):
-    """Patch line_verifier.httpx.AsyncClient to use a MockTransport with `handler`."""
-    real_client = httpx.AsyncClient
+# Signed with a channel secret, as LINE web login does: never verifiable locally.
+_HS256_TOKEN = jwt.encode({"sub": "U1"}, "channel-secret", algorithm="HS256")
 
-    def factory(**kwargs):
-        kwargs.pop("transport", None)
-        return real_client(transport=httpx.MockTransport(handler), **kwargs)
-    monkeypatch.setattr(line_verifier.httpx, "AsyncClient", factory)
+
+def _verifier(handler) -> LineVerifyApiVerifier:
+    """A verifier whose injected client answers every request with `handler`."""
+    return LineVerifyApiVerifier("chan", client=httpx.AsyncClient(transport=httpx.MockTransport(handler)))
 
 
 @pytest.mark.asyncio
-async def test_adapter_valid_claims(monkeypatch):
+async def test_adapter_valid_claims():
     """200 + valid claims -> LineIdentity with sub/name/email."""
-    _patch_client(monkeypatch, lambda req: httpx.Response(
+    verifier = _verifier(lambda req: httpx.Response(
         200, json={"sub": "U1", "name": "Mei", "email": "m@x.com"}))
-    lid = await LineVerifyApiVerifier("chan").verify("tok")
+    lid = await verifier.verify(_HS256_TOKEN)
     assert lid.sub == "U1" and lid.name == "Mei" and lid.email == "m@x.com"
 
 
 @pytest.mark.asyncio
-async def test_adapter_no_email_is_none(monkeypatch):
+async def test_adapter_no_email_is_none():
     """200 without email -> LineIdentity.email is None."""
-    _patch_client(monkeypatch, lambda req: httpx.Response(200, json={"sub": "U1", "name": "A"}))
-    lid = await LineVerifyApiVerifier("chan").verify("tok")
+    verifier = _verifier(lambda req: httpx.Response(200, json={"sub": "U1", "name": "A"}))
+    lid = await verifier.verify(_HS256_TOKEN)
     assert lid.email is None
 
 
 @pytest.mark.asyncio
-async def test_adapter_non_200_raises(monkeypatch):
+async def test_adapter_non_200_raises():
     """Non-200 from LINE -> LineTokenVerificationError (so endpoint maps to 401, not 500)."""
-    _patch_client(monkeypatch, lambda req: httpx.Response(400, json={"error": "invalid_request"}))
+    verifier = _verifier(lambda req: httpx.Response(400, json={"error": "invalid_request"}))
     with pytest.raises(LineTokenVerificationError):
-        await LineVerifyApiVerifier("chan").verify("tok")
+        await verifier.verify(_HS256_TOKEN)
 
 
 @pytest.mark.asyncio
-async def test_adapter_non_json_raises(monkeypatch):
+async def test_adapter_non_json_raises():
     """200 with a non-JSON body -> LineTokenVerificationError, not an unhandled 500."""
-    _patch_client(monkeypatch, lambda req: httpx.Response(200, text="not json"))
+    verifier = _verifier(lambda req: httpx.Response(200, text="not json"))
     with pytest.raises(LineTokenVerificationError):
-        await LineVerifyApiVerifier("chan").verify("tok")
+        await verifier.verify(_HS256_TOKEN)
 
 
 @pytest.mark.asyncio
-async def test_adapter_missing_sub_raises(monkeypatch):
+async def test_adapter_missing_sub_raises():
     """200 + JSON without sub -> LineTokenVerificationError."""
-    _patch_client(monkeypatch, lambda req: httpx.Response(200, json={"name": "no sub"}))
+    verifier = _verifier(lambda req: httpx.Response(200, json={"name": "no sub"}))
     with pytest.raises(LineTokenVerificationError):
-        await LineVerifyApiVerifier("chan").verify("tok")
+        await verifier.verify(_HS256_TOKEN)
 
 
 @pytest.mark.asyncio
-async def test_adapter_httpx_error_raises(monkeypatch):
+async def test_adapter_httpx_error_raises():
     """A transport/network error -> LineTokenVerificationError (401-not-500 contract)."""
     def boom(req):
         raise httpx.ConnectError("boom")
-    _patch_client(monkeypatch, boom)
+    verifier = _verifier(boom)
     with pytest.raises(LineTokenVerificationError):
-        await LineVerifyApiVerifier("chan").verify("tok")
+        await verifier.verify(_HS256_TOKEN)
@@ -0,0 +1,188 @@
+"""Tests for live change fan-out (app/core/live_events.py) and the subscription plumbing over it."""
+
+import asyncio
+import time
+from datetime import timedelta
+from types import SimpleNamespace
+
+import pytest
+import strawberry
+from shapely.geometry import box
+
+from app.core import live_events as live_events_mod
+from app.core.context import request_access_claims
+from app.core.live_events import Change, LiveEvents
+from app.core.permissions import Perm
+from app.core.rbac_scopes import Scope
+from app.core.revocation import revoked_sessions
+from app.core.security import create_access_token
+from app.graphql.subscriptions import Watch, changes
+
+
+async def _next(queue: asyncio.Queue) -> Change:
+    return await asyncio.wait_for(queue.get(), timeout=2)
+
+
+async def _relaying(hub: LiveEvents) -> None:
+    """Wait for the hub's relay to be subscribed: a probe change makes it back through Redis."""
+    async with hub.subscribe("probe") as queue:
+        for _ in range(100):
+            await hub.publish("probe", "p")
+            try:
+                await asyncio.wait_for(queue.get(), timeout=0.05)
+                return
+            except TimeoutError:
+                pass
+
+
+@pytest.mark.asyncio
+async def test_publish_without_redis_reaches_local_subscribers_of_that_kind():
+    """Unbound, publish delivers in-process, and only to subscribers of the change's kind."""
+    hub = LiveEvents()
+    async with hub.subscribe("ticket") as tickets, hub.subscribe("station") as stations:
+        await hub.publish("ticket", "t-1", "created")
+        assert await _next(tickets) == Change("ticket", "t-1", "created")
+        assert stations.empty()
+    assert not hub._queues["ticket"]
+
+
+@pytest.mark.asyncio
+async def test_a_stalled_subscriber_loses_its_oldest_changes(monkeypatch):
+    """A full queue drops its oldest change rather than blocking the publisher."""
+    monkeypatch.setattr(live_events_mod, "QUEUE_SIZE", 2)
+    hub = LiveEvents()
+    async with hub.subscribe("task") as queue:
+        for n in range(3):
+            await hub.publish("task", f"k-{n}")
+        assert [queue.get_nowait().uuid for _ in range(queue.qsize())] == ["k-1", "k-2"]
+
+
+@pytest.mark.asyncio
+async def test_changes_are_relayed_through_redis(redis):
+    """Bound to Redis, a publish goes through the channel and back out to every subscriber."""
+    hub = LiveEvents()
+    hub.start(redis)
+    try:
+        async with hub.subscribe("station") as first, hub.subscribe("station") as second:
+            await _relaying(hub)
+            await hub.publish("station", "s-1", "deleted")
+            assert await _next(first) == await _next(second) == Change("station", "s-1", "deleted")
+    finally:
+        await hub.stop()
+    assert hub.redis is None
+
+
+@pytest.mark.asyncio
+async def test_publish_many_announces_every_row(redis):
+    """A bulk write announces each created row, through the channel in one round trip."""
+    hub = LiveEvents()
+    hub.start(redis)
+    try:
+        async with hub.subscribe("ticket") as queue:
+            await _relaying(hub)
+            await hub.publish_many("ticket", ["t-1", "t-2", "t-3"], "created")
+            assert [(await _next(queue)).uuid for _ in range(3)] == ["t-1", "t-2", "t-3"]
+    finally:
+        await hub.stop()
+
+
+class _Session:
+    """Stands in for the socket's AsyncSession: records closes."""
+
+    def __init__(self):
+        self.closes = 0
+
+    async def close(self):
+        self.closes += 1
+
+
+@strawberry.type
+class _Query:
+    ok: bool = True
+
+
+_loaders: list[dict] = []
+
+
+@strawberry.type
+class _Subscription:
+    @strawberry.subscription
+    async def ticket_changed(self, info: strawberry.types.Info) -> str:
+        async for change in changes(info, "ticket"):
+            _loaders.append(info.context["loaders"])
+            yield change.uuid
+
+
+_schema = strawberry.Schema(query=_Query, subscription=_Subscription)
+
+
+@pytest.mark.asyncio
+async def test_each_change_gets_fresh_loaders_and_releases_the_session(monkeypatch):
+    """Per change: new loaders (no stale memo), and the session is closed once it is handled."""
+    hub = LiveEvents()
+    monkeypatch.setattr("app.graphql.subscriptions.live_events", hub)
+    db = _Session()
+    stream = await _schema.subscribe(
+        "subscription { ticketChanged }", context_value={"db": db, "user": None, "loaders": {}}
+    )
+    first = asyncio.ensure_future(anext(stream))
+    await asyncio.sleep(0)  # let the subscription register its queue
+    await hub.publish("ticket", "t-1")
+    await hub.publish("ticket", "t-2")
+    assert (await first).data == {"ticketChanged": "t-1"}
+    assert db.closes == 0  # still handling t-1
+    assert (await anext(stream)).data == {"ticketChanged": "t-2"}
+    assert _loaders[-2] is not _loaders[-1] and db.closes == 1
+    await stream.aclose()
+    for _ in range(10):  # the resolver's generator is closed a few ticks later
+        await asyncio.sleep(0)
+    assert db.closes == 2 and not hub._queues["ticket"]
+
+
+def _signed_in_context(token: str) -> dict:
+    request = SimpleNamespace(headers={"Authorization": f"Bearer {token}"}, app=SimpleNamespace(state=None))
+    return {"db": _Session(), "user": SimpleNamespace(uuid="u-1"), "loaders": {}, "request": request}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("expired", [True, False])
+async def test_an_expired_or_revoked_token_ends_the_subscription_at_the_next_change(monkeypatch, expired):
+    """The token is re-checked per change, even with the socket's connect-time claims reused."""
+    hub = LiveEvents()
+    monkeypatch.setattr("app.graphql.subscriptions.live_events", hub)
+    if expired:
+        token = create_access_token({"sub": "u-1"}, expires_delta=timedelta(seconds=-1))
+        claims = {"sub": "u-1", "type": "access", "exp": time.time() - 1}
+    else:
+        token = create_access_token({"sub": "u-1"}, sid="s-1")
+        claims = {"sub": "u-1", "type": "access", "sid": "s-1", "exp": time.time() + 60}
+        monkeypatch.setattr(revoked_sessions, "is_revoked", lambda sid: sid == "s-1")
+    reset = request_access_claims.set((token, claims))  # as AuditContextMiddleware leaves a websocket
+    try:
+        context = _signed_in_context(token)
+        stream = await _schema.subscribe("subscription { ticketChanged }", context_value=context)
+        pending = asyncio.ensure_future(anext(stream))
+        await asyncio.sleep(0)
+        await hub.publish("ticket", "t-1")
+        result = await pending
+    finally:
+        request_access_claims.reset(reset)
+    assert result.data is None
+    assert "Could not validate credentials" in result.errors[0].message
+    with pytest.raises(StopAsyncIteration):
+        await anext(stream)
+
+
+@pytest.mark.asyncio
+async def test_watch_checks_the_area_before_the_scope():
+    """Outside the watched area a row is never pushed; with no area everything is covered."""
+    area = box(121.0, 25.0, 122.0, 26.0)
+    assert Watch(Perm.TICKET_VIEW, None).covers(None)
+    assert not Watch(Perm.TICKET_VIEW, area).covers(None)
+
+    info = SimpleNamespace(context={"user": None, "db": None})
+    row = SimpleNamespace(geometry=None)
+    assert not await Watch(Perm.TICKET_VIEW, area).sees(info, row)
+    assert await Watch(Perm.TICKET_VIEW, None).sees(info, row)  # public to a Guest
+    assert await Watch(Perm.TICKET_EDIT, None).scope(info) == Scope.NONE
+    assert not await Watch(Perm.TICKET_EDIT, None).sees(info, row)  # Guest holds no other grant
@@ -0,0 +1,140 @@
+"""Tests for the email/SMS outbox: enqueue, worker delivery, retries, reclaim, status lookups."""
+
+import asyncio
+
+import pytest
+
+from app.messaging.outbox import (
+    GROUP,
+    MSG,
+    RETRY,
+    STREAM,
+    Outbox,
+    OutboxEmailSender,
+    OutboxSmsSender,
+    OutboxWorker,
+)
+
+
+class _Recorder:
+    """Sender double recording deliveries; fails its first `failures` calls."""
+
+    def __init__(self, failures: int = 0, delay: float = 0.0):
+        """Fail `failures` times, then succeed; each send takes `delay` seconds."""
+        self.failures = failures
+        self.delay = delay
+        self.sent: list[tuple] = []
+        self.in_flight = 0
+        self.peak = 0
+
+    async def send(self, to, **payload):
+        """Record one delivery (or raise while failures remain)."""
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+            if self.failures:
+                self.failures -= 1
+                raise RuntimeError("provider down")
+            self.sent.append((to, payload))
+        finally:
+            self.in_flight -= 1
+
+
+def _worker(redis, email=None, sms=None, **kwargs) -> OutboxWorker:
+    return OutboxWorker(
+        redis, {"email": email or _Recorder(), "sms": sms or _Recorder()}, consumer="test", **kwargs
+    )
+
+
+@pytest.mark.asyncio
+async def test_enqueue_returns_before_delivery_then_worker_sends(redis):
+    """Queued senders only record the message; the worker delivers it and wipes the payload."""
+    outbox = Outbox(redis)
+    await OutboxEmailSender(outbox).send("a@x.com", "Verify", "<p>123456</p>", "123456")
+    await OutboxSmsSender(outbox).send("+886912345678", "code 123456")
+    (queued,) = await outbox.recent("a@x.com")
+    assert queued["status"] == "queued" and queued["attempts"] == 0
+    assert "payload" not in queued
+
+    email, sms = _Recorder(), _Recorder()
+    assert await _worker(redis, email, sms).run_once(block_ms=10) == 2
+    assert email.sent == [("a@x.com", {"subject": "Verify", "html": "<p>123456</p>", "text": "123456"})]
+    assert sms.sent == [("+886912345678", {"body": "code 123456"})]
+    sent = await outbox.status(queued["id"])
+    assert sent["status"] == "sent" and sent["attempts"] == 1
+    assert not await redis.hexists(MSG + queued["id"], "payload")  # the OTP is gone
+    assert await redis.xlen(STREAM) == 0
+
+
+@pytest.mark.asyncio
+async def test_failed_send_retries_with_backoff_then_succeeds(redis):
+    """A provider error schedules a retry; once due, the next cycle delivers it."""
+    outbox = Outbox(redis)
+    message_id = await outbox.enqueue("email", "a@x.com", subject="s", html="h", text="t")
+    email = _Recorder(failures=1)
+    worker = _worker(redis, email, backoff_seconds=60)
+    await worker.run_once(block_ms=10)
+    retrying = await outbox.status(message_id)
+    assert retrying["status"] == "retrying" and "provider down" in retrying["last_error"]
+    assert await redis.zscore(RETRY, message_id) is not None
+
+    assert await worker.run_once(block_ms=10) == 0  # not due yet
+    await redis.zadd(RETRY, {message_id: 0})  # fast-forward the backoff
+    assert await worker.run_once(block_ms=10) == 1
+    assert email.sent and (await outbox.status(message_id))["status"] == "sent"
+    assert (await outbox.status(message_id))["last_error"] is None
+
+
+@pytest.mark.asyncio
+async def test_gives_up_after_max_attempts(redis):
+    """After max_attempts failures the message is marked failed and its payload deleted."""
+    outbox = Outbox(redis)
+    message_id = await outbox.enqueue("sms", "+886912345678", body="code")
+    worker = _worker(redis, sms=_Recorder(failures=10), max_attempts=2, backoff_seconds=0)
+    for _ in range(3):
+        await worker.run_once(block_ms=10)
+    failed = await outbox.status(message_id)
+    assert failed["status"] == "failed" and failed["attempts"] == 2
+    assert not await redis.hexists(MSG + message_id, "payload")
+    assert await redis.zcard(RETRY) == 0
+
+
+@pytest.mark.asyncio
+async def test_per_channel_concurrency_limit(redis):
+    """No more than the channel's concurrency cap is in flight at once within a batch."""
+    outbox = Outbox(redis)
+    for i in range(6):
+        await outbox.enqueue("email", f"u{i}@x.com", subject="s", html="h", text="t")
+    email = _Recorder(delay=0.01)
+    await _worker(redis, email, concurrency={"email": 2, "sms": 1}).run_once(block_ms=10)
+    assert len(email.sent) == 6
+    assert email.peak == 2
+
+
+@pytest.mark.asyncio
+async def test_entries_of_a_crashed_worker_are_reclaimed(redis, monkeypatch):
+    """An entry claimed but never acked by a dead consumer is delivered by another worker."""
+    outbox = Outbox(redis)
+    message_id = await outbox.enqueue("email", "a@x.com", subject="s", html="h", text="t")
+    await redis.xgroup_create(STREAM, GROUP, id="0", mkstream=True)
+    await redis.xreadgroup(GROUP, "crashed", {STREAM: ">"}, count=10)  # claimed, never acked
+
+    email = _Recorder()
+    worker = _worker(redis, email)
+    assert await worker.run_once(block_ms=10) == 0  # still within RECLAIM_IDLE_MS
+    monkeypatch.setattr("app.messaging.outbox.RECLAIM_IDLE_MS", 0)
+    worker._next_reclaim = 0.0
+    assert await worker.run_once(block_ms=10) == 1
+    assert email.sent and (await outbox.status(message_id))["status"] == "sent"
+
+
+@pytest.mark.asyncio
+async def test_recent_lists_newest_first(redis):
+    """Support lookups return a recipient's messages newest first, without bodies."""
+    outbox = Outbox(redis)
+    first = await outbox.enqueue("email", "a@x.com", subject="s", html="h", text="t")
+    second = await outbox.enqueue("email", "a@x.com", subject="s", html="h", text="t")
+    await outbox.enqueue("email", "b@x.com", subject="s", html="h", text="t")
+    assert [m["id"] for m in await outbox.recent("a@x.com")] == [second, first]
+    assert await outbox.recent("nobody@x.com") == []
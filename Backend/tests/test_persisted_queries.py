@@ -0,0 +1,126 @@
+"""Tests for automatic persisted queries and the validated-document LRU."""
+
+import json
+from types import SimpleNamespace
+
+import pytest
+import strawberry
+
+from app.core.config import settings
+from app.graphql import persisted_queries
+from app.graphql.persisted_queries import PersistedQueries, sha256
+
+HELLO = "query Hello { hello }"
+
+
+@strawberry.type
+class _Query:
+    @strawberry.field
+    def hello(self) -> str:
+        return "world"
+
+
+_schema = strawberry.Schema(query=_Query, extensions=[PersistedQueries])
+
+
+@pytest.fixture(autouse=True)
+def _fresh_caches():
+    persisted_queries._documents.clear()
+    persisted_queries.manifest.cache_clear()
+    yield
+    persisted_queries._documents.clear()
+    persisted_queries.manifest.cache_clear()
+
+
+@pytest.fixture
+def parses(monkeypatch):
+    """Count graphql-core parses behind strawberry's back."""
+    import strawberry.schema.schema as strawberry_schema
+
+    calls = []
+    real = strawberry_schema.parse
+
+    def _parse(*args, **kwargs):
+        calls.append(args[0])
+        return real(*args, **kwargs)
+
+    monkeypatch.setattr(strawberry_schema, "parse", _parse)
+    return calls
+
+
+async def _run(redis, query=None, query_hash=None):
+    request = SimpleNamespace(app=SimpleNamespace(state=SimpleNamespace(redis=redis)))
+    extensions = {"persistedQuery": {"version": 1, "sha256Hash": query_hash}} if query_hash else None
+    return await _schema.execute(query, context_value={"request": request}, operation_extensions=extensions)
+
+
+def _code(result) -> str | None:
+    return result.errors[0].extensions["code"] if result.errors else None
+
+
+@pytest.mark.asyncio
+async def test_apq_handshake_registers_then_serves_by_hash(redis, parses):
+    """Unknown hash -> NotFound; the retry with text registers it; later hashes need no text."""
+    query_hash = sha256(HELLO)
+    assert _code(await _run(redis, query_hash=query_hash)) == "PERSISTED_QUERY_NOT_FOUND"
+    assert (await _run(redis, HELLO, query_hash)).data == {"hello": "world"}
+    assert await redis.get("apq:" + query_hash) == HELLO.encode()
+
+    persisted_queries._documents.clear()  # another worker: only Redis knows the hash
+    assert (await _run(redis, query_hash=query_hash)).data == {"hello": "world"}
+    assert (await _run(redis, query_hash=query_hash)).data == {"hello": "world"}
+    assert len(parses) == 2  # once per process, never for the repeat
+
+
+@pytest.mark.asyncio
+async def test_plain_query_text_parsed_once(redis, parses):
+    """Repeats of the same text skip parsing and validation via the document LRU."""
+    for _ in range(3):
+        assert (await _run(redis, HELLO)).data == {"hello": "world"}
+    assert len(parses) == 1
+    assert not await redis.keys("apq:*")  # plain requests register nothing
+
+
+@pytest.mark.asyncio
+async def test_hash_mismatch_and_invalid_documents_rejected(redis):
+    """A wrong hash errors; a document that fails validation is neither cached nor registered."""
+    assert _code(await _run(redis, HELLO, sha256("{ other }"))) == "PERSISTED_QUERY_HASH_MISMATCH"
+    bad = "{ nope }"
+    assert (await _run(redis, bad, sha256(bad))).errors
+    assert not persisted_queries._documents
+    assert not await redis.keys("apq:*")
+
+
+@pytest.mark.asyncio
+async def test_lru_evicts_least_recently_used(redis, monkeypatch):
+    """Past GRAPHQL_DOCUMENT_CACHE_SIZE the least recently used document is dropped."""
+    monkeypatch.setattr(settings, "GRAPHQL_DOCUMENT_CACHE_SIZE", 2)
+    queries = ["query A { hello }", "query B { hello }", "query C { hello }"]
+    await _run(redis, queries[0])
+    await _run(redis, queries[1])
+    await _run(redis, queries[0])  # A is now the most recent
+    await _run(redis, queries[2])
+    assert list(persisted_queries._documents) == [sha256(queries[0]), sha256(queries[2])]
+
+
+@pytest.mark.asyncio
+async def test_allow_list_mode_runs_only_manifest_operations(redis, monkeypatch, tmp_path):
+    """With GRAPHQL_PERSISTED_ONLY, manifest operations run by hash or text; nothing else does."""
+    manifest = tmp_path / "persisted-query-manifest.json"
+    manifest.write_text(json.dumps({
+        "format": "apollo-persisted-query-manifest", "version": 1,
+        "operations": [
+            {"id": sha256(HELLO), "name": "Hello", "type": "query", "body": HELLO},
+            {"id": "0" * 64, "name": "Stale", "type": "query", "body": "{ hello }"},
+        ],
+    }))
+    monkeypatch.setattr(settings, "GRAPHQL_PERSISTED_QUERY_MANIFEST", str(manifest))
+    monkeypatch.setattr(settings, "GRAPHQL_PERSISTED_ONLY", True)
+
+    assert (await _run(redis, query_hash=sha256(HELLO))).data == {"hello": "world"}
+    assert (await _run(redis, HELLO)).data == {"hello": "world"}
+    assert _code(await _run(redis, "{ hello }")) == "PERSISTED_QUERY_REQUIRED"
+    assert _code(await _run(redis, query_hash="0" * 64)) == "PERSISTED_QUERY_NOT_FOUND"
+    other = "query Other { hello }"
+    assert _code(await _run(redis, other, sha256(other))) == "PERSISTED_QUERY_REQUIRED"
+    assert not await redis.keys("apq:*")
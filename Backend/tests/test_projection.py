@@ -0,0 +1,148 @@
+"""Tests for selection-aware column projection (app/graphql/projection.py)."""
+
+from datetime import UTC, datetime
+from types import SimpleNamespace
+
+import pytest
+import strawberry
+from geoalchemy2.shape import from_shape
+from shapely.geometry import Point
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.engine.result import IteratorResult, SimpleResultMetaData
+from strawberry.types.base import get_object_definition
+
+from app.graphql.geo.types import STATION_READS, StationConnection, StationType
+from app.graphql.projection import projected_columns
+from app.graphql.shared import PageInfo
+from app.graphql.tickets.types import TICKET_READS, TicketConnection, TicketType
+from app.infrastructure.repository.base import read_columns
+from app.models.auth import User
+from app.models.geo import Station
+from app.models.request import Tickets
+from app.repositories.auth_repository import user_repository
+
+_seen: dict[str, list | None] = {}
+_EMPTY = PageInfo(total_count=0, has_next_page=False, has_previous_page=False)
+
+
+@strawberry.type
+class _Query:
+    @strawberry.field
+    def stations(self, info: strawberry.types.Info) -> StationConnection:
+        _seen["stations"] = projected_columns(info, Station, STATION_READS)
+        return StationConnection(items=[], page_info=_EMPTY)
+
+    @strawberry.field
+    def tickets(self, info: strawberry.types.Info) -> TicketConnection:
+        _seen["tickets"] = projected_columns(info, Tickets, TICKET_READS)
+        return TicketConnection(items=[], page_info=_EMPTY)
+
+
+_schema = strawberry.Schema(query=_Query)
+
+
+def _projected(query: str, root: str = "stations") -> list | None:
+    result = _schema.execute_sync(query)
+    assert result.errors is None, result.errors
+    return _seen[root]
+
+
+def _columns(query: str, root: str = "stations") -> list[str]:
+    return [c.key for c in _projected(query, root)]
+
+
+def test_only_selected_columns_are_loaded():
+    """`items { uuid name }` selects those columns (plus property_name) and no geometry."""
+    assert _columns("{ stations { items { uuid name createdAt } } }") == [
+        "created_at", "name", "property_name", "uuid",
+    ]
+    columns = _projected("{ stations { items { name } } }")
+    sql = str(select(*columns).compile(dialect=postgresql.dialect()))
+    assert "stations.name" in sql and "base_geometries.uuid" in sql  # joined inheritance kept
+    assert "geometry" not in sql and "description" not in sql
+
+
+def test_fragments_and_loader_fields():
+    """Fragments are merged; loader-backed fields need only `uuid`; pageInfo adds nothing."""
+    query = """
+    { stations { ...Page items { ... on StationType { level } photos { uuid } } } }
+    fragment Page on StationConnection { pageInfo { totalCount } items { type } }
+    """
+    assert _columns(query) == ["level", "property_name", "type", "uuid"]
+    assert _columns("{ tickets { items { tasks { uuid } photos { uuid } } } }", "tickets") == [
+        "property_name", "uuid",
+    ]
+
+
+def test_pii_fields_load_what_the_scope_check_reads():
+    """A contact_* resolver checks scope against created_by and geometry, so both are loaded."""
+    assert _columns("{ tickets { items { contactEmail } } }", "tickets") == [
+        "contact_email", "created_by", "geometry", "property_name", "uuid",
+    ]
+
+
+def test_unselected_connection_items_and_typename():
+    """Only `__typename` / `pageInfo` selected: just the always-loaded keys."""
+    assert _columns("{ stations { __typename pageInfo { totalCount } } }") == ["property_name", "uuid"]
+
+
+def test_every_field_is_projectable():
+    """Each StationType/TicketType field is a column or listed in *_READS (else lists load entities)."""
+    for type_, reads, model in [(StationType, STATION_READS, Station), (TicketType, TICKET_READS, Tickets)]:
+        columns = model.__mapper__.column_attrs
+        fields = [f.python_name for f in get_object_definition(type_).fields]
+        assert [f for f in fields if f not in reads and f not in columns] == []
+
+
+def _row(columns, values):
+    """A Core `Row`, as a projected select returns it."""
+    metadata = SimpleResultMetaData([c.key for c in columns])
+    return IteratorResult(metadata, iter([tuple(values)])).one()
+
+
+def test_row_values_build_the_type():
+    """A projected row becomes a StationType with GeoJSON and raw PII set like from_model."""
+    created = datetime(2026, 1, 1, tzinfo=UTC)
+    columns = [Station.uuid, Station.property_name, Station.geometry, Station.contact_name,
+               Station.created_at]
+    row = _row(columns, [
+        "6f1c...", "station", from_shape(Point(121.5, 25.0), srid=4326), "Alice", created,
+    ])
+    station = StationType.from_row(row)
+    assert station.geometry == {"type": "Point", "coordinates": (121.5, 25.0)}
+    assert station._geometry_raw is not None
+    assert station._contact_name_raw == "Alice"
+    assert station.created_at == created and station.name is None
+
+
+def test_full_rows_feed_from_model():
+    """`read_columns` rows read like the entity they replace, so from_model accepts them."""
+    columns = read_columns(Station)
+    values = {c.key: None for c in columns} | {
+        "uuid": "6f1c...", "property_name": "station", "name": "Depot", "level": 2,
+        "contact_phone": "0912", "geometry": from_shape(Point(121.5, 25.0), srid=4326),
+    }
+    station = StationType.from_model(_row(columns, [values[c.key] for c in columns]))
+    assert (station.name, station.level, station._contact_phone_raw) == ("Depot", 2, "0912")
+    assert station.geometry == {"type": "Point", "coordinates": (121.5, 25.0)}
+    sql = str(select(*columns).compile(dialect=postgresql.dialect()))
+    assert "FROM base_geometries JOIN stations" in sql
+
+
+@pytest.mark.asyncio
+async def test_get_multi_rows_selects_only_the_given_columns():
+    """The admin user list reads three columns as `Row`s; password hashes never leave the table."""
+    executed = []
+
+    class _Db:
+        async def execute(self, query):
+            executed.append(query)
+            return SimpleNamespace(all=list)
+
+    columns = (User.uuid, User.name, User.team_uuid)
+    assert await user_repository.get_multi_rows(_Db(), columns, skip=5, limit=10, filters={"name": "a"}) == []
+    sql = str(executed[0].compile(dialect=postgresql.dialect()))
+    assert sql.startswith("SELECT users.uuid, users.name, users.team_uuid \nFROM users")
+    assert "password" not in sql and "WHERE users.name =" in sql
+
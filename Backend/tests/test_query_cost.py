@@ -0,0 +1,100 @@
+"""Tests for GraphQL query cost and depth limits (app/graphql/query_cost.py)."""
+
+from types import SimpleNamespace
+
+import pytest
+import strawberry
+
+from app.core.config import settings
+from app.graphql.query_cost import ASSUMED_LIST_SIZE, QueryCost
+from app.graphql.schema import schema
+
+BOARD = """
+query Board($limit: Int) {
+  tickets(limit: $limit) {
+    items { uuid photos { uuid } tasks { uuid assignedCount } }
+    pageInfo { hasNextPage }
+  }
+}
+"""
+
+
+def _context(user=None) -> dict:
+    request = SimpleNamespace(app=SimpleNamespace(state=SimpleNamespace()))
+    return {"request": request, "user": user, "db": None}
+
+
+async def _run(query, variables=None, user=None, target=schema):
+    return await target.execute(query, variable_values=variables, context_value=_context(user))
+
+
+@pytest.mark.asyncio
+async def test_oversized_limit_rejected_before_any_resolver():
+    """`limit: 10000` with nested lists prices far over the Guest limit; nothing executes."""
+    result = await _run(BOARD, {"limit": 10_000})
+    (error,) = result.errors
+    assert error.extensions["code"] == "QUERY_TOO_COSTLY"
+    assert "exceeds the limit" in error.message
+    assert result.data is None
+    per_ticket = 1 + ASSUMED_LIST_SIZE + ASSUMED_LIST_SIZE * (1 + 1)  # photos, tasks{assignedCount}
+    assert result.extensions["cost"]["requested"] == 1 + 10_000 * per_ticket + 1  # + pageInfo
+
+
+@pytest.mark.asyncio
+async def test_cost_prices_literal_variable_and_default_limits():
+    """The size comes from a literal, a variable, the variable's default or the schema default."""
+    costs = []
+    for query, variables in [
+        ("{ tickets(limit: 7) { items { uuid } } }", None),
+        ("query($n: Int) { tickets(limit: $n) { items { uuid } } }", {"n": 7}),
+        ("query($n: Int = 7) { tickets(limit: $n) { items { uuid } } }", None),
+        ("{ tickets { items { uuid } } }", None),
+    ]:
+        result = await _run(query, variables, user=SimpleNamespace(), target=_priced)
+        costs.append(result.extensions["cost"]["requested"])
+    assert costs == [1 + 7, 1 + 7, 1 + 7, 1 + 50]
+
+
+@pytest.mark.asyncio
+async def test_limits_depend_on_the_caller(monkeypatch):
+    """The same operation can be over a Guest's limit but within a logged-in caller's."""
+    monkeypatch.setattr(settings, "GRAPHQL_MAX_COST_GUEST", 50)
+    query = "{ tickets(limit: 60) { items { uuid } } }"
+    guest = await _run(query, target=_priced)
+    assert guest.errors[0].extensions["code"] == "QUERY_TOO_COSTLY"
+    member = await _run(query, user=SimpleNamespace(), target=_priced)
+    assert member.errors is None
+    assert member.extensions["cost"]["maximum"] == settings.GRAPHQL_MAX_COST_AUTHENTICATED
+
+
+@pytest.mark.asyncio
+async def test_depth_limit(monkeypatch):
+    """Nesting past the depth limit is rejected; fragments and introspection do not count."""
+    monkeypatch.setattr(settings, "GRAPHQL_MAX_DEPTH_GUEST", 3)
+    deep = "{ tickets { items { tasks { assignments { uuid } } } } }"
+    result = await _run(deep)
+    assert result.errors[0].extensions["code"] == "QUERY_TOO_DEEP"
+    assert result.extensions["cost"]["depth"] == 5
+    shallow = "query { ...T __schema { types { name } } } fragment T on Query { tickets { items { uuid } } }"
+    result = await _run(shallow, target=_priced)
+    assert result.errors is None and result.extensions["cost"]["depth"] == 3
+
+
+@strawberry.type
+class _Item:
+    uuid: str
+
+
+@strawberry.type
+class _Connection:
+    items: list[_Item]
+
+
+@strawberry.type
+class _Query:
+    @strawberry.field
+    def tickets(self, limit: int = 50) -> _Connection:
+        return _Connection(items=[_Item(uuid=str(i)) for i in range(limit)])
+
+
+_priced = strawberry.Schema(query=_Query, extensions=[QueryCost])
@@ -0,0 +1,89 @@
+"""Tests for the shared Redis rate limiter and its local fallback (app/core/rate_limit.py)."""
+
+from uuid import uuid4
+
+import pytest
+import redis.asyncio as aioredis
+from fastapi import Depends, FastAPI, HTTPException
+from httpx import ASGITransport, AsyncClient
+
+from app.core.rate_limit import RateLimit, body_identifier
+
+
+def _bucket() -> str:
+    """A bucket name no other test (or earlier run) has touched."""
+    return f"test-{uuid4().hex[:8]}"
+
+
+@pytest.mark.asyncio
+async def test_limit_is_enforced_and_reports_retry_after(redis):
+    """The (times+1)th request in the window is refused with 429 and a Retry-After."""
+    limit, name = RateLimit(3, 60), _bucket()
+    for _ in range(3):
+        await limit.check(redis, name, ip="10.0.0.1")
+    with pytest.raises(HTTPException) as exc:
+        await limit.check(redis, name, ip="10.0.0.1")
+    assert exc.value.status_code == 429
+    assert 1 <= int(exc.value.headers["Retry-After"]) <= 60
+    await limit.check(redis, name, ip="10.0.0.2")  # other IPs keep their own quota
+
+
+@pytest.mark.asyncio
+async def test_identifier_quota_is_shared_across_ips_and_workers(redis):
+    """One identifier is limited however many IPs and worker processes it is spread over."""
+    from tests.conftest import TEST_REDIS_URL
+
+    other_worker = aioredis.from_url(TEST_REDIS_URL, decode_responses=False)
+    try:
+        name = _bucket()
+        await RateLimit(2, 60).check(redis, name, ip="10.0.0.1", subject="a@x.com")
+        await RateLimit(2, 60).check(other_worker, name, ip="10.0.0.2", subject="a@x.com")
+        with pytest.raises(HTTPException):
+            await RateLimit(2, 60).check(redis, name, ip="10.0.0.3", subject="a@x.com")
+    finally:
+        await other_worker.aclose()
+
+
+@pytest.mark.asyncio
+async def test_refused_request_costs_no_quota(redis):
+    """A request refused on one key does not consume the other key's quota."""
+    limit, name = RateLimit(1, 60), _bucket()
+    await limit.check(redis, name, subject="busy")
+    with pytest.raises(HTTPException):
+        await limit.check(redis, name, ip="10.0.0.9", subject="busy")
+    await limit.check(redis, name, ip="10.0.0.9")
+
+
+@pytest.mark.asyncio
+async def test_unreachable_redis_falls_back_to_the_local_bucket():
+    """With Redis down the limit still holds, per worker, instead of failing open or 500ing."""
+    dead = aioredis.from_url("redis://127.0.0.1:1", decode_responses=False)
+    try:
+        limit, name = RateLimit(2, 60), _bucket()
+        await limit.check(dead, name, ip="10.0.0.1")
+        await limit.check(None, name, ip="10.0.0.1")
+        with pytest.raises(HTTPException):
+            await limit.check(dead, name, ip="10.0.0.1")
+    finally:
+        await dead.aclose()
+
+
+@pytest.mark.asyncio
+async def test_dependency_keys_by_body_identifier():
+    """As a route dependency, the JSON `value` is a key of its own, across client IPs."""
+    app = FastAPI()
+
+    @app.post("/otp", dependencies=[Depends(RateLimit(2, 60, identifier=body_identifier))])
+    async def otp(body: dict):
+        return {"ok": True}
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        statuses = [
+            (await client.post(
+                "/otp", json={"value": "Victim@X.com"}, headers={"X-Forwarded-For": f"10.1.0.{i}"}
+            )).status_code
+            for i in range(3)
+        ]
+        other = await client.post("/otp", json={"value": "other@x.com"})
+    assert statuses == [200, 200, 429]
+    assert other.status_code == 200
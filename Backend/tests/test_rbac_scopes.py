@@ -21,7 +21,7 @@ from sqlalchemy import false, select
 from app.core.rbac_scopes import Scope, in_scope, scope_filter, widest
 from app.models.auth import User
 from app.models.geo import Station
-from app.models.team import Team, TeamZoneAssign, WorkZone
+from app.models.team import Team, TeamZoneAssign, WorkZone, WorkZonePart
 
 # --- widest() ---
 
@@ -223,6 +223,79 @@ async def test_in_scope_zone_false_when_resource_has_no_geometry(db):
     assert await in_scope(Scope.ZONE, actor=actor, resource=resource, db=db) is False
 
 
+def _many_vertex_polygon(n: int = 400) -> Polygon:
+    """A ~1° circle around (121.5, 25.0) drawn with `n` vertices — enough to be subdivided."""
+    return Point(121.5, 25.0).buffer(1.0, quad_segs=n // 4)
+
+
+async def _part_count(db, zone_uuid) -> int:
+    """Count the subdivided pieces stored for `zone_uuid`."""
+    result = await db.execute(select(WorkZonePart.uuid).where(WorkZonePart.zone_uuid == zone_uuid))
+    return len(result.scalars().all())
+
+
+@pytest.mark.asyncio
+async def test_work_zone_insert_subdivides_into_parts(db):
+    """Inserting a many-vertex zone stores several ST_Subdivide pieces in the same flush."""
+    zone = WorkZone(name="Coast", geometry=from_shape(_many_vertex_polygon(), srid=4326))
+    db.add(zone)
+    await db.flush()
+    assert await _part_count(db, zone.uuid) > 1
+
+
+@pytest.mark.asyncio
+async def test_work_zone_geometry_update_rebuilds_parts(db):
+    """Changing a zone's boundary replaces its pieces; the old shape no longer matches."""
+    team = Team(name="T1", type="ngo")
+    db.add(team)
+    await db.flush()
+    actor = User(name="A", team_uuid=team.uuid)
+    db.add(actor)
+    await db.flush()
+    zone = WorkZone(name="Coast", geometry=from_shape(_many_vertex_polygon(), srid=4326))
+    db.add(zone)
+    await db.flush()
+    db.add(TeamZoneAssign(team_uuid=team.uuid, zone_uuid=zone.uuid, assigned_by=str(actor.uuid)))
+    await db.flush()
+
+    zone.geometry = from_shape(
+        Polygon([(130.0, 30.0), (131.0, 30.0), (131.0, 31.0), (130.0, 31.0), (130.0, 30.0)]), srid=4326
+    )
+    await db.flush()
+
+    assert await _part_count(db, zone.uuid) == 1
+    old_spot = Station(geometry=from_shape(Point(121.5, 25.0), srid=4326), created_by=str(actor.uuid))
+    new_spot = Station(geometry=from_shape(Point(130.5, 30.5), srid=4326), created_by=str(actor.uuid))
+    assert await in_scope(Scope.ZONE, actor=actor, resource=old_spot, db=db) is False
+    assert await in_scope(Scope.ZONE, actor=actor, resource=new_spot, db=db) is True
+
+
+@pytest.mark.asyncio
+async def test_zone_scope_matches_points_against_subdivided_zone(db):
+    """in_scope and scope_filter agree on a many-vertex zone tested through its pieces."""
+    team = Team(name="T1", type="ngo")
+    db.add(team)
+    await db.flush()
+    actor = User(name="A", team_uuid=team.uuid)
+    db.add(actor)
+    await db.flush()
+    zone = WorkZone(name="Coast", geometry=from_shape(_many_vertex_polygon(), srid=4326))
+    db.add(zone)
+    await db.flush()
+    db.add(TeamZoneAssign(team_uuid=team.uuid, zone_uuid=zone.uuid, assigned_by=str(actor.uuid)))
+    await db.flush()
+
+    inside = Station(geometry=from_shape(Point(121.9, 25.3), srid=4326), created_by=str(actor.uuid))
+    outside = Station(geometry=from_shape(Point(122.6, 25.0), srid=4326), created_by=str(actor.uuid))
+    db.add_all([inside, outside])
+    await db.flush()
+
+    assert await in_scope(Scope.ZONE, actor=actor, resource=inside, db=db) is True
+    assert await in_scope(Scope.ZONE, actor=actor, resource=outside, db=db) is False
+    uuids = await _station_uuids(db, *scope_filter(Scope.ZONE, actor=actor, model=Station))
+    assert uuids == {str(inside.uuid)}
+
+
 # --- in_scope(): NONE ---
 
 
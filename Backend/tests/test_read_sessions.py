@@ -0,0 +1,103 @@
+"""Tests for per-root-field read sessions (ReadSessions / read_session in app/graphql/context.py)."""
+
+import asyncio
+
+import pytest
+import strawberry
+
+from app.core.config import settings
+from app.graphql import context as graphql_context
+from app.graphql.context import ReadSessions, read_session
+
+
+class _Session:
+    """Stands in for an AsyncSession: counts how many of its queries overlap in time."""
+
+    in_flight = 0
+    most_in_flight = 0
+
+    def __init__(self):
+        self.closed = False
+
+    async def execute(self):
+        _Session.in_flight += 1
+        _Session.most_in_flight = max(_Session.most_in_flight, _Session.in_flight)
+        await asyncio.sleep(0.01)
+        _Session.in_flight -= 1
+
+    async def close(self):
+        self.closed = True
+
+
+_seen: list[_Session] = []
+
+
+async def _read(info) -> str:
+    session = read_session(info)
+    await session.execute()
+    _seen.append(session)
+    return str(id(session))
+
+
+@strawberry.type
+class _Query:
+    @strawberry.field
+    async def stations(self, info: strawberry.types.Info) -> str:
+        await _read(info)  # a count, then the page: both on the field's own session
+        return await _read(info)
+
+    @strawberry.field
+    async def tickets(self, info: strawberry.types.Info) -> str:
+        return await _read(info)
+
+
+@strawberry.type
+class _Mutation:
+    @strawberry.mutation
+    async def save(self, info: strawberry.types.Info) -> str:
+        return await _read(info)
+
+
+_schema = strawberry.Schema(query=_Query, mutation=_Mutation, extensions=[ReadSessions])
+
+
+@pytest.fixture(autouse=True)
+def _sessions(monkeypatch):
+    monkeypatch.setattr(graphql_context, "SessionLocal", _Session)
+    _seen.clear()
+    _Session.most_in_flight = 0
+
+
+async def _run(query):
+    db = _Session()
+    result = await _schema.execute(query, context_value={"db": db, "loaders": {}})
+    assert result.errors is None, result.errors
+    return db, result.data
+
+
+@pytest.mark.asyncio
+async def test_off_by_default_every_field_shares_the_request_session(monkeypatch):
+    """Without GRAPHQL_CONCURRENT_READS nothing changes: one session (one connection) for all."""
+    monkeypatch.setattr(settings, "GRAPHQL_CONCURRENT_READS", False)
+    db, data = await _run("{ stations tickets }")
+    assert data == {"stations": str(id(db)), "tickets": str(id(db))}
+    assert not _seen[0].closed
+
+
+@pytest.mark.asyncio
+async def test_root_fields_get_their_own_sessions_and_run_in_parallel(monkeypatch):
+    """Each root field (per alias) reads on its own session; all are closed afterwards."""
+    monkeypatch.setattr(settings, "GRAPHQL_CONCURRENT_READS", True)
+    db, data = await _run("{ stations tickets other: tickets }")
+    assert len({data["stations"], data["tickets"], data["other"], str(id(db))}) == 4
+    assert len(set(map(id, _seen))) == 3  # stations reused its session for both reads
+    assert _Session.most_in_flight == 3
+    assert all(session.closed for session in _seen) and not db.closed
+
+
+@pytest.mark.asyncio
+async def test_mutations_stay_on_the_request_session(monkeypatch):
+    """A mutation keeps its single transactional session."""
+    monkeypatch.setattr(settings, "GRAPHQL_CONCURRENT_READS", True)
+    db, data = await _run("mutation { save }")
+    assert data == {"save": str(id(db))}
@@ -0,0 +1,133 @@
+"""Tests for the anonymous GraphQL response cache (app/graphql/response_cache.py)."""
+
+from types import SimpleNamespace
+
+import pytest
+import strawberry
+
+from app.graphql.response_cache import ResponseCache
+
+STATIONS = "query Map($type: String) { stations(type: $type) }"
+
+
+class _Calls:
+    """Resolver call counter shared by the test schema."""
+
+    count = 0
+
+
+@strawberry.type
+class _Query:
+    @strawberry.field
+    def stations(self, type: str | None = None) -> list[str]:
+        _Calls.count += 1
+        return [f"{type or 'any'}-{_Calls.count}"]
+
+    @strawberry.field
+    def work_zones(self) -> list[str]:
+        _Calls.count += 1
+        return ["zone"]
+
+    @strawberry.field
+    def announcements(self) -> list[str]:
+        raise ValueError("boom")
+
+
+@strawberry.type
+class _Mutation:
+    @strawberry.mutation
+    def create_station(self) -> bool:
+        return True
+
+    @strawberry.mutation
+    def create_work_zone(self) -> bool:
+        return True
+
+    @strawberry.mutation
+    def brand_new_mutation(self) -> bool:
+        return True
+
+
+_schema = strawberry.Schema(query=_Query, mutation=_Mutation, extensions=[ResponseCache])
+
+
+@pytest.fixture(autouse=True)
+def _reset_calls():
+    _Calls.count = 0
+
+
+def _context(redis, user=None) -> dict:
+    request = SimpleNamespace(app=SimpleNamespace(state=SimpleNamespace(redis=redis)))
+    return {"request": request, "user": user}
+
+
+async def _run(redis, query, variables=None, user=None):
+    result = await _schema.execute(query, variable_values=variables, context_value=_context(redis, user))
+    return result.data
+
+
+@pytest.mark.asyncio
+async def test_repeat_anonymous_query_served_from_cache(redis):
+    """The second identical Guest query never reaches the resolver; formatting doesn't matter."""
+    first = await _run(redis, STATIONS, {"type": "shelter"})
+    reformatted = "query Map($type: String) {\n  stations(type: $type)  # map\n}"
+    again = await _run(redis, reformatted, {"type": "shelter"})
+    assert first == again == {"stations": ["shelter-1"]}
+    assert _Calls.count == 1
+    await _run(redis, STATIONS, {"type": "medical"})  # other variables, other entry
+    assert _Calls.count == 2
+
+
+@pytest.mark.asyncio
+async def test_mutation_bumps_only_its_tags(redis):
+    """A createStation mutation invalidates station queries; a mutation Guests can't observe does not."""
+    await _run(redis, STATIONS)
+    await _run(redis, "mutation { createWorkZone }")
+    await _run(redis, STATIONS)
+    assert _Calls.count == 1
+    await _run(redis, "mutation { createStation }")
+    assert await _run(redis, STATIONS) == {"stations": ["any-2"]}
+
+
+@pytest.mark.asyncio
+async def test_unmapped_mutation_bumps_every_tag(redis):
+    """A mutation missing from MUTATION_TAGS errs on the side of invalidating everything."""
+    await _run(redis, STATIONS)
+    await _run(redis, "mutation { brandNewMutation }")
+    await _run(redis, STATIONS)
+    assert _Calls.count == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("query", "user"),
+    [
+        (STATIONS, SimpleNamespace(uuid="u1")),  # authenticated: results depend on scope
+        ("{ stations workZones }", None),  # a non-public root field
+        ("{ announcements }", None),  # errored results are never stored
+    ],
+    ids=["authenticated", "non-public-field", "errors"],
+)
+async def test_not_cached(redis, query, user):
+    """Authenticated callers, non-public fields and errored results always execute."""
+    await _run(redis, query, user=user)
+    await _run(redis, query, user=user)
+    assert not await redis.keys("gqlcache:r:*")
+
+
+@pytest.mark.asyncio
+async def test_runs_uncached_without_redis():
+    """With no Redis client (no lifespan) queries and mutations simply execute."""
+    assert await _run(None, STATIONS) == {"stations": ["any-1"]}
+    assert await _run(None, STATIONS) == {"stations": ["any-2"]}
+    assert await _run(None, "mutation { createStation }") == {"createStation": True}
+
+
+def test_tag_maps_match_the_schema():
+    """Every real mutation is mapped explicitly, and every cacheable query exists."""
+    from app.graphql.response_cache import CACHEABLE_QUERIES, MUTATION_TAGS
+    from app.graphql.schema import schema
+
+    graphql_schema = schema._schema
+    assert set(MUTATION_TAGS) == set(graphql_schema.mutation_type.fields)
+    assert set(CACHEABLE_QUERIES) <= set(graphql_schema.query_type.fields)
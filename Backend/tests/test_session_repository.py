@@ -63,25 +63,39 @@ async def test_unknown_token_is_invalid(repo):
 
 @pytest.mark.asyncio
 async def test_concurrent_rotate_same_token_one_wins(repo):
-    """Two concurrent rotations of the same token: exactly one wins, one is reuse-detected.
+    """Concurrent rotations of the same token: exactly one wins, the rest are reuse-detected.
 
-    Uses an asyncio.Barrier to deterministically force the race window: both coroutines read the
-    refresh record before either mutates, which is exactly the interleave the fix must survive.
+    The whole check-claim-swap runs as one Lua script, so there is no client-side interleave
+    left to force; firing several rotations at once exercises the server-side serialization.
     """
-    sid, raw = await repo.create_session("u-1", "dev")
-    gate = asyncio.Barrier(2)
-    orig_get = repo.get_refresh
-
-    async def gated_get_refresh(h):
-        rec = await orig_get(h)
-        await gate.wait()  # both coroutines have read before either mutates
-        return rec
-
-    repo.get_refresh = gated_get_refresh
-    results = await asyncio.gather(repo.rotate(raw), repo.rotate(raw), return_exceptions=True)
+    _, raw = await repo.create_session("u-1", "dev")
+    results = await asyncio.gather(*(repo.rotate(raw) for _ in range(5)), return_exceptions=True)
     oks = [r for r in results if not isinstance(r, Exception)]
     reuse = [r for r in results if isinstance(r, RefreshTokenReuse)]
-    assert len(oks) == 1 and len(reuse) == 1
+    assert len(oks) == 1 and len(reuse) == 4
+
+
+@pytest.mark.asyncio
+async def test_rotate_keeps_the_session_record_consistent(repo):
+    """After rotation the session points at the new token, keeps its fields and its TTL."""
+    sid, raw = await repo.create_session("user-1", device="UA")
+    _, _user, new_raw = await repo.rotate(raw)
+    session = repo._load(await repo.redis.get(repo.SESSION + sid))
+    assert session["current_rt_hash"] == repo._hash(new_raw)
+    assert session["device"] == "UA" and session["user_uuid"] == "user-1"
+    assert 0 < await repo.redis.ttl(repo.SESSION + sid) <= repo.ttl
+    assert await repo.get_refresh(repo._hash(new_raw)) == {"sid": sid, "user_uuid": "user-1"}
+
+
+@pytest.mark.asyncio
+async def test_scripts_reload_after_script_flush(repo):
+    """A Redis restart drops cached scripts; the next call reloads instead of failing."""
+    await SessionRepository.load_scripts(repo.redis)
+    await repo.redis.script_flush()
+    sid, raw = await repo.create_session("user-1", device="UA")
+    await repo.revoke_session(sid)
+    with pytest.raises(InvalidRefreshToken):
+        await repo.rotate(raw)
 
 
 @pytest.mark.asyncio
@@ -93,3 +107,39 @@ async def test_revoke_all_for_user_kills_every_session(repo):
     for raw in (raw1, raw2):
         with pytest.raises(InvalidRefreshToken):
             await repo.rotate(raw)
+
+
+@pytest.mark.asyncio
+async def test_revoke_all_for_users_spares_everyone_else(repo):
+    """Bulk revoke kills every listed user's sessions and no one else's, and counts them."""
+    _, a1 = await repo.create_session("user-a", device="A1")
+    _, a2 = await repo.create_session("user-a", device="A2")
+    _, b1 = await repo.create_session("user-b", device="B1")
+    _, c1 = await repo.create_session("user-c", device="C1")
+
+    assert await repo.revoke_all_for_users(["user-a", "user-b", "user-without-sessions"]) == 3
+    for raw in (a1, a2, b1):
+        with pytest.raises(InvalidRefreshToken):
+            await repo.rotate(raw)
+    assert not await repo.redis.exists(repo.USER_SESSIONS + "user-a")
+    await repo.rotate(c1)
+
+
+@pytest.mark.asyncio
+async def test_revocation_is_recorded_and_broadcast(repo):
+    """revoke_session records the sid in Redis and announces it; resync restores the denylist."""
+    from app.core import revocation
+
+    sid, _raw = await repo.create_session("user-1", device="UA")
+    async with repo.redis.pubsub(ignore_subscribe_messages=True) as pubsub:
+        await pubsub.subscribe(revocation.CHANNEL)
+        await repo.revoke_session(sid)
+        message = None
+        for _ in range(3):  # the subscribe confirmation is consumed as a None first
+            message = message or await pubsub.get_message(timeout=1.0)
+    assert message is not None and message["data"] == sid.encode()
+    assert revocation.revoked_sessions.is_revoked(sid)
+
+    revocation.revoked_sessions.clear()
+    await revocation.resync(repo.redis)
+    assert revocation.revoked_sessions.is_revoked(sid)
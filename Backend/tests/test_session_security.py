@@ -1,11 +1,14 @@
 """Unit tests for refresh-token helpers and access-token claims."""
 
 import uuid
+from datetime import timedelta
 
-from jose import jwt
+import pytest
+from jose import JWTError, jwt
 
 from app.core import security
 from app.core.config import settings
+from app.core.token_cache import VerifiedTokenCache
 
 
 def test_generate_refresh_token_is_unique_and_urlsafe():
@@ -41,3 +44,72 @@ def test_access_token_without_sid_still_works():
     payload = jwt.decode(token, settings.JWT_SIGNING_KEY, algorithms=[settings.ALGORITHM])
     assert payload["type"] == "access"
     assert payload.get("sid") is None
+
+
+def test_verified_token_cache_serves_repeat_decodes_without_reverifying(monkeypatch):
+    """A second decode of the same token is a cache hit: jwt.decode is not called again."""
+    cache = VerifiedTokenCache()
+    token = security.create_access_token(data={"sub": "user-1"})
+    first = cache.decode(token)
+
+    def _boom(*args, **kwargs):
+        raise AssertionError("cache hit must not re-verify")
+
+    monkeypatch.setattr("app.core.token_cache.jwt.decode", _boom)
+    assert cache.decode(token) == first
+
+
+def test_verified_token_cache_never_serves_an_expired_token():
+    """An entry past its exp is dropped and the fresh decode raises, as jwt.decode would."""
+    cache = VerifiedTokenCache()
+    token = security.create_access_token(data={"sub": "user-1"}, expires_delta=timedelta(seconds=-1))
+    with pytest.raises(JWTError):
+        cache.decode(token)
+    assert len(cache) == 0
+
+
+def test_verified_token_cache_rejects_tampered_tokens():
+    """A token signed with another key fails and is not cached."""
+    cache = VerifiedTokenCache()
+    forged = jwt.encode({"sub": "user-1", "type": "access"}, "not-the-key", algorithm=settings.ALGORITHM)
+    with pytest.raises(JWTError):
+        cache.decode(forged)
+    assert len(cache) == 0
+
+
+def test_verified_token_cache_is_bounded():
+    """Past maxsize the least-recently-used token is evicted."""
+    cache = VerifiedTokenCache(maxsize=2)
+    for i in range(3):
+        cache.decode(security.create_access_token(data={"sub": f"user-{i}"}))
+    assert len(cache) == 2
+
+
+def test_revoked_sessions_deny_until_expiry():
+    """A revoked sid is denied until its recorded expiry, and a missing sid never is."""
+    import time
+
+    from app.core.revocation import RevokedSessions
+
+    denylist = RevokedSessions()
+    denylist.add(["live"])
+    denylist.add(["stale"], expires_at=time.time() - 1)
+    assert denylist.is_revoked("live") is True
+    assert denylist.is_revoked("stale") is False
+    assert denylist.is_revoked("never-revoked") is False
+    assert denylist.is_revoked(None) is False
+
+
+def test_access_token_of_a_revoked_session_is_rejected():
+    """_decode_access_payload refuses a validly signed token once its sid is revoked."""
+    from fastapi import HTTPException
+
+    from app.core.revocation import revoked_sessions
+
+    sid = str(uuid.uuid4())
+    token = security.create_access_token(data={"sub": "user-1"}, sid=sid)
+    assert security._decode_access_payload(token)["sid"] == sid
+    revoked_sessions.add([sid])
+    with pytest.raises(HTTPException) as exc:
+        security._decode_access_payload(token)
+    assert exc.value.status_code == 401
@@ -3,7 +3,7 @@ import logging
 
 import pytest
 
-from app.messaging.sms import ConsoleSmsSender, build_verification_sms, get_sms_sender
+from app.messaging.sms import ConsoleSmsSender, build_sms_sender, build_verification_sms
 
 
 @pytest.mark.asyncio
@@ -20,8 +20,8 @@ def test_build_verification_sms_has_code():
     assert "123456" in build_verification_sms("123456")
 
 
-def test_get_sms_sender_defaults_to_console(monkeypatch):
-    """get_sms_sender returns the console sender by default."""
+def test_build_sms_sender_defaults_to_console(monkeypatch):
+    """build_sms_sender returns the console sender by default."""
     from app.core.config import settings
     monkeypatch.setattr(settings, "SMS_PROVIDER", "console")
-    assert isinstance(get_sms_sender(), ConsoleSmsSender)
+    assert isinstance(build_sms_sender(), ConsoleSmsSender)
@@ -0,0 +1,103 @@
+"""Tests for the Redis-backed authenticated-user snapshot (app/core/user_cache.py)."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from app.core import user_cache
+from app.core.security import create_access_token, get_current_user
+from app.core.user_cache import CachedUser
+from app.main import app
+from app.models.auth import User
+
+
+def _request_with(redis) -> SimpleNamespace:
+    """The slice of a Starlette Request that get_current_user reads."""
+    return SimpleNamespace(app=SimpleNamespace(state=SimpleNamespace(redis=redis)))
+
+
+@pytest.mark.asyncio
+async def test_snapshot_round_trips_and_invalidates(db, redis):
+    """put/get round-trips every cached column; invalidate drops the entry."""
+    user = User(name="Cached", credibility_score=72.5)
+    db.add(user)
+    await db.commit()
+    await db.refresh(user)
+
+    await user_cache.put(redis, CachedUser.from_model(user))
+    cached = await user_cache.get(redis, str(user.uuid))
+    assert (cached.uuid, cached.name, cached.team_uuid, cached.credibility_score) == (
+        user.uuid, "Cached", None, 72.5,
+    )
+    assert cached.created_at == user.created_at
+
+    await user_cache.invalidate(redis, user.uuid)
+    assert await user_cache.get(redis, str(user.uuid)) is None
+
+
+@pytest.mark.asyncio
+async def test_ttl_never_exceeds_the_access_token_lifetime(db, redis):
+    """A snapshot expires no later than the token that loaded it."""
+    from app.core.config import settings
+
+    user = User(name="Ttl")
+    db.add(user)
+    await db.commit()
+    await db.refresh(user)
+    await user_cache.put(redis, CachedUser.from_model(user))
+    assert 0 < await redis.ttl(f"user_snapshot:{user.uuid}") <= settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+
+
+@pytest.mark.asyncio
+async def test_get_current_user_is_served_from_cache_without_the_database(db, redis):
+    """A cache hit never reaches the users table — even a row that is gone still resolves."""
+    user = User(name="Ghost")
+    db.add(user)
+    await db.commit()
+    await db.refresh(user)
+    token = create_access_token(data={"sub": str(user.uuid)})
+
+    first = await get_current_user(request=_request_with(redis), db=db, token=token)
+    assert first.name == "Ghost"
+
+    await db.delete(user)
+    await db.commit()
+    second = await get_current_user(request=_request_with(redis), db=db, token=token)
+    assert second.uuid == user.uuid and second.name == "Ghost"
+
+
+@pytest.mark.asyncio
+async def test_cached_user_loads_the_live_row_lazily(db, redis):
+    """A snapshot parsed from Redis fetches its ORM row only when asked."""
+    user = User(name="Lazy")
+    db.add(user)
+    await db.commit()
+    await db.refresh(user)
+    await user_cache.put(redis, CachedUser.from_model(user))
+
+    cached = await user_cache.get(redis, str(user.uuid))
+    orm = await cached.load(db)
+    assert isinstance(orm, User) and orm.uuid == user.uuid
+    assert await cached.load(db) is orm
+
+
+@pytest.mark.asyncio
+async def test_profile_update_invalidates_the_snapshot(client, db_session, redis):
+    """PATCH /users/me drops the snapshot, so the next GET sees the new name."""
+    user = User(name="Before")
+    db_session.add(user)
+    await db_session.flush()
+    user_uuid = str(user.uuid)
+    await db_session.commit()
+    headers = {"Authorization": f"Bearer {create_access_token(data={'sub': user_uuid})}"}
+
+    app.state.redis = redis  # the in-process transport never runs the lifespan
+    try:
+        assert (await client.get("/api/v1/users/me", headers=headers)).json()["name"] == "Before"
+        assert await user_cache.get(redis, user_uuid) is not None
+
+        resp = await client.patch("/api/v1/users/me", json={"name": "After"}, headers=headers)
+        assert resp.status_code == 200, resp.json()
+        assert (await client.get("/api/v1/users/me", headers=headers)).json()["name"] == "After"
+    finally:
+        del app.state.redis